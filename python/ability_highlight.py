@@ -0,0 +1,338 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+构建期预计算能力描述的关键词高亮，输出 src/data/abilityHighlights.ts：
+
+  ABILITY_HIGHLIGHTS[语言][能力文本] = [起, 止, 颜色下标, 起, 止, 颜色下标, ...]
+
+下标为 UTF-16 码元（与 JS 字符串一致），颜色下标对应 ABILITY_HIGHLIGHT_TONES。
+覆盖角色库中全部内置角色（characters.ts、charactersEn.ts、roles.json、fabled.ts、loric.ts）
+的中英文能力描述；highlightAbilityText() 命中时直接按区间拼接，只有用户编辑过的
+自定义角色才在运行时扫描。
+
+关键词表直接读取 scriptGenerator.ts 中的 ABILITY_KEYWORDS，编译成一个 Aho-Corasick 自动机，
+一遍扫描找出全部候选，再按“最左、最长”选取互不重叠的匹配，与运行时兜底用的单条正则
+（关键词按长度降序组成交替分支）结果一致：
+- 中文：区分大小写，直接按子串匹配
+- 英文：不区分大小写（仅 ASCII），匹配两端须为单词边界（同 JS 的 \\b）
+同一关键词出现在多个颜色组时以先出现的组为准（evil、good、purple）。
+
+--bench 对比三种做法在全部能力描述上的耗时，并逐字比较高亮颜色：
+- sequential：原 highlightAbilityText() 的做法（每个关键词一次 replaceAll / 正则替换）
+- regex：运行时兜底的单条正则
+- automaton：本模块的自动机
+--check 只比对已提交的文件是否为最新。
+"""
+import argparse
+import json
+import re
+import sys
+import time
+from collections import deque
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from chardb import DATA_DIR, ROOT, load_db
+from ts_literal import parse_literal
+
+SCRIPT_GENERATOR_TS = ROOT / 'src' / 'utils' / 'scriptGenerator.ts'
+OUTPUT_TS = DATA_DIR / 'abilityHighlights.ts'
+
+HEADER = '''// 此文件由 python/ability_highlight.py 自动生成，请勿手动修改。
+// 角色数据或 scriptGenerator.ts 中的 ABILITY_KEYWORDS 变化后运行：python ./python/ability_highlight.py
+'''
+
+LANGS = ('zh-CN', 'en')
+TONES = ('evil', 'good', 'purple')
+# 与 scriptGenerator.ts 中 language === 'en' 的分支一致
+WORD_BOUNDARY_LANGS = ('en',)
+# 只折叠 ASCII 大小写，保持字符串长度不变（JS 的 /i 不会让非 ASCII 字符匹配 ASCII 关键词）
+_ASCII_LOWER = str.maketrans('ABCDEFGHIJKLMNOPQRSTUVWXYZ', 'abcdefghijklmnopqrstuvwxyz')
+
+Span = Tuple[int, int, int]  # (起, 止, 颜色下标)，Python 字符下标
+
+
+def load_keywords() -> Dict[str, Dict[str, List[str]]]:
+    return parse_literal(SCRIPT_GENERATOR_TS.read_bytes(), r'const ABILITY_KEYWORDS\s*:[^=]*=')
+
+
+def is_word_char(ch: str) -> bool:
+    """JS 正则 \\w：仅 ASCII 字母、数字与下划线"""
+    return ch.isascii() and (ch.isalnum() or ch == '_')
+
+
+class AhoCorasick:
+    """多模式串匹配自动机：goto 表 + 失败指针，每个状态记录以此结尾的全部模式 (长度, 取值)"""
+
+    def __init__(self, patterns: Iterable[Tuple[str, Any]]):
+        self.goto: List[Dict[str, int]] = [{}]
+        self.fail: List[int] = [0]
+        self.out: List[List[Tuple[int, Any]]] = [[]]
+        for word, value in patterns:
+            state = 0
+            for ch in word:
+                nxt = self.goto[state].get(ch)
+                if nxt is None:
+                    nxt = len(self.goto)
+                    self.goto[state][ch] = nxt
+                    self.goto.append({})
+                    self.fail.append(0)
+                    self.out.append([])
+                state = nxt
+            if not self.out[state]:
+                self.out[state].append((len(word), value))
+
+        queue = deque(self.goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for ch, nxt in self.goto[state].items():
+                queue.append(nxt)
+                f = self.fail[state]
+                while f and ch not in self.goto[f]:
+                    f = self.fail[f]
+                self.fail[nxt] = self.goto[f].get(ch, 0)
+                self.out[nxt] = self.out[nxt] + self.out[self.fail[nxt]]
+
+    def iter_matches(self, text: str) -> Iterator[Tuple[int, int, Any]]:
+        """产出全部匹配 (起, 止, 取值)，按结束位置递增"""
+        goto, fail, out = self.goto, self.fail, self.out
+        state = 0
+        for i, ch in enumerate(text):
+            while state and ch not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(ch, 0)
+            for length, value in out[state]:
+                yield i + 1 - length, i + 1, value
+
+
+class Highlighter:
+    def __init__(self, keywords: Dict[str, List[str]], english: bool):
+        self.english = english
+        patterns: Dict[str, int] = {}
+        for tone_index, tone in enumerate(TONES):
+            for word in keywords.get(tone, []):
+                patterns.setdefault(self.fold(word), tone_index)
+        self.patterns = patterns
+        self.automaton = AhoCorasick(patterns.items())
+
+    def fold(self, text: str) -> str:
+        return text.translate(_ASCII_LOWER) if self.english else text
+
+    def spans(self, text: str) -> List[Span]:
+        candidates = []
+        for start, end, tone in self.automaton.iter_matches(self.fold(text)):
+            if self.english and not (at_boundary(text, start) and at_boundary(text, end)):
+                continue
+            candidates.append((start, end, tone))
+        # 最左优先，同一起点取最长；与正则全局扫描一样从上一个匹配的结尾继续
+        candidates.sort(key=lambda m: (m[0], m[0] - m[1]))
+        spans: List[Span] = []
+        cursor = 0
+        for start, end, tone in candidates:
+            if start >= cursor:
+                spans.append((start, end, tone))
+                cursor = end
+        return spans
+
+
+def at_boundary(text: str, pos: int) -> bool:
+    before = pos > 0 and is_word_char(text[pos - 1])
+    after = pos < len(text) and is_word_char(text[pos])
+    return before != after
+
+
+def utf16_offsets(text: str) -> Optional[List[int]]:
+    """Python 字符下标 -> UTF-16 码元下标；全部位于 BMP 时返回 None（两者相同）"""
+    if all(ord(ch) <= 0xFFFF for ch in text):
+        return None
+    offsets = [0]
+    for ch in text:
+        offsets.append(offsets[-1] + (2 if ord(ch) > 0xFFFF else 1))
+    return offsets
+
+
+def highlighters(keywords: Dict[str, Dict[str, List[str]]]) -> Dict[str, Highlighter]:
+    return {lang: Highlighter(keywords[lang], lang in WORD_BOUNDARY_LANGS) for lang in LANGS}
+
+
+def collect_abilities() -> Dict[str, List[str]]:
+    """各语言下全部内置角色的能力描述（去重，按首次出现的顺序）"""
+    abilities: Dict[str, Dict[str, None]] = {lang: {} for lang in LANGS}
+    for role in load_db().source_roles:
+        ability = role.data.get('ability')
+        if isinstance(ability, str) and ability and role.lang in abilities:
+            abilities[role.lang].setdefault(ability, None)
+    return {lang: list(texts) for lang, texts in abilities.items()}
+
+
+def build_table(keywords: Dict[str, Dict[str, List[str]]]) -> Dict[str, Dict[str, List[int]]]:
+    table: Dict[str, Dict[str, List[int]]] = {}
+    hl = highlighters(keywords)
+    for lang, texts in collect_abilities().items():
+        rows: Dict[str, List[int]] = {}
+        for text in sorted(texts):
+            offsets = utf16_offsets(text)
+            flat: List[int] = []
+            for start, end, tone in hl[lang].spans(text):
+                if offsets is not None:
+                    start, end = offsets[start], offsets[end]
+                flat.extend((start, end, tone))
+            rows[text] = flat
+        table[lang] = rows
+    return table
+
+
+def render_ts(table: Dict[str, Dict[str, List[int]]]) -> str:
+    parts = [HEADER, f'\nexport const ABILITY_HIGHLIGHT_TONES = {json.dumps(list(TONES))} as const;\n',
+             'export type HighlightTone = typeof ABILITY_HIGHLIGHT_TONES[number];\n',
+             '\n// 能力文本 -> [起, 止, 颜色下标, ...]（UTF-16 下标）\n',
+             "export const ABILITY_HIGHLIGHTS: Record<'zh-CN' | 'en', Record<string, readonly number[]>> = {\n"]
+    for lang in LANGS:
+        parts.append(f'  {json.dumps(lang)}: {{\n')
+        parts.extend(f'    {json.dumps(text, ensure_ascii=False)}: {json.dumps(flat).replace(" ", "")},\n'
+                     for text, flat in table[lang].items())
+        parts.append('  },\n')
+    parts.append('};\n')
+    return ''.join(parts)
+
+
+# ---------------------------------------------------------------------------
+# 基准
+# ---------------------------------------------------------------------------
+
+# 与 THEME_COLORS 相同的颜色值：旧做法逐个替换时，后面的关键词也会在已插入的标签里查找
+BENCH_COLORS = {'evil': '#a32222ff', 'good': '#0078ba', 'purple': '#b463aaff'}
+
+
+def span_html(text: str, tone: str) -> str:
+    return f'<span style="color: {BENCH_COLORS[tone]}; font-weight: 700;">{text}</span>'
+
+
+def sequential_highlight(text: str, keywords: Dict[str, List[str]], english: bool) -> str:
+    """原 highlightAbilityText()：按颜色组、组内按关键词逐个替换（英文组内按长度降序）"""
+    result = text
+    for tone in TONES:
+        words = keywords.get(tone, [])
+        if english:
+            for word in sorted(words, key=len, reverse=True):
+                pattern = re.compile(rf'\b{re.escape(word)}\b', re.I | re.A)
+                result = pattern.sub(lambda m, t=tone: span_html(m.group(0), t), result)
+        else:
+            for word in words:
+                result = result.replace(word, span_html(word, tone))
+    return result
+
+
+def regex_highlighter(highlighter: Highlighter) -> Callable[[str], str]:
+    """运行时兜底：全部关键词按长度降序组成一条正则"""
+    alternatives = '|'.join(re.escape(w) for w in sorted(highlighter.patterns, key=len, reverse=True))
+    if highlighter.english:
+        pattern = re.compile(rf'\b(?:{alternatives})\b', re.I | re.A)
+    else:
+        pattern = re.compile(alternatives)
+    tones = {word: TONES[tone] for word, tone in highlighter.patterns.items()}
+    return lambda text: pattern.sub(lambda m: span_html(m.group(0), tones[highlighter.fold(m.group(0))]), text)
+
+
+def automaton_highlight(highlighter: Highlighter, text: str) -> str:
+    parts: List[str] = []
+    last = 0
+    for start, end, tone in highlighter.spans(text):
+        parts.append(text[last:start])
+        parts.append(span_html(text[start:end], TONES[tone]))
+        last = end
+    parts.append(text[last:])
+    return ''.join(parts)
+
+
+_TAG_RE = re.compile(r'<span style="color: (#\w+); font-weight: 700;">|</span>')
+
+
+def char_tones(html: str) -> List[Optional[str]]:
+    """去掉标签后每个字符的颜色（嵌套时取最内层），用于比较不同做法的可见效果"""
+    tones: List[Optional[str]] = []
+    stack: List[str] = []
+    pos = 0
+    for m in _TAG_RE.finditer(html):
+        tones.extend([stack[-1] if stack else None] * (m.start() - pos))
+        if m.group(1):
+            stack.append(m.group(1))
+        elif stack:
+            stack.pop()
+        pos = m.end()
+    tones.extend([stack[-1] if stack else None] * (len(html) - pos))
+    return tones
+
+
+def best_of(fn: Callable[[], object], repeat: int) -> float:
+    times: List[float] = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        times.append(time.perf_counter() - start)
+    return min(times)
+
+
+def run_bench(keywords: Dict[str, Dict[str, List[str]]], repeat: int):
+    hl = highlighters(keywords)
+    abilities = collect_abilities()
+    for lang in LANGS:
+        texts = abilities[lang]
+        highlighter = hl[lang]
+        regex_fn = regex_highlighter(highlighter)
+        impls = {
+            'sequential': lambda t: sequential_highlight(t, keywords[lang], highlighter.english),
+            'regex': regex_fn,
+            'automaton': lambda t: automaton_highlight(highlighter, t),
+        }
+        outputs = {name: [fn(t) for t in texts] for name, fn in impls.items()}
+        print(f'{lang}: {len(texts)} abilities, {sum(map(len, texts))} chars, '
+              f'{len(highlighter.patterns)} keywords, {len(highlighter.automaton.goto)} automaton states')
+        base = None
+        for name, fn in impls.items():
+            seconds = best_of(lambda: [fn(t) for t in texts], repeat)
+            base = base or seconds
+            print(f'  {name:10} {seconds * 1000:8.2f} ms  {seconds / len(texts) * 1e6:7.1f} us/ability  '
+                  f'({base / seconds:.1f}x)')
+
+        # 自动机与兜底正则必须逐字节一致；与旧做法比较可见颜色（旧做法会产生嵌套 span）
+        regex_diff = sum(a != b for a, b in zip(outputs['regex'], outputs['automaton']))
+        tone_diff = [t for t, a, b in zip(texts, outputs['sequential'], outputs['automaton'])
+                     if char_tones(a) != char_tones(b)]
+        print(f'  automaton vs regex: {regex_diff} differing outputs')
+        print(f'  automaton vs sequential: {len(tone_diff)} abilities with different visible colors')
+        for text in tone_diff[:3]:
+            print(f'    {text[:60]}')
+
+
+def main():
+    parser = argparse.ArgumentParser(description='预计算内置角色能力描述的关键词高亮（src/data/abilityHighlights.ts）')
+    parser.add_argument('--check', action='store_true', help='只检查已生成的文件是否为最新，不写入')
+    parser.add_argument('--bench', action='store_true', help='对比逐个替换、单条正则与自动机的耗时和结果')
+    parser.add_argument('--repeat', type=int, default=5, help='基准重复次数，取最快一次（默认 5）')
+    args = parser.parse_args()
+
+    keywords = load_keywords()
+    if args.bench:
+        run_bench(keywords, args.repeat)
+        return
+
+    table = build_table(keywords)
+    content = render_ts(table)
+    current = OUTPUT_TS.read_text(encoding='utf-8') if OUTPUT_TS.exists() else ''
+    if args.check:
+        if current != content:
+            print(f'{OUTPUT_TS} 已过期，请运行 python ./python/ability_highlight.py', file=sys.stderr)
+            sys.exit(1)
+        print(f'{OUTPUT_TS.name} is up to date')
+        return
+
+    if current != content:
+        OUTPUT_TS.write_text(content, encoding='utf-8', newline='\n')
+    counts = ', '.join(f'{lang}={len(table[lang])}' for lang in LANGS)
+    spans = sum(len(flat) // 3 for rows in table.values() for flat in rows.values())
+    print(f'Ability highlights -> {OUTPUT_TS} ({counts} abilities, {spans} spans, '
+          f'{len(content.encode("utf-8")) / 1024:.1f} KiB)')
+
+
+if __name__ == '__main__':
+    main()
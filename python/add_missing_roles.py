@@ -7,9 +7,10 @@ import json
 import re
 from pathlib import Path
 
-ROOT = Path(__file__).parent
-CHARACTERS_TS = ROOT / 'src' / 'data' / 'characters.ts'
-ROLES_JSON = ROOT / 'src' / 'data' / 'roles.json'
+from chardb import ROLES_JSON, load_db
+from instrument import count, stage
+
+ROOT = Path(__file__).resolve().parent
 MISSING_TXT = ROOT / 'missing_characters_with_mapping.txt'
 OUTPUT_JSON = ROOT / 'roles_to_add.json'
 
@@ -19,55 +20,30 @@ def parse_missing_ids():
     pattern = re.compile(r'CN_ID:\s*(\S+)')
     return pattern.findall(text)
 
-def extract_role_data(char_id, characters_content):
-    """从 characters.ts 提取指定角色的完整数据"""
-    # 匹配角色对象块
-    pattern = rf'"{re.escape(char_id)}"\s*:\s*\{{(.*?)\n  \}}(?:,|\n)'
-    match = re.search(pattern, characters_content, re.DOTALL)
-    if not match:
+def extract_role_data(char_id, db):
+    """从角色数据库中取出 characters.ts 里指定角色的完整数据"""
+    entry = next((r for r in db.from_source('characters', 'custom') if r.key == char_id), None)
+    if entry is None:
         return None
-    
-    block = match.group(1)
-    
-    # 提取各个字段
-    def extract_field(field_name, default=''):
-        # 字符串字段
-        m = re.search(rf'"{field_name}"\s*:\s*"((?:[^"\\]|\\.)*)"', block)
-        if m:
-            return m.group(1)
-        # 数字字段
-        m = re.search(rf'"{field_name}"\s*:\s*(\d+)', block)
-        if m:
-            return int(m.group(1))
-        # 布尔字段
-        m = re.search(rf'"{field_name}"\s*:\s*(true|false)', block)
-        if m:
-            return m.group(1) == 'true'
-        # 数组字段
-        m = re.search(rf'"{field_name}"\s*:\s*\[(.*?)\]', block, re.DOTALL)
-        if m:
-            array_content = m.group(1)
-            items = re.findall(r'"([^"]*)"', array_content)
-            return items
-        return default
-    
+    data = entry.data
+
     role_data = {
         'id': char_id,
-        'name': extract_field('name', char_id),
-        'edition': extract_field('edition', 'custom'),
-        'team': extract_field('team', 'townsfolk'),
-        'firstNight': extract_field('firstNight', 0),
-        'firstNightReminder': extract_field('firstNightReminder', ''),
-        'otherNight': extract_field('otherNight', 0),
-        'otherNightReminder': extract_field('otherNightReminder', ''),
-        'reminders': extract_field('reminders', []),
-        'setup': extract_field('setup', False),
-        'ability': extract_field('ability', '')
+        'name': data.get('name', char_id),
+        'edition': data.get('edition', 'custom'),
+        'team': data.get('team', 'townsfolk'),
+        'firstNight': data.get('firstNight', 0),
+        'firstNightReminder': data.get('firstNightReminder', ''),
+        'otherNight': data.get('otherNight', 0),
+        'otherNightReminder': data.get('otherNightReminder', ''),
+        'reminders': data.get('reminders', []),
+        'setup': data.get('setup', False),
+        'ability': data.get('ability', '')
     }
     
     # 提取可选字段
-    reminders_global = extract_field('remindersGlobal', None)
-    if reminders_global and reminders_global != []:
+    reminders_global = data.get('remindersGlobal')
+    if reminders_global:
         role_data['remindersGlobal'] = reminders_global
     
     return role_data
@@ -77,18 +53,19 @@ def main():
     missing_ids = parse_missing_ids()
     print(f'Found {len(missing_ids)} missing role IDs')
     
-    # 读取 characters.ts
-    characters_content = CHARACTERS_TS.read_text(encoding='utf-8')
+    db = load_db()
     
     # 提取每个角色的数据
-    roles_to_add = []
-    for char_id in missing_ids:
-        role_data = extract_role_data(char_id, characters_content)
-        if role_data:
-            roles_to_add.append(role_data)
-            print(f'  Extracted: {char_id} ({role_data["name"]})')
-        else:
-            print(f'  WARNING: Could not extract data for {char_id}')
+    with stage('extract'):
+        roles_to_add = []
+        for char_id in missing_ids:
+            role_data = extract_role_data(char_id, db)
+            if role_data:
+                roles_to_add.append(role_data)
+                print(f'  Extracted: {char_id} ({role_data["name"]})')
+            else:
+                print(f'  WARNING: Could not extract data for {char_id}')
+    count('roles', len(roles_to_add))
     
     # 保存到 JSON 文件
     with open(OUTPUT_JSON, 'w', encoding='utf-8') as f:
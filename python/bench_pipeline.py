@@ -0,0 +1,385 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+基准测试：在合成的大规模数据上运行 python/ 下的数据工具，观察耗时与内存随规模的增长。
+
+每个规模（默认 1×、10×、100×）生成一份独立的合成仓库 .cache/bench/<N>x/：
+- src/data：characters.ts（_characters 与 custom_characters）、roles.json、jinx.ts、jinxEn.json
+  中的条目复制 N 份，副本的 id 加 "_x<i>" 后缀、名字加 "#<i>" 后缀，CN_TO_EN_ID_MAP 同步补上
+  副本的映射，副本之间的相克关系与原数据一一对应；其余数据文件原样复制
+- public/scripts/json：每个剧本复制 N 份（<分类>/bench-<i>/ 子目录），内容不变
+- python：复制当前的全部脚本，使其中的 ROOT 指向合成仓库
+
+随后在合成仓库里以子进程方式逐个运行各工具（见 TOOLS），每个工具重复 --repeat 次，
+记录最快一次的墙钟时间、各次中最大的峰值 RSS（工具进程自身，见 RUNNER；无法获取时为 null）
+与每秒处理的条目数（剧本文件数、角色条目数或相克对数），写入 JSON 报告。
+
+--baseline 指定之前的报告时逐项对比耗时与内存；配合 --max-regression 可在变慢超过阈值时
+以状态 1 退出。
+"""
+import argparse
+import json
+import os
+import platform
+import re
+import shutil
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, List, Tuple
+
+from chardb import CHARACTERS_TS, DATA_DIR, MAPPING_TS, ROLES_JSON, ROOT
+from generate_manifest import JSON_ROOT, iter_script_files
+from jinx_index import JINX_EN_JSON, JINX_TS
+from ts_literal import iter_blocks
+
+PYTHON_DIR = Path(__file__).resolve().parent
+BENCH_DIR = ROOT / '.cache' / 'bench'
+DEFAULT_REPORT = BENCH_DIR / 'report.json'
+DEFAULT_SCALES = (1, 10, 100)
+DEFAULT_TIMEOUT = 600
+REPORT_VERSION = 1
+
+ID_SUFFIX = '_x{}'
+NAME_SUFFIX = '#{}'
+
+
+@dataclass
+class Tool:
+    name: str
+    argv: List[str]
+    unit: str               # 吞吐量的计数单位，对应 corpus_stats() 的键
+    mutates: Tuple[str, ...] = ()  # 会改写的数据文件（相对 src/data），每次运行前恢复
+
+
+# 按依赖顺序执行：compare_characters_with_mapping 输出的缺失列表供 add_missing_roles 使用
+TOOLS = (
+    Tool('chardb', ['chardb.py', '--rebuild'], 'roles'),
+    Tool('manifest', ['generate_manifest.py', '--full'], 'scripts'),
+    Tool('manifest-incremental', ['generate_manifest.py'], 'scripts'),
+    Tool('manifest-summary', ['generate_manifest.py', '--full', '--summary'], 'scripts'),
+    Tool('validate-scripts', ['validate_scripts.py', '--quiet'], 'scripts'),
+    Tool('similar-index', ['similar_scripts.py', '--full'], 'scripts'),
+    Tool('compare-cn-en', ['compare_cn_en_roles.py'], 'roles'),
+    Tool('check-duplicates', ['check_roles_duplicates.py'], 'roles'),
+    Tool('jinx-index', ['jinx_index.py', '--quiet'], 'jinxes'),
+    Tool('missing-roles', ['compare_characters_with_mapping.py'], 'roles'),
+    Tool('add-missing-roles', ['add_missing_roles.py'], 'roles', mutates=('roles.json',)),
+)
+
+
+# ---------------------------------------------------------------------------
+# 合成数据
+# ---------------------------------------------------------------------------
+
+def literal_span(text: str, anchor: str) -> Tuple[int, int]:
+    """anchor 之后对象字面量的内容区间（不含首尾花括号）；字面量以行首的 } 结束"""
+    m = re.search(anchor + r'\s*\{', text)
+    end = re.compile(r'\r?\n\}').search(text, m.end())
+    return m.end(), end.start()
+
+
+def scale_literal(text: str, anchor: str, factor: int, rename) -> str:
+    """把 anchor 处对象字面量的内容复制 factor 份，第 i 份经 rename(body, i) 改名"""
+    if factor <= 1:
+        return text
+    start, end = literal_span(text, anchor)
+    body = text[start:end].rstrip().rstrip(',')
+    newline = '\r\n' if '\r\n' in body else '\n'
+    copies = [rename(body, i) for i in range(2, factor + 1)]
+    return text[:start] + (',' + newline).join([body] + copies) + text[end:]
+
+
+def rename_characters(body: str, i: int) -> str:
+    suffix, name_suffix = ID_SUFFIX.format(i), NAME_SUFFIX.format(i)
+    body = re.sub(r'^(  )"([^"]+)"(\s*:\s*\{)', rf'\1"\2{suffix}"\3', body, flags=re.M)
+    body = re.sub(r'("id"\s*:\s*")([^"]*)"', rf'\1\2{suffix}"', body)
+    return re.sub(r'("name"\s*:\s*")([^"]*)"', rf'\1\2{name_suffix}"', body)
+
+
+def rename_jinx(body: str, i: int) -> str:
+    # jinx.ts 的键全部是中文角色名
+    return re.sub(r'^(\s+)"([^"]+)"(\s*:)', rf'\1"\2{NAME_SUFFIX.format(i)}"\3', body, flags=re.M)
+
+
+def scale_mapping(text: str, factor: int) -> str:
+    m = re.search(r'CN_TO_EN_ID_MAP[^=]*=\s*\{', text)
+    end = text.index('};', m.end())
+    pairs = re.findall(r"'([^']+)'\s*:\s*'([^']+)'", text[m.end():end])
+    newline = '\r\n' if '\r\n' in text else '\n'
+    extra = ''.join(f"  '{cn}{ID_SUFFIX.format(i)}': '{en}{ID_SUFFIX.format(i)}',{newline}"
+                    for i in range(2, factor + 1) for cn, en in pairs)
+    return text[:end] + extra + text[end:]
+
+
+def scale_roles(roles: List[Dict[str, Any]], factor: int) -> List[Dict[str, Any]]:
+    scaled = list(roles)
+    for i in range(2, factor + 1):
+        for role in roles:
+            copy = dict(role)
+            if copy.get('id'):
+                copy['id'] += ID_SUFFIX.format(i)
+            if copy.get('name'):
+                copy['name'] += NAME_SUFFIX.format(i)
+            scaled.append(copy)
+    return scaled
+
+
+def scale_jinx_en(items: List[Dict[str, Any]], factor: int) -> List[Dict[str, Any]]:
+    scaled = list(items)
+    for i in range(2, factor + 1):
+        suffix = ID_SUFFIX.format(i)
+        for item in items:
+            scaled.append({**item, 'id': item['id'] + suffix,
+                           'jinx': [{**j, 'id': j['id'] + suffix} for j in item.get('jinx') or []]})
+    return scaled
+
+
+def write_text(path: Path, text: str):
+    # 保留原文件的换行符
+    path.write_bytes(text.encode('utf-8'))
+
+
+def build_corpus(root: Path, factor: int):
+    if root.exists():
+        shutil.rmtree(root)
+    data_dir = root / 'src' / 'data'
+    shutil.copytree(DATA_DIR, data_dir)
+    (root / 'python').mkdir(parents=True)
+    for p in PYTHON_DIR.glob('*.py'):
+        shutil.copy2(p, root / 'python' / p.name)
+
+    text = CHARACTERS_TS.read_bytes().decode('utf-8')
+    for anchor in (r'const\s+_characters\s*=', r'const\s+custom_characters\s*='):
+        text = scale_literal(text, anchor, factor, rename_characters)
+    write_text(data_dir / CHARACTERS_TS.name, text)
+    write_text(data_dir / JINX_TS.name,
+               scale_literal(JINX_TS.read_bytes().decode('utf-8'), r'const\s+jinx\s*=', factor, rename_jinx))
+    write_text(data_dir / MAPPING_TS.name, scale_mapping(MAPPING_TS.read_bytes().decode('utf-8'), factor))
+    for src, scale in ((ROLES_JSON, scale_roles), (JINX_EN_JSON, scale_jinx_en)):
+        with src.open('r', encoding='utf-8') as f:
+            items = json.load(f)
+        with (data_dir / src.name).open('w', encoding='utf-8') as f:
+            json.dump(scale(items, factor), f, ensure_ascii=False, indent=2)
+
+    json_root = root / JSON_ROOT.relative_to(ROOT)
+    for jf, _ in iter_script_files():
+        rel = jf.relative_to(JSON_ROOT)
+        for i in range(1, factor + 1):
+            target = json_root / rel if i == 1 else json_root / rel.parts[0] / f'bench-{i}' / Path(*rel.parts[1:])
+            target.parent.mkdir(parents=True, exist_ok=True)
+            shutil.copyfile(jf, target)
+
+
+def corpus_stats(root: Path) -> Dict[str, int]:
+    data_dir = root / 'src' / 'data'
+    characters = data_dir / CHARACTERS_TS.name
+    data = characters.read_bytes()
+    blocks = sum(1 for anchor in (r'const _characters\s*=', r'const custom_characters\s*=')
+                 for _ in iter_blocks(data, anchor))
+    with (data_dir / ROLES_JSON.name).open('r', encoding='utf-8') as f:
+        roles = len(json.load(f))
+    with (data_dir / JINX_EN_JSON.name).open('r', encoding='utf-8') as f:
+        jinxes = sum(len(item.get('jinx') or []) for item in json.load(f))
+    json_root = root / JSON_ROOT.relative_to(ROOT)
+    scripts = sum(1 for sub in json_root.iterdir() if sub.is_dir() for _ in sub.rglob('*.json'))
+    return {'scripts': scripts, 'roles': roles + blocks, 'jinxes': jinxes}
+
+
+# ---------------------------------------------------------------------------
+# 计时
+# ---------------------------------------------------------------------------
+
+# 在子进程中运行工具脚本，结束时把本进程的峰值 RSS（KiB）写入 argv[1] 指定的文件。
+# Linux 上读取 /proc/self/status 的 VmHWM：它随 exec 重置，不会把 fork 前父进程的内存算进去；
+# 其他 POSIX 平台退回到 ru_maxrss（macOS 以字节计），Windows 上不记录
+RUNNER = r'''
+import os, runpy, sys
+out, script = sys.argv[1], sys.argv[2]
+sys.argv = sys.argv[2:]
+sys.path.insert(0, os.path.dirname(os.path.abspath(script)))
+try:
+    runpy.run_path(script, run_name='__main__')
+finally:
+    peak = ''
+    try:
+        with open('/proc/self/status') as f:
+            peak = next((line.split()[1] for line in f if line.startswith('VmHWM:')), '')
+    except OSError:
+        try:
+            import resource
+            rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+            peak = str(rss // 1024 if sys.platform == 'darwin' else rss)
+        except ImportError:
+            pass
+    with open(out, 'w') as f:
+        f.write(peak)
+'''
+
+
+def run_tool(root: Path, tool: Tool, timeout: float) -> Dict[str, Any]:
+    """运行一次工具，返回 {seconds, peakRssKiB, exitCode, timedOut, stderr}"""
+    with tempfile.TemporaryDirectory() as tmp:
+        rss_file, err_file = Path(tmp) / 'rss', Path(tmp) / 'stderr'
+        with err_file.open('wb') as err:
+            start = time.perf_counter()
+            proc = subprocess.Popen([sys.executable, '-c', RUNNER, str(rss_file), *tool.argv],
+                                    cwd=root / 'python', stdout=subprocess.DEVNULL, stderr=err,
+                                    env={**os.environ, 'PYTHONDONTWRITEBYTECODE': '1', 'PYTHONIOENCODING': 'utf-8'})
+            # Popen.wait(timeout) 以轮询实现，会把耗时量化到数十毫秒；这里阻塞等待，超时由定时器结束进程
+            timer = threading.Timer(timeout, proc.kill)
+            timer.start()
+            proc.wait()
+            seconds = time.perf_counter() - start
+            timer.cancel()
+            timed_out = not timer.is_alive() and seconds >= timeout
+        peak = rss_file.read_text() if rss_file.exists() else ''
+        stderr = err_file.read_bytes().decode('utf-8', 'replace')
+    return {'seconds': seconds, 'peakRssKiB': int(peak) if peak else None, 'exitCode': proc.returncode,
+            'timedOut': timed_out, 'stderr': stderr}
+
+
+def bench_tool(root: Path, tool: Tool, stats: Dict[str, int], repeat: int, timeout: float) -> Dict[str, Any]:
+    backups = {name: (root / 'src' / 'data' / name).read_bytes() for name in tool.mutates}
+    runs = []
+    for _ in range(repeat):
+        for name, content in backups.items():
+            (root / 'src' / 'data' / name).write_bytes(content)
+        run = run_tool(root, tool, timeout)
+        runs.append(run)
+        if run['timedOut']:
+            break
+    for name, content in backups.items():
+        (root / 'src' / 'data' / name).write_bytes(content)
+
+    seconds = min(r['seconds'] for r in runs)
+    rss = [r['peakRssKiB'] for r in runs if r['peakRssKiB'] is not None]
+    items = stats[tool.unit]
+    result = {
+        'tool': tool.name,
+        'unit': tool.unit,
+        'items': items,
+        'seconds': round(seconds, 4),
+        'peakRssKiB': max(rss) if rss else None,
+        'perSecond': round(items / seconds, 1) if seconds > 0 else None,
+        'exitCode': runs[-1]['exitCode'],
+        'timedOut': runs[-1]['timedOut'],
+    }
+    # validate_scripts 等工具以状态 1 表示发现了问题，不代表运行失败；只在有异常堆栈时附上 stderr
+    if result['timedOut'] or 'Traceback' in runs[-1]['stderr']:
+        result['stderr'] = runs[-1]['stderr'][-2000:]
+    return result
+
+
+# ---------------------------------------------------------------------------
+# 报告
+# ---------------------------------------------------------------------------
+
+def compare(report: Dict[str, Any], baseline: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """按 (tool, scale) 对比耗时与峰值内存，比值 > 1 表示比基线更慢/更大"""
+    base = {(r['tool'], r['scale']): r for r in baseline.get('results', [])}
+    rows = []
+    for r in report['results']:
+        b = base.get((r['tool'], r['scale']))
+        if b is None or not b.get('seconds'):
+            continue
+        row = {'tool': r['tool'], 'scale': r['scale'], 'seconds': r['seconds'], 'baselineSeconds': b['seconds'],
+               'timeRatio': round(r['seconds'] / b['seconds'], 3)}
+        if r.get('peakRssKiB') and b.get('peakRssKiB'):
+            row['rssRatio'] = round(r['peakRssKiB'] / b['peakRssKiB'], 3)
+        rows.append(row)
+    return rows
+
+
+def print_header():
+    print(f'{"tool":22} {"scale":>5} {"items":>7} {"seconds":>9} {"peak RSS":>10} {"items/s":>10}')
+
+
+def print_results(results: List[Dict[str, Any]]):
+    for r in results:
+        rss = f'{r["peakRssKiB"] / 1024:.1f} MiB' if r['peakRssKiB'] else '-'
+        rate = f'{r["perSecond"]:.0f}' if r['perSecond'] else '-'
+        note = ' TIMEOUT' if r['timedOut'] else (f' exit {r["exitCode"]}' if 'stderr' in r else '')
+        print(f'{r["tool"]:22} {r["scale"]:>4}x {r["items"]:>7} {r["seconds"]:>9.3f} {rss:>10} {rate:>10}{note}')
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description='数据工具基准：在 1×/10×/100× 合成数据上计时并记录峰值内存')
+    parser.add_argument('--scales', default=','.join(map(str, DEFAULT_SCALES)),
+                        help='逗号分隔的规模倍数（默认: 1,10,100）')
+    parser.add_argument('--tools', default='', help='只运行这些工具（逗号分隔），可选: '
+                        + ', '.join(t.name for t in TOOLS))
+    parser.add_argument('--repeat', type=int, default=3, help='每个工具重复次数，耗时取最快一次（默认 3）')
+    parser.add_argument('--timeout', type=float, default=DEFAULT_TIMEOUT,
+                        help=f'单次运行的超时秒数，超时记为 timedOut（默认 {DEFAULT_TIMEOUT}）')
+    parser.add_argument('--output', type=Path, default=DEFAULT_REPORT, help=f'报告路径（默认 {DEFAULT_REPORT}）')
+    parser.add_argument('--baseline', type=Path, help='与之前的报告对比')
+    parser.add_argument('--max-regression', type=float, default=None,
+                        help='与基线相比耗时增加超过该比例（如 0.25）时以状态 1 退出')
+    parser.add_argument('--keep', action='store_true', help='保留合成仓库（默认运行后删除）')
+    return parser.parse_args()
+
+
+def main():
+    args = parse_args()
+    scales = [int(s) for s in args.scales.split(',') if s.strip()]
+    wanted = {t for t in args.tools.split(',') if t}
+    unknown = wanted - {t.name for t in TOOLS}
+    if unknown:
+        sys.exit(f'未知的工具: {", ".join(sorted(unknown))}')
+    tools = [t for t in TOOLS if not wanted or t.name in wanted]
+
+    report: Dict[str, Any] = {
+        'version': REPORT_VERSION,
+        'generatedAt': __import__('datetime').datetime.utcnow().isoformat() + 'Z',
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'cpus': os.cpu_count(),
+        'repeat': args.repeat,
+        'corpora': {},
+        'results': [],
+    }
+    for factor in scales:
+        root = BENCH_DIR / f'{factor}x'
+        start = time.perf_counter()
+        build_corpus(root, factor)
+        stats = corpus_stats(root)
+        report['corpora'][str(factor)] = {**stats, 'buildSeconds': round(time.perf_counter() - start, 3)}
+        print(f'{factor}x corpus: {stats["scripts"]} scripts, {stats["roles"]} roles, {stats["jinxes"]} jinxes '
+              f'({time.perf_counter() - start:.1f} s) -> {root}', flush=True)
+        print_header()
+        try:
+            for tool in tools:
+                result = {'scale': factor, **bench_tool(root, tool, stats, args.repeat, args.timeout)}
+                report['results'].append(result)
+                print_results([result])
+        finally:
+            if not args.keep:
+                shutil.rmtree(root, ignore_errors=True)
+
+    failed = False
+    if args.baseline:
+        with args.baseline.open('r', encoding='utf-8') as f:
+            rows = compare(report, json.load(f))
+        report['baseline'] = {'path': str(args.baseline), 'comparison': rows}
+        print(f'\nvs {args.baseline}:')
+        for row in rows:
+            rss = f'  rss x{row["rssRatio"]:.2f}' if 'rssRatio' in row else ''
+            slower = args.max_regression is not None and row['timeRatio'] > 1 + args.max_regression
+            failed = failed or slower
+            print(f'  {row["tool"]:22} {row["scale"]:>4}x  time x{row["timeRatio"]:.2f}{rss}'
+                  f'{"  REGRESSION" if slower else ""}')
+
+    args.output.parent.mkdir(parents=True, exist_ok=True)
+    with args.output.open('w', encoding='utf-8') as f:
+        json.dump(report, f, ensure_ascii=False, indent=2)
+    print(f'\nReport -> {args.output}')
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,150 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+基准测试：characters.ts 解析方式对比
+- regex：原 compare_characters_with_mapping.parse_characters() 与
+         add_missing_roles.extract_role_data() 的做法（每个 id 一条 DOTALL 正则全文搜索，每个字段再一条正则）
+- tokenizer：ts_literal.iter_blocks() 单遍流式解析
+
+两者对每个角色得到的 name 会互相校验，避免只比速度不比结果。
+"""
+import argparse
+import re
+import time
+from typing import Callable, Dict, List
+
+from chardb import CHARACTERS_TS
+from ts_literal import iter_blocks
+
+ANCHORS = (r'const\s+_characters\s*=', r'const\s+custom_characters\s*=')
+
+
+# --- 原正则实现（逐字保留，仅去掉文件读取） -----------------------------------------
+
+def regex_parse_characters(text: str):
+    ids = re.findall(r'"([a-z0-9_\-]+)"\s*:\s*\{', text)
+    seen = set()
+    ordered = []
+    for id_ in ids:
+        if id_ not in seen:
+            seen.add(id_)
+            ordered.append(id_)
+    info = {}
+    for cid in ordered:
+        pat = re.compile(rf'"{re.escape(cid)}"\s*:\s*\{{(.*?)\}}\s*,', re.DOTALL)
+        m = pat.search(text)
+        block = m.group(1) if m else ''
+        name_m = re.search(r'"name"\s*:\s*"([^"]+)"', block)
+        ability_m = re.search(r'"ability"\s*:\s*"([\s\S]*?)"\s*(?:,|$)', block)
+        name = name_m.group(1) if name_m else ''
+        ability = ability_m.group(1) if ability_m else ''
+        ability = re.sub(r"\s+", " ", ability).strip()
+        info[cid] = {'name': name, 'ability': ability, 'raw_block': block}
+    return ordered, info
+
+
+def regex_extract_role_data(char_id: str, characters_content: str):
+    pattern = rf'"{re.escape(char_id)}"\s*:\s*\{{(.*?)\n  \}}(?:,|\n)'
+    match = re.search(pattern, characters_content, re.DOTALL)
+    if not match:
+        return None
+    block = match.group(1)
+
+    def extract_field(field_name, default=''):
+        m = re.search(rf'"{field_name}"\s*:\s*"((?:[^"\\]|\\.)*)"', block)
+        if m:
+            return m.group(1)
+        m = re.search(rf'"{field_name}"\s*:\s*(\d+)', block)
+        if m:
+            return int(m.group(1))
+        m = re.search(rf'"{field_name}"\s*:\s*(true|false)', block)
+        if m:
+            return m.group(1) == 'true'
+        m = re.search(rf'"{field_name}"\s*:\s*\[(.*?)\]', block, re.DOTALL)
+        if m:
+            return re.findall(r'"([^"]*)"', m.group(1))
+        return default
+
+    return {
+        'id': char_id,
+        'name': extract_field('name', char_id),
+        'edition': extract_field('edition', 'custom'),
+        'team': extract_field('team', 'townsfolk'),
+        'firstNight': extract_field('firstNight', 0),
+        'firstNightReminder': extract_field('firstNightReminder', ''),
+        'otherNight': extract_field('otherNight', 0),
+        'otherNightReminder': extract_field('otherNightReminder', ''),
+        'reminders': extract_field('reminders', []),
+        'setup': extract_field('setup', False),
+        'ability': extract_field('ability', ''),
+    }
+
+
+def run_regex(text: str) -> Dict[str, str]:
+    ordered, info = regex_parse_characters(text)
+    names = {}
+    for cid in ordered:
+        role = regex_extract_role_data(cid, text)
+        names[cid] = role['name'] if role else info[cid]['name']
+    return names
+
+
+# --- 单遍 tokenizer ------------------------------------------------------------------
+
+def run_tokenizer(data: bytes) -> Dict[str, str]:
+    names = {}
+    for anchor in ANCHORS:
+        for block in iter_blocks(data, anchor):
+            names.setdefault(block.key, block.value.get('name', ''))
+    return names
+
+
+def scaled(text: str, factor: int) -> str:
+    """把 _characters 中的角色块复制 factor 份（键加后缀），用于观察两种做法随规模的增长"""
+    if factor <= 1:
+        return text
+    m = re.search(ANCHORS[0] + r'\s*\{', text)
+    body_end = text.index('\n}', m.end())
+    body = text[m.end():body_end].rstrip().rstrip(',')
+    copies = [re.sub(r'^  "([a-z0-9_\-]+)"(\s*:\s*\{)', rf'  "\g<1>_x{i}"\2', body, flags=re.M)
+              for i in range(1, factor)]
+    return text[:m.end()] + ',\n'.join([body] + copies) + text[body_end:]
+
+
+def best_of(fn: Callable[[], object], repeat: int) -> float:
+    times: List[float] = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        times.append(time.perf_counter() - start)
+    return min(times)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='characters.ts 解析基准：正则 vs 单遍 tokenizer')
+    parser.add_argument('--repeat', type=int, default=5, help='重复次数，取最快一次（默认 5）')
+    parser.add_argument('--scale', type=int, default=1, help='把角色块复制 N 倍后再测（默认 1）')
+    args = parser.parse_args()
+
+    text = scaled(CHARACTERS_TS.read_bytes().decode('utf-8'), args.scale)
+    data = text.encode('utf-8')
+
+    regex_names = run_regex(text)
+    token_names = run_tokenizer(data)
+    # 正则实现拿到的是转义前的原文，含转义字符的名字可能不一致
+    mismatched = [cid for cid, name in token_names.items()
+                  if regex_names.get(cid) not in (name, None)]
+
+    regex_s = best_of(lambda: run_regex(text), args.repeat)
+    token_s = best_of(lambda: run_tokenizer(data), args.repeat)
+
+    print(f'characters.ts: {len(data) / 1024:.1f} KiB, {len(token_names)} blocks '
+          f'(regex found {len(regex_names)} ids)')
+    print(f'  regex     : {regex_s * 1000:8.1f} ms')
+    print(f'  tokenizer : {token_s * 1000:8.1f} ms  ({regex_s / token_s:.1f}x)')
+    if mismatched:
+        print(f'  name mismatches: {len(mismatched)} ({", ".join(mismatched[:5])})')
+
+
+if __name__ == '__main__':
+    main()
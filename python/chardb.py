@@ -0,0 +1,305 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+统一的角色数据库：一次性解析 src/data 下的全部角色数据源，合并为按规范化 id 索引的记录。
+
+数据源：
+- characters.ts      中文官方角色（_characters）与自制角色（custom_characters）
+- charactersEn.ts    英文自制角色（custom_characters_en）
+- roles.json         英文官方角色
+- fabled.ts/loric.ts 传奇 / Loric 角色（中英文由 isEnglish 三元表达式给出）
+- characterIdMapping.ts  CN_TO_EN_ID_MAP 中英文 id 映射
+
+解析结果缓存在 .cache/chardb.json，任一数据源内容变化（sha1）时自动重建。
+各对账脚本通过 load_db() 获取同一份快照，无需各自用正则重复解析；同一进程内数据源未变化时
+直接复用上次返回的对象，不再重复读取快照（watch.py 的各阶段都会调用 load_db()）。
+"""
+import argparse
+import hashlib
+import json
+import os
+import time
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from instrument import count, stage
+from ts_literal import iter_blocks, parse_literal
+
+ROOT = Path(__file__).resolve().parents[1]
+DATA_DIR = ROOT / 'src' / 'data'
+CHARACTERS_TS = DATA_DIR / 'characters.ts'
+CHARACTERS_EN_TS = DATA_DIR / 'charactersEn.ts'
+ROLES_JSON = DATA_DIR / 'roles.json'
+FABLED_TS = DATA_DIR / 'fabled.ts'
+LORIC_TS = DATA_DIR / 'loric.ts'
+MAPPING_TS = DATA_DIR / 'characterIdMapping.ts'
+
+SOURCES = {
+    'characters': CHARACTERS_TS,
+    'charactersEn': CHARACTERS_EN_TS,
+    'roles': ROLES_JSON,
+    'fabled': FABLED_TS,
+    'loric': LORIC_TS,
+    'mapping': MAPPING_TS,
+}
+
+SNAPSHOT_PATH = ROOT / '.cache' / 'chardb.json'
+# 记录结构或解析逻辑变化时递增
+SNAPSHOT_VERSION = 1
+
+DEFAULT_ICON_URL = 'https://oss.gstonegames.com/data_file/clocktower/web/icons/{}.png'
+
+
+def normalize_id(id_str: str) -> str:
+    """标准化 ID：移除下划线和连字符，转小写"""
+    if not id_str:
+        return ''
+    return id_str.replace('_', '').replace('-', '').lower().strip()
+
+
+# ---------------------------------------------------------------------------
+# 记录类型
+# ---------------------------------------------------------------------------
+
+@dataclass(slots=True)
+class Character:
+    """合并后的角色记录；中英文字段分别来自中文与英文数据源"""
+    key: str                      # 规范化 id（normalize_id(en_id)）
+    en_id: str = ''
+    cn_id: str = ''
+    team: str = ''
+    edition: str = ''
+    name_zh: str = ''
+    name_en: str = ''
+    ability_zh: str = ''
+    ability_en: str = ''
+    first_night: int = 0
+    other_night: int = 0
+    first_night_reminder_zh: str = ''
+    first_night_reminder_en: str = ''
+    other_night_reminder_zh: str = ''
+    other_night_reminder_en: str = ''
+    reminders_zh: List[str] = field(default_factory=list)
+    reminders_en: List[str] = field(default_factory=list)
+    setup: bool = False
+    image: str = ''
+    author: str = ''
+    sources: List[str] = field(default_factory=list)
+
+
+@dataclass(slots=True)
+class SourceRole:
+    """数据源中的单个原始条目（保留原始顺序与重复项，供查重/计数类脚本使用）"""
+    source: str                   # characters / custom / charactersEn / roles / fabled / loric
+    index: int
+    key: str                      # 对象字面量中的键（roles.json 为空）
+    data: Dict[str, Any]
+    lang: str = 'zh-CN'
+
+
+# ---------------------------------------------------------------------------
+# 数据源加载
+# ---------------------------------------------------------------------------
+
+def load_cn_to_en_map() -> Dict[str, str]:
+    data = MAPPING_TS.read_bytes()
+    return {b.key: b.value for b in iter_blocks(data, r'CN_TO_EN_ID_MAP\s*:[^=]*=')}
+
+
+def load_source_roles() -> List[SourceRole]:
+    roles: List[SourceRole] = []
+
+    text = CHARACTERS_TS.read_bytes()
+    for source, anchor in (('characters', r'const\s+_characters\s*='),
+                           ('custom', r'const\s+custom_characters\s*=')):
+        for i, block in enumerate(iter_blocks(text, anchor)):
+            roles.append(SourceRole(source, i, block.key, block.value, 'zh-CN'))
+
+    text = CHARACTERS_EN_TS.read_bytes()
+    for i, block in enumerate(iter_blocks(text, r'const\s+custom_characters_en\s*=')):
+        roles.append(SourceRole('charactersEn', i, block.key, block.value, 'en'))
+
+    with ROLES_JSON.open('r', encoding='utf-8') as f:
+        for i, data in enumerate(json.load(f)):
+            roles.append(SourceRole('roles', i, '', data or {}, 'en'))
+
+    for source, path in (('fabled', FABLED_TS), ('loric', LORIC_TS)):
+        text = path.read_bytes()
+        for lang, is_english in (('zh-CN', False), ('en', True)):
+            items = parse_literal(text, r'return', {'isEnglish': is_english})
+            for i, data in enumerate(items):
+                roles.append(SourceRole(source, i, '', data, lang))
+
+    return roles
+
+
+def build_characters(source_roles: Iterable[SourceRole], cn_to_en: Dict[str, str]) -> Dict[str, Character]:
+    """合并各数据源；同一语言内先出现的定义优先（与 TS 中对象展开的覆盖顺序一致的部分除外：
+    fabled / loric 在 TS 中最后展开、会覆盖同名键，这里同样让它们覆盖）"""
+    en_to_cn = {v: k for k, v in cn_to_en.items()}
+    db: Dict[str, Character] = {}
+
+    for role in source_roles:
+        data = role.data
+        rid = data.get('id') or role.key
+        if not rid:
+            continue
+        if role.lang == 'en':
+            en_id, cn_id = rid, en_to_cn.get(rid, rid)
+        else:
+            en_id, cn_id = cn_to_en.get(rid, rid), rid
+        key = normalize_id(en_id)
+
+        c = db.get(key)
+        if c is None:
+            c = db[key] = Character(key=key, en_id=en_id, cn_id=cn_id)
+        overriding = role.source in ('fabled', 'loric')
+        zh = role.lang == 'zh-CN'
+
+        def put(attr: str, value: Any):
+            if value in (None, '', []):
+                return
+            if overriding or not getattr(c, attr):
+                setattr(c, attr, value)
+
+        put('team', data.get('team'))
+        put('edition', data.get('edition'))
+        put('name_zh' if zh else 'name_en', data.get('name'))
+        put('ability_zh' if zh else 'ability_en', data.get('ability'))
+        put('first_night_reminder_zh' if zh else 'first_night_reminder_en', data.get('firstNightReminder'))
+        put('other_night_reminder_zh' if zh else 'other_night_reminder_en', data.get('otherNightReminder'))
+        put('reminders_zh' if zh else 'reminders_en', data.get('reminders'))
+        put('image', data.get('image'))
+        put('author', data.get('author'))
+        # 夜晚顺序以中文库为准（与 scriptGenerator 一致），中文缺失时用英文
+        if zh or not c.first_night:
+            put('first_night', data.get('firstNight'))
+        if zh or not c.other_night:
+            put('other_night', data.get('otherNight'))
+        if data.get('setup'):
+            c.setup = True
+        if role.source not in c.sources:
+            c.sources.append(role.source)
+
+    for c in db.values():
+        if not c.image:
+            c.image = DEFAULT_ICON_URL.format(c.cn_id)
+    return db
+
+
+# ---------------------------------------------------------------------------
+# 数据库与快照
+# ---------------------------------------------------------------------------
+
+class CharacterDB:
+    def __init__(self, characters: Dict[str, Character], source_roles: List[SourceRole],
+                 cn_to_en: Dict[str, str]):
+        self.characters = characters
+        self.source_roles = source_roles
+        self.cn_to_en = cn_to_en
+        self.en_to_cn = {v: k for k, v in cn_to_en.items()}
+
+    def __len__(self) -> int:
+        return len(self.characters)
+
+    def __iter__(self):
+        return iter(self.characters.values())
+
+    def key_of(self, any_id: str) -> str:
+        """任意中文/英文 id -> 规范化 id"""
+        return normalize_id(self.cn_to_en.get(any_id, any_id))
+
+    def get(self, any_id: str) -> Optional[Character]:
+        return self.characters.get(self.key_of(any_id))
+
+    def from_source(self, *sources: str, lang: Optional[str] = None) -> List[SourceRole]:
+        return [r for r in self.source_roles
+                if r.source in sources and (lang is None or r.lang == lang)]
+
+    def to_json(self) -> Dict[str, Any]:
+        return {
+            'characters': [asdict(c) for c in self.characters.values()],
+            'sourceRoles': [[r.source, r.index, r.key, r.data, r.lang] for r in self.source_roles],
+            'cnToEn': self.cn_to_en,
+        }
+
+    @classmethod
+    def from_json(cls, payload: Dict[str, Any]) -> 'CharacterDB':
+        characters = {c['key']: Character(**c) for c in payload['characters']}
+        source_roles = [SourceRole(*r) for r in payload['sourceRoles']]
+        return cls(characters, source_roles, payload['cnToEn'])
+
+
+def sources_digest() -> Dict[str, str]:
+    return {name: hashlib.sha1(path.read_bytes()).hexdigest() for name, path in SOURCES.items()}
+
+
+def build_db() -> CharacterDB:
+    count('bytes_parsed', sum(path.stat().st_size for path in SOURCES.values()))
+    cn_to_en = load_cn_to_en_map()
+    source_roles = load_source_roles()
+    return CharacterDB(build_characters(source_roles, cn_to_en), source_roles, cn_to_en)
+
+
+# 进程内最近一次返回的 (数据源哈希, 数据库)
+_LOADED: Optional[Tuple[Dict[str, str], CharacterDB]] = None
+
+
+def write_snapshot(db: CharacterDB, digest: Dict[str, str]):
+    with stage('chardb/write_snapshot'):
+        SNAPSHOT_PATH.parent.mkdir(parents=True, exist_ok=True)
+        tmp = SNAPSHOT_PATH.with_suffix('.tmp')
+        with tmp.open('w', encoding='utf-8') as f:
+            json.dump({'version': SNAPSHOT_VERSION, 'sources': digest, **db.to_json()},
+                      f, ensure_ascii=False, separators=(',', ':'))
+        os.replace(tmp, SNAPSHOT_PATH)
+
+
+def load_db(rebuild: bool = False, write: bool = True) -> CharacterDB:
+    """读取快照；数据源哈希不一致或快照不存在时重新解析并写回（write=False 时由调用方稍后
+    调用 write_snapshot()）"""
+    global _LOADED
+    with stage('chardb/digest'):
+        digest = sources_digest()
+    if not rebuild:
+        if _LOADED is not None and _LOADED[0] == digest:
+            count('chardb_memo_hits')
+            return _LOADED[1]
+        try:
+            with stage('chardb/load_snapshot'):
+                with SNAPSHOT_PATH.open('r', encoding='utf-8') as f:
+                    payload = json.load(f)
+                if payload.get('version') == SNAPSHOT_VERSION and payload.get('sources') == digest:
+                    count('chardb_snapshot_hits')
+                    db = CharacterDB.from_json(payload)
+                    _LOADED = (digest, db)
+                    return db
+        except (OSError, ValueError, KeyError, TypeError):
+            pass
+
+    with stage('chardb/parse'):
+        db = build_db()
+    if write:
+        write_snapshot(db, digest)
+    _LOADED = (digest, db)
+    return db
+
+
+def main():
+    parser = argparse.ArgumentParser(description='构建/查看统一角色数据库快照')
+    parser.add_argument('--rebuild', action='store_true', help='忽略快照，强制重新解析数据源')
+    parser.add_argument('ids', nargs='*', help='要查看的角色 id（中文或英文 id 均可）')
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    db = load_db(rebuild=args.rebuild)
+    elapsed = (time.perf_counter() - start) * 1000
+    print(f'{len(db)} characters, {len(db.source_roles)} source entries ({elapsed:.1f} ms) -> {SNAPSHOT_PATH}')
+    for any_id in args.ids:
+        c = db.get(any_id)
+        print(json.dumps(asdict(c), ensure_ascii=False, indent=2) if c else f'{any_id}: not found')
+
+
+if __name__ == '__main__':
+    main()
@@ -6,12 +6,16 @@
 
 import json
 
+from chardb import ROLES_JSON
+from instrument import count, stage
+
 def check_roles():
-    filepath = r'c:\Learning\sample\synchronous github\botc-script-tool\botc-script-generator-modern\src\data\roles.json'
+    filepath = ROLES_JSON
     
     print("正在加载 roles.json...")
-    with open(filepath, 'r', encoding='utf-8') as f:
+    with stage('load'), open(filepath, 'r', encoding='utf-8') as f:
         roles = json.load(f)
+    count('roles', len(roles))
     
     print(f"\n{'='*60}")
     print(f"总角色数: {len(roles)}")
@@ -65,8 +69,8 @@ def check_roles():
         team = role.get('team', 'unknown')
         team_counts[team] = team_counts.get(team, 0) + 1
     
-    for team, count in sorted(team_counts.items()):
-        print(f"  {team:15}: {count:3} 个")
+    for team, team_count in sorted(team_counts.items()):
+        print(f"  {team:15}: {team_count:3} 个")
     
     # 检查特定索引附近的角色
     print(f"\n🔍 检查索引 2533 附近的角色 (ganshiren 附近):")
@@ -4,18 +4,6 @@
 对比中英文角色数据,找出差异
 """
 
-import json
-import sys
-
-def load_json_file(filepath):
-    """加载JSON文件"""
-    try:
-        with open(filepath, 'r', encoding='utf-8') as f:
-            return json.load(f)
-    except Exception as e:
-        print(f"Error loading {filepath}: {e}")
-        return None
-
 def normalize_id(id_str):
     """标准化ID - 移除特殊字符,统一格式"""
     if not id_str:
@@ -122,63 +110,21 @@ def compare_roles(cn_roles, en_roles):
     return only_in_en, only_in_cn
 
 def main():
-    # 文件路径
-    cn_file = r'c:\Learning\sample\synchronous github\botc-script-tool\botc-script-generator-modern\src\data\roles.json'
-    en_file = r'c:\Learning\sample\synchronous github\botc-script-tool\botc-script-generator-modern\src\data\charactersEn.ts'
-    
-    print("正在加载中文角色数据...")
-    cn_roles = load_json_file(cn_file)
-    
-    if cn_roles is None:
-        print("❌ 无法加载中文角色数据")
-        return
-    
+    # 中英文数据均取自统一角色数据库快照（chardb），不再各自解析 TS 文件
+    from chardb import load_db
+    from instrument import count, stage
+
+    with stage('load'):
+        db = load_db()
+        cn_roles = [r.data for r in db.from_source('characters', 'custom', 'fabled', 'loric', lang='zh-CN')]
+        en_roles = [r.data for r in db.from_source('roles', 'charactersEn', 'fabled', 'loric', lang='en')]
+    count('roles', len(cn_roles) + len(en_roles))
     print(f"✅ 中文角色数据加载成功: {len(cn_roles)} 个角色")
-    
-    # 对于英文文件,我们需要先读取并提取JSON部分
-    print("\n正在加载英文角色数据...")
-    try:
-        with open(en_file, 'r', encoding='utf-8') as f:
-            content = f.read()
-            
-        # 尝试找到JSON数组
-        # 查找 export const CHARACTERS_EN 后的数组
-        import re
-        
-        # 尝试多种模式
-        patterns = [
-            r'export\s+const\s+CHARACTERS_EN\s*[:\=]\s*(\[[\s\S]*?\]);',
-            r'CHARACTERS_EN\s*[:\=]\s*(\[[\s\S]*?\]);',
-            r'=\s*(\[[\s\S]*?\]);',
-        ]
-        
-        json_str = None
-        for pattern in patterns:
-            match = re.search(pattern, content)
-            if match:
-                json_str = match.group(1)
-                break
-        
-        if not json_str:
-            print("❌ 无法从英文文件中提取角色数据")
-            print("文件内容预览:", content[:500])
-            return
-        
-        # 清理TypeScript特有的语法
-        json_str = re.sub(r'//.*?\n', '\n', json_str)  # 移除单行注释
-        json_str = re.sub(r'/\*[\s\S]*?\*/', '', json_str)  # 移除多行注释
-        
-        en_roles = json.loads(json_str)
-        print(f"✅ 英文角色数据加载成功: {len(en_roles)} 个角色")
-        
-    except Exception as e:
-        print(f"❌ 加载英文角色数据时出错: {e}")
-        import traceback
-        traceback.print_exc()
-        return
-    
+    print(f"✅ 英文角色数据加载成功: {len(en_roles)} 个角色")
+
     # 执行对比
-    compare_roles(cn_roles, en_roles)
+    with stage('compare'):
+        compare_roles(cn_roles, en_roles)
 
 if __name__ == '__main__':
     main()
@@ -0,0 +1,200 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+为 manifest 与 scripts/json 下的剧本文件生成预压缩副本：
+- .gz：gzip 最高压缩级别（始终生成）
+- .br：brotli 最高质量（仅在安装了 brotli 模块时生成）
+内容哈希未变化且压缩副本仍存在的文件不会重复压缩；源文件被原样重写（如 git checkout）时
+只把副本的 mtime 提到不早于源文件（serve_public.py 把比源文件旧的副本视为过期）。
+"""
+import argparse
+import gzip
+import json
+import os
+from pathlib import Path
+from typing import Any, Dict, List, Tuple
+
+from generate_manifest import (
+    CACHE_DIR,
+    JSON_ROOT,
+    SHARD_DIR,
+    content_hash,
+    detect_category,
+)
+
+try:
+    import brotli  # type: ignore
+except ImportError:  # brotli 为可选依赖
+    brotli = None
+
+COMPRESS_CACHE_PATH = CACHE_DIR / 'compress-cache.json'
+COMPRESS_CACHE_VERSION = 1
+# 压缩后未变小的文件不保留压缩副本
+MIN_SAVING_BYTES = 1
+
+
+def iter_targets() -> List[Tuple[Path, str]]:
+    """列出需要压缩的文件及其统计分类（manifest / official / official_mix / custom）"""
+    targets: List[Tuple[Path, str]] = []
+    if not JSON_ROOT.exists():
+        return targets
+
+    for p in sorted(JSON_ROOT.glob('*.json')):
+        targets.append((p, 'manifest'))
+    if SHARD_DIR.exists():
+        for p in sorted(SHARD_DIR.rglob('*.json')):
+            targets.append((p, 'manifest'))
+
+    for sub in sorted(JSON_ROOT.iterdir()):
+        if not sub.is_dir() or sub == SHARD_DIR:
+            continue
+        category = detect_category(sub)
+        for p in sorted(sub.rglob('*.json')):
+            targets.append((p, category))
+    return targets
+
+
+def load_cache() -> Dict[str, Any]:
+    try:
+        with COMPRESS_CACHE_PATH.open('r', encoding='utf-8') as f:
+            cache = json.load(f)
+        if cache.get('version') == COMPRESS_CACHE_VERSION and isinstance(cache.get('files'), dict):
+            return cache
+    except Exception:
+        pass
+    return {'version': COMPRESS_CACHE_VERSION, 'files': {}}
+
+
+def save_cache(cache: Dict[str, Any]):
+    CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    tmp = COMPRESS_CACHE_PATH.with_suffix('.tmp')
+    with tmp.open('w', encoding='utf-8') as f:
+        json.dump(cache, f, ensure_ascii=False, separators=(',', ':'))
+    os.replace(tmp, COMPRESS_CACHE_PATH)
+
+
+def gzip_bytes(raw: bytes) -> bytes:
+    # mtime=0 保证同样的输入得到同样的输出
+    return gzip.compress(raw, compresslevel=9, mtime=0)
+
+
+def brotli_bytes(raw: bytes) -> bytes:
+    return brotli.compress(raw, quality=11, mode=brotli.MODE_TEXT)
+
+
+def write_sibling(src: Path, ext: str, data: bytes, original_size: int) -> int:
+    """写出压缩副本并返回其大小；压缩无收益时删除已有副本并返回 0"""
+    dst = src.with_name(src.name + ext)
+    if original_size - len(data) < MIN_SAVING_BYTES:
+        if dst.exists():
+            dst.unlink()
+        return 0
+    dst.write_bytes(data)
+    return len(data)
+
+
+def refresh_sibling_mtime(src: Path, ext: str, src_mtime_ns: int):
+    dst = src.with_name(src.name + ext)
+    try:
+        st = dst.stat()
+    except OSError:
+        return
+    if st.st_mtime_ns < src_mtime_ns:
+        os.utime(dst, ns=(st.st_atime_ns, src_mtime_ns))
+
+
+def compress_all(force: bool = False) -> Dict[str, Dict[str, int]]:
+    """压缩所有目标文件，返回按分类汇总的字节统计"""
+    cache = {'version': COMPRESS_CACHE_VERSION, 'files': {}} if force else load_cache()
+    cached_files: Dict[str, Any] = cache['files']
+    next_files: Dict[str, Any] = {}
+    report: Dict[str, Dict[str, int]] = {}
+
+    for p, category in iter_targets():
+        key = str(p.relative_to(JSON_ROOT)).replace('\\', '/')
+        raw = p.read_bytes()
+        digest = content_hash(raw)
+        record = cached_files.get(key)
+
+        gz_path = p.with_name(p.name + '.gz')
+        br_path = p.with_name(p.name + '.br')
+        up_to_date = (
+            record is not None
+            and record['hash'] == digest
+            and (record['gz'] == 0 or gz_path.exists())
+            and (brotli is None or (record.get('br') is not None and (record['br'] == 0 or br_path.exists())))
+        )
+
+        if up_to_date:
+            gz_size, br_size = record['gz'], record.get('br')
+            src_mtime_ns = p.stat().st_mtime_ns
+            for ext in ('.gz', '.br'):
+                refresh_sibling_mtime(p, ext, src_mtime_ns)
+            reused = True
+        else:
+            gz_size = write_sibling(p, '.gz', gzip_bytes(raw), len(raw))
+            br_size = write_sibling(p, '.br', brotli_bytes(raw), len(raw)) if brotli is not None else None
+            reused = False
+
+        next_files[key] = {'hash': digest, 'gz': gz_size, 'br': br_size}
+
+        stat = report.setdefault(category, {
+            'files': 0, 'recompressed': 0, 'bytes': 0,
+            'gzipBytes': 0, 'gzipSaved': 0, 'brotliBytes': 0, 'brotliSaved': 0,
+        })
+        stat['files'] += 1
+        stat['recompressed'] += 0 if reused else 1
+        stat['bytes'] += len(raw)
+        # 未生成副本的文件按原始大小传输
+        stat['gzipBytes'] += gz_size or len(raw)
+        stat['gzipSaved'] += len(raw) - gz_size if gz_size else 0
+        if br_size is not None:
+            stat['brotliBytes'] += br_size or len(raw)
+            stat['brotliSaved'] += len(raw) - br_size if br_size else 0
+
+    # 源文件已删除的，连同其压缩副本一起清理
+    for key in set(cached_files) - set(next_files):
+        src = JSON_ROOT / key
+        for ext in ('.gz', '.br'):
+            sibling = src.with_name(src.name + ext)
+            if sibling.exists():
+                sibling.unlink()
+
+    cache['files'] = next_files
+    save_cache(cache)
+    return report
+
+
+def print_report(report: Dict[str, Dict[str, int]]):
+    print(f"{'category':14} {'files':>6} {'redo':>6} {'raw':>10} {'gzip':>10} {'saved':>10} {'brotli':>10} {'saved':>10}")
+    total = {k: 0 for k in ('files', 'recompressed', 'bytes', 'gzipBytes', 'gzipSaved', 'brotliBytes', 'brotliSaved')}
+    for category, stat in sorted(report.items()):
+        for k in total:
+            total[k] += stat[k]
+        _print_row(category, stat)
+    _print_row('total', total)
+    if brotli is None:
+        print('brotli module not installed: .br files skipped (pip install brotli)')
+
+
+def _print_row(label: str, stat: Dict[str, int]):
+    br = f"{stat['brotliBytes']:>10} {stat['brotliSaved']:>10}" if brotli is not None else f"{'-':>10} {'-':>10}"
+    print(f"{label:14} {stat['files']:>6} {stat['recompressed']:>6} {stat['bytes']:>10} "
+          f"{stat['gzipBytes']:>10} {stat['gzipSaved']:>10} {br}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description='生成 manifest 与剧本 JSON 的 .gz/.br 预压缩副本')
+    parser.add_argument('--force', action='store_true', help='忽略缓存，重新压缩所有文件')
+    parser.add_argument('--json', action='store_true', help='以 JSON 格式输出统计结果')
+    args = parser.parse_args()
+
+    report = compress_all(force=args.force)
+    if args.json:
+        print(json.dumps(report, ensure_ascii=False, indent=2))
+    else:
+        print_report(report)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,382 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+剧本库统计：把 public/scripts/json 下的全部剧本载入 NumPy 布尔矩阵（剧本 × 角色），
+向量化计算：
+- 角色出现频率（每个角色出现在多少个剧本中），以及在 official / official_mix / custom 各分类中的频率
+- 角色共现矩阵：一次矩阵乘法 Mᵀ·M（按行分块累加，限制 float32 副本的内存），
+  同时给出 lift = 共现数 × 剧本数 / (频率A × 频率B)，> 1 表示比随机搭配更常一起出现
+- 按阵营（每个剧本的平均角色数、最常见角色）与按角色版本（tb / bmr / snv / 实验角色 ...，
+  各分类中角色位的占比）的统计
+- 相克触发次数：jinx_index.py 编译的每个相克对在多少个剧本中同时出现（标出 jinxEn.json 中是否有该条）
+
+角色识别与 script_summary.role_set() 一致（id 经 CN_TO_EN_ID_MAP 规范化为英文 id，再按名字回退）；
+无法识别的自定义角色不进入矩阵，只计数。每个剧本解析出的角色列表缓存在 .cache/analytics-cache.json，
+mtime/size 未变的剧本不再读取，10 万个剧本的重复统计主要耗时在矩阵运算上。
+
+输出（默认 .cache/analytics/，--out 指定）：
+- analytics.json  紧凑 JSON：汇总、角色频率、阵营/版本统计、lift 最高与共现最多的角色对、相克触发次数
+- roles.csv / pairs.csv / jinxes.csv / teams.csv / editions.csv（UTF-8 BOM，便于 Excel 直接打开）
+
+依赖 numpy（可选依赖，pip install numpy）。
+"""
+import argparse
+import csv
+import json
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+try:
+    import numpy as np  # type: ignore
+except ImportError:  # numpy 为可选依赖
+    np = None
+
+from chardb import load_db
+from generate_manifest import (CACHE_DIR, CATEGORIES, JSON_ROOT, PARALLEL_THRESHOLD, default_workers,
+                               iter_script_files, parse_json_bytes)
+from instrument import count, stage
+from jinx_index import jinx_index
+from script_summary import TEAMS, role_index, role_set, sources_hash
+
+CACHE_PATH = CACHE_DIR / 'analytics-cache.json'
+# 角色提取逻辑变化时递增，使旧缓存整体失效
+CACHE_VERSION = 1
+DEFAULT_OUT_DIR = CACHE_DIR / 'analytics'
+CUSTOM_PREFIX = 'custom:'
+# 共现矩阵按行分块累加，每块的 float32 副本不超过 ROW_CHUNK × 角色数
+ROW_CHUNK = 16384
+# analytics.json 中列出的角色对数量（CSV 中为全部共现对）
+TOP_PAIRS = 100
+# 计算 lift 时要求的最少共现剧本数，避免小样本的极端值
+MIN_PAIR_COUNT = 3
+# 角色版本为空时的显示名（实验角色、旅行者等）
+NO_EDITION = 'other'
+
+
+def _extract_roles(path: str) -> Tuple[List[str], int]:
+    """解析单个剧本，返回 (已识别角色 id 列表, 自定义角色数)（可在子进程中执行）"""
+    roles = role_set(parse_json_bytes(Path(path).read_bytes()))
+    official = sorted(r for r in roles if not r.startswith(CUSTOM_PREFIX))
+    return official, len(roles) - len(official)
+
+
+def load_cache(options: Dict[str, Any]) -> Dict[str, Any]:
+    try:
+        with CACHE_PATH.open('r', encoding='utf-8') as f:
+            cache = json.load(f)
+        if (cache.get('version') == CACHE_VERSION and cache.get('options') == options
+                and isinstance(cache.get('files'), dict)):
+            return cache
+    except Exception:
+        pass
+    return {'version': CACHE_VERSION, 'options': options, 'files': {}}
+
+
+def save_cache(cache: Dict[str, Any]):
+    CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    tmp = CACHE_PATH.with_suffix('.tmp')
+    with tmp.open('w', encoding='utf-8') as f:
+        json.dump(cache, f, ensure_ascii=False, separators=(',', ':'))
+    os.replace(tmp, CACHE_PATH)
+
+
+def collect_role_lists(full: bool = False, workers: Optional[int] = None,
+                       stats: Optional[Dict[str, int]] = None) -> List[Dict[str, Any]]:
+    """按 iter_script_files() 顺序返回各剧本的 {key, category, roles, custom}"""
+    if stats is None:
+        stats = {}
+    stats.update({'reused': 0, 'parsed': 0})
+    if workers is None:
+        workers = default_workers()
+    options = {'dataHash': sources_hash()}
+    with stage('load_cache'):
+        cache = load_cache(options)
+    cached: Dict[str, Any] = {} if full else cache['files']
+    files: Dict[str, Any] = {}
+    scripts: List[Tuple[str, str]] = []
+    jobs: List[Tuple[str, str, os.stat_result]] = []
+
+    with stage('stat'):
+        for jf, category in iter_script_files():
+            key = jf.relative_to(JSON_ROOT).as_posix()
+            scripts.append((key, category))
+            st = jf.stat()
+            record = cached.get(key)
+            if record and record['mtime_ns'] == st.st_mtime_ns and record['size'] == st.st_size:
+                files[key] = record
+            else:
+                jobs.append((key, str(jf), st))
+    stats['reused'] = len(files)
+    stats['parsed'] = len(jobs)
+    count('files_read', len(jobs))
+
+    with stage('extract'):
+        paths = [path for _, path, _ in jobs]
+        if workers > 1 and len(paths) >= PARALLEL_THRESHOLD:
+            # 先在主进程中构建角色表，子进程 fork 后直接复用
+            role_index()
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                chunksize = max(1, len(paths) // (workers * 4))
+                results = list(pool.map(_extract_roles, paths, chunksize=chunksize))
+        else:
+            results = [_extract_roles(path) for path in paths]
+    for (key, _, st), (roles, custom) in zip(jobs, results):
+        files[key] = {'mtime_ns': st.st_mtime_ns, 'size': st.st_size, 'roles': roles, 'custom': custom}
+
+    if jobs or len(files) != len(cached):
+        with stage('save_cache'):
+            save_cache({'version': CACHE_VERSION, 'options': options, 'files': files})
+    return [{'key': key, 'category': category, **files[key]} for key, category in scripts]
+
+
+class CorpusMatrix:
+    """剧本 × 角色的布尔矩阵及各项统计"""
+
+    def __init__(self, scripts: List[Dict[str, Any]]):
+        db = load_db()
+        index = role_index()
+        ids = set(index.team)
+        for s in scripts:
+            ids.update(s['roles'])
+        self.role_ids: List[str] = sorted(ids)
+        column = {rid: i for i, rid in enumerate(self.role_ids)}
+        # 版本取 roles.json（合并后的 chardb 记录中 characters.ts 的 edition 字段优先，多为 custom）
+        role_editions = {r.data.get('id'): r.data.get('edition') for r in db.from_source('roles')}
+        self.teams: List[str] = []
+        self.editions: List[str] = []
+        self.names: List[str] = []
+        for rid in self.role_ids:
+            c = db.get(rid)
+            self.teams.append(index.team.get(rid) or (c.team if c else '') or '')
+            self.editions.append(role_editions.get(rid) or NO_EDITION)
+            self.names.append((c.name_zh or c.name_en) if c else rid)
+
+        self.keys = [s['key'] for s in scripts]
+        self.categories = list(CATEGORIES)
+        for s in scripts:
+            if s['category'] not in self.categories:
+                self.categories.append(s['category'])
+        category_index = {c: i for i, c in enumerate(self.categories)}
+        self.script_category = np.fromiter((category_index[s['category']] for s in scripts), dtype=np.int32,
+                                           count=len(scripts))
+        self.custom = np.fromiter((s['custom'] for s in scripts), dtype=np.int32, count=len(scripts))
+
+        lengths = np.fromiter((len(s['roles']) for s in scripts), dtype=np.int64, count=len(scripts))
+        rows = np.repeat(np.arange(len(scripts)), lengths)
+        cols = np.fromiter((column[r] for s in scripts for r in s['roles']), dtype=np.int64,
+                           count=int(lengths.sum()))
+        self.matrix = np.zeros((len(scripts), len(self.role_ids)), dtype=bool)
+        self.matrix[rows, cols] = True
+
+    @property
+    def n_scripts(self) -> int:
+        return self.matrix.shape[0]
+
+    def frequencies(self) -> 'np.ndarray':
+        return self.matrix.sum(axis=0, dtype=np.int64)
+
+    def category_frequencies(self) -> 'np.ndarray':
+        """分类 × 角色的出现次数：分类 one-hot 矩阵的转置乘以 M"""
+        onehot = np.zeros((self.n_scripts, len(self.categories)), dtype=np.float32)
+        onehot[np.arange(self.n_scripts), self.script_category] = 1
+        return self._chunked_product(onehot, self.matrix)
+
+    def cooccurrence(self) -> 'np.ndarray':
+        """角色 × 角色的共现剧本数（对角线即频率）"""
+        return self._chunked_product(self.matrix, self.matrix)
+
+    def _chunked_product(self, left: 'np.ndarray', right: 'np.ndarray') -> 'np.ndarray':
+        # float32 走 BLAS；计数不超过 2^24 时结果精确
+        out = np.zeros((left.shape[1], right.shape[1]), dtype=np.float32)
+        for start in range(0, self.n_scripts, ROW_CHUNK):
+            a = left[start:start + ROW_CHUNK].astype(np.float32, copy=False)
+            b = right[start:start + ROW_CHUNK].astype(np.float32, copy=False)
+            out += a.T @ b
+        return np.rint(out).astype(np.int64)
+
+    def onehot(self, labels: List[str]) -> Tuple[List[str], 'np.ndarray']:
+        """角色 -> 标签（阵营 / 版本）的 one-hot 矩阵"""
+        names = sorted(set(labels), key=lambda t: (TEAMS.index(t) if t in TEAMS else len(TEAMS), t))
+        index = {t: i for i, t in enumerate(names)}
+        m = np.zeros((len(labels), len(names)), dtype=np.int64)
+        m[np.arange(len(labels)), [index[t] for t in labels]] = 1
+        return names, m
+
+
+def analyze(cm: CorpusMatrix, top_pairs: int = TOP_PAIRS) -> Tuple[Dict[str, Any], List[List[Any]]]:
+    """返回 (汇总结果, 全部共现角色对 [a, b, 剧本数, lift]，按剧本数降序)"""
+    n = cm.n_scripts
+    with stage('frequencies'):
+        freq = cm.frequencies()
+        by_category = cm.category_frequencies()
+        scripts_per_category = np.bincount(cm.script_category, minlength=len(cm.categories))
+    with stage('cooccurrence'):
+        co = cm.cooccurrence()
+
+    with stage('breakdowns'):
+        team_names, team_onehot = cm.onehot(cm.teams)
+        # 每个剧本各阵营的角色数：M · (角色 -> 阵营)
+        per_script_team = cm.matrix.astype(np.int32) @ team_onehot.astype(np.int32)
+        teams = {}
+        for j, team in enumerate(team_names):
+            members = np.flatnonzero(team_onehot[:, j])
+            top = members[np.argsort(-freq[members], kind='stable')][:5]
+            teams[team or 'unknown'] = {
+                'roles': int(len(members)),
+                'used': int((freq[members] > 0).sum()),
+                'meanPerScript': round(float(per_script_team[:, j].mean()) if n else 0.0, 3),
+                'top': [[cm.role_ids[i], int(freq[i])] for i in top if freq[i] > 0],
+            }
+        edition_names, edition_onehot = cm.onehot(cm.editions)
+        # 分类 × 版本的角色位数：(分类 × 角色) · (角色 -> 版本)
+        slots = by_category @ edition_onehot
+        editions = {}
+        for j, edition in enumerate(edition_names):
+            editions[edition] = {
+                'roles': int(edition_onehot[:, j].sum()),
+                'slots': int(slots[:, j].sum()),
+                'share': round(float(slots[:, j].sum() / max(1, slots.sum())), 4),
+                'byCategory': {c: round(float(slots[i, j] / max(1, slots[i].sum())), 4)
+                               for i, c in enumerate(cm.categories) if scripts_per_category[i]},
+            }
+
+    with stage('pairs'):
+        upper = np.triu_indices(len(cm.role_ids), k=1)
+        counts = co[upper]
+        expected = freq[upper[0]] * freq[upper[1]]
+        lift = np.divide(counts * n, expected, out=np.zeros(len(counts), dtype=np.float64), where=expected > 0)
+        nonzero = np.flatnonzero(counts)
+        by_count = nonzero[np.lexsort((-lift[nonzero], -counts[nonzero]))]
+        reliable = nonzero[counts[nonzero] >= MIN_PAIR_COUNT]
+        by_lift = reliable[np.lexsort((-counts[reliable], -lift[reliable]))]
+
+        def pair_rows(selection: 'np.ndarray') -> List[List[Any]]:
+            return [[cm.role_ids[upper[0][i]], cm.role_ids[upper[1][i]], int(counts[i]), round(float(lift[i]), 3)]
+                    for i in selection]
+
+    with stage('jinxes'):
+        column = {rid: i for i, rid in enumerate(cm.role_ids)}
+        jinxes = []
+        for (a, b), reasons in jinx_index().pairs.items():
+            ia, ib = column.get(a), column.get(b)
+            triggered = int(co[ia, ib]) if ia is not None and ib is not None else 0
+            jinxes.append([a, b, triggered, 'en' in reasons, 'zh-CN' in reasons])
+        jinxes.sort(key=lambda j: (-j[2], j[0], j[1]))
+
+    return {
+        'version': 1,
+        'scripts': n,
+        'roles': len(cm.role_ids),
+        'usedRoles': int((freq > 0).sum()),
+        'customRoles': int(cm.custom.sum()),
+        'meanRolesPerScript': round(float(cm.matrix.sum() / n) if n else 0.0, 3),
+        'categories': {c: int(scripts_per_category[i]) for i, c in enumerate(cm.categories)},
+        'frequencies': [[cm.role_ids[i], cm.teams[i], cm.editions[i], int(freq[i]),
+                         *(int(by_category[c, i]) for c in range(len(cm.categories)))]
+                        for i in np.argsort(-freq, kind='stable')],
+        'teams': teams,
+        'editions': editions,
+        'topPairs': pair_rows(by_count[:top_pairs]),
+        'topLift': pair_rows(by_lift[:top_pairs]),
+        'jinxes': jinxes,
+    }, pair_rows(by_count)
+
+
+def write_csv(path: Path, header: List[str], rows: List[List[Any]]):
+    with path.open('w', encoding='utf-8-sig', newline='') as f:
+        writer = csv.writer(f)
+        writer.writerow(header)
+        writer.writerows(rows)
+
+
+def export(result: Dict[str, Any], all_pairs: List[List[Any]], cm: CorpusMatrix, out_dir: Path) -> List[Path]:
+    out_dir.mkdir(parents=True, exist_ok=True)
+    names = dict(zip(cm.role_ids, cm.names))
+    n = max(1, result['scripts'])
+    written = []
+
+    path = out_dir / 'analytics.json'
+    with path.open('w', encoding='utf-8') as f:
+        json.dump({**result, 'columns': {'frequencies': ['id', 'team', 'edition', 'scripts', *cm.categories],
+                                         'pairs': ['a', 'b', 'scripts', 'lift'],
+                                         'jinxes': ['a', 'b', 'scripts', 'en', 'zh-CN']}},
+                  f, ensure_ascii=False, separators=(',', ':'))
+    written.append(path)
+
+    tables = {
+        'roles.csv': (['id', 'name', 'team', 'edition', 'scripts', 'share', *cm.categories],
+                      [[rid, names[rid], team, edition, c, round(c / n, 4), *rest]
+                       for rid, team, edition, c, *rest in result['frequencies']]),
+        'pairs.csv': (['a', 'b', 'nameA', 'nameB', 'scripts', 'lift'],
+                      [[a, b, names[a], names[b], c, lift] for a, b, c, lift in all_pairs]),
+        'jinxes.csv': (['a', 'b', 'nameA', 'nameB', 'scripts', 'inJinxEn', 'inJinxTs'],
+                       [[a, b, names.get(a, a), names.get(b, b), c, int(en), int(zh)]
+                        for a, b, c, en, zh in result['jinxes']]),
+        'teams.csv': (['team', 'roles', 'used', 'meanPerScript'],
+                      [[t, v['roles'], v['used'], v['meanPerScript']] for t, v in result['teams'].items()]),
+        'editions.csv': (['edition', 'roles', 'slots', 'share', *cm.categories],
+                         [[e, v['roles'], v['slots'], v['share'], *(v['byCategory'].get(c, '') for c in cm.categories)]
+                          for e, v in result['editions'].items()]),
+    }
+    for name, (header, rows) in tables.items():
+        path = out_dir / name
+        write_csv(path, header, rows)
+        written.append(path)
+    return written
+
+
+def print_report(result: Dict[str, Any], limit: int = 10):
+    print(f"{result['scripts']} scripts, {result['usedRoles']}/{result['roles']} roles used, "
+          f"{result['meanRolesPerScript']} roles per script, {result['customRoles']} custom roles")
+    print('Most used roles:')
+    for rid, team, _, c, *_ in result['frequencies'][:limit]:
+        print(f'  {c:7}  {rid:24} {team}')
+    print('Most frequent pairs (scripts, lift):')
+    for a, b, c, lift in result['topPairs'][:limit]:
+        print(f'  {c:7}  {a} + {b}  ({lift})')
+    triggered = [j for j in result['jinxes'] if j[2]]
+    print(f"Jinxes triggered in at least one script: {len(triggered)}/{len(result['jinxes'])}")
+    for a, b, c, _, _ in triggered[:limit]:
+        print(f'  {c:7}  {a} + {b}')
+
+
+def main():
+    parser = argparse.ArgumentParser(description='剧本库角色频率、共现、阵营/版本与相克触发统计（需要 numpy）')
+    parser.add_argument('--out', type=Path, default=DEFAULT_OUT_DIR, help=f'输出目录（默认 {DEFAULT_OUT_DIR}）')
+    parser.add_argument('--full', action='store_true', help='忽略缓存，重新解析所有剧本')
+    parser.add_argument('--workers', type=int, default=default_workers(), help='并行解析的进程数（默认 CPU 核数）')
+    parser.add_argument('--top', type=int, default=TOP_PAIRS, help=f'analytics.json 中列出的角色对数（默认 {TOP_PAIRS}）')
+    parser.add_argument('--quiet', action='store_true', help='不打印统计摘要')
+    args = parser.parse_args()
+
+    if np is None:
+        print('numpy 未安装，无法统计（pip install numpy）', file=sys.stderr)
+        sys.exit(1)
+
+    start = time.perf_counter()
+    stats: Dict[str, int] = {}
+    with stage('collect'):
+        scripts = collect_role_lists(full=args.full, workers=args.workers, stats=stats)
+    loaded = time.perf_counter()
+    with stage('matrix'):
+        cm = CorpusMatrix(scripts)
+    with stage('analyze'):
+        result, all_pairs = analyze(cm, top_pairs=args.top)
+    computed = time.perf_counter()
+    with stage('export'):
+        written = export(result, all_pairs, cm, args.out)
+
+    if not args.quiet:
+        print_report(result)
+    print(f"Analyzed {cm.n_scripts} scripts x {len(cm.role_ids)} roles "
+          f"(parsed {stats['parsed']}, cached {stats['reused']}): load {(loaded - start) * 1000:.0f} ms, "
+          f"compute {(computed - loaded) * 1000:.0f} ms, total {(time.perf_counter() - start) * 1000:.0f} ms "
+          f"-> {args.out} ({', '.join(p.name for p in written)})")
+
+
+if __name__ == '__main__':
+    main()
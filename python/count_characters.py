@@ -4,31 +4,27 @@
 统计 characters.ts 中实际有多少角色
 """
 
-import re
-import json
+from collections import Counter
+
+from chardb import load_db
+
 
 def count_characters_in_ts():
-    # 读取 characters.ts
-    cn_file = r'c:\Learning\sample\synchronous github\botc-script-tool\botc-script-generator-modern\src\data\characters.ts'
-    
     print("正在分析 characters.ts...")
-    with open(cn_file, 'r', encoding='utf-8') as f:
-        content = f.read()
-    
-    # 查找所有的 id: 定义
-    id_pattern = r"id:\s*['\"]([^'\"]+)['\"]"
-    ids = re.findall(id_pattern, content)
-    
+    db = load_db()
+    cn_entries = db.from_source('characters', 'custom')
+    ids = [r.data.get('id') or r.key for r in cn_entries]
+
     print(f"\n{'='*60}")
     print(f"在 characters.ts 中找到的 id 定义: {len(ids)} 个")
+    print(f"  官方角色 (_characters): {len(db.from_source('characters'))} 个")
+    print(f"  自制角色 (custom_characters): {len(db.from_source('custom'))} 个")
     print(f"{'='*60}\n")
-    
+
     # 统计重复
-    from collections import Counter
     id_counts = Counter(ids)
-    
     duplicates = {id_val: count for id_val, count in id_counts.items() if count > 1}
-    
+
     if duplicates:
         print(f"🔴 发现重复ID ({len(duplicates)} 个):")
         print("-" * 60)
@@ -36,38 +32,29 @@ def count_characters_in_ts():
             print(f"  {id_val:30} 出现 {count} 次")
     else:
         print("✅ 没有发现重复ID")
-    
-    # 检查是否导入了 fabled
-    if 'fabled' in content.lower():
-        print(f"\n✅ characters.ts 导入了 fabled 角色")
-        
-        # 读取 fabled.ts
-        fabled_file = r'c:\Learning\sample\synchronous github\botc-script-tool\botc-script-generator-modern\src\data\fabled.ts'
-        try:
-            with open(fabled_file, 'r', encoding='utf-8') as f:
-                fabled_content = f.read()
-            
-            fabled_ids = re.findall(id_pattern, fabled_content)
-            print(f"   在 fabled.ts 中找到: {len(fabled_ids)} 个传奇角色")
-            print(f"   传奇角色列表: {', '.join(fabled_ids)}")
-        except:
-            print("   ⚠️  无法读取 fabled.ts")
-    
+
+    # 对象键与 id 字段不一致的条目
+    mismatched = [r for r in cn_entries if r.data.get('id') and r.data['id'] != r.key]
+    if mismatched:
+        print(f"\n⚠️  对象键与 id 字段不一致 ({len(mismatched)} 个):")
+        for r in mismatched:
+            print(f"  {r.key:30} -> {r.data['id']}")
+
+    fabled_ids = [r.data.get('id') for r in db.from_source('fabled', lang='zh-CN')]
+    loric_ids = [r.data.get('id') for r in db.from_source('loric', lang='zh-CN')]
+    print(f"\n   在 fabled.ts 中找到: {len(fabled_ids)} 个传奇角色")
+    print(f"   传奇角色列表: {', '.join(fabled_ids)}")
+    print(f"   在 loric.ts 中找到: {len(loric_ids)} 个 Loric 角色")
+
+    roles_count = len(db.from_source('roles'))
     print(f"\n📊 预估总角色数:")
     print("-" * 60)
-    print(f"  roles.json: 213 个")
-    
-    # 尝试估算传奇角色数
-    if 'fabled' in content.lower():
-        try:
-            with open(r'c:\Learning\sample\synchronous github\botc-script-tool\botc-script-generator-modern\src\data\fabled.ts', 'r', encoding='utf-8') as f:
-                fabled_content = f.read()
-            fabled_ids = re.findall(id_pattern, fabled_content)
-            print(f"  + fabled: {len(fabled_ids)} 个")
-            print(f"  = 总计: {213 + len(fabled_ids)} 个")
-        except:
-            print(f"  + fabled: ? 个 (无法读取)")
-            print(f"  = 总计: 213 + ? 个")
+    print(f"  roles.json: {roles_count} 个")
+    print(f"  + fabled: {len(fabled_ids)} 个")
+    print(f"  + loric: {len(loric_ids)} 个")
+    print(f"  = 总计: {roles_count + len(fabled_ids) + len(loric_ids)} 个")
+    print(f"  合并后的角色库（按规范化 id 去重）: {len(db)} 个")
+
 
 if __name__ == '__main__':
     count_characters_in_ts()
@@ -0,0 +1,152 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+生成角色查找表 src/data/characterLookup.ts，供 scriptGenerator.ts 以 O(1) 解析导入剧本中的角色：
+- ZH_NAME_TO_ID        中文名 -> CHARACTERS 中的 id
+- EN_NAME_TO_ID        英文名 -> CHARACTERS_EN 中的 id
+- NORMALIZED_ID_TO_ID  规范化 id（去 _ / -，小写）-> 规范 id（英文 id）
+- CN_ID_TO_EN_ID / EN_ID_TO_CN_ID  全量中英文 id 对照
+- PINYIN_TO_ID         PINYIN_MAP 中的拼音 -> CHARACTERS 中的 id
+
+字典按 characters.ts / charactersEn.ts 的展开顺序（官方、自制、传奇、Loric）合并，与运行时一致；
+同名查找取迭代顺序中的第一个，与 findCharacterIdByName() 的线性扫描结果相同。
+
+一个键对应多个不同角色（冲突）时输出到 stderr 并以状态 1 退出，且不写文件。
+唯一的例外是 Loric 版与同名传奇角色（如 gardener / gardener_loric）：两者有意并存，
+按运行时顺序取传奇版本。--check 只比对已提交的文件是否为最新。
+"""
+import argparse
+import json
+import sys
+from typing import Any, Dict, List
+
+from chardb import DATA_DIR, CharacterDB, load_db, normalize_id
+from pinyin_table import parse_pinyin_map
+
+OUTPUT_TS = DATA_DIR / 'characterLookup.ts'
+
+HEADER = '''// 此文件由 python/gen_lookup_tables.py 自动生成，请勿手动修改。
+// 数据源变化后运行：python ./python/gen_lookup_tables.py
+'''
+
+# 对应 CHARACTERS = { ..._characters, ...custom_characters, ...fabledDict, ...loricDict }
+ZH_ORDER = (('characters', None), ('custom', None), ('fabled', 'zh-CN'), ('loric', 'zh-CN'))
+# 对应 CHARACTERS_EN = { ..._charactersEn, ...custom_characters_en, ...fabledDict, ...loricDict }
+EN_ORDER = (('roles', None), ('charactersEn', None), ('fabled', 'en'), ('loric', 'en'))
+
+
+def runtime_dict(db: CharacterDB, order) -> Dict[str, Dict[str, Any]]:
+    """按对象展开语义合并：后者覆盖前者的值，但键保持首次出现的位置"""
+    merged: Dict[str, Dict[str, Any]] = {}
+    for source, lang in order:
+        for role in db.from_source(source, lang=lang):
+            key = role.key or role.data.get('id')
+            if not key:
+                continue
+            data = dict(role.data)
+            if source == 'roles':
+                data['name'] = data.get('name') or key
+            merged[key] = data
+    return merged
+
+
+LORIC_SUFFIX = '_loric'
+
+
+def is_loric_twin(a: str, b: str) -> bool:
+    return b == a + LORIC_SUFFIX or a == b + LORIC_SUFFIX
+
+
+class Table:
+    """键 -> id，记录映射到不同 id 的冲突"""
+
+    def __init__(self, name: str):
+        self.name = name
+        self.map: Dict[str, str] = {}
+        self.collisions: Dict[str, List[str]] = {}
+
+    def add(self, key: str, value: str, same=None):
+        if not key:
+            return
+        current = self.map.get(key)
+        if current is None:
+            self.map[key] = value
+        elif current != value and not (same and same(current, value)):
+            self.collisions.setdefault(key, [current]).append(value)
+
+
+def build_tables(db: CharacterDB) -> List[Table]:
+    zh = runtime_dict(db, ZH_ORDER)
+    en = runtime_dict(db, EN_ORDER)
+    # 同一角色的中英文 id 视为同一个值（冲突判断时）
+    same_role = lambda a, b: db.key_of(a) == db.key_of(b)
+
+    zh_names = Table('ZH_NAME_TO_ID')
+    for key, data in zh.items():
+        zh_names.add(data.get('name', ''), key, is_loric_twin)
+
+    en_names = Table('EN_NAME_TO_ID')
+    for key, data in en.items():
+        en_names.add(data.get('name', ''), key, is_loric_twin)
+
+    normalized = Table('NORMALIZED_ID_TO_ID')
+    for key in list(en) + list(zh):
+        normalized.add(normalize_id(key), db.cn_to_en.get(key, key), same_role)
+
+    cn_to_en = Table('CN_ID_TO_EN_ID')
+    en_to_cn = Table('EN_ID_TO_CN_ID')
+    for key in zh:
+        en_id = db.cn_to_en.get(key, key)
+        if en_id in en:
+            cn_to_en.add(key, en_id)
+            en_to_cn.add(en_id, key)
+
+    pinyin = Table('PINYIN_TO_ID')
+    pinyin_map = parse_pinyin_map()
+    for name, key in zh_names.map.items():
+        pinyin.add(pinyin_map.get(name, ''), key)
+
+    return [zh_names, en_names, normalized, cn_to_en, en_to_cn, pinyin]
+
+
+def render_ts(tables: List[Table]) -> str:
+    parts = [HEADER]
+    for table in tables:
+        lines = ''.join(f'  {json.dumps(k, ensure_ascii=False)}: {json.dumps(v, ensure_ascii=False)},\n'
+                        for k, v in sorted(table.map.items()))
+        parts.append(f'\nexport const {table.name}: Record<string, string> = {{\n{lines}}};\n')
+    return ''.join(parts)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='生成角色名/id/拼音查找表（src/data/characterLookup.ts）')
+    parser.add_argument('--check', action='store_true', help='只检查已生成的文件是否为最新，不写入')
+    args = parser.parse_args()
+
+    tables = build_tables(load_db())
+
+    failed = False
+    for table in tables:
+        for key, values in sorted(table.collisions.items()):
+            failed = True
+            print(f'error: {table.name} 冲突 {key!r} -> {", ".join(values)}', file=sys.stderr)
+    if failed:
+        sys.exit(1)
+
+    content = render_ts(tables)
+    current = OUTPUT_TS.read_text(encoding='utf-8') if OUTPUT_TS.exists() else ''
+    if args.check:
+        if current != content:
+            print(f'{OUTPUT_TS} 已过期，请运行 python ./python/gen_lookup_tables.py', file=sys.stderr)
+            sys.exit(1)
+        print(f'{OUTPUT_TS.name} is up to date')
+        return
+
+    if current != content:
+        OUTPUT_TS.write_text(content, encoding='utf-8', newline='\n')
+    sizes = ', '.join(f'{t.name}={len(t.map)}' for t in tables)
+    print(f'Lookup tables -> {OUTPUT_TS} ({sizes})')
+
+
+if __name__ == '__main__':
+    main()
@@ -1,13 +1,40 @@
+import argparse
+import codecs
+import io
 import json
 import hashlib
+import os
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from typing import Dict, Any, List, Union
+from typing import Dict, Any, BinaryIO, List, Optional, Union, Tuple
+
+from instrument import count, stage
 
 
 ROOT = Path(__file__).resolve().parents[1]
 JSON_ROOT = ROOT / 'public' / 'scripts' / 'json'
 MANIFEST_PATH = JSON_ROOT / 'manifest.json'
 
+# 分片输出：轻量索引 + 按分类分页的条目文件
+MANIFEST_INDEX_PATH = JSON_ROOT / 'manifest-index.json'
+SHARD_DIR = JSON_ROOT / '_manifest'
+DEFAULT_PAGE_SIZE = 200
+CATEGORIES = ('official', 'official_mix', 'custom')
+
+# 增量构建缓存：记录 (path, mtime, size, content hash) -> 提取出的条目
+CACHE_DIR = ROOT / '.cache'
+CACHE_PATH = CACHE_DIR / 'manifest-cache.json'
+# 条目提取逻辑变化时递增，使旧缓存整体失效
+CACHE_VERSION = 1
+
+# 流式读取 _meta 时的初始块大小（首个元素超出时按倍数扩大）
+STREAM_CHUNK_SIZE = 16 * 1024
+# 待解析文件少于该数量时不启动进程池（进程启动开销大于解析本身）
+PARALLEL_THRESHOLD = 64
+
+_JSON_DECODER = json.JSONDecoder()
+_JSON_WS = ' \t\n\r'
+
 
 def slugify(text: str) -> str:
     slug = ''.join(ch.lower() if ch.isalnum() else '-' for ch in text)
@@ -25,6 +52,18 @@ def detect_category(dir_path: Path) -> str:
     return 'custom'
 
 
+def script_category(path: Path) -> str:
+    """单个剧本文件的分类，与 iter_script_files() 一致：取 JSON_ROOT 下的一级目录；
+    不在分类子目录中的文件（包括 JSON_ROOT 之外的路径）按 custom 处理"""
+    try:
+        parts = path.resolve().relative_to(JSON_ROOT).parts
+    except ValueError:
+        return 'custom'
+    if len(parts) < 2:
+        return 'custom'
+    return detect_category(JSON_ROOT / parts[0])
+
+
 def read_json_safely(p: Path) -> Union[Dict[str, Any], List[Any]]:
     try:
         with p.open('r', encoding='utf-8') as f:
@@ -33,6 +72,18 @@ def read_json_safely(p: Path) -> Union[Dict[str, Any], List[Any]]:
         return {}
 
 
+def parse_json_bytes(raw: bytes) -> Union[Dict[str, Any], List[Any]]:
+    """与 read_json_safely 相同的容错语义，但作用于已读入的字节（避免二次读盘）"""
+    try:
+        return json.loads(raw.decode('utf-8'))
+    except Exception:
+        return {}
+
+
+def content_hash(raw: bytes) -> str:
+    return hashlib.sha1(raw).hexdigest()
+
+
 def extract_meta(data: Union[Dict[str, Any], List[Any]]) -> Dict[str, Any]:
     """从 JSON 数据提取 _meta 信息，兼容数组格式与对象格式。
     - 对象：直接 data.get('_meta', {})
@@ -47,59 +98,253 @@ def extract_meta(data: Union[Dict[str, Any], List[Any]]) -> Dict[str, Any]:
     return {}
 
 
-def collect_entries() -> List[Dict[str, Any]]:
-    entries: List[Dict[str, Any]] = []
+def _skip_ws(buf: str, pos: int) -> int:
+    while pos < len(buf) and buf[pos] in _JSON_WS:
+        pos += 1
+    return pos
+
+
+def extract_meta_streaming(f: BinaryIO) -> Optional[Dict[str, Any]]:
+    """流式解码数组格式剧本的首个元素，若其为 _meta 则立即返回，不再解码剩余内容。
+
+    返回 None 表示需要回退到完整解析：对象格式剧本、_meta 不在首位、
+    或内容无法按 UTF-8 / JSON 解码。
+    """
+    decoder = codecs.getincrementaldecoder('utf-8')()
+    buf = ''
+    chunk_size = STREAM_CHUNK_SIZE
+    eof = False
+    try:
+        while not eof:
+            data = f.read(chunk_size)
+            eof = not data
+            buf += decoder.decode(data, final=eof)
+
+            pos = _skip_ws(buf, 0)
+            if pos >= len(buf):
+                continue
+            if buf[pos] != '[':
+                return None
+            pos = _skip_ws(buf, pos + 1)
+            if pos >= len(buf):
+                continue
+            if buf[pos] == ']':
+                return None
+
+            try:
+                item, _ = _JSON_DECODER.raw_decode(buf, pos)
+            except json.JSONDecodeError:
+                # 首个元素尚未读完整，扩大读取块继续
+                chunk_size *= 2
+                continue
+
+            if isinstance(item, dict) and item.get('id') == '_meta':
+                return item
+            return None
+    except UnicodeDecodeError:
+        return None
+    return None
+
+
+def extract_script_meta(raw: bytes) -> Dict[str, Any]:
+    """优先流式提取 _meta，失败时回退到完整解析"""
+    meta = extract_meta_streaming(io.BytesIO(raw))
+    if meta is not None:
+        return meta
+    return extract_meta(parse_json_bytes(raw))
+
+
+def build_entry(jf: Path, category: str, meta: Dict[str, Any]) -> Dict[str, Any]:
+    name = meta.get('name') or jf.stem
+    # 英文名支持多种命名：name_en / title_en / nameEn / titleEn
+    name_en = (
+        meta.get('name_en')
+        or meta.get('title_en')
+        or meta.get('nameEn')
+        or meta.get('titleEn')
+        or ''
+    )
+    # 官方目录默认作者为 Official，其它为 未知
+    author = meta.get('author') or meta.get('authors') or ('Official' if category == 'official' else '未知')
+    description = meta.get('description') or ''
+    logo = meta.get('logo') or meta.get('icon') or ''
+
+    # 生成稳定 id
+    base_id = f"{category}:{name}:{jf.name}"
+    id_ = slugify(base_id)
+
+    # 生成可被前端直接 fetch 的路径（以 public 为根）
+    # 需要确保路径形如 /scripts/json/.../file.json
+    public_rel = jf.relative_to(ROOT / 'public')  # scripts/json/.../file.json
+    json_url = '/' + str(public_rel).replace('\\', '/')
+
+    return {
+        'id': id_,
+        'name': name,
+        'nameEn': name_en,
+        'author': author,
+        'description': description,
+        'category': category,
+        'logo': logo,
+        'jsonUrl': json_url,
+        'file': jf.name,
+        'dir': str(jf.parent.relative_to(JSON_ROOT)).replace('\\', '/'),
+    }
+
+
+def iter_script_files() -> List[Tuple[Path, str]]:
+    """列出所有剧本文件及其分类，顺序与 manifest 输出顺序一致"""
+    files: List[Tuple[Path, str]] = []
 
     if not JSON_ROOT.exists():
-        return entries
+        return files
 
     # 遍历一级子目录（official / official_mix / custom）
     for sub in sorted(JSON_ROOT.iterdir()):
-        if not sub.is_dir():
+        if not sub.is_dir() or sub == SHARD_DIR:
             continue
         category = detect_category(sub)
-
         for jf in sorted(sub.rglob('*.json')):
-            data = read_json_safely(jf)
-            meta = extract_meta(data)
-
-            name = meta.get('name') or jf.stem
-            # 英文名支持多种命名：name_en / title_en / nameEn / titleEn
-            name_en = (
-                meta.get('name_en')
-                or meta.get('title_en')
-                or meta.get('nameEn')
-                or meta.get('titleEn')
-                or ''
-            )
-            # 官方目录默认作者为 Official，其它为 未知
-            author = meta.get('author') or meta.get('authors') or ('Official' if category == 'official' else '未知')
-            description = meta.get('description') or ''
-            logo = meta.get('logo') or meta.get('icon') or ''
-
-            # 生成稳定 id
-            base_id = f"{category}:{name}:{jf.name}"
-            id_ = slugify(base_id)
-
-            # 生成可被前端直接 fetch 的路径（以 public 为根）
-            # 需要确保路径形如 /scripts/json/.../file.json
-            public_rel = jf.relative_to(ROOT / 'public')  # scripts/json/.../file.json
-            json_url = '/' + str(public_rel).replace('\\', '/')
-
-            entries.append({
-                'id': id_,
-                'name': name,
-                'nameEn': name_en,
-                'author': author,
-                'description': description,
-                'category': category,
-                'logo': logo,
-                'jsonUrl': json_url,
-                'file': jf.name,
-                'dir': str(jf.parent.relative_to(JSON_ROOT)).replace('\\', '/'),
-            })
+            files.append((jf, category))
+
+    return files
 
-    return entries
+
+def load_cache() -> Dict[str, Any]:
+    try:
+        with CACHE_PATH.open('r', encoding='utf-8') as f:
+            cache = json.load(f)
+        if cache.get('version') == CACHE_VERSION and isinstance(cache.get('files'), dict):
+            return cache
+    except Exception:
+        pass
+    return {'version': CACHE_VERSION, 'files': {}}
+
+
+def save_cache(cache: Dict[str, Any]):
+    CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    tmp = CACHE_PATH.with_suffix('.tmp')
+    with tmp.open('w', encoding='utf-8') as f:
+        json.dump(cache, f, ensure_ascii=False, separators=(',', ':'))
+    os.replace(tmp, CACHE_PATH)
+
+
+def _extract_file(job: Tuple[str, str, Optional[str], bool]) -> Tuple[str, str, Optional[Dict[str, Any]]]:
+    """读取并解析单个剧本文件（可在子进程中执行）。
+
+    job 为 (文件路径, 分类, 缓存中的内容哈希, 是否计算内容摘要)；
+    内容哈希未变化时不解析，返回的条目为 None。
+    计算摘要需要完整解析剧本，此时不走流式 _meta 提取。
+    """
+    path, category, cached_hash, with_summary = job
+    jf = Path(path)
+    raw = jf.read_bytes()
+    digest = content_hash(raw)
+    if digest == cached_hash:
+        return path, digest, None
+    if not with_summary:
+        return path, digest, build_entry(jf, category, extract_script_meta(raw))
+
+    from script_summary import summarize_script
+    data = parse_json_bytes(raw)
+    entry = build_entry(jf, category, extract_meta(data))
+    entry['summary'] = summarize_script(data)
+    return path, digest, entry
+
+
+def default_workers() -> int:
+    return os.cpu_count() or 1
+
+
+def collect_entries(
+    full: bool = False,
+    stats: Optional[Dict[str, int]] = None,
+    workers: Optional[int] = None,
+    summary: bool = False,
+) -> List[Dict[str, Any]]:
+    """收集 manifest 条目。
+
+    full=False 时启用增量模式：mtime 与 size 均未变化的文件直接复用缓存条目，
+    不读取也不解析；mtime/size 变化但内容哈希相同的文件只读取不解析；
+    已删除的文件会从缓存中剔除。
+    需要解析的文件较多且 workers > 1 时，使用进程池并行提取。
+    summary=True 时为每个条目附加内容摘要（见 script_summary.py）；
+    角色数据源变化或该选项切换时缓存整体失效。
+    """
+    if stats is None:
+        stats = {}
+    stats.update({'reused': 0, 'reparsed': 0, 'pruned': 0})
+    if workers is None:
+        workers = default_workers()
+
+    options: Dict[str, Any] = {'summary': summary}
+    if summary:
+        from script_summary import sources_hash
+        options['dataHash'] = sources_hash()
+
+    with stage('load_cache'):
+        cache = load_cache()
+    if full or cache.get('options') != options:
+        cache = {'version': CACHE_VERSION, 'files': {}}
+    cache['options'] = options
+    cached_files: Dict[str, Any] = cache['files']
+    next_files: Dict[str, Any] = {}
+
+    # 第一遍：仅 stat，命中缓存的直接复用，其余收集为待处理任务
+    with stage('walk'):
+        files = iter_script_files()
+    keys: List[str] = []
+    pending: Dict[str, Tuple[str, os.stat_result]] = {}
+    jobs: List[Tuple[str, str, Optional[str], bool]] = []
+    with stage('stat'):
+        for jf, category in files:
+            key = str(jf.relative_to(JSON_ROOT)).replace('\\', '/')
+            keys.append(key)
+            st = jf.stat()
+            record = cached_files.get(key)
+
+            if record and record['mtime_ns'] == st.st_mtime_ns and record['size'] == st.st_size:
+                next_files[key] = record
+                stats['reused'] += 1
+                continue
+
+            pending[str(jf)] = (key, st)
+            jobs.append((str(jf), category, record['hash'] if record else None, summary))
+    count('files_seen', len(files))
+    count('files_read', len(jobs))
+    count('bytes_read', sum(st.st_size for _, st in pending.values()))
+
+    # 第二遍：读取并提取未命中的文件
+    with stage('extract'):
+        if workers > 1 and len(jobs) >= PARALLEL_THRESHOLD:
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                chunksize = max(1, len(jobs) // (workers * 4))
+                results = list(pool.map(_extract_file, jobs, chunksize=chunksize))
+        else:
+            results = [_extract_file(job) for job in jobs]
+
+    for path, digest, entry in results:
+        key, st = pending[path]
+        if entry is None:
+            entry = cached_files[key]['entry']
+            stats['reused'] += 1
+        else:
+            stats['reparsed'] += 1
+        next_files[key] = {
+            'mtime_ns': st.st_mtime_ns,
+            'size': st.st_size,
+            'hash': digest,
+            'entry': entry,
+        }
+
+    stats['pruned'] = len(set(cached_files) - set(next_files))
+    cache['files'] = next_files
+    with stage('save_cache'):
+        save_cache(cache)
+    count('cache_hits', stats['reused'])
+    count('files_parsed', stats['reparsed'])
+
+    return [next_files[key]['entry'] for key in keys]
 
 
 def write_manifest(entries: List[Dict[str, Any]]):
@@ -113,13 +358,105 @@ def write_manifest(entries: List[Dict[str, Any]]):
         json.dump(payload, f, ensure_ascii=False, indent=2)
 
 
+def public_url(p: Path) -> str:
+    return '/' + str(p.relative_to(ROOT / 'public')).replace('\\', '/')
+
+
+def write_compact_json(p: Path, payload: Any):
+    with p.open('w', encoding='utf-8') as f:
+        json.dump(payload, f, ensure_ascii=False, separators=(',', ':'))
+
+
+def write_sharded_manifest(entries: List[Dict[str, Any]], page_size: int = DEFAULT_PAGE_SIZE):
+    """写出分片 manifest：
+    - manifest-index.json：各分类条目数与分页 URL，体积很小，可优先加载
+    - _manifest/<category>/<n>.json：每页至多 page_size 条，紧凑格式无缩进
+    """
+    generated_at = __import__('datetime').datetime.utcnow().isoformat() + 'Z'
+    by_category: Dict[str, List[Dict[str, Any]]] = {c: [] for c in CATEGORIES}
+    for entry in entries:
+        by_category.setdefault(entry['category'], []).append(entry)
+
+    # 清理上一次生成的分片，避免残留过期页面
+    if SHARD_DIR.exists():
+        for old in SHARD_DIR.rglob('*.json'):
+            old.unlink()
+
+    categories: Dict[str, Any] = {}
+    for category, items in by_category.items():
+        cat_dir = SHARD_DIR / category
+        cat_dir.mkdir(parents=True, exist_ok=True)
+        pages: List[str] = []
+        for page_no, start in enumerate(range(0, len(items), page_size), 1):
+            page_path = cat_dir / f'{page_no}.json'
+            write_compact_json(page_path, {
+                'category': category,
+                'page': page_no,
+                'scripts': items[start:start + page_size],
+            })
+            pages.append(public_url(page_path))
+        categories[category] = {'count': len(items), 'pages': pages}
+
+    write_compact_json(MANIFEST_INDEX_PATH, {
+        'generatedAt': generated_at,
+        'version': 1,
+        'pageSize': page_size,
+        'total': len(entries),
+        'categories': categories,
+    })
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description='生成剧本仓库 manifest.json')
+    parser.add_argument('--full', action='store_true',
+                        help='忽略构建缓存，重新解析所有剧本文件')
+    parser.add_argument('--workers', type=int, default=default_workers(),
+                        help='并行提取使用的进程数，1 表示串行（默认: CPU 核数）')
+    parser.add_argument('--sharded', action='store_true',
+                        help='额外输出分片 manifest（manifest-index.json + _manifest/ 分页文件）')
+    parser.add_argument('--page-size', type=int, default=DEFAULT_PAGE_SIZE,
+                        help=f'分片模式下每页条目数（默认: {DEFAULT_PAGE_SIZE}）')
+    parser.add_argument('--summary', action='store_true',
+                        help='为每个条目附加内容摘要：阵营计数、角色 id 列表与触发的相克对')
+    parser.add_argument('--search-index', action='store_true',
+                        help='同时生成搜索倒排索引 search-index.json（名称/英文名/作者/简介/拼音）')
+    parser.add_argument('--similar', action='store_true',
+                        help='同时生成相似剧本索引 similar-index.json（角色集合 MinHash + LSH，增量更新）')
+    parser.add_argument('--compress', action='store_true',
+                        help='生成完成后为 manifest 与剧本文件写出 .gz/.br 预压缩副本')
+    return parser.parse_args()
+
+
 def main():
-    entries = collect_entries()
-    write_manifest(entries)
+    args = parse_args()
+    stats: Dict[str, int] = {}
+    with stage('collect'):
+        entries = collect_entries(full=args.full, stats=stats, workers=args.workers, summary=args.summary)
+    with stage('write_manifest'):
+        write_manifest(entries)
     print(f"Generated {len(entries)} entries -> {MANIFEST_PATH}")
+    print(f"  reused: {stats['reused']}, reparsed: {stats['reparsed']}, pruned: {stats['pruned']}")
+    if args.sharded:
+        with stage('write_sharded'):
+            write_sharded_manifest(entries, page_size=args.page_size)
+        print(f"Sharded manifest (page size {args.page_size}) -> {MANIFEST_INDEX_PATH}")
+    if args.search_index:
+        from search_index import SEARCH_INDEX_PATH, write_search_index
+        with stage('search_index'):
+            index_stats = write_search_index(entries)
+        print(f"Search index: {index_stats['terms']} terms, {index_stats['postings']} postings, "
+              f"{index_stats['bytes']} bytes in {index_stats['seconds'] * 1000:.1f} ms -> {SEARCH_INDEX_PATH}")
+    if args.similar:
+        from similar_scripts import print_stats, write_similar_index
+        with stage('similar_index'):
+            similar_stats = write_similar_index(entries, full=args.full)
+        print_stats(similar_stats)
+    if args.compress:
+        from compress_assets import compress_all, print_report
+        with stage('compress'):
+            report = compress_all()
+        print_report(report)
 
 
 if __name__ == '__main__':
     main()
-
-
@@ -0,0 +1,320 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+角色图标本地镜像与雪碧图（依赖 Pillow，可选安装：pip install pillow）。
+
+characters.ts 等数据源里的 image 大多指向 oss.gstonegames.com，渲染一个 20 人剧本就要发起
+20 多次跨域图片请求，html2canvas 导出前还得等它们全部加载。本脚本分两步去掉这些请求：
+
+1. 镜像：从预先下载好的目录或压缩包（.zip / .tar / .tar.gz）中找出各角色图标，复制到
+   .cache/icons/（文件名取 URL 的 sha1），索引记录在 .cache/icons/index.json。构建过程不访问网络；
+   已镜像过的图标之后无需再提供来源。--list-urls 输出全部图标 URL，可交给 wget/curl 预先下载。
+   来源中的文件按以下顺序匹配：host/路径、路径、文件名、<角色 id>.<扩展名>。
+   站内图片（/imgs/... 或 botc.letshare.fun/imgs/...）直接使用 public/ 下的文件。
+2. 打包：把图标统一缩放为 --size 像素的正方形（保持比例、居中、透明填充），按阵营
+   （或 --group edition 按版本）打成雪碧图 public/imgs/atlas/<分组>.webp，并写出坐标表
+   public/imgs/atlas/atlas.json：
+   {
+     "version": 1, "size": 128, "group": "team",
+     "atlases": {"townsfolk": {"url": "/imgs/atlas/townsfolk.webp", "width": 2048, "height": 896, "count": 110}},
+     "icons": {"washerwoman": {"atlas": "townsfolk", "x": 0, "y": 0, "w": 128, "h": 128}, ...},
+     "missing": ["..."]
+   }
+   icons 同时以中文 id 与英文 id 为键（两者不同时），前端按 CHARACTERS / CHARACTERS_EN 的键都能直接查到。
+   输入图标与参数均未变化时跳过打包。
+"""
+import argparse
+import hashlib
+import json
+import os
+import sys
+import tarfile
+import zipfile
+from io import BytesIO
+from math import ceil
+from pathlib import Path, PurePosixPath
+from typing import Any, Callable, Dict, List, Optional, Tuple
+from urllib.parse import unquote, urlsplit
+
+try:
+    from PIL import Image  # type: ignore
+except ImportError:  # Pillow 为可选依赖
+    Image = None
+
+from chardb import Character, load_db
+from generate_manifest import CACHE_DIR, ROOT, content_hash
+
+PUBLIC_DIR = ROOT / 'public'
+MIRROR_DIR = CACHE_DIR / 'icons'
+MIRROR_INDEX_PATH = MIRROR_DIR / 'index.json'
+MIRROR_INDEX_VERSION = 1
+ATLAS_DIR = PUBLIC_DIR / 'imgs' / 'atlas'
+ATLAS_JSON_PATH = ATLAS_DIR / 'atlas.json'
+
+# 指向本站的图片 URL（与 public/ 目录对应）
+LOCAL_HOSTS = ('botc.letshare.fun',)
+IMAGE_EXTS = ('.png', '.webp', '.jpg', '.jpeg', '.gif')
+DEFAULT_SIZE = 128
+# 每张雪碧图最多的列数；2048px 宽度在移动端也能安全解码
+MAX_COLUMNS = 16
+ATLAS_QUALITY = 90
+GROUPS = ('team', 'edition')
+
+
+# ---------------------------------------------------------------------------
+# 镜像
+# ---------------------------------------------------------------------------
+
+class IconSource:
+    """预下载的图标来源（目录或压缩包），按相对路径与文件名建立索引"""
+
+    def __init__(self, path: Path):
+        self.path = path
+        self.readers: Dict[str, Callable[[], bytes]] = {}
+        self.by_name: Dict[str, str] = {}
+        if path.is_dir():
+            for p in sorted(path.rglob('*')):
+                if p.is_file():
+                    self._add(p.relative_to(path).as_posix(), p.read_bytes)
+        elif zipfile.is_zipfile(path):
+            archive = zipfile.ZipFile(path)
+            for info in archive.infolist():
+                if not info.is_dir():
+                    self._add(info.filename, lambda n=info.filename: archive.read(n))
+        elif tarfile.is_tarfile(path):
+            archive = tarfile.open(path)
+            for member in archive.getmembers():
+                if member.isfile():
+                    self._add(member.name, lambda m=member: archive.extractfile(m).read())
+        else:
+            raise ValueError(f'无法识别的图标来源：{path}（应为目录、zip 或 tar 包）')
+
+    def _add(self, rel: str, reader: Callable[[], bytes]):
+        rel = rel.removeprefix('./').lstrip('/')
+        if PurePosixPath(rel).suffix.lower() not in IMAGE_EXTS:
+            return
+        self.readers[rel] = reader
+        self.by_name.setdefault(PurePosixPath(rel).name, rel)
+
+    def find(self, url: str, char_ids: Tuple[str, ...]) -> Optional[bytes]:
+        parts = urlsplit(url)
+        path = parts.path.lstrip('/')
+        for candidate in (f'{parts.netloc}/{path}', path):
+            for rel in (candidate, unquote(candidate)):
+                if rel in self.readers:
+                    return self.readers[rel]()
+        name = unquote(PurePosixPath(path).name)
+        for rel_name in [name] + [f'{cid}{ext}' for cid in char_ids if cid for ext in IMAGE_EXTS]:
+            rel = self.by_name.get(rel_name)
+            if rel is not None:
+                return self.readers[rel]()
+        return None
+
+
+def local_file(url: str) -> Optional[Path]:
+    """站内图片对应的 public/ 文件"""
+    parts = urlsplit(url)
+    if parts.netloc and parts.netloc not in LOCAL_HOSTS:
+        return None
+    if not parts.path.startswith('/'):
+        return None
+    p = PUBLIC_DIR / unquote(parts.path).lstrip('/')
+    return p if p.is_file() else None
+
+
+def icon_characters() -> List[Character]:
+    return [c for c in load_db().characters.values() if c.image]
+
+
+def load_mirror_index() -> Dict[str, Any]:
+    try:
+        with MIRROR_INDEX_PATH.open('r', encoding='utf-8') as f:
+            index = json.load(f)
+        if index.get('version') == MIRROR_INDEX_VERSION and isinstance(index.get('files'), dict):
+            return index
+    except Exception:
+        pass
+    return {'version': MIRROR_INDEX_VERSION, 'files': {}}
+
+
+def save_mirror_index(index: Dict[str, Any]):
+    MIRROR_DIR.mkdir(parents=True, exist_ok=True)
+    tmp = MIRROR_INDEX_PATH.with_suffix('.tmp')
+    with tmp.open('w', encoding='utf-8') as f:
+        json.dump(index, f, ensure_ascii=False, separators=(',', ':'))
+    os.replace(tmp, MIRROR_INDEX_PATH)
+
+
+def mirror_icons(characters: List[Character], sources: List[IconSource]) -> Dict[str, int]:
+    """把来源中找到的图标复制进本地镜像；已镜像的 URL 不再查找"""
+    index = load_mirror_index()
+    files: Dict[str, Any] = index['files']
+    stats = {'mirrored': 0, 'cached': 0, 'local': 0, 'missing': 0}
+    for c in characters:
+        url = c.image
+        record = files.get(url)
+        if local_file(url) is not None:
+            stats['local'] += 1
+            continue
+        if record is not None and (MIRROR_DIR / record['file']).exists():
+            stats['cached'] += 1
+            continue
+        raw = None
+        for source in sources:
+            raw = source.find(url, (c.cn_id, c.en_id))
+            if raw is not None:
+                break
+        if raw is None:
+            stats['missing'] += 1
+            continue
+        ext = PurePosixPath(urlsplit(url).path).suffix.lower()
+        name = hashlib.sha1(url.encode('utf-8')).hexdigest()[:16] + (ext if ext in IMAGE_EXTS else '.png')
+        MIRROR_DIR.mkdir(parents=True, exist_ok=True)
+        (MIRROR_DIR / name).write_bytes(raw)
+        files[url] = {'file': name, 'hash': content_hash(raw)}
+        stats['mirrored'] += 1
+    save_mirror_index(index)
+    return stats
+
+
+def resolve_icon(url: str, files: Dict[str, Any]) -> Optional[Tuple[Path, str]]:
+    """URL -> (本地文件, 内容哈希)"""
+    p = local_file(url)
+    if p is not None:
+        return p, content_hash(p.read_bytes())
+    record = files.get(url)
+    if record is not None and (MIRROR_DIR / record['file']).exists():
+        return MIRROR_DIR / record['file'], record['hash']
+    return None
+
+
+# ---------------------------------------------------------------------------
+# 雪碧图
+# ---------------------------------------------------------------------------
+
+def normalize_icon(raw: bytes, size: int) -> 'Image.Image':
+    """缩放到 size x size 的透明画布内，保持比例居中"""
+    with Image.open(BytesIO(raw)) as im:
+        im.load()
+        img = im.convert('RGBA')
+    if max(img.size) != size:
+        scale = size / max(img.size)
+        img = img.resize((max(1, round(img.width * scale)), max(1, round(img.height * scale))), Image.LANCZOS)
+    canvas = Image.new('RGBA', (size, size), (0, 0, 0, 0))
+    canvas.paste(img, ((size - img.width) // 2, (size - img.height) // 2), img)
+    return canvas
+
+
+def group_of(c: Character, group: str) -> str:
+    value = c.team if group == 'team' else c.edition
+    return value or 'base'
+
+
+def build_atlases(characters: List[Character], size: int = DEFAULT_SIZE, group: str = 'team',
+                  force: bool = False) -> Dict[str, Any]:
+    files = load_mirror_index()['files']
+    groups: Dict[str, List[Tuple[Character, Path]]] = {}
+    missing: List[str] = []
+    fingerprint = hashlib.sha1(json.dumps([size, group, MAX_COLUMNS, ATLAS_QUALITY]).encode('ascii'))
+    for c in sorted(characters, key=lambda c: (group_of(c, group), c.key)):
+        resolved = resolve_icon(c.image, files)
+        if resolved is None:
+            missing.append(c.en_id or c.cn_id)
+            continue
+        path, digest = resolved
+        groups.setdefault(group_of(c, group), []).append((c, path))
+        fingerprint.update(f'{c.key}:{c.cn_id}:{c.en_id}:{digest}\n'.encode('utf-8'))
+    fingerprint = fingerprint.hexdigest()
+
+    if not force and ATLAS_JSON_PATH.exists():
+        try:
+            current = json.loads(ATLAS_JSON_PATH.read_text(encoding='utf-8'))
+        except ValueError:
+            current = {}
+        if current.get('fingerprint') == fingerprint and all(
+                (PUBLIC_DIR / a['url'].lstrip('/')).exists() for a in current.get('atlases', {}).values()):
+            current['skipped'] = True
+            return current
+
+    ATLAS_DIR.mkdir(parents=True, exist_ok=True)
+    atlases: Dict[str, Any] = {}
+    icons: Dict[str, Any] = {}
+    for name, members in sorted(groups.items()):
+        columns = min(MAX_COLUMNS, len(members))
+        rows = ceil(len(members) / columns)
+        sheet = Image.new('RGBA', (columns * size, rows * size), (0, 0, 0, 0))
+        for i, (c, path) in enumerate(members):
+            x, y = (i % columns) * size, (i // columns) * size
+            sheet.paste(normalize_icon(path.read_bytes(), size), (x, y))
+            entry = {'atlas': name, 'x': x, 'y': y, 'w': size, 'h': size}
+            for cid in (c.en_id, c.cn_id):
+                if cid:
+                    icons.setdefault(cid, entry)
+        out = ATLAS_DIR / f'{name}.webp'
+        tmp = out.with_name(out.name + '.tmp')
+        sheet.save(tmp, format='WEBP', quality=ATLAS_QUALITY, method=4)
+        os.replace(tmp, out)
+        atlases[name] = {'url': '/' + out.relative_to(PUBLIC_DIR).as_posix(),
+                         'width': sheet.width, 'height': sheet.height, 'count': len(members)}
+
+    # 分组方式变化后遗留的旧雪碧图
+    for p in ATLAS_DIR.glob('*.webp'):
+        if p.stem not in atlases:
+            p.unlink()
+
+    payload = {
+        'version': 1,
+        'size': size,
+        'group': group,
+        'fingerprint': fingerprint,
+        'atlases': atlases,
+        'icons': dict(sorted(icons.items())),
+        'missing': sorted(missing),
+    }
+    tmp = ATLAS_JSON_PATH.with_suffix('.tmp')
+    tmp.write_text(json.dumps(payload, ensure_ascii=False, separators=(',', ':')), encoding='utf-8')
+    os.replace(tmp, ATLAS_JSON_PATH)
+    return payload
+
+
+def main():
+    parser = argparse.ArgumentParser(description='镜像角色图标到本地缓存，并按阵营/版本打包为雪碧图')
+    parser.add_argument('--source', action='append', type=Path, default=[],
+                        help='预先下载的图标目录或压缩包（可重复指定）')
+    parser.add_argument('--size', type=int, default=DEFAULT_SIZE, help=f'图标边长（像素，默认 {DEFAULT_SIZE}）')
+    parser.add_argument('--group', choices=GROUPS, default='team', help='雪碧图分组方式（默认按阵营）')
+    parser.add_argument('--force', action='store_true', help='忽略缓存，重新生成雪碧图')
+    parser.add_argument('--list-urls', action='store_true', help='只输出需要预先下载的图标 URL')
+    args = parser.parse_args()
+
+    characters = icon_characters()
+    if args.list_urls:
+        for url in sorted({c.image for c in characters if local_file(c.image) is None}):
+            print(url)
+        return
+
+    if Image is None:
+        print('Pillow 未安装，跳过图标雪碧图（pip install pillow）', file=sys.stderr)
+        return
+
+    try:
+        sources = [IconSource(p) for p in args.source]
+    except (OSError, ValueError, zipfile.BadZipFile, tarfile.TarError) as e:
+        print(f'error: {e}', file=sys.stderr)
+        sys.exit(1)
+
+    stats = mirror_icons(characters, sources)
+    print(f"Mirror: {stats['mirrored']} new, {stats['cached']} cached, "
+          f"{stats['local']} local, {stats['missing']} missing -> {MIRROR_DIR}")
+
+    result = build_atlases(characters, size=args.size, group=args.group, force=args.force)
+    if result.get('skipped'):
+        print(f'Atlases up to date -> {ATLAS_JSON_PATH}')
+        return
+    total = sum(a['count'] for a in result['atlases'].values())
+    print(f"Packed {total} icons into {len(result['atlases'])} atlases ({args.size}px, by {args.group}) "
+          f"-> {ATLAS_JSON_PATH}; {len(result['missing'])} without a mirrored icon")
+
+
+if __name__ == '__main__':
+    main()
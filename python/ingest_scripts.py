@@ -0,0 +1,401 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+批量导入社区剧本：从目录、zip 压缩包或单个 JSON 文件中逐个读取剧本，去重后放入
+public/scripts/json/<分类>/，最后增量更新 manifest.json。
+
+对每个剧本计算两种指纹：
+- 内容哈希：解析后按键排序、紧凑格式重新序列化再取 sha1，因此缩进、换行、键顺序、BOM
+  不同的同一份文件视为完全相同
+- 角色集签名：script_summary.role_set() 排序后的 sha1（官方角色规范化为英文 id，
+  自定义角色记为 custom:<阵营>:<id 或名称>），与顺序、名称、_meta 无关，
+  用来识别改了文件名或打乱了角色顺序的重复上传
+
+两种指纹保存在持久索引 .cache/ingest-index.json 中，每次运行只对 mtime/size 变化过的
+现有剧本重新计算，之后每个待导入文件的查重都是一次字典查找，与仓库大小无关。
+
+处理结果：
+- duplicate   内容哈希与已有剧本（或同批次中先导入的剧本）相同，跳过
+- same-roles  角色集与已有剧本相同但内容不同；默认拒绝，--merge 时把新剧本 _meta 中
+              已有剧本缺少的字段（logo、英文名、简介等）补充到已有剧本（merged）
+- invalid     不是 UTF-8/GB18030 JSON 数组、超出大小限制，或 validate_scripts.py 报告 error
+              （--allow-errors 时只报告不拒绝）
+- accepted    写入目标目录；文件名取 _meta.name（重名时追加 -2、-3 ...）
+
+zip 中未设置 UTF-8 标志的文件名按 GBK 解码（Windows 中文系统打包的常见情况）。
+"""
+import argparse
+import hashlib
+import json
+import os
+import re
+import sys
+import time
+import zipfile
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional
+
+from generate_manifest import (CACHE_DIR, CATEGORIES, JSON_ROOT, MANIFEST_PATH, collect_entries, default_workers,
+                               extract_meta, iter_script_files, write_manifest)
+from instrument import count, stage
+from script_summary import role_set, sources_hash
+
+INDEX_PATH = CACHE_DIR / 'ingest-index.json'
+# 指纹算法变化时递增，使旧索引整体失效
+INDEX_VERSION = 1
+# 单个剧本的大小上限，防止压缩包中的异常文件占满内存
+MAX_SCRIPT_BYTES = 4 * 1024 * 1024
+# 文件名中不允许出现的字符（兼容 Windows）
+_UNSAFE_NAME_RE = re.compile(r'[\\/:*?"<>|\x00-\x1f]+')
+# 合并 _meta 时沿用原文件第一行缩进
+_INDENT_RE = re.compile(r'\n([ \t]+)\S')
+# zip 通用位标志：文件名为 UTF-8
+ZIP_UTF8_FLAG = 0x800
+
+
+@dataclass
+class Candidate:
+    source: str  # 来源描述（路径或 压缩包!成员名）
+    stem: str    # 来源文件名（不含扩展名），_meta 中没有名称时用作文件名
+    raw: bytes
+
+
+@dataclass
+class Result:
+    source: str
+    status: str
+    target: str = ''
+    message: str = ''
+
+
+@dataclass
+class Fingerprint:
+    data: List[Any]
+    text: str
+    hash: str
+    roles: str
+    meta: Dict[str, Any] = field(default_factory=dict)
+
+
+def decode_script(raw: bytes) -> str:
+    """UTF-8（可带 BOM）优先，失败时按 GB18030 解码"""
+    try:
+        return raw.decode('utf-8-sig')
+    except UnicodeDecodeError:
+        return raw.decode('gb18030')
+
+
+def canonical_hash(data: Any) -> str:
+    canonical = json.dumps(data, ensure_ascii=False, sort_keys=True, separators=(',', ':'))
+    return hashlib.sha1(canonical.encode('utf-8')).hexdigest()
+
+
+def role_signature(data: List[Any]) -> str:
+    return hashlib.sha1('\n'.join(sorted(role_set(data))).encode('utf-8')).hexdigest()
+
+
+def fingerprint(raw: bytes) -> Fingerprint:
+    """解析并计算两种指纹；内容不是 JSON 数组时抛出 ValueError"""
+    text = decode_script(raw)
+    data = json.loads(text)
+    if not isinstance(data, list):
+        raise ValueError('剧本顶层必须是数组')
+    return Fingerprint(data, text, canonical_hash(data), role_signature(data), extract_meta(data))
+
+
+# ---------------------------------------------------------------------------
+# 输入
+
+
+def zip_member_name(info: zipfile.ZipInfo) -> str:
+    if info.flag_bits & ZIP_UTF8_FLAG:
+        return info.filename
+    try:
+        return info.filename.encode('cp437').decode('gbk')
+    except (UnicodeEncodeError, UnicodeDecodeError):
+        return info.filename
+
+
+def iter_zip(path: Path) -> Iterator[Candidate]:
+    """逐个读取压缩包中的 .json 成员，不整体解压"""
+    with zipfile.ZipFile(path) as zf:
+        for info in zf.infolist():
+            name = zip_member_name(info)
+            if info.is_dir() or not name.lower().endswith('.json'):
+                continue
+            if name.startswith('__MACOSX/') or Path(name).name.startswith('._'):
+                continue
+            source = f'{path}!{name}'
+            if info.file_size > MAX_SCRIPT_BYTES:
+                yield Candidate(source, Path(name).stem, b'')
+                continue
+            with zf.open(info) as f:
+                yield Candidate(source, Path(name).stem, f.read(MAX_SCRIPT_BYTES + 1))
+
+
+def read_file(path: Path) -> Candidate:
+    with path.open('rb') as f:
+        return Candidate(str(path), path.stem, f.read(MAX_SCRIPT_BYTES + 1))
+
+
+def iter_candidates(paths: List[Path]) -> Iterator[Candidate]:
+    for path in paths:
+        if path.is_dir():
+            for p in sorted(path.rglob('*')):
+                if p.suffix.lower() == '.zip':
+                    yield from iter_zip(p)
+                elif p.suffix.lower() == '.json' and p.is_file():
+                    yield read_file(p)
+        elif path.suffix.lower() == '.zip':
+            yield from iter_zip(path)
+        else:
+            yield read_file(path)
+
+
+# ---------------------------------------------------------------------------
+# 持久索引
+
+
+class IngestIndex:
+    """现有剧本 key（相对 JSON_ROOT）-> 指纹，以及指纹 -> key 的反查表"""
+
+    def __init__(self, payload: Dict[str, Any]):
+        self.payload = payload
+        self.files: Dict[str, Dict[str, Any]] = payload['files']
+        self.by_hash: Dict[str, str] = {}
+        self.by_roles: Dict[str, str] = {}
+        self.rebuild()
+
+    def rebuild(self):
+        self.by_hash.clear()
+        self.by_roles.clear()
+        for key in sorted(self.files):
+            record = self.files[key]
+            self.by_hash.setdefault(record['hash'], key)
+            if record['roles']:
+                self.by_roles.setdefault(record['roles'], key)
+
+    @classmethod
+    def load(cls, data_hash: str) -> 'IngestIndex':
+        try:
+            with INDEX_PATH.open('r', encoding='utf-8') as f:
+                payload = json.load(f)
+            if (payload.get('version') == INDEX_VERSION and payload.get('dataHash') == data_hash
+                    and isinstance(payload.get('files'), dict)):
+                return cls(payload)
+        except Exception:
+            pass
+        return cls({'version': INDEX_VERSION, 'dataHash': data_hash, 'files': {}})
+
+    def refresh(self) -> Dict[str, int]:
+        """与磁盘同步：只对 mtime/size 变化的剧本重新计算指纹，剔除已删除的剧本"""
+        stats = {'reused': 0, 'rehashed': 0, 'pruned': 0}
+        seen = set()
+        for jf, _ in iter_script_files():
+            key = jf.relative_to(JSON_ROOT).as_posix()
+            seen.add(key)
+            st = jf.stat()
+            record = self.files.get(key)
+            if record and record['mtime_ns'] == st.st_mtime_ns and record['size'] == st.st_size:
+                stats['reused'] += 1
+                continue
+            self.update(key, jf)
+            stats['rehashed'] += 1
+        for key in set(self.files) - seen:
+            del self.files[key]
+            stats['pruned'] += 1
+        if stats['rehashed'] or stats['pruned']:
+            self.rebuild()
+        return stats
+
+    def update(self, key: str, path: Path, fp: Optional[Fingerprint] = None):
+        st = path.stat()
+        if fp is None:
+            try:
+                fp = fingerprint(path.read_bytes())
+                digest, roles = fp.hash, fp.roles
+            except ValueError:
+                # 无法解析的现有文件：用原始字节哈希占位，不参与角色集查重
+                digest, roles = hashlib.sha1(path.read_bytes()).hexdigest(), ''
+        else:
+            digest, roles = fp.hash, fp.roles
+        self.files[key] = {'mtime_ns': st.st_mtime_ns, 'size': st.st_size, 'hash': digest, 'roles': roles}
+        self.by_hash.setdefault(digest, key)
+        if roles:
+            self.by_roles.setdefault(roles, key)
+
+    def save(self):
+        CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        tmp = INDEX_PATH.with_suffix('.tmp')
+        with tmp.open('w', encoding='utf-8') as f:
+            json.dump(self.payload, f, ensure_ascii=False, separators=(',', ':'))
+        os.replace(tmp, INDEX_PATH)
+
+
+# ---------------------------------------------------------------------------
+# 放置与合并
+
+
+def safe_file_name(name: str) -> str:
+    cleaned = _UNSAFE_NAME_RE.sub('-', name).strip(' .-')
+    return cleaned[:120] or 'script'
+
+
+def write_atomic(path: Path, text: str):
+    tmp = path.with_name(path.name + '.tmp')
+    with tmp.open('w', encoding='utf-8', newline='') as f:
+        f.write(text)
+    os.replace(tmp, path)
+
+
+def place(fp: Fingerprint, stem: str, dest_dir: Path) -> Path:
+    name = fp.meta.get('name')
+    base = safe_file_name(name if isinstance(name, str) and name.strip() else stem)
+    target = dest_dir / f'{base}.json'
+    n = 2
+    while target.exists():
+        target = dest_dir / f'{base}-{n}.json'
+        n += 1
+    dest_dir.mkdir(parents=True, exist_ok=True)
+    write_atomic(target, fp.text)
+    return target
+
+
+def merge_meta(path: Path, incoming: Dict[str, Any], write: bool = True) -> List[str]:
+    """把 incoming 中已有剧本 _meta 缺少（或为空）的字段补充进去，返回补充的字段名"""
+    text = decode_script(path.read_bytes())
+    data = json.loads(text)
+    meta = extract_meta(data)
+    if not isinstance(data, list) or not meta:
+        return []
+    added = [k for k, v in incoming.items() if v not in (None, '', [], {}) and meta.get(k) in (None, '', [], {})]
+    if not added or not write:
+        return added
+    for k in added:
+        meta[k] = incoming[k]
+    # 沿用原文件的缩进与结尾换行，减小差异
+    m = _INDENT_RE.search(text)
+    content = json.dumps(data, ensure_ascii=False, indent=m.group(1) if m else 2)
+    write_atomic(path, content + ('\n' if text.endswith('\n') else ''))
+    return added
+
+
+def ingest(candidates: Iterator[Candidate], index: IngestIndex, dest_dir: Path, merge: bool = False,
+           allow_errors: bool = False, dry_run: bool = False) -> List[Result]:
+    from validate_scripts import validate_script
+
+    results: List[Result] = []
+    for cand in candidates:
+        count('ingest_candidates')
+        count('ingest_bytes', len(cand.raw))
+        if not cand.raw or len(cand.raw) > MAX_SCRIPT_BYTES:
+            results.append(Result(cand.source, 'invalid', message=f'为空或超过 {MAX_SCRIPT_BYTES // 1024} KiB'))
+            continue
+        try:
+            fp = fingerprint(cand.raw)
+        except ValueError as e:
+            results.append(Result(cand.source, 'invalid', message=str(e)))
+            continue
+
+        existing = index.by_hash.get(fp.hash)
+        if existing is not None:
+            results.append(Result(cand.source, 'duplicate', existing))
+            continue
+        existing = index.by_roles.get(fp.roles)
+        if existing is not None:
+            if not merge:
+                results.append(Result(cand.source, 'same-roles', existing))
+                continue
+            added = merge_meta(JSON_ROOT / existing, fp.meta, write=not dry_run)
+            if added and not dry_run:
+                index.update(existing, JSON_ROOT / existing)
+            results.append(Result(cand.source, 'merged' if added else 'same-roles', existing,
+                                  ', '.join(added)))
+            continue
+
+        errors = [i for i in validate_script(fp.data)[0] if i['severity'] == 'error']
+        if errors and not allow_errors:
+            results.append(Result(cand.source, 'invalid', message='; '.join(i['message'] for i in errors[:3])))
+            continue
+
+        if dry_run:
+            target_key = f'{dest_dir.relative_to(JSON_ROOT).as_posix()}/(dry-run)'
+        else:
+            target = place(fp, cand.stem, dest_dir)
+            target_key = target.relative_to(JSON_ROOT).as_posix()
+            index.update(target_key, target, fp)
+        # 同一批次中的后续文件也要与刚导入的剧本查重
+        index.by_hash.setdefault(fp.hash, target_key)
+        index.by_roles.setdefault(fp.roles, target_key)
+        results.append(Result(cand.source, 'accepted', target_key,
+                              f'{len(errors)} errors（--allow-errors）' if errors else ''))
+    return results
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description='批量导入剧本（目录 / zip / JSON），按内容与角色集去重后更新 manifest')
+    parser.add_argument('paths', nargs='+', type=Path, help='要导入的目录、zip 压缩包或 JSON 文件')
+    parser.add_argument('--dest', default='custom',
+                        help=f'目标目录（相对 public/scripts/json，一级目录决定分类：{" / ".join(CATEGORIES)}，默认 custom）')
+    parser.add_argument('--merge', action='store_true',
+                        help='角色集相同的剧本不拒绝，而是把其 _meta 中缺少的字段补充到已有剧本')
+    parser.add_argument('--allow-errors', action='store_true', help='validate_scripts 报告 error 的剧本也导入')
+    parser.add_argument('--dry-run', action='store_true', help='只报告处理结果，不写入任何文件')
+    parser.add_argument('--no-manifest', action='store_true', help='导入后不更新 manifest.json')
+    parser.add_argument('--workers', type=int, default=default_workers(), help='更新 manifest 时的并行进程数')
+    parser.add_argument('--quiet', action='store_true', help='只输出汇总')
+    return parser.parse_args()
+
+
+def main():
+    args = parse_args()
+    dest_dir = (JSON_ROOT / args.dest).resolve()
+    if JSON_ROOT.resolve() not in dest_dir.parents:
+        print(f'--dest 必须位于 {JSON_ROOT} 之下', file=sys.stderr)
+        sys.exit(2)
+    missing = [p for p in args.paths if not p.exists()]
+    if missing:
+        print(f'找不到: {", ".join(map(str, missing))}', file=sys.stderr)
+        sys.exit(2)
+
+    start = time.perf_counter()
+    with stage('index'):
+        index = IngestIndex.load(sources_hash())
+        index_stats = index.refresh()
+    with stage('ingest'):
+        results = ingest(iter_candidates(args.paths), index, dest_dir, merge=args.merge,
+                         allow_errors=args.allow_errors, dry_run=args.dry_run)
+    if not args.dry_run:
+        with stage('save_index'):
+            index.save()
+
+    totals: Dict[str, int] = {}
+    for r in results:
+        totals[r.status] = totals.get(r.status, 0) + 1
+        if args.quiet:
+            continue
+        arrow = {'accepted': '->', 'merged': '<-', 'duplicate': '==', 'same-roles': '~='}.get(r.status, '  ')
+        line = f'{r.status:10} {r.source}'
+        if r.target:
+            line += f' {arrow} {r.target}'
+        if r.message:
+            line += f'  ({r.message})'
+        print(line)
+    elapsed = time.perf_counter() - start
+    print(f'Ingested {len(results)} scripts in {elapsed * 1000:.0f} ms: '
+          + ', '.join(f'{k} {v}' for k, v in sorted(totals.items()))
+          + f"  [index: {index_stats['reused']} reused, {index_stats['rehashed']} rehashed, "
+            f"{index_stats['pruned']} pruned]")
+
+    if args.dry_run or args.no_manifest or not (totals.get('accepted') or totals.get('merged')):
+        return
+    stats: Dict[str, int] = {}
+    with stage('manifest'):
+        entries = collect_entries(stats=stats, workers=args.workers)
+        write_manifest(entries)
+    print(f"Manifest updated ({len(entries)} entries, reparsed {stats['reparsed']}) -> {MANIFEST_PATH}")
+
+
+if __name__ == '__main__':
+    main()
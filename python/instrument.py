@@ -0,0 +1,207 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+各数据工具共用的计时与计数埋点。默认关闭，关闭时 stage()/count() 几乎没有开销。
+
+在工具代码中：
+    from instrument import count, stage
+    with stage('walk'):
+        files = iter_script_files()
+    count('files_read')
+    count('bytes_parsed', len(raw))
+
+阶段可以嵌套，名字按 "外层/内层" 拼接。同名阶段多次进入时累计次数与耗时。
+
+通过环境变量启用，无需修改代码（CI 中直接设置即可）：
+- BOTC_TRACE=stderr        进程退出时把各阶段耗时与计数器汇总打印到 stderr
+- BOTC_TRACE=<文件路径>     以 JSONL 追加写入：每次阶段结束一行 {"type": "stage", ...}，
+                            退出时一行 {"type": "summary", ...}
+- BOTC_PROFILE=cprofile     同时用 cProfile 采样，退出时把 .prof 文件写到 BOTC_PROFILE_DIR
+                            （默认 .cache/profile/），并在 stderr 打印累计耗时前 20 的函数
+- BOTC_PROFILE=tracemalloc  记录 Python 内存分配，汇总中附上峰值与分配最多的代码行
+  两者可同时使用：BOTC_PROFILE=cprofile,tracemalloc
+
+也可以作为启动器运行任意工具（包括尚未埋点的脚本，此时至少得到总耗时与 profile）：
+    python python/instrument.py --trace trace.jsonl --profile cprofile generate_manifest.py --full
+
+进程池中的子进程（fork）不会写出汇总，它们的工作计入父进程中包住进程池的阶段。
+"""
+import argparse
+import atexit
+import json
+import os
+import sys
+import time
+from collections import Counter
+from contextlib import contextmanager, nullcontext
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, TextIO
+
+ROOT = Path(__file__).resolve().parents[1]
+ENV_TRACE = 'BOTC_TRACE'
+ENV_PROFILE = 'BOTC_PROFILE'
+ENV_PROFILE_DIR = 'BOTC_PROFILE_DIR'
+DEFAULT_PROFILE_DIR = ROOT / '.cache' / 'profile'
+PROFILERS = ('cprofile', 'tracemalloc')
+TOP_N = 20
+
+
+class Recorder:
+    def __init__(self, target: str, profilers: List[str]):
+        self.tool = Path(sys.argv[0]).stem if sys.argv and sys.argv[0] not in ('', '-c') else 'python'
+        self.pid = os.getpid()
+        self.started = time.perf_counter()
+        self.stages: Dict[str, List[float]] = {}  # 名字 -> [次数, 总秒数]
+        self.counters: Counter = Counter()
+        self.stack: List[str] = []
+        self.out: Optional[TextIO] = None
+        if target and target != 'stderr':
+            path = Path(target)
+            path.parent.mkdir(parents=True, exist_ok=True)
+            self.out = path.open('a', encoding='utf-8')
+
+        self.profile = None
+        if 'cprofile' in profilers:
+            import cProfile
+            self.profile = cProfile.Profile()
+            self.profile.enable()
+        self.tracemalloc = None
+        if 'tracemalloc' in profilers:
+            import tracemalloc
+            self.tracemalloc = tracemalloc
+            tracemalloc.start()
+
+    def emit(self, record: Dict[str, Any]):
+        if self.out is not None:
+            self.out.write(json.dumps({'tool': self.tool, 'pid': self.pid, **record},
+                                      ensure_ascii=False, separators=(',', ':')) + '\n')
+            self.out.flush()
+
+    @contextmanager
+    def stage(self, name: str) -> Iterator[None]:
+        self.stack.append(name)
+        full = '/'.join(self.stack)
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter() - start
+            self.stack.pop()
+            totals = self.stages.setdefault(full, [0, 0.0])
+            totals[0] += 1
+            totals[1] += elapsed
+            self.emit({'type': 'stage', 'name': full, 'start': round(start - self.started, 6),
+                       'ms': round(elapsed * 1000, 3)})
+
+    def finish(self):
+        if os.getpid() != self.pid:
+            return
+        summary: Dict[str, Any] = {
+            'type': 'summary',
+            'argv': sys.argv[1:],
+            'ms': round((time.perf_counter() - self.started) * 1000, 3),
+            'stages': {k: {'calls': v[0], 'ms': round(v[1] * 1000, 3)} for k, v in self.stages.items()},
+            'counters': dict(self.counters),
+        }
+        if self.tracemalloc is not None:
+            current, peak = self.tracemalloc.get_traced_memory()
+            top = self.tracemalloc.take_snapshot().statistics('lineno')[:TOP_N // 2]
+            self.tracemalloc.stop()
+            summary['tracemalloc'] = {
+                'currentKiB': current // 1024,
+                'peakKiB': peak // 1024,
+                'top': [{'where': f'{s.traceback[0].filename}:{s.traceback[0].lineno}',
+                         'KiB': s.size // 1024, 'count': s.count} for s in top],
+            }
+        if self.profile is not None:
+            self.profile.disable()
+            out_dir = Path(os.environ.get(ENV_PROFILE_DIR) or DEFAULT_PROFILE_DIR)
+            out_dir.mkdir(parents=True, exist_ok=True)
+            prof_path = out_dir / f'{self.tool}-{self.pid}.prof'
+            self.profile.dump_stats(prof_path)
+            summary['cprofile'] = str(prof_path)
+
+        self.emit(summary)
+        if self.out is not None:
+            self.out.close()
+            return
+
+        lines = [f'[trace] {self.tool}: {summary["ms"]:.1f} ms']
+        for name, v in summary['stages'].items():
+            lines.append(f'[trace]   {name:40} {v["ms"]:10.1f} ms  x{v["calls"]}')
+        for name, value in sorted(self.counters.items()):
+            lines.append(f'[trace]   {name:40} {value:>10}')
+        if 'tracemalloc' in summary:
+            tm = summary['tracemalloc']
+            lines.append(f'[trace]   tracemalloc peak {tm["peakKiB"] / 1024:.1f} MiB')
+            lines.extend(f'[trace]     {t["KiB"]:8} KiB  {t["where"]}' for t in tm['top'])
+        print('\n'.join(lines), file=sys.stderr)
+        if self.profile is not None:
+            import pstats
+            print(f'[trace]   cProfile -> {summary["cprofile"]}', file=sys.stderr)
+            pstats.Stats(self.profile, stream=sys.stderr).sort_stats('cumulative').print_stats(TOP_N)
+
+
+def _from_env() -> Optional[Recorder]:
+    target = os.environ.get(ENV_TRACE, '')
+    profilers = [p.strip() for p in os.environ.get(ENV_PROFILE, '').lower().split(',') if p.strip()]
+    if not target and not profilers:
+        return None
+    recorder = Recorder(target or 'stderr', profilers)
+    atexit.register(recorder.finish)
+    return recorder
+
+
+_recorder = _from_env()
+_NULL = nullcontext()
+
+
+def enabled() -> bool:
+    return _recorder is not None
+
+
+def stage(name: str):
+    """计时上下文；未启用时返回共享的空上下文"""
+    return _recorder.stage(name) if _recorder is not None else _NULL
+
+
+def count(name: str, n: int = 1):
+    if _recorder is not None:
+        _recorder.counters[name] += n
+
+
+def main():
+    parser = argparse.ArgumentParser(description='以埋点/性能分析模式运行 python/ 下的工具')
+    parser.add_argument('--trace', default='stderr', help='stderr（默认）或 JSONL 文件路径')
+    parser.add_argument('--profile', default='', help='cprofile、tracemalloc，或用逗号同时指定')
+    parser.add_argument('script', help='要运行的脚本（相对 python/ 目录或完整路径）')
+    parser.add_argument('args', nargs=argparse.REMAINDER, help='传给脚本的参数')
+    args = parser.parse_args()
+
+    unknown = {p for p in args.profile.split(',') if p} - set(PROFILERS)
+    if unknown:
+        parser.error(f'未知的 profile 类型: {", ".join(sorted(unknown))}')
+    script = Path(args.script)
+    if not script.exists():
+        script = Path(__file__).resolve().parent / args.script
+    # 环境变量会被子进程继承，tools 内部启动的其他脚本也会被记录
+    os.environ[ENV_TRACE] = args.trace
+    os.environ[ENV_PROFILE] = args.profile
+    sys.argv = [str(script), *args.args]
+    sys.path.insert(0, str(script.resolve().parent))
+
+    global _recorder
+    if _recorder is not None:
+        # 环境变量中已有设置：以命令行参数为准重新创建
+        atexit.unregister(_recorder.finish)
+    _recorder = _from_env()
+    # 工具以 "from instrument import ..." 导入本模块；以脚本方式运行时本模块名为 __main__，
+    # 需要让它们拿到同一个 Recorder
+    sys.modules['instrument'] = sys.modules[__name__]
+
+    import runpy
+    runpy.run_path(str(script), run_name='__main__')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,185 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+相克关系编译器：把 jinx.ts（中文名嵌套字典）与 jinxEn.json（{id, jinx: [...]} 列表）合并为
+按规范 id（英文 id）对索引的对称邻接表，输出 src/data/jinxIndex.ts：
+
+  JINX_PAIRS = [[a, b, 中文原因, 英文原因], ...]   a < b，按 (a, b) 排序；缺少某一语言时为空串
+
+jinx.ts 中无法对应到角色库的中文名（如改版角色）以 "zh:<中文名>" 作为 id 保留，与原先运行时
+按名字匹配的行为一致；jinxEn.json 中无法识别的 id 原样保留。
+
+scriptGenerator.ts 据此按剧本中角色的邻接边查找相克，不再对角色两两调用 hasJinx/getJinx；
+script_summary.py 也用同一份索引统计剧本内触发的相克对。
+
+编译时检查（输出到 stderr）：
+- unresolved  jinx.ts 中的中文名或 jinxEn.json 中的 id 无法对应到角色库（warning，按原名保留）
+- duplicate   同一语言内同一对角色出现多次且原因相同（warning，例如 add_jinx_en.py 重复追加）
+- conflict    同一语言内同一对角色出现多次且原因不同（error，以先出现的为准）
+- self        角色与自身相克（warning，被丢弃）
+存在 error 时以状态 1 退出且不写文件；--check 只比对已提交的文件是否为最新。
+"""
+import argparse
+import json
+import sys
+from functools import lru_cache
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+from chardb import DATA_DIR, CharacterDB, load_db
+from gen_lookup_tables import ZH_ORDER, runtime_dict
+from ts_literal import Parser, literal_start
+
+JINX_TS = DATA_DIR / 'jinx.ts'
+JINX_EN_JSON = DATA_DIR / 'jinxEn.json'
+OUTPUT_TS = DATA_DIR / 'jinxIndex.ts'
+
+HEADER = '''// 此文件由 python/jinx_index.py 自动生成，请勿手动修改。
+// jinx.ts / jinxEn.json 变化后运行：python ./python/jinx_index.py
+'''
+
+LANGS = ('zh-CN', 'en')
+# 角色库中没有的中文名所用的 id 前缀（运行时中文模式按同样规则生成）
+ZH_NAME_PREFIX = 'zh:'
+
+Pair = Tuple[str, str]
+
+
+def iter_jinx_ts() -> Iterator[Tuple[str, str, str]]:
+    """逐条产出 jinx.ts 中的 (中文名 A, 中文名 B, 原因)，重复键全部保留"""
+    data = JINX_TS.read_bytes()
+    parser = Parser(data, literal_start(data, r'const jinx\s*='))
+    parser.expect(b'{')
+    while parser.tok.text != b'}':
+        a = parser.key()
+        parser.expect(b':')
+        parser.expect(b'{')
+        for b, reason, _, _ in parser.entries():
+            yield a, b, reason
+        parser.skip_comma()
+
+
+def iter_jinx_en() -> Iterator[Tuple[str, str, str]]:
+    with JINX_EN_JSON.open('r', encoding='utf-8') as f:
+        for item in json.load(f):
+            for j in item.get('jinx') or []:
+                yield item.get('id', ''), j.get('id', ''), j.get('reason', '')
+
+
+class JinxIndex:
+    """规范 id 对 -> {语言: 原因}，以及对称邻接表"""
+
+    def __init__(self, db: CharacterDB):
+        self.db = db
+        self.pairs: Dict[Pair, Dict[str, str]] = {}
+        self.adjacency: Dict[str, List[str]] = {}
+        self.issues: List[Tuple[str, str, str]] = []  # (severity, code, message)
+
+        zh_names: Dict[str, str] = {}
+        for key, data in runtime_dict(db, ZH_ORDER).items():
+            zh_names.setdefault(data.get('name', ''), key)
+
+        for a, b, reason in iter_jinx_ts():
+            self.add('zh-CN', self.canonical(zh_names.get(a)), self.canonical(zh_names.get(b)), reason, a, b,
+                     ZH_NAME_PREFIX)
+        for a, b, reason in iter_jinx_en():
+            self.add('en', self.canonical(a), self.canonical(b), reason, a, b)
+
+        for a, b in self.pairs:
+            self.adjacency.setdefault(a, []).append(b)
+            self.adjacency.setdefault(b, []).append(a)
+        for neighbours in self.adjacency.values():
+            neighbours.sort()
+
+    def canonical(self, rid: Optional[str]) -> Optional[str]:
+        if not rid:
+            return None
+        c = self.db.get(rid)
+        return c.en_id if c is not None else None
+
+    def add(self, lang: str, a: Optional[str], b: Optional[str], reason: str, raw_a: str, raw_b: str,
+            prefix: str = ''):
+        where = f'{lang} {raw_a} / {raw_b}'
+        for raw in (raw_a if a is None else None, raw_b if b is None else None):
+            if raw is not None:
+                self.issues.append(('warning', 'unresolved', f'{where}: 角色库中没有 "{raw}"，按原名保留'))
+        a = a or prefix + raw_a
+        b = b or prefix + raw_b
+        if a == b:
+            self.issues.append(('warning', 'self', f'{where}: 角色与自身相克'))
+            return
+        key = (a, b) if a < b else (b, a)
+        reasons = self.pairs.setdefault(key, {})
+        current = reasons.get(lang)
+        if current is None:
+            reasons[lang] = reason
+        elif current == reason:
+            self.issues.append(('warning', 'duplicate', f'{where}: 重复的相克条目'))
+        else:
+            self.issues.append(('error', 'conflict', f'{where}: 原因不一致\n    {current}\n    {reason}'))
+
+    def reason(self, a: str, b: str, lang: str) -> str:
+        key = (a, b) if a < b else (b, a)
+        return self.pairs.get(key, {}).get(lang, '')
+
+    def script_jinxes(self, role_ids: Iterable[str], lang: Optional[str] = None) -> List[Pair]:
+        """剧本内触发的相克对 (a, b)，a < b；只遍历剧本角色的邻接边，与角色数的平方无关。
+        指定 lang 时只返回该语言有原因文本的相克"""
+        roles = set(role_ids)
+        found = []
+        for a in roles:
+            for b in self.adjacency.get(a, ()):
+                if a < b and b in roles and (lang is None or self.reason(a, b, lang)):
+                    found.append((a, b))
+        return sorted(found)
+
+
+@lru_cache(maxsize=1)
+def jinx_index() -> JinxIndex:
+    # 进程内只构建一次（进程池中每个子进程各构建一次）
+    return JinxIndex(load_db())
+
+
+def render_ts(index: JinxIndex) -> str:
+    rows = ''.join(
+        f'  {json.dumps([a, b, r.get("zh-CN", ""), r.get("en", "")], ensure_ascii=False)},\n'
+        for (a, b), r in sorted(index.pairs.items())
+    )
+    return (HEADER + '\n// [规范 id A, 规范 id B, 中文原因, 英文原因]，A < B\n'
+            f'export const JINX_PAIRS: readonly (readonly [string, string, string, string])[] = [\n{rows}];\n')
+
+
+def main():
+    parser = argparse.ArgumentParser(description='编译相克关系索引（src/data/jinxIndex.ts）')
+    parser.add_argument('--check', action='store_true', help='只检查已生成的文件是否为最新，不写入')
+    parser.add_argument('--quiet', action='store_true', help='只输出 error')
+    args = parser.parse_args()
+
+    index = jinx_index()
+    errors = 0
+    for severity, code, message in index.issues:
+        if severity == 'error':
+            errors += 1
+        elif args.quiet:
+            continue
+        print(f'{severity}: {code:10} {message}', file=sys.stderr)
+    if errors:
+        sys.exit(1)
+
+    content = render_ts(index)
+    current = OUTPUT_TS.read_text(encoding='utf-8') if OUTPUT_TS.exists() else ''
+    if args.check:
+        if current != content:
+            print(f'{OUTPUT_TS} 已过期，请运行 python ./python/jinx_index.py', file=sys.stderr)
+            sys.exit(1)
+        print(f'{OUTPUT_TS.name} is up to date')
+        return
+
+    if current != content:
+        OUTPUT_TS.write_text(content, encoding='utf-8', newline='\n')
+    both = sum(1 for r in index.pairs.values() if len(r) == len(LANGS))
+    print(f'Jinx index -> {OUTPUT_TS} ({len(index.pairs)} pairs, {both} in both languages, '
+          f'{len(index.issues)} issues)')
+
+
+if __name__ == '__main__':
+    main()
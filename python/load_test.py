@@ -0,0 +1,252 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+serve_public.py 的压测脚本：若干个 asyncio 客户端各自保持一条 keep-alive 连接，按轮询顺序请求
+一组路径，统计请求数/秒与延迟分位数（p50 / p90 / p99 / max），并按路径分别列出。
+
+默认请求组合模拟剧本库页面：
+- manifest.json（带 Accept-Encoding，命中 .br/.gz 预压缩副本时返回压缩内容）
+- manifest.json 带 If-None-Match（预热时取得的 ETag，应返回 304）
+- /api/manifest 分页、/api/search 搜索
+- 单个剧本 JSON 与一张图片的 Range 请求
+
+用法：
+    python python/load_test.py --spawn                      # 在随机端口启动 serve_public.py 后压测
+    python python/load_test.py --url http://127.0.0.1:8787  # 压测已运行的服务器
+    python python/load_test.py --spawn --path /scripts/json/manifest.json --duration 10
+
+注意客户端与服务器在同一台机器上时会争用 CPU，结果偏保守。
+"""
+import argparse
+import asyncio
+import json
+import os
+import socket
+import subprocess
+import sys
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+from urllib.parse import quote, urlsplit
+
+PYTHON_DIR = Path(__file__).resolve().parent
+DEFAULT_URL = 'http://127.0.0.1:8787'
+DEFAULT_CONCURRENCY = 32
+DEFAULT_DURATION = 5.0
+DEFAULT_ACCEPT_ENCODING = 'br, gzip'
+SPAWN_TIMEOUT = 10.0
+
+# (名称, 路径, 额外请求头)；'{etag}' 在预热后替换为该路径首个响应的 ETag
+DEFAULT_SCENARIOS: List[Tuple[str, str, Dict[str, str]]] = [
+    ('manifest', '/scripts/json/manifest.json', {}),
+    ('manifest-304', '/scripts/json/manifest.json', {'If-None-Match': '{etag}'}),
+    ('api-page', '/api/manifest?category=custom&page=1&pageSize=50', {}),
+    ('api-search', '/api/search?q=' + quote('暗流'), {}),
+    ('script', '/scripts/json/official/' + quote('Trouble Brewing.json'), {}),
+    ('range', '/bg.png', {'Range': 'bytes=0-65535'}),
+]
+
+
+class Connection:
+    def __init__(self, host: str, port: int):
+        self.host = host
+        self.port = port
+        self.reader: Optional[asyncio.StreamReader] = None
+        self.writer: Optional[asyncio.StreamWriter] = None
+
+    async def request(self, path: str, headers: Dict[str, str]) -> Tuple[int, Dict[str, str], int]:
+        """发送 GET 并读完响应体，返回 (状态码, 响应头, 响应体字节数)；连接断开时自动重连一次"""
+        for attempt in (0, 1):
+            if self.writer is None:
+                self.reader, self.writer = await asyncio.open_connection(self.host, self.port)
+            lines = [f'GET {path} HTTP/1.1', f'Host: {self.host}:{self.port}']
+            lines.extend(f'{k}: {v}' for k, v in headers.items())
+            self.writer.write(('\r\n'.join(lines) + '\r\n\r\n').encode('utf-8'))
+            try:
+                head = await self.reader.readuntil(b'\r\n\r\n')
+            except (asyncio.IncompleteReadError, ConnectionError):
+                self.close()
+                if attempt:
+                    raise
+                continue
+            status_line, *header_lines = head.decode('latin-1').rstrip('\r\n').split('\r\n')
+            status = int(status_line.split(' ', 2)[1])
+            response_headers = {}
+            for line in header_lines:
+                name, _, value = line.partition(':')
+                response_headers[name.strip().lower()] = value.strip()
+            length = int(response_headers.get('content-length') or 0)
+            if length:
+                await self.reader.readexactly(length)
+            if response_headers.get('connection', '').lower() == 'close':
+                self.close()
+            return status, response_headers, length
+        raise ConnectionError('连接被关闭')
+
+    def close(self):
+        if self.writer is not None:
+            self.writer.close()
+        self.reader = self.writer = None
+
+
+def percentile(sorted_values: List[float], p: float) -> float:
+    if not sorted_values:
+        return 0.0
+    index = min(len(sorted_values) - 1, max(0, int(round(p / 100 * len(sorted_values) + 0.5)) - 1))
+    return sorted_values[index]
+
+
+def summarize(latencies: List[float]) -> Dict[str, float]:
+    values = sorted(latencies)
+    return {
+        'requests': len(values),
+        'p50': round(percentile(values, 50) * 1000, 3),
+        'p90': round(percentile(values, 90) * 1000, 3),
+        'p99': round(percentile(values, 99) * 1000, 3),
+        'max': round((values[-1] if values else 0.0) * 1000, 3),
+    }
+
+
+async def warm_up(host: str, port: int, scenarios: List[Tuple[str, str, Dict[str, str]]],
+                  accept_encoding: str) -> List[Tuple[str, str, Dict[str, str]]]:
+    """每个路径先请求一次：确认可访问，并把 {etag} 占位符替换为实际 ETag"""
+    conn = Connection(host, port)
+    etags: Dict[str, str] = {}
+    resolved = []
+    try:
+        for name, path, headers in scenarios:
+            base = {'Accept-Encoding': accept_encoding} if accept_encoding else {}
+            if path not in etags:
+                status, response_headers, _ = await conn.request(path, base)
+                if status >= 400:
+                    print(f'warning: {name} {path} -> {status}', file=sys.stderr)
+                etags[path] = response_headers.get('etag', '')
+            resolved.append((name, path, {**base, **{k: v.replace('{etag}', etags[path])
+                                                     for k, v in headers.items()}}))
+    finally:
+        conn.close()
+    return resolved
+
+
+async def run_load(host: str, port: int, scenarios: List[Tuple[str, str, Dict[str, str]]], concurrency: int,
+                   duration: float, total: Optional[int]) -> Dict[str, Any]:
+    latencies: Dict[str, List[float]] = {name: [] for name, _, _ in scenarios}
+    statuses: Dict[int, int] = {}
+    errors = 0
+    received = 0
+    issued = 0
+    deadline = time.perf_counter() + duration
+
+    async def worker(offset: int):
+        nonlocal errors, received, issued
+        conn = Connection(host, port)
+        i = offset
+        try:
+            while time.perf_counter() < deadline and (total is None or issued < total):
+                issued += 1
+                name, path, headers = scenarios[i % len(scenarios)]
+                i += 1
+                start = time.perf_counter()
+                try:
+                    status, _, length = await conn.request(path, headers)
+                except (OSError, asyncio.IncompleteReadError, ValueError):
+                    errors += 1
+                    conn.close()
+                    continue
+                latencies[name].append(time.perf_counter() - start)
+                statuses[status] = statuses.get(status, 0) + 1
+                received += length
+        finally:
+            conn.close()
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker(n) for n in range(concurrency)))
+    elapsed = time.perf_counter() - started
+    everything = [v for values in latencies.values() for v in values]
+    return {
+        'concurrency': concurrency,
+        'seconds': round(elapsed, 3),
+        'requestsPerSecond': round(len(everything) / elapsed, 1) if elapsed else 0.0,
+        'latencyMs': summarize(everything),
+        'statuses': {str(k): v for k, v in sorted(statuses.items())},
+        'errors': errors,
+        'bytes': received,
+        'scenarios': {name: {'path': path, **summarize(latencies[name])} for name, path, _ in scenarios},
+    }
+
+
+def free_port() -> int:
+    with socket.socket() as s:
+        s.bind(('127.0.0.1', 0))
+        return s.getsockname()[1]
+
+
+def spawn_server(port: int, root: Optional[Path]) -> subprocess.Popen:
+    cmd = [sys.executable, str(PYTHON_DIR / 'serve_public.py'), '--port', str(port)]
+    if root is not None:
+        cmd += ['--root', str(root)]
+    proc = subprocess.Popen(cmd, stdout=subprocess.PIPE, text=True, env={**os.environ, 'PYTHONUNBUFFERED': '1'})
+    deadline = time.monotonic() + SPAWN_TIMEOUT
+    while time.monotonic() < deadline:
+        line = proc.stdout.readline()
+        if line.startswith('Serving'):
+            print(line.rstrip(), file=sys.stderr)
+            return proc
+        if not line and proc.poll() is not None:
+            break
+    proc.kill()
+    raise SystemExit('serve_public.py 启动失败')
+
+
+def print_report(report: Dict[str, Any]):
+    lat = report['latencyMs']
+    print(f"{lat['requests']} requests in {report['seconds']:.2f} s with {report['concurrency']} connections: "
+          f"{report['requestsPerSecond']:.0f} req/s, {report['bytes'] / 1024 / 1024:.1f} MiB received")
+    print(f"latency ms: p50 {lat['p50']:.2f}  p90 {lat['p90']:.2f}  p99 {lat['p99']:.2f}  max {lat['max']:.2f}")
+    print(f"statuses: {', '.join(f'{k}: {v}' for k, v in report['statuses'].items())}; errors: {report['errors']}")
+    print(f"{'scenario':14} {'requests':>9} {'p50':>8} {'p99':>8}  path")
+    for name, s in report['scenarios'].items():
+        print(f"{name:14} {s['requests']:>9} {s['p50']:>8.2f} {s['p99']:>8.2f}  {s['path']}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description='serve_public.py 压测：请求数/秒与 p99 延迟')
+    parser.add_argument('--url', default=DEFAULT_URL, help=f'服务器地址（默认 {DEFAULT_URL}）')
+    parser.add_argument('--spawn', action='store_true', help='在空闲端口启动 serve_public.py，压测结束后关闭')
+    parser.add_argument('--root', type=Path, help='--spawn 时传给服务器的静态文件根目录')
+    parser.add_argument('--concurrency', '-c', type=int, default=DEFAULT_CONCURRENCY, help='并发连接数')
+    parser.add_argument('--duration', '-d', type=float, default=DEFAULT_DURATION, help='压测时长（秒）')
+    parser.add_argument('--requests', '-n', type=int, help='请求总数上限（达到时提前结束）')
+    parser.add_argument('--path', action='append', help='只压测这些路径（可重复；默认使用内置的请求组合）')
+    parser.add_argument('--accept-encoding', default=DEFAULT_ACCEPT_ENCODING,
+                        help=f'Accept-Encoding 请求头，空字符串表示不压缩（默认 "{DEFAULT_ACCEPT_ENCODING}"）')
+    parser.add_argument('--json', action='store_true', help='以 JSON 输出结果')
+    args = parser.parse_args()
+
+    proc = None
+    if args.spawn:
+        port = free_port()
+        proc = spawn_server(port, args.root)
+        host = '127.0.0.1'
+    else:
+        parts = urlsplit(args.url)
+        host, port = parts.hostname or '127.0.0.1', parts.port or 80
+
+    scenarios = ([(p, p, {}) for p in args.path] if args.path else DEFAULT_SCENARIOS)
+    try:
+        resolved = asyncio.run(warm_up(host, port, scenarios, args.accept_encoding))
+        report = asyncio.run(run_load(host, port, resolved, args.concurrency, args.duration, args.requests))
+    finally:
+        if proc is not None:
+            proc.terminate()
+            proc.wait()
+
+    if args.json:
+        json.dump(report, sys.stdout, ensure_ascii=False, indent=2)
+        sys.stdout.write('\n')
+    else:
+        print_report(report)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,128 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+生成夜晚行动顺序表 src/data/nightOrder.ts，供 scriptGenerator.ts 直接查表：
+- NIGHT_ORDER        id -> [首夜顺序, 其他夜晚顺序]，只收录至少有一项非 0 的角色
+- FIRST_NIGHT_STEPS  首夜行动的角色，按顺序排好，附中英文提示文本
+- OTHER_NIGHT_STEPS  其他夜晚行动的角色，同上
+
+覆盖官方角色、自制角色、传奇（fabled.ts）与 Loric（loric.ts）。
+NIGHT_ORDER 的键包含中文库与英文库中的全部 id 及 CN/EN 映射中的 id，取值与运行时
+getNightOrderFromChinese() 原先的探测结果一致：先取 CHARACTERS[normalizeCharacterId(id, 'zh-CN')]，
+不存在时取 CHARACTERS[id]；均不存在（或两项都为 0）则不收录，查表结果按 0 处理。
+
+manifest 生成摘要（--summary）时用同一张表为每个剧本预先排好首夜/其他夜晚的行动序列。
+--check 只比对已提交的文件是否为最新。
+"""
+import argparse
+import json
+import sys
+from functools import lru_cache
+from typing import Any, Dict, List, Tuple
+
+from chardb import DATA_DIR, CharacterDB, load_db
+from gen_lookup_tables import EN_ORDER, ZH_ORDER, runtime_dict
+
+OUTPUT_TS = DATA_DIR / 'nightOrder.ts'
+
+HEADER = '''// 此文件由 python/night_order.py 自动生成，请勿手动修改。
+// 数据源变化后运行：python ./python/night_order.py
+'''
+
+TS_TYPES = '''
+export interface NightStep {
+  id: string;
+  cnId: string;
+  team: string;
+  order: number;
+  reminder: { 'zh-CN': string; en: string };
+}
+'''
+
+# 参与夜晚行动排序的阵营（与 generateScript() 一致：传奇、旅行者不进入夜晚顺序）
+NIGHT_TEAMS = ('townsfolk', 'outsider', 'minion', 'demon')
+
+
+def order_value(value: Any) -> int:
+    return value if isinstance(value, int) and not isinstance(value, bool) else 0
+
+
+class NightOrderTable:
+    """id -> (首夜, 其他夜晚)，与运行时从中文库（CHARACTERS）取值的方式一致"""
+
+    def __init__(self, db: CharacterDB):
+        self.db = db
+        zh = runtime_dict(db, ZH_ORDER)
+        en = runtime_dict(db, EN_ORDER)
+        self.orders: Dict[str, Tuple[int, int]] = {}
+        for key in sorted(set(zh) | set(en) | set(db.cn_to_en) | set(db.en_to_cn)):
+            cn_id = db.en_to_cn.get(key, key)
+            data = zh.get(cn_id) if cn_id in zh else zh.get(key)
+            if data is None:
+                continue
+            first, other = order_value(data.get('firstNight')), order_value(data.get('otherNight'))
+            if first or other:
+                self.orders[key] = (first, other)
+
+    def get(self, rid: str) -> Tuple[int, int]:
+        return self.orders.get(rid, (0, 0))
+
+    def steps(self, night: int) -> List[Dict[str, Any]]:
+        """night 为 0（首夜）或 1（其他夜晚）"""
+        steps = []
+        for c in self.db.characters.values():
+            order = self.get(c.cn_id or c.en_id)[night]
+            if not order:
+                continue
+            reminder = ((c.first_night_reminder_zh, c.first_night_reminder_en) if night == 0
+                        else (c.other_night_reminder_zh, c.other_night_reminder_en))
+            steps.append({
+                'id': c.en_id,
+                'cnId': c.cn_id,
+                'team': c.team,
+                'order': order,
+                'reminder': {'zh-CN': reminder[0], 'en': reminder[1]},
+            })
+        steps.sort(key=lambda s: (s['order'], s['id']))
+        return steps
+
+
+@lru_cache(maxsize=1)
+def night_order_table() -> NightOrderTable:
+    # 进程内只构建一次（进程池中每个子进程各构建一次）
+    return NightOrderTable(load_db())
+
+
+def render_ts(table: NightOrderTable) -> str:
+    parts = [HEADER, TS_TYPES]
+    lines = ''.join(f'  {json.dumps(k, ensure_ascii=False)}: [{a}, {b}],\n' for k, (a, b) in sorted(table.orders.items()))
+    parts.append(f'\nexport const NIGHT_ORDER: Record<string, readonly [number, number]> = {{\n{lines}}};\n')
+    for name, night in (('FIRST_NIGHT_STEPS', 0), ('OTHER_NIGHT_STEPS', 1)):
+        rows = ''.join(f'  {json.dumps(s, ensure_ascii=False)},\n' for s in table.steps(night))
+        parts.append(f'\nexport const {name}: readonly NightStep[] = [\n{rows}];\n')
+    return ''.join(parts)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='生成夜晚行动顺序表（src/data/nightOrder.ts）')
+    parser.add_argument('--check', action='store_true', help='只检查已生成的文件是否为最新，不写入')
+    args = parser.parse_args()
+
+    table = night_order_table()
+    content = render_ts(table)
+    current = OUTPUT_TS.read_text(encoding='utf-8') if OUTPUT_TS.exists() else ''
+    if args.check:
+        if current != content:
+            print(f'{OUTPUT_TS} 已过期，请运行 python ./python/night_order.py', file=sys.stderr)
+            sys.exit(1)
+        print(f'{OUTPUT_TS.name} is up to date')
+        return
+
+    if current != content:
+        OUTPUT_TS.write_text(content, encoding='utf-8', newline='\n')
+    print(f'Night order -> {OUTPUT_TS} ({len(table.orders)} ids, '
+          f'{len(table.steps(0))} first-night steps, {len(table.steps(1))} other-night steps)')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,242 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+public/imgs 图片优化（依赖 Pillow，可选安装：pip install pillow）：
+- 每张 PNG/JPEG/WebP 生成多个宽度的 WebP（以及 Pillow 支持时的 AVIF）变体，不放大原图
+- 去除 EXIF/XMP/文本块等元数据（保留 ICC 色彩配置）
+- 输出到 public/imgs/_optimized/，并写出资源映射 public/imgs/asset-map.json：
+  {
+    "version": 1,
+    "images": {
+      "/imgs/images/content_back.png": {
+        "width": 2480, "height": 3508, "bytes": 1115727,
+        "variants": [{"url": "...-640.webp", "format": "webp", "width": 640, "height": 905, "bytes": 41234}, ...]
+      }
+    }
+  }
+  前端可按显示宽度和浏览器支持的格式选择最小的变体，找不到时回退到原图。
+- 多进程并行；按内容哈希缓存（.cache/image-cache.json），未变化的图片直接复用上次结果
+- 前端尚未读取 asset-map.json，因此不在 prebuild 中运行（变体会随 public/ 一起被复制进构建产物），
+  需要时手动执行 yarn gen:images
+"""
+import argparse
+import hashlib
+import json
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from io import BytesIO
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+try:
+    from PIL import Image, features  # type: ignore
+except ImportError:  # Pillow 为可选依赖
+    Image = None
+    features = None
+
+from generate_manifest import CACHE_DIR, ROOT, content_hash, default_workers
+from icon_atlas import ATLAS_DIR
+
+PUBLIC_DIR = ROOT / 'public'
+IMGS_DIR = PUBLIC_DIR / 'imgs'
+OUTPUT_DIR = IMGS_DIR / '_optimized'
+ASSET_MAP_PATH = IMGS_DIR / 'asset-map.json'
+IMAGE_CACHE_PATH = CACHE_DIR / 'image-cache.json'
+IMAGE_CACHE_VERSION = 1
+
+SOURCE_EXTS = ('.png', '.jpg', '.jpeg', '.webp')
+WIDTHS = (160, 320, 640, 960, 1280, 1920)
+QUALITY = {'webp': 80, 'avif': 55}
+# 编码速度档位：WebP method 0-6 越大越慢，AVIF speed 0-10 越大越快
+EFFORT = {'webp': ('method', 4), 'avif': ('speed', 8)}
+# 原尺寸变体不小于原图时不保留（缩小后的变体总是保留）
+MIN_SAVING_BYTES = 1
+
+
+def available_formats() -> Tuple[str, ...]:
+    if Image is None:
+        return ()
+    formats = ['webp'] if features.check('webp') else []
+    if not features.check('avif'):
+        try:
+            import pillow_avif  # type: ignore  # noqa: F401  旧版 Pillow 通过插件注册 AVIF
+        except ImportError:
+            pass
+    Image.init()  # 插件按需注册，先加载才能从 Image.SAVE 判断
+    if 'AVIF' in Image.SAVE:
+        formats.append('avif')
+    return tuple(formats)
+
+
+def iter_sources() -> List[Path]:
+    """public/imgs 下的源图片；跳过本工具的输出目录与 icon_atlas.py 生成的精灵图
+    （精灵图的坐标写在 atlas.json 中，缩放后的副本无法对应）"""
+    generated = (OUTPUT_DIR, ATLAS_DIR)
+    return sorted(
+        p for p in IMGS_DIR.rglob('*')
+        if p.is_file() and p.suffix.lower() in SOURCE_EXTS and not any(d in p.parents for d in generated)
+    )
+
+
+def public_url(p: Path) -> str:
+    return '/' + p.relative_to(PUBLIC_DIR).as_posix()
+
+
+def settings_key(formats: Tuple[str, ...]) -> str:
+    """输出参数变化时（宽度、格式、质量、速度档位）缓存失效"""
+    return hashlib.sha1(json.dumps([WIDTHS, formats, QUALITY, EFFORT]).encode('ascii')).hexdigest()[:12]
+
+
+def target_widths(width: int) -> List[int]:
+    return [w for w in WIDTHS if w < width] + [width]
+
+
+def encode(img: 'Image.Image', fmt: str, icc: Optional[bytes]) -> bytes:
+    out = BytesIO()
+    params: Dict[str, Any] = {'quality': QUALITY[fmt]}
+    name, value = EFFORT[fmt]
+    params[name] = value
+    if icc:
+        params['icc_profile'] = icc
+    # 不传 exif/xmp，即去除元数据
+    img.save(out, format=fmt.upper(), **params)
+    return out.getvalue()
+
+
+def _optimize_one(job: Tuple[Path, Tuple[str, ...]]) -> Dict[str, Any]:
+    """生成单张图片的全部变体，返回资源映射条目"""
+    src, formats = job
+    raw = src.read_bytes()
+    with Image.open(BytesIO(raw)) as im:
+        im.load()
+        icc = im.info.get('icc_profile')
+        has_alpha = im.mode in ('RGBA', 'LA', 'PA') or (im.mode == 'P' and 'transparency' in im.info)
+        img = im.convert('RGBA' if has_alpha else 'RGB')
+    width, height = img.size
+
+    rel = src.relative_to(IMGS_DIR).with_suffix('')
+    variants = []
+    for w in target_widths(width):
+        h = max(1, round(height * w / width))
+        resized = img if w == width else img.resize((w, h), Image.LANCZOS)
+        for fmt in formats:
+            data = encode(resized, fmt, icc)
+            if w == width and len(raw) - len(data) < MIN_SAVING_BYTES:
+                continue
+            dst = OUTPUT_DIR / rel.parent / f'{rel.name}-{w}.{fmt}'
+            dst.parent.mkdir(parents=True, exist_ok=True)
+            tmp = dst.with_name(dst.name + '.tmp')
+            tmp.write_bytes(data)
+            os.replace(tmp, dst)
+            variants.append({'url': public_url(dst), 'format': fmt, 'width': w, 'height': h, 'bytes': len(data)})
+
+    return {'width': width, 'height': height, 'bytes': len(raw), 'variants': variants}
+
+
+def load_cache() -> Dict[str, Any]:
+    try:
+        with IMAGE_CACHE_PATH.open('r', encoding='utf-8') as f:
+            cache = json.load(f)
+        if cache.get('version') == IMAGE_CACHE_VERSION and isinstance(cache.get('files'), dict):
+            return cache
+    except Exception:
+        pass
+    return {'version': IMAGE_CACHE_VERSION, 'files': {}}
+
+
+def save_cache(cache: Dict[str, Any]):
+    CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    tmp = IMAGE_CACHE_PATH.with_suffix('.tmp')
+    with tmp.open('w', encoding='utf-8') as f:
+        json.dump(cache, f, ensure_ascii=False, separators=(',', ':'))
+    os.replace(tmp, IMAGE_CACHE_PATH)
+
+
+def optimize_all(force: bool = False, workers: Optional[int] = None) -> Dict[str, Any]:
+    formats = available_formats()
+    key = settings_key(formats)
+    cache = {'version': IMAGE_CACHE_VERSION, 'files': {}} if force else load_cache()
+    cached_files: Dict[str, Any] = cache['files']
+    next_files: Dict[str, Any] = {}
+    stats = {'images': 0, 'reused': 0, 'processed': 0}
+
+    jobs: List[Tuple[Path, Tuple[str, ...]]] = []
+    hashes: Dict[Path, str] = {}
+    for src in iter_sources():
+        url = public_url(src)
+        digest = content_hash(src.read_bytes())
+        hashes[src] = digest
+        record = cached_files.get(url)
+        if (record is not None and record['hash'] == digest and record['settings'] == key
+                and all((PUBLIC_DIR / v['url'].lstrip('/')).exists() for v in record['entry']['variants'])):
+            next_files[url] = record
+            stats['reused'] += 1
+        else:
+            jobs.append((src, formats))
+
+    workers = workers or default_workers()
+    if workers > 1 and len(jobs) > 1:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            results = list(pool.map(_optimize_one, jobs))
+    else:
+        results = [_optimize_one(job) for job in jobs]
+
+    for (src, _), entry in zip(jobs, results):
+        next_files[public_url(src)] = {'hash': hashes[src], 'settings': key, 'entry': entry}
+        stats['processed'] += 1
+
+    # 源图已删除或变体不再生成的，清理旧输出
+    keep = {v['url'] for record in next_files.values() for v in record['entry']['variants']}
+    for record in cached_files.values():
+        for v in record['entry']['variants']:
+            if v['url'] not in keep:
+                stale = PUBLIC_DIR / v['url'].lstrip('/')
+                if stale.exists():
+                    stale.unlink()
+
+    cache['files'] = next_files
+    save_cache(cache)
+
+    images = {url: next_files[url]['entry'] for url in sorted(next_files)}
+    asset_map = {'version': 1, 'formats': list(formats), 'images': images}
+    data = json.dumps(asset_map, ensure_ascii=False, separators=(',', ':'))
+    current = ASSET_MAP_PATH.read_text(encoding='utf-8') if ASSET_MAP_PATH.exists() else ''
+    if data != current:
+        ASSET_MAP_PATH.write_text(data, encoding='utf-8')
+
+    stats['images'] = len(images)
+    stats['formats'] = formats
+    stats['originalBytes'] = sum(e['bytes'] for e in images.values())
+    # 以每张图原尺寸下最小的变体（没有则为原图）计算节省量
+    stats['optimizedBytes'] = sum(
+        min([v['bytes'] for v in e['variants'] if v['width'] == e['width']] + [e['bytes']])
+        for e in images.values()
+    )
+    stats['variants'] = sum(len(e['variants']) for e in images.values())
+    return stats
+
+
+def main():
+    parser = argparse.ArgumentParser(description='把 public/imgs 下的图片转为多尺寸 WebP/AVIF 并生成资源映射')
+    parser.add_argument('--force', action='store_true', help='忽略缓存，重新处理所有图片')
+    parser.add_argument('--workers', type=int, default=None, help='并行进程数（默认 CPU 核数）')
+    args = parser.parse_args()
+
+    if Image is None:
+        print('Pillow 未安装，跳过图片优化（pip install pillow）', file=sys.stderr)
+        return
+
+    start = time.perf_counter()
+    stats = optimize_all(force=args.force, workers=args.workers)
+    before, after = stats['originalBytes'], stats['optimizedBytes']
+    print(f"Optimized {stats['images']} images ({', '.join(stats['formats'])}): "
+          f"{stats['processed']} processed, {stats['reused']} reused, {stats['variants']} variants")
+    if before:
+        print(f'Full-size bytes: {before / 1024 / 1024:.2f} MiB -> {after / 1024 / 1024:.2f} MiB '
+              f'({after / before:.1%}) in {time.perf_counter() - start:.1f}s -> {ASSET_MAP_PATH}')
+
+
+if __name__ == '__main__':
+    main()
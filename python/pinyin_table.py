@@ -0,0 +1,150 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+汉字 -> 拼音 查表工具（供搜索索引等构建步骤使用）
+- 逐字读音来自随仓库提交的 python/pinyin_chars.txt（覆盖 CJK 基本区与扩展 A 区，约 2.7 万字），
+  构建时不需要任何第三方库，各机器上生成的搜索索引一致
+- 该表由 pypinyin 生成（多音字取其默认读音，ü 记作 v）；升级 pypinyin 后可重新生成：
+    pip install pypinyin
+    python python/pinyin_table.py --update-table
+- 查不到读音的汉字会抛出 PinyinTableError，而不是被静默跳过（否则会拼出错位的全拼/首字母）
+- --check 校验剧本库中所有剧本名的汉字都有读音
+"""
+import argparse
+import re
+import sys
+from functools import lru_cache
+from pathlib import Path
+from typing import Dict, List, Optional
+
+ROOT = Path(__file__).resolve().parents[1]
+PINYIN_MAP_TS = ROOT / 'src' / 'data' / 'pinyinMap.ts'
+CHAR_TABLE_PATH = Path(__file__).resolve().parent / 'pinyin_chars.txt'
+
+# 表覆盖的码位范围，与 is_cjk() 一致
+CJK_RANGES = ((0x4E00, 0x9FFF), (0x3400, 0x4DBF))
+
+
+class PinyinTableError(LookupError):
+    pass
+
+
+def is_cjk(ch: str) -> bool:
+    return '一' <= ch <= '鿿' or '㐀' <= ch <= '䶿'
+
+
+def parse_pinyin_map(path: Path = PINYIN_MAP_TS) -> Dict[str, str]:
+    """解析 PINYIN_MAP: 形如  '主教': 'zhujiao',"""
+    text = path.read_text(encoding='utf-8')
+    return dict(re.findall(r"'([^']+)'\s*:\s*'([a-z]+)'", text))
+
+
+@lru_cache(maxsize=1)
+def char_table() -> Dict[str, str]:
+    """读取逐字拼音表。文件格式：每行 `音节<TAB>该读音的全部汉字`，# 开头为注释"""
+    try:
+        text = CHAR_TABLE_PATH.read_text(encoding='utf-8')
+    except OSError as e:
+        raise PinyinTableError(f'缺少拼音表 {CHAR_TABLE_PATH}，请运行 '
+                               f'python python/pinyin_table.py --update-table 重新生成') from e
+    table: Dict[str, str] = {}
+    for line in text.splitlines():
+        if not line or line.startswith('#'):
+            continue
+        syllable, _, chars = line.partition('\t')
+        for ch in chars:
+            table[ch] = syllable
+    return table
+
+
+def char_pinyin(ch: str) -> Optional[str]:
+    """非汉字返回 None；汉字查不到读音时抛出 PinyinTableError"""
+    if not is_cjk(ch):
+        return None
+    syllable = char_table().get(ch)
+    if syllable is None:
+        raise PinyinTableError(f'拼音表中没有 {ch!r}（U+{ord(ch):04X}）的读音：安装 pypinyin 后运行 '
+                               'python python/pinyin_table.py --update-table')
+    return syllable
+
+
+def to_pinyin(text: str) -> List[str]:
+    """把文本中的汉字逐字转为拼音音节，非汉字字符被跳过；查不到读音的汉字抛出 PinyinTableError"""
+    syllables: List[str] = []
+    for ch in text:
+        syl = char_pinyin(ch)
+        if syl:
+            syllables.append(syl)
+    return syllables
+
+
+def build_table() -> Dict[str, str]:
+    """用 pypinyin 为 CJK_RANGES 内的每个汉字取默认读音"""
+    try:
+        from pypinyin import lazy_pinyin  # type: ignore
+    except ImportError:
+        raise SystemExit('重新生成拼音表需要 pypinyin：pip install pypinyin')
+    table: Dict[str, str] = {}
+    for start, end in CJK_RANGES:
+        for cp in range(start, end + 1):
+            ch = chr(cp)
+            result = lazy_pinyin(ch, errors='ignore')
+            if result and re.fullmatch(r'[a-z]+', result[0]):
+                table[ch] = result[0]
+    return table
+
+
+def write_table(table: Dict[str, str], path: Path = CHAR_TABLE_PATH):
+    groups: Dict[str, List[str]] = {}
+    for ch in sorted(table):
+        groups.setdefault(table[ch], []).append(ch)
+    lines = [
+        '# 由 python/pinyin_table.py --update-table 用 pypinyin 生成，请勿手动修改',
+        '# 格式：音节<TAB>该读音的全部汉字（多音字取默认读音，ü 记作 v）',
+    ]
+    lines.extend(f'{syllable}\t{"".join(chars)}' for syllable, chars in sorted(groups.items()))
+    path.write_text('\n'.join(lines) + '\n', encoding='utf-8')
+
+
+def check() -> List[str]:
+    """剧本库中所有剧本名里查不到读音的汉字"""
+    from generate_manifest import build_entry, extract_script_meta, iter_script_files
+
+    table = char_table()
+    missing: List[str] = []
+    for jf, category in iter_script_files():
+        try:
+            name = build_entry(jf, category, extract_script_meta(jf.read_bytes()))['name']
+        except Exception:
+            continue  # 无法解析的剧本由 validate_scripts.py 报告
+        unknown = sorted({ch for ch in name if is_cjk(ch) and ch not in table})
+        if unknown:
+            missing.append(f'{jf.relative_to(ROOT)}: {name!r} 缺少 {"".join(unknown)}')
+    return missing
+
+
+def main():
+    parser = argparse.ArgumentParser(description='逐字拼音表：重新生成与覆盖率校验')
+    parser.add_argument('--update-table', action='store_true', help=f'用 pypinyin 重新生成 {CHAR_TABLE_PATH.name}')
+    parser.add_argument('--check', action='store_true', help='校验全部剧本名的汉字都有读音')
+    args = parser.parse_args()
+
+    if args.update_table:
+        table = build_table()
+        write_table(table)
+        char_table.cache_clear()
+        print(f'Pinyin table: {len(table)} chars, {len(set(table.values()))} syllables -> {CHAR_TABLE_PATH}')
+    if args.check:
+        missing = check()
+        for line in missing:
+            print(f'error: {line}', file=sys.stderr)
+        if missing:
+            sys.exit(1)
+        print('All script names have pinyin readings')
+    if not (args.update_table or args.check):
+        table = char_table()
+        print(f'chars in {CHAR_TABLE_PATH.name}: {len(table)} ({len(set(table.values()))} syllables)')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,558 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+命令行批量渲染剧本角色表与夜晚顺序表（SVG，安装 cairosvg 时另出 PDF），不依赖浏览器。
+
+每个剧本输出两页（按语言分目录，zh-CN 与 en 可以同时保留）：
+- sheets/<语言>/<剧本>.svg        角色表：标题、作者，按阵营分节，每个角色一块（图标 + 名称 + 能力）
+- sheets/<语言>/<剧本>.night.svg  夜晚顺序：首个夜晚 / 其他夜晚两栏（图标 + 名称 + 提示文本）
+页面为 A4（96 dpi），内容超出时页面高度随之增加。
+
+角色数据来自 chardb 快照，识别方式与剧本库预览（官方 id 解析模式）一致：已识别角色用官方数据，
+自定义角色用 JSON 中的字段；夜晚顺序取 night_order.py 的表。
+输出文件自包含，可以归档或拷贝到其他机器：
+- 图标取 public/ 下的站内图片或 icon_atlas.py 的本地镜像，内嵌为 data URI（安装 Pillow 时先缩小为 PNG），
+  找不到时画占位圆
+- 标题字体（public/font 下的本地字体）内嵌到 SVG：安装 fontTools 时只保留页面用到的字形；
+  否则体积不超过 MAX_EMBED_FONT_BYTES 的字体整体内嵌，更大的字体只按名称引用本机已安装的字体
+
+文字换行按字体度量计算：安装 fontTools 时读取本地字体的字宽，否则按全角 1em / 半角 0.55em 估算。
+每个角色块的排版结果（分行与高度）按内容哈希缓存在 .cache/sheet-layout.json，
+剧本之间共享同一角色时直接复用。剧本数量较多时使用进程池并行渲染。
+"""
+import argparse
+import base64
+import hashlib
+import json
+import logging
+import mimetypes
+import os
+import sys
+import time
+import unicodedata
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from io import BytesIO
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+from xml.sax.saxutils import escape, quoteattr
+
+try:
+    from fontTools import subset as ft_subset  # type: ignore
+    from fontTools.ttLib import TTFont  # type: ignore
+except ImportError:  # fontTools 为可选依赖
+    ft_subset = None
+    TTFont = None
+
+try:
+    from PIL import Image  # type: ignore
+except ImportError:  # Pillow 为可选依赖
+    Image = None
+
+try:
+    import cairosvg  # type: ignore
+except (ImportError, OSError):  # cairosvg 为可选依赖（还需要系统的 cairo 库）
+    cairosvg = None
+
+from chardb import load_db
+from generate_manifest import CACHE_DIR, JSON_ROOT, PARALLEL_THRESHOLD, ROOT, default_workers, iter_script_files
+from icon_atlas import load_mirror_index, resolve_icon
+from night_order import NIGHT_TEAMS, night_order_table, order_value
+from script_summary import NON_ROLE_TEAMS, TEAMS, role_index
+
+OUTPUT_DIR = ROOT / 'sheets'
+LAYOUT_CACHE_PATH = CACHE_DIR / 'sheet-layout.json'
+# 排版参数或算法变化时递增，使旧缓存整体失效
+LAYOUT_VERSION = 1
+FORMATS = ('svg', 'pdf')
+
+# 页面与版式（单位 px，96 dpi）
+PAGE_WIDTH, PAGE_HEIGHT = 794, 1123
+MARGIN = 36
+COLUMN_GAP = 16
+ICON_SIZE = 44
+ICON_GAP = 8
+BLOCK_GAP = 8
+NAME_SIZE = 14
+TEXT_SIZE = 11
+LINE_HEIGHT = 1.4
+TITLE_SIZE = 30
+SECTION_SIZE = 16
+NIGHT_ICON_SIZE = 28
+NIGHT_TEXT_SIZE = 9
+# 内嵌图标的像素边长（打印时约 2 倍清晰度）
+EMBED_ICON_PX = 96
+# 未安装 fontTools 无法裁剪时，整体内嵌的字体大小上限（HYJiFengTiU 约 3 MB，超出）
+MAX_EMBED_FONT_BYTES = 512 * 1024
+
+BODY_FONT_FAMILY = '"Source Han Serif", "Source Han Serif SC", "Noto Serif CJK SC", "思源宋体", serif'
+TITLE_FONTS = {
+    'zh-CN': ('jicao', ROOT / 'public' / 'font' / 'jicao' / 'HYJiFengTiU.ttf'),
+    'en': ('Dumbledor', ROOT / 'public' / 'font' / 'dumbledor' / 'dum1.ttf'),
+}
+# 与 src/theme/colors.ts 的 TEAM_COLORS 一致
+TEAM_COLORS = {
+    'townsfolk': '#0078ba',
+    'outsider': '#0078ba',
+    'minion': '#a32222',
+    'demon': '#a32222',
+    'traveler': '#b463aa',
+    'fabled': '#d4af37',
+    'loric': '#359026',
+}
+UNKNOWN_TEAM_COLOR = '#2d5c4f'
+# 与 src/utils/map.ts 的 team.* / firstNight / otherNight 文案一致
+LABELS = {
+    'zh-CN': {
+        'townsfolk': '镇民', 'outsider': '外来者', 'minion': '爪牙', 'demon': '恶魔',
+        'traveler': '旅行者', 'fabled': '说书人·传奇角色', 'loric': '说书人·洛克角色',
+        'firstNight': '首夜顺序', 'otherNight': '其他夜晚顺序', 'author': '作者：',
+    },
+    'en': {
+        'townsfolk': 'Townsfolk', 'outsider': 'Outsider', 'minion': 'Minion', 'demon': 'Demon',
+        'traveler': 'Traveler', 'fabled': 'Fabled', 'loric': 'Loric',
+        'firstNight': 'First Night Order', 'otherNight': 'Other Nights Order', 'author': 'by ',
+    },
+}
+
+
+# ---------------------------------------------------------------------------
+# 字体度量与换行
+# ---------------------------------------------------------------------------
+
+class FontMetrics:
+    """字符宽度（em）；本地字体缺字或未安装 fontTools 时按全角/半角估算"""
+
+    def __init__(self, path: Optional[Path] = None):
+        self.widths: Dict[int, float] = {}
+        if TTFont is not None and path is not None and path.exists():
+            font = TTFont(str(path), lazy=True)
+            upm = font['head'].unitsPerEm
+            hmtx = font['hmtx']
+            for cp, glyph in font.getBestCmap().items():
+                self.widths[cp] = hmtx[glyph][0] / upm
+            font.close()
+
+    def char_width(self, ch: str) -> float:
+        w = self.widths.get(ord(ch))
+        if w is not None:
+            return w
+        return 1.0 if unicodedata.east_asian_width(ch) in ('W', 'F') else 0.55
+
+    def text_width(self, text: str, size: float) -> float:
+        return sum(self.char_width(ch) for ch in text) * size
+
+
+@lru_cache(maxsize=None)
+def metrics(name: str) -> FontMetrics:
+    if name == 'body':
+        return FontMetrics()
+    return FontMetrics(TITLE_FONTS[name][1])
+
+
+def wrap_text(text: str, width: float, size: float, m: FontMetrics) -> List[str]:
+    """按宽度换行：CJK 可在任意字符处断开，拉丁文字按空格断词（超长单词硬断）"""
+    lines: List[str] = []
+    for para in str(text or '').split('\n'):
+        line, line_w = '', 0.0
+        tokens: List[str] = []
+        word = ''
+        for ch in para:
+            if ch == ' ' or unicodedata.east_asian_width(ch) in ('W', 'F'):
+                if word:
+                    tokens.append(word)
+                    word = ''
+                tokens.append(ch)
+            else:
+                word += ch
+        if word:
+            tokens.append(word)
+        for tok in tokens:
+            tok_w = m.text_width(tok, size)
+            if line_w + tok_w <= width or not line:
+                if tok_w > width and not line:
+                    # 单个超长单词：逐字符硬断
+                    for ch in tok:
+                        ch_w = m.char_width(ch) * size
+                        if line_w + ch_w > width and line:
+                            lines.append(line)
+                            line, line_w = '', 0.0
+                        line += ch
+                        line_w += ch_w
+                    continue
+                line += tok
+                line_w += tok_w
+            else:
+                lines.append(line.rstrip())
+                line, line_w = ('', 0.0) if tok == ' ' else (tok, tok_w)
+        lines.append(line.rstrip())
+    return [ln for ln in lines if ln] or ['']
+
+
+# ---------------------------------------------------------------------------
+# 角色块排版缓存
+# ---------------------------------------------------------------------------
+
+_LAYOUTS: Dict[str, Any] = {}
+_NEW_LAYOUTS: Dict[str, Any] = {}
+
+
+def load_layout_cache() -> Dict[str, Any]:
+    try:
+        with LAYOUT_CACHE_PATH.open('r', encoding='utf-8') as f:
+            cache = json.load(f)
+        if cache.get('version') == LAYOUT_VERSION and isinstance(cache.get('blocks'), dict):
+            return cache['blocks']
+    except Exception:
+        pass
+    return {}
+
+
+def save_layout_cache(blocks: Dict[str, Any]):
+    CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    tmp = LAYOUT_CACHE_PATH.with_suffix('.tmp')
+    with tmp.open('w', encoding='utf-8') as f:
+        json.dump({'version': LAYOUT_VERSION, 'blocks': blocks}, f, ensure_ascii=False, separators=(',', ':'))
+    os.replace(tmp, LAYOUT_CACHE_PATH)
+
+
+def _init_worker(blocks: Dict[str, Any]):
+    _LAYOUTS.clear()
+    _LAYOUTS.update(blocks)
+
+
+def block_layout(name: str, text: str, width: float, text_size: float) -> Dict[str, Any]:
+    """一个角色块的分行结果与高度；同一内容与宽度只排一次"""
+    key = hashlib.sha1(json.dumps([LAYOUT_VERSION, name, text, width, text_size],
+                                  ensure_ascii=False).encode('utf-8')).hexdigest()
+    layout = _LAYOUTS.get(key)
+    if layout is None:
+        m = metrics('body')
+        name_lines = wrap_text(name, width, text_size + 3, m)
+        lines = wrap_text(text, width, text_size, m) if text else []
+        height = (len(name_lines) * (text_size + 3) + len(lines) * text_size) * LINE_HEIGHT
+        layout = {'name': name_lines, 'lines': lines, 'height': round(height, 2)}
+        _LAYOUTS[key] = _NEW_LAYOUTS[key] = layout
+    return layout
+
+
+# ---------------------------------------------------------------------------
+# 剧本 -> 页面模型
+# ---------------------------------------------------------------------------
+
+def resolve_entries(data: Any, lang: str) -> Tuple[Dict[str, Any], List[Dict[str, Any]]]:
+    """返回 (_meta, 角色条目列表)；角色条目含 id/team/name/ability/image/night 字段"""
+    db = load_db()
+    index = role_index()
+    night = night_order_table()
+    zh = lang == 'zh-CN'
+    meta: Dict[str, Any] = {}
+    entries: List[Dict[str, Any]] = []
+    seen = set()
+
+    for item in data if isinstance(data, list) else []:
+        if isinstance(item, str):
+            item = {'id': item}
+        if not isinstance(item, dict):
+            continue
+        if item.get('id') == '_meta':
+            meta = item
+            continue
+        if str(item.get('team', '')).lower() in NON_ROLE_TEAMS:
+            continue
+        rid = index.resolve(item)
+        c = db.get(rid) if rid else None
+        if c is not None:
+            if rid in seen:
+                continue
+            seen.add(rid)
+            first, other = night.get(rid)
+            entry = {
+                'id': rid,
+                'team': item.get('team') or c.team,
+                'name': (c.name_zh or c.name_en) if zh else (c.name_en or c.name_zh),
+                'ability': (c.ability_zh or c.ability_en) if zh else (c.ability_en or c.ability_zh),
+                'image': c.image,
+                'firstNight': first,
+                'otherNight': other,
+                'firstNightReminder': c.first_night_reminder_zh if zh else c.first_night_reminder_en,
+                'otherNightReminder': c.other_night_reminder_zh if zh else c.other_night_reminder_en,
+            }
+        elif item.get('team'):
+            image = item.get('image')
+            entry = {
+                'id': item.get('id') or item.get('name') or '',
+                'team': item['team'],
+                'name': item.get('name') or item.get('id') or '',
+                'ability': item.get('ability') or '',
+                'image': image[0] if isinstance(image, list) and image else image or '',
+                'firstNight': order_value(item.get('firstNight')),
+                'otherNight': order_value(item.get('otherNight')),
+                'firstNightReminder': item.get('firstNightReminder') or '',
+                'otherNightReminder': item.get('otherNightReminder') or '',
+            }
+        else:
+            continue
+        entries.append(entry)
+    return meta, entries
+
+
+# ---------------------------------------------------------------------------
+# SVG
+# ---------------------------------------------------------------------------
+
+@lru_cache(maxsize=None)
+def icon_href(url: str) -> Optional[str]:
+    resolved = resolve_icon(url, load_mirror_index()['files']) if url else None
+    if resolved is None:
+        return None
+    path, _ = resolved
+    if Image is None:
+        mime = mimetypes.guess_type(path.name)[0] or 'application/octet-stream'
+        return f'data:{mime};base64,' + base64.b64encode(path.read_bytes()).decode('ascii')
+    with Image.open(path) as im:
+        img = im.convert('RGBA')
+    img.thumbnail((EMBED_ICON_PX, EMBED_ICON_PX), Image.LANCZOS)
+    out = BytesIO()
+    img.save(out, format='PNG', optimize=True)
+    return 'data:image/png;base64,' + base64.b64encode(out.getvalue()).decode('ascii')
+
+
+def svg_icon(entry: Dict[str, Any], x: float, y: float, size: float) -> str:
+    href = icon_href(entry['image'])
+    if href is not None:
+        return f'<image x="{x}" y="{y}" width="{size}" height="{size}" href={quoteattr(href)}/>'
+    color = TEAM_COLORS.get(entry['team'], UNKNOWN_TEAM_COLOR)
+    r = size / 2
+    initial = escape(entry['name'][:1])
+    return (f'<circle cx="{x + r}" cy="{y + r}" r="{r - 1}" fill="none" stroke="{color}" stroke-width="2"/>'
+            f'<text x="{x + r}" y="{y + r + size * 0.15}" font-size="{size * 0.45}" fill="{color}" '
+            f'text-anchor="middle">{initial}</text>')
+
+
+def svg_text_lines(lines: List[str], x: float, y: float, size: float, **attrs: str) -> Tuple[str, float]:
+    extra = ''.join(f' {k.replace("_", "-")}={quoteattr(v)}' for k, v in attrs.items())
+    parts = []
+    for line in lines:
+        y += size * LINE_HEIGHT
+        parts.append(f'<text x="{x}" y="{y - size * (LINE_HEIGHT - 1) / 2:.2f}" font-size="{size}"{extra}>'
+                     f'{escape(line)}</text>')
+    return ''.join(parts), y
+
+
+@lru_cache(maxsize=256)
+def title_font_src(lang: str, chars: str) -> str:
+    """标题字体的 @font-face src：内嵌裁剪到 chars 的子集，无法内嵌时引用本机安装的同名字体"""
+    family, font_path = TITLE_FONTS[lang]
+    local = f'local("{family}")'
+    if not font_path.exists():
+        return local
+    if ft_subset is not None:
+        logging.getLogger('fontTools').setLevel(logging.ERROR)
+        options = ft_subset.Options()
+        options.layout_features = ['*']
+        options.notdef_outline = True
+        subsetter = ft_subset.Subsetter(options)
+        subsetter.populate(text=chars)
+        font = TTFont(str(font_path))
+        subsetter.subset(font)
+        out = BytesIO()
+        font.save(out)
+        font.close()
+        data = out.getvalue()
+    elif font_path.stat().st_size <= MAX_EMBED_FONT_BYTES:
+        data = font_path.read_bytes()
+    else:
+        return local
+    return f'{local},url(data:font/ttf;base64,{base64.b64encode(data).decode("ascii")}) format("truetype")'
+
+
+def svg_document(body: List[str], height: float, lang: str, title_text: str) -> str:
+    """title_text 为页面中使用标题字体的全部文字，用于裁剪内嵌字体"""
+    family, _ = TITLE_FONTS[lang]
+    src = title_font_src(lang, ''.join(sorted(set(title_text))))
+    return (
+        f'<svg xmlns="http://www.w3.org/2000/svg" width="{PAGE_WIDTH}" height="{height:.0f}" '
+        f'viewBox="0 0 {PAGE_WIDTH} {height:.0f}">'
+        f'<style>@font-face{{font-family:{quoteattr(family)[1:-1]};src:{src}}}'
+        f'text{{font-family:{escape(BODY_FONT_FAMILY)};fill:#000}}'
+        f'.title{{font-family:"{family}",serif}}</style>'
+        f'<rect width="100%" height="100%" fill="#fff"/>'
+        + ''.join(body) + '</svg>'
+    )
+
+
+def render_sheet(meta: Dict[str, Any], entries: List[Dict[str, Any]], lang: str, fallback_title: str) -> str:
+    labels = LABELS[lang]
+    title = (meta.get('name') if lang == 'zh-CN' else meta.get('name_en') or meta.get('name')) or fallback_title
+    body: List[str] = []
+    title_text = [title]
+    y = MARGIN + TITLE_SIZE
+    body.append(f'<text class="title" x="{PAGE_WIDTH / 2}" y="{y}" font-size="{TITLE_SIZE}" '
+                f'text-anchor="middle">{escape(title)}</text>')
+    author = meta.get('author')
+    if author:
+        y += 20
+        body.append(f'<text x="{PAGE_WIDTH / 2}" y="{y}" font-size="{TEXT_SIZE}" text-anchor="middle">'
+                    f'{escape(labels["author"] + str(author))}</text>')
+    y += 16
+
+    column_width = (PAGE_WIDTH - 2 * MARGIN - COLUMN_GAP) / 2
+    text_width = column_width - ICON_SIZE - ICON_GAP
+    order = {t: i for i, t in enumerate(TEAMS)}
+    teams = sorted({e['team'] for e in entries}, key=lambda t: (order.get(t, len(TEAMS)), t))
+    for team in teams:
+        members = [e for e in entries if e['team'] == team]
+        color = TEAM_COLORS.get(team, UNKNOWN_TEAM_COLOR)
+        title_text.append(labels.get(team, team))
+        y += SECTION_SIZE + 6
+        body.append(f'<text class="title" x="{MARGIN}" y="{y}" font-size="{SECTION_SIZE}" fill="{color}" '
+                    f'style="fill:{color}">{escape(labels.get(team, team))}</text>')
+        body.append(f'<line x1="{MARGIN}" y1="{y + 5}" x2="{PAGE_WIDTH - MARGIN}" y2="{y + 5}" '
+                    f'stroke="{color}" stroke-width="1"/>')
+        y += 12
+        # 两栏排列，每行高度取两块中较高者
+        for row in range(0, len(members), 2):
+            row_height = 0.0
+            for col, entry in enumerate(members[row:row + 2]):
+                x = MARGIN + col * (column_width + COLUMN_GAP)
+                layout = block_layout(entry['name'], entry['ability'], text_width, TEXT_SIZE)
+                body.append(svg_icon(entry, x, y, ICON_SIZE))
+                tx = x + ICON_SIZE + ICON_GAP
+                part, ny = svg_text_lines(layout['name'], tx, y, TEXT_SIZE + 3, font_weight='bold',
+                                          style=f'fill:{color}')
+                body.append(part)
+                part, _ = svg_text_lines(layout['lines'], tx, ny, TEXT_SIZE)
+                body.append(part)
+                row_height = max(row_height, ICON_SIZE, layout['height'])
+            y += row_height + BLOCK_GAP
+    return svg_document(body, max(PAGE_HEIGHT, y + MARGIN), lang, ''.join(title_text))
+
+
+def render_night(entries: List[Dict[str, Any]], lang: str) -> str:
+    labels = LABELS[lang]
+    column_width = (PAGE_WIDTH - 2 * MARGIN - COLUMN_GAP) / 2
+    text_width = column_width - NIGHT_ICON_SIZE - ICON_GAP
+    body: List[str] = []
+    bottom = 0.0
+    for col, night in enumerate(('firstNight', 'otherNight')):
+        x = MARGIN + col * (column_width + COLUMN_GAP)
+        y = MARGIN + SECTION_SIZE
+        body.append(f'<text class="title" x="{x}" y="{y}" font-size="{SECTION_SIZE}">{escape(labels[night])}</text>')
+        y += 12
+        steps = [(e[night], i, e) for i, e in enumerate(entries) if e['team'] in NIGHT_TEAMS and e[night] > 0]
+        for _, _, entry in sorted(steps, key=lambda s: (s[0], s[1])):
+            layout = block_layout(entry['name'], entry[night + 'Reminder'], text_width, NIGHT_TEXT_SIZE)
+            body.append(svg_icon(entry, x, y, NIGHT_ICON_SIZE))
+            tx = x + NIGHT_ICON_SIZE + ICON_GAP
+            color = TEAM_COLORS.get(entry['team'], UNKNOWN_TEAM_COLOR)
+            part, ny = svg_text_lines(layout['name'], tx, y, NIGHT_TEXT_SIZE + 3, font_weight='bold',
+                                      style=f'fill:{color}')
+            body.append(part)
+            part, _ = svg_text_lines(layout['lines'], tx, ny, NIGHT_TEXT_SIZE)
+            body.append(part)
+            y += max(NIGHT_ICON_SIZE, layout['height']) + BLOCK_GAP / 2
+        bottom = max(bottom, y)
+    return svg_document(body, max(PAGE_HEIGHT, bottom + MARGIN), lang,
+                        labels['firstNight'] + labels['otherNight'])
+
+
+# ---------------------------------------------------------------------------
+# 批量渲染
+# ---------------------------------------------------------------------------
+
+def write_outputs(svg: str, stem: Path, formats: Tuple[str, ...]) -> List[str]:
+    written = []
+    stem.parent.mkdir(parents=True, exist_ok=True)
+    if 'svg' in formats:
+        p = stem.with_name(stem.name + '.svg')
+        p.write_text(svg, encoding='utf-8')
+        written.append(str(p))
+    if 'pdf' in formats and cairosvg is not None:
+        p = stem.with_name(stem.name + '.pdf')
+        cairosvg.svg2pdf(bytestring=svg.encode('utf-8'), write_to=str(p))
+        written.append(str(p))
+    return written
+
+
+def _render_file(job: Tuple[str, str, str, Tuple[str, ...], str]) -> Tuple[str, List[str], Dict[str, Any], Optional[str]]:
+    """渲染单个剧本（可在子进程中执行），返回 (源文件, 输出文件, 新增的排版缓存, 错误)"""
+    path, rel, lang, formats, out_dir = job
+    _NEW_LAYOUTS.clear()
+    try:
+        data = json.loads(Path(path).read_bytes().decode('utf-8'))
+        meta, entries = resolve_entries(data, lang)
+        stem = Path(out_dir) / lang / Path(rel).with_suffix('')
+        written = write_outputs(render_sheet(meta, entries, lang, Path(path).stem), stem, formats)
+        written += write_outputs(render_night(entries, lang), stem.with_name(stem.name + '.night'), formats)
+        return path, written, dict(_NEW_LAYOUTS), None
+    except (OSError, ValueError) as e:
+        return path, [], dict(_NEW_LAYOUTS), str(e)
+
+
+def render_all(files: List[Tuple[Path, str]], lang: str, formats: Tuple[str, ...], out_dir: Path,
+               workers: Optional[int] = None) -> Dict[str, Any]:
+    blocks = load_layout_cache()
+    cached = len(blocks)
+    jobs = []
+    for path, _ in files:
+        try:
+            rel = path.relative_to(JSON_ROOT).as_posix()
+        except ValueError:
+            rel = path.name
+        jobs.append((str(path), rel, lang, formats, str(out_dir)))
+
+    workers = workers or default_workers()
+    if workers > 1 and len(jobs) >= PARALLEL_THRESHOLD:
+        # 先在主进程里确保 chardb 快照是最新的，避免子进程同时重建
+        load_db()
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(blocks,)) as pool:
+            chunksize = max(1, len(jobs) // (workers * 4))
+            results = list(pool.map(_render_file, jobs, chunksize=chunksize))
+    else:
+        _init_worker(blocks)
+        results = [_render_file(job) for job in jobs]
+
+    errors = []
+    outputs = 0
+    for path, written, new_blocks, error in results:
+        blocks.update(new_blocks)
+        outputs += len(written)
+        if error:
+            errors.append(f'{path}: {error}')
+    save_layout_cache(blocks)
+    return {'scripts': len(jobs), 'outputs': outputs, 'errors': errors,
+            'layoutsReused': cached, 'layoutsNew': len(blocks) - cached}
+
+
+def main():
+    parser = argparse.ArgumentParser(description='批量渲染剧本角色表与夜晚顺序（SVG / PDF），不依赖浏览器')
+    parser.add_argument('paths', nargs='*', type=Path, help='只渲染这些剧本（默认渲染 public/scripts/json 下全部剧本）')
+    parser.add_argument('--lang', choices=tuple(LABELS), default='zh-CN', help='输出语言（默认 zh-CN）')
+    parser.add_argument('--format', default='svg', help='输出格式，逗号分隔：svg,pdf（pdf 需要 cairosvg）')
+    parser.add_argument('--out', type=Path, default=OUTPUT_DIR,
+                        help=f'输出目录，按语言分子目录（默认 {OUTPUT_DIR}/<语言>）')
+    parser.add_argument('--workers', type=int, default=None, help='并行进程数（默认 CPU 核数）')
+    args = parser.parse_args()
+
+    formats = tuple(f.strip() for f in args.format.split(',') if f.strip())
+    unknown = [f for f in formats if f not in FORMATS]
+    if unknown:
+        parser.error(f'未知格式: {", ".join(unknown)}')
+    if 'pdf' in formats and cairosvg is None:
+        print('cairosvg 未安装，跳过 PDF 输出（pip install cairosvg）', file=sys.stderr)
+
+    files = [(p.resolve(), p.resolve().parent.name) for p in args.paths] if args.paths else iter_script_files()
+    start = time.perf_counter()
+    stats = render_all(files, args.lang, formats, args.out, args.workers)
+    for line in stats['errors']:
+        print(f'error: {line}', file=sys.stderr)
+    print(f"Rendered {stats['scripts']} scripts -> {stats['outputs']} files in "
+          f"{time.perf_counter() - start:.2f}s ({stats['layoutsReused']} cached blocks, "
+          f"{stats['layoutsNew']} new) -> {args.out / args.lang}")
+    if stats['errors']:
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,174 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+在 manifest 生成阶段预先计算每个剧本的内容摘要：
+- teams：各阵营角色数量
+- roles：已识别的官方角色 id（规范化为英文 id，升序）
+- custom：无法识别、按自定义角色处理的数量
+- jinxes：剧本内触发的官方相克对 [[a, b], ...]（来自 jinx_index.py 编译的相克索引，a < b）
+- firstNight / otherNight：首夜与其他夜晚的行动序列（角色 id，已按行动顺序排好）。
+  与剧本库预览（官方 id 解析模式）一致：已识别角色取官方顺序（night_order.py），
+  自定义角色取 JSON 中的 firstNight / otherNight；只有镇民、外来者、爪牙、恶魔参与排序
+
+角色识别顺序与 scriptGenerator.ts 的 generateScript() 一致：
+先按 id（含 CN_TO_EN_ID_MAP 映射），再按中文/英文 name 回退。
+"""
+import hashlib
+import json
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+from chardb import load_db
+from jinx_index import jinx_index
+from night_order import NIGHT_TEAMS, night_order_table, order_value
+
+ROOT = Path(__file__).resolve().parents[1]
+DATA_DIR = ROOT / 'src' / 'data'
+ROLES_JSON = DATA_DIR / 'roles.json'
+CHARACTERS_TS = DATA_DIR / 'characters.ts'
+FABLED_TS = DATA_DIR / 'fabled.ts'
+LORIC_TS = DATA_DIR / 'loric.ts'
+MAPPING_TS = DATA_DIR / 'characterIdMapping.ts'
+JINX_TS = DATA_DIR / 'jinx.ts'
+JINX_EN_JSON = DATA_DIR / 'jinxEn.json'
+
+SOURCES = (ROLES_JSON, CHARACTERS_TS, FABLED_TS, LORIC_TS, MAPPING_TS, JINX_TS, JINX_EN_JSON)
+TEAMS = ('townsfolk', 'outsider', 'minion', 'demon', 'traveler', 'fabled', 'loric')
+# 不属于角色的条目
+NON_ROLE_TEAMS = ('special_rule', 'a jinxed')
+
+
+def sources_hash() -> str:
+    """角色数据源的整体哈希，用于判断摘要缓存是否失效"""
+    h = hashlib.sha1()
+    for p in SOURCES:
+        if p.exists():
+            h.update(p.read_bytes())
+    return h.hexdigest()
+
+
+class RoleIndex:
+    """规范化 id -> 阵营，以及 name -> 规范化 id 的查找表"""
+
+    def __init__(self):
+        self.cn_to_en = load_db().cn_to_en
+        self.team: Dict[str, str] = {}
+        self.by_name: Dict[str, str] = {}
+
+        # 角色数据统一取自 chardb 快照；按 roles.json、characters.ts、fabled/loric 的顺序登记
+        db = load_db()
+        ordered = (db.from_source('roles') + db.from_source('characters', 'custom')
+                   + db.from_source('fabled', 'loric', lang='zh-CN'))
+        for role in ordered:
+            rid = role.data.get('id') or role.key
+            if not rid:
+                continue
+            if role.source in ('characters', 'custom'):
+                rid = self.canonical(rid)
+            self.team.setdefault(rid, role.data.get('team', ''))
+            name = role.data.get('name')
+            if name and role.source not in ('fabled', 'loric'):
+                self.by_name.setdefault(name, rid)
+
+    def canonical(self, rid: str) -> str:
+        return self.cn_to_en.get(rid, rid)
+
+    def resolve(self, item: Dict[str, Any]) -> Optional[str]:
+        rid = item.get('id')
+        if isinstance(rid, str):
+            if rid in self.team:
+                return rid
+            if self.canonical(rid) in self.team:
+                return self.canonical(rid)
+        name = item.get('name')
+        if isinstance(name, str) and name in self.by_name:
+            return self.by_name[name]
+        return None
+
+
+@lru_cache(maxsize=1)
+def role_index() -> RoleIndex:
+    # 进程内只构建一次（进程池中每个子进程各构建一次）
+    return RoleIndex()
+
+
+def role_set(data: Any) -> Set[str]:
+    """剧本中全部角色的集合：已识别的官方角色为规范化 id，其余记为 custom:<阵营>:<id 或名称>；
+    与顺序、名称、_meta 无关（ingest_scripts.py 查重与 similar_scripts.py 相似度使用）"""
+    index = role_index()
+    roles: Set[str] = set()
+    for item in data if isinstance(data, list) else []:
+        if isinstance(item, str):
+            item = {'id': item}
+        if not isinstance(item, dict) or item.get('id') == '_meta':
+            continue
+        if str(item.get('team', '')).lower() in NON_ROLE_TEAMS:
+            continue
+        rid = index.resolve(item)
+        if rid is None:
+            rid = f"custom:{item.get('team') or ''}:{item.get('id') or item.get('name') or ''}"
+        roles.add(rid)
+    return roles
+
+
+def summarize_script(data: Any) -> Dict[str, Any]:
+    index = role_index()
+    items = data if isinstance(data, list) else []
+    teams: Dict[str, int] = {}
+    roles: Set[str] = set()
+    custom = 0
+    # (顺序, 剧本中的位置, id)，位置保证同序角色保持剧本中的先后
+    first_night: List[Tuple[int, int, str]] = []
+    other_night: List[Tuple[int, int, str]] = []
+
+    for position, item in enumerate(items):
+        if isinstance(item, str):
+            item = {'id': item}
+        if not isinstance(item, dict) or item.get('id') == '_meta':
+            continue
+        if str(item.get('team', '')).lower() in NON_ROLE_TEAMS:
+            continue
+
+        rid = index.resolve(item)
+        if rid is None:
+            team = item.get('team')
+            if not team:
+                continue
+            custom += 1
+            seq_id = item.get('id') or item.get('name') or ''
+            first, other = order_value(item.get('firstNight')), order_value(item.get('otherNight'))
+        else:
+            # JSON 中自定义的 team 优先
+            team = item.get('team') or index.team.get(rid, '')
+            if rid in roles:
+                continue
+            roles.add(rid)
+            seq_id = rid
+            first, other = night_order_table().get(rid)
+        teams[team] = teams.get(team, 0) + 1
+        if team in NIGHT_TEAMS:
+            if first > 0:
+                first_night.append((first, position, seq_id))
+            if other > 0:
+                other_night.append((other, position, seq_id))
+
+    jinxes = [list(pair) for pair in jinx_index().script_jinxes(roles)]
+
+    return {
+        'teams': {t: teams[t] for t in sorted(teams, key=lambda t: (TEAMS.index(t) if t in TEAMS else len(TEAMS), t))},
+        'roles': sorted(roles),
+        'custom': custom,
+        'jinxes': jinxes,
+        'firstNight': [rid for _, _, rid in sorted(first_night)],
+        'otherNight': [rid for _, _, rid in sorted(other_night)],
+    }
+
+
+if __name__ == '__main__':
+    import sys
+    from generate_manifest import parse_json_bytes
+
+    for arg in sys.argv[1:]:
+        summary = summarize_script(parse_json_bytes(Path(arg).read_bytes()))
+        print(json.dumps(summary, ensure_ascii=False))
@@ -0,0 +1,150 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+剧本仓库搜索索引：把 manifest 条目编译成紧凑的倒排索引，前端输入时直接查表，无需线性扫描。
+
+索引词（term）来源：
+- name / nameEn / author / description 归一化（NFKC + 小写）后：
+  - 汉字：单字与相邻双字 n-gram
+  - 拉丁字母/数字：每个单词的前缀（edge n-gram），支持边输入边搜索
+- name 的拼音（逐字读音见 pinyin_table.py）：每个音节的前缀，以及整词全拼与首字母缩写的前缀
+  （如 anliuyongdong / alyd）
+
+输出格式（紧凑 JSON）：
+{
+  "version": 1,
+  "ids": [manifest 条目 id, ...],       // 下标即整数 entry id
+  "terms": {"term": [entry id, ...]}  // 升序整数列表
+}
+查询时把输入按同样规则切分，对各 term 的列表取交集即可。
+"""
+import json
+import re
+import time
+import unicodedata
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Set
+
+from generate_manifest import JSON_ROOT
+from pinyin_table import char_pinyin, is_cjk
+
+SEARCH_INDEX_PATH = JSON_ROOT / 'search-index.json'
+SEARCH_INDEX_VERSION = 1
+TEXT_FIELDS = ('name', 'nameEn', 'author', 'description')
+# 前缀 n-gram 最大长度：更长的输入取该长度前缀后再由前端校验
+MAX_PREFIX = 12
+
+_WORD_RE = re.compile(r'[a-z0-9]+')
+
+
+def normalize(text: str) -> str:
+    return unicodedata.normalize('NFKC', text or '').lower()
+
+
+def prefixes(word: str) -> Iterable[str]:
+    for i in range(1, min(len(word), MAX_PREFIX) + 1):
+        yield word[:i]
+
+
+def text_terms(text: str) -> Set[str]:
+    """拉丁单词前缀 + 汉字单字/双字 n-gram"""
+    text = normalize(text)
+    terms: Set[str] = set()
+    for word in _WORD_RE.findall(text):
+        terms.update(prefixes(word))
+
+    run: List[str] = []
+    for ch in text + ' ':
+        if is_cjk(ch):
+            run.append(ch)
+            continue
+        for i, c in enumerate(run):
+            terms.add(c)
+            if i + 1 < len(run):
+                terms.add(c + run[i + 1])
+        run = []
+    return terms
+
+
+def pinyin_terms(text: str) -> Set[str]:
+    terms: Set[str] = set()
+    cjk_chars = [ch for ch in normalize(text) if is_cjk(ch)]
+    if not cjk_chars:
+        return terms
+    # 查不到读音的汉字由 char_pinyin 直接报错，不会拼出错位的全拼与首字母
+    syllables = [char_pinyin(ch) for ch in cjk_chars]
+    for syl in syllables:
+        terms.update(prefixes(syl))
+    terms.update(prefixes(''.join(syllables)))
+    terms.update(prefixes(''.join(s[0] for s in syllables)))
+    return terms
+
+
+def entry_terms(entry: Dict[str, Any]) -> Set[str]:
+    terms: Set[str] = set()
+    for field in TEXT_FIELDS:
+        terms |= text_terms(entry.get(field) or '')
+    terms |= pinyin_terms(entry.get('name') or '')
+    return terms
+
+
+def build_search_index(entries: List[Dict[str, Any]]) -> Dict[str, Any]:
+    postings: Dict[str, List[int]] = {}
+    for idx, entry in enumerate(entries):
+        for term in entry_terms(entry):
+            postings.setdefault(term, []).append(idx)
+    return {
+        'version': SEARCH_INDEX_VERSION,
+        'ids': [e['id'] for e in entries],
+        # 按 term 排序以保证输出稳定；posting 列表天然升序
+        'terms': {term: postings[term] for term in sorted(postings)},
+    }
+
+
+def write_search_index(entries: List[Dict[str, Any]], path: Path = SEARCH_INDEX_PATH) -> Dict[str, Any]:
+    """构建并写出索引，返回统计信息（耗时、体积、term 数）"""
+    start = time.perf_counter()
+    index = build_search_index(entries)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    data = json.dumps(index, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+    path.write_bytes(data)
+    return {
+        'entries': len(entries),
+        'terms': len(index['terms']),
+        'postings': sum(len(v) for v in index['terms'].values()),
+        'bytes': len(data),
+        'seconds': time.perf_counter() - start,
+    }
+
+
+def search(index: Dict[str, Any], query: str) -> List[str]:
+    """参考实现：返回命中的 manifest 条目 id（与前端查询逻辑一致）"""
+    terms = text_terms(query) | pinyin_terms(query)
+    q = normalize(query)
+    # 查询只需最长的那些 term（短前缀是其超集）
+    words = _WORD_RE.findall(q)
+    wanted = {w[:MAX_PREFIX] for w in words}
+    wanted |= {t for t in terms if is_cjk(t[0]) and len(t) == 2}
+    cjk = [ch for ch in q if is_cjk(ch)]
+    if len(cjk) == 1:
+        wanted.add(cjk[0])
+    if not wanted:
+        return []
+
+    result: Set[int] = set()
+    for i, term in enumerate(sorted(wanted)):
+        posting = set(index['terms'].get(term, []))
+        result = posting if i == 0 else result & posting
+        if not result:
+            break
+    return [index['ids'][i] for i in sorted(result)]
+
+
+if __name__ == '__main__':
+    from generate_manifest import MANIFEST_PATH
+
+    with MANIFEST_PATH.open('r', encoding='utf-8') as f:
+        manifest_entries = json.load(f).get('scripts', [])
+    stats = write_search_index(manifest_entries)
+    print(f"Search index: {stats['terms']} terms, {stats['postings']} postings, "
+          f"{stats['bytes']} bytes in {stats['seconds'] * 1000:.1f} ms -> {SEARCH_INDEX_PATH}")
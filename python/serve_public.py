@@ -0,0 +1,567 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+public/（或 vite 构建产物 dist/）的本地/自托管静态服务器，基于 asyncio，无第三方依赖。
+
+静态文件：
+- 强 ETag：内容的 sha1（按 mtime/size 缓存，文件变化后重新计算）；If-None-Match 命中时返回 304
+- 预压缩：按 Accept-Encoding 的 q 值从高到低选择同目录下的 .br / .gz 副本（compress_assets.py 生成，
+  比原文件旧的副本视为过期），q 相同时 br 优先；identity;q=0 且没有可接受的副本时返回 406。
+  响应带 Vary: Accept-Encoding，ETag 为所选副本自身的哈希
+- Range：单个字节范围（bytes=a-b / a- / -n），支持 If-Range；无法满足时返回 416
+- 热点文件保存在按字节预算淘汰的内存 LRU 中；超过单文件上限的大文件分块从磁盘读取
+- JSON 使用 Cache-Control: no-cache（每次协商，未变化时只返回 304），其余资源缓存一小时
+- 不带扩展名且不存在的路径回退到根目录的 index.html（若存在），便于直接托管单页应用
+
+JSON 接口（数据来自 manifest.json，文件变化后自动重新加载）：
+- GET /api/manifest?category=custom&page=1&pageSize=50   分页列出剧本条目
+- GET /api/search?q=暗流&category=official&limit=20        与 search_index.py 相同规则的搜索
+接口响应同样带强 ETag，支持 304。
+
+运行：python python/serve_public.py [--root dist] [--port 8787]
+压测：python python/load_test.py --spawn
+"""
+import argparse
+import asyncio
+import email.utils
+import hashlib
+import json
+import mimetypes
+import os
+import re
+import sys
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+from urllib.parse import parse_qs, unquote, urlsplit
+
+from generate_manifest import CATEGORIES, DEFAULT_PAGE_SIZE, MANIFEST_PATH, ROOT
+
+DEFAULT_ROOT = ROOT / 'public'
+DEFAULT_HOST = '127.0.0.1'
+DEFAULT_PORT = 8787
+# 内存 LRU 的总字节预算与单文件上限
+DEFAULT_CACHE_BYTES = 64 * 1024 * 1024
+MAX_CACHED_FILE = 4 * 1024 * 1024
+# 大文件分块读取与发送的块大小
+STREAM_CHUNK = 256 * 1024
+# 请求头总长度上限与 keep-alive 空闲超时
+MAX_HEADER_BYTES = 16 * 1024
+KEEP_ALIVE_TIMEOUT = 15.0
+DEFAULT_API_PAGE_SIZE = 50
+DEFAULT_SEARCH_LIMIT = 20
+API_CACHE_ENTRIES = 256
+# 预压缩副本的扩展名，按服务器偏好排序
+ENCODINGS = (('br', '.br'), ('gzip', '.gz'))
+LONG_CACHE = 'public, max-age=3600'
+REVALIDATE = 'no-cache'
+
+mimetypes.add_type('application/json', '.json')
+mimetypes.add_type('image/webp', '.webp')
+mimetypes.add_type('image/avif', '.avif')
+mimetypes.add_type('font/woff2', '.woff2')
+mimetypes.add_type('font/ttf', '.ttf')
+mimetypes.add_type('text/javascript', '.js')
+
+REASONS = {
+    200: 'OK', 206: 'Partial Content', 304: 'Not Modified', 400: 'Bad Request', 404: 'Not Found',
+    405: 'Method Not Allowed', 406: 'Not Acceptable', 413: 'Payload Too Large', 416: 'Range Not Satisfiable',
+    500: 'Internal Server Error',
+}
+
+_RANGE_RE = re.compile(r'^bytes=(\d*)-(\d*)$')
+
+
+def strong_etag(data: bytes) -> str:
+    return f'"{hashlib.sha1(data).hexdigest()}"'
+
+
+def etag_matches(header: str, etag: str) -> bool:
+    """If-None-Match：逗号分隔的列表或 *，按弱比较（忽略 W/ 前缀）"""
+    if header.strip() == '*':
+        return True
+    return any(t.strip().removeprefix('W/') == etag for t in header.split(','))
+
+
+def accepted_encodings(header: str) -> Dict[str, float]:
+    """解析 Accept-Encoding -> {编码: q}；q=0 表示明确拒绝"""
+    result: Dict[str, float] = {}
+    for part in header.split(','):
+        name, _, params = part.strip().partition(';')
+        name = name.strip().lower()
+        if not name:
+            continue
+        q = 1.0
+        params = params.strip()
+        if params.startswith('q='):
+            try:
+                q = float(params[2:])
+            except ValueError:
+                q = 0.0
+        result[name] = q
+    return result
+
+
+def parse_range(header: str, size: int) -> Optional[Tuple[int, int]]:
+    """返回 [start, end)；格式不支持（如多个范围）时返回 None 表示忽略 Range；无法满足时抛出 ValueError"""
+    m = _RANGE_RE.match(header.strip())
+    if not m:
+        return None
+    first, last = m.groups()
+    if not first and not last:
+        return None
+    if not first:
+        length = int(last)
+        if length == 0:
+            raise ValueError
+        return max(0, size - length), size
+    start = int(first)
+    end = min(int(last) + 1, size) if last else size
+    if start >= size or start >= end:
+        raise ValueError
+    return start, end
+
+
+@dataclass
+class Representation:
+    path: Path
+    mtime_ns: int
+    size: int
+    etag: str
+    body: Optional[bytes]  # None 表示超过单文件上限，发送时从磁盘分块读取
+
+
+class FileCache:
+    """path -> Representation 的 LRU，按 body 字节数淘汰；大文件只缓存 ETag"""
+
+    def __init__(self, budget: int = DEFAULT_CACHE_BYTES, max_file: int = MAX_CACHED_FILE):
+        self.budget = budget
+        self.max_file = min(max_file, budget)
+        self.entries: 'OrderedDict[Path, Representation]' = OrderedDict()
+        self.bytes = 0
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, path: Path, st: os.stat_result) -> Optional[Representation]:
+        rep = self.entries.get(path)
+        if rep is None or rep.mtime_ns != st.st_mtime_ns or rep.size != st.st_size:
+            self.misses += 1
+            return None
+        self.entries.move_to_end(path)
+        self.hits += 1
+        return rep
+
+    def put(self, rep: Representation):
+        old = self.entries.pop(rep.path, None)
+        if old is not None and old.body is not None:
+            self.bytes -= len(old.body)
+        self.entries[rep.path] = rep
+        if rep.body is not None:
+            self.bytes += len(rep.body)
+        while self.bytes > self.budget and self.entries:
+            _, evicted = self.entries.popitem(last=False)
+            if evicted.body is not None:
+                self.bytes -= len(evicted.body)
+
+
+def _read_and_hash(path: Path, max_file: int) -> Tuple[Optional[bytes], str]:
+    """在线程池中执行：小文件读入内存，大文件只流式计算哈希"""
+    if path.stat().st_size <= max_file:
+        data = path.read_bytes()
+        return data, strong_etag(data)
+    h = hashlib.sha1()
+    with path.open('rb') as f:
+        for chunk in iter(lambda: f.read(STREAM_CHUNK), b''):
+            h.update(chunk)
+    return None, f'"{h.hexdigest()}"'
+
+
+class Catalog:
+    """manifest.json 的内存副本：按分类分组、搜索索引按需构建；文件变化后重新加载"""
+
+    def __init__(self, path: Path = MANIFEST_PATH):
+        self.path = path
+        self.stamp: Optional[Tuple[int, int]] = None
+        self.entries: List[Dict[str, Any]] = []
+        self.by_category: Dict[str, List[Dict[str, Any]]] = {}
+        self._search_index: Optional[Dict[str, Any]] = None
+        self._by_id: Dict[str, Dict[str, Any]] = {}
+
+    def refresh(self):
+        try:
+            st = self.path.stat()
+        except OSError:
+            self.stamp, self.entries, self.by_category, self._search_index = None, [], {}, None
+            return
+        stamp = (st.st_mtime_ns, st.st_size)
+        if stamp == self.stamp:
+            return
+        with self.path.open('r', encoding='utf-8') as f:
+            self.entries = json.load(f).get('scripts', [])
+        self.by_category = {}
+        for entry in self.entries:
+            self.by_category.setdefault(entry.get('category', 'custom'), []).append(entry)
+        self._by_id = {e['id']: e for e in self.entries}
+        self._search_index = None
+        self.stamp = stamp
+
+    def page(self, category: Optional[str], page: int, page_size: int) -> Dict[str, Any]:
+        items = self.by_category.get(category, []) if category else self.entries
+        pages = max(1, -(-len(items) // page_size))
+        start = (page - 1) * page_size
+        return {'category': category, 'total': len(items), 'page': page, 'pageSize': page_size, 'pages': pages,
+                'scripts': items[start:start + page_size]}
+
+    def search(self, query: str, category: Optional[str], limit: int) -> Dict[str, Any]:
+        from search_index import build_search_index, search
+
+        if self._search_index is None:
+            self._search_index = build_search_index(self.entries)
+        hits = [self._by_id[i] for i in search(self._search_index, query) if i in self._by_id]
+        if category:
+            hits = [e for e in hits if e.get('category') == category]
+        return {'query': query, 'category': category, 'total': len(hits), 'scripts': hits[:limit]}
+
+
+class HttpError(Exception):
+    def __init__(self, status: int, message: str = ''):
+        super().__init__(message or REASONS.get(status, ''))
+        self.status = status
+
+
+class Request:
+    __slots__ = ('method', 'target', 'path', 'query', 'version', 'headers')
+
+    def __init__(self, method: str, target: str, version: str, headers: Dict[str, str]):
+        self.method = method
+        self.target = target
+        self.version = version
+        self.headers = headers
+        parts = urlsplit(target)
+        self.path = unquote(parts.path)
+        self.query = parse_qs(parts.query)
+
+    def param(self, name: str, default: str = '') -> str:
+        values = self.query.get(name)
+        return values[0] if values else default
+
+    def int_param(self, name: str, default: int, low: int, high: int) -> int:
+        raw = self.param(name)
+        if not raw:
+            return default
+        try:
+            return min(high, max(low, int(raw)))
+        except ValueError:
+            raise HttpError(400, f'{name} 必须是整数')
+
+
+class PublicServer:
+    def __init__(self, root: Path, cache: FileCache, access_log: bool = False):
+        self.root = root.resolve()
+        self.cache = cache
+        self.catalog = Catalog()
+        # 接口响应按 (请求目标, manifest 版本) 缓存
+        self.api_cache: 'OrderedDict[Tuple[str, Any], Tuple[bytes, str]]' = OrderedDict()
+        self.access_log = access_log
+        self.requests = 0
+        self._date = ''
+        self._date_at = 0
+
+    # ------------------------------------------------------------------
+    # 连接与 HTTP 解析
+
+    async def handle_connection(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        try:
+            while True:
+                try:
+                    head = await asyncio.wait_for(reader.readuntil(b'\r\n\r\n'), KEEP_ALIVE_TIMEOUT)
+                except (asyncio.IncompleteReadError, asyncio.TimeoutError, ConnectionError):
+                    return
+                except asyncio.LimitOverrunError:
+                    await self.send_error(writer, HttpError(413), keep_alive=False)
+                    return
+                try:
+                    request = self.parse_head(head)
+                except HttpError as e:
+                    await self.send_error(writer, e, keep_alive=False)
+                    return
+                length = request.headers.get('content-length') or '0'
+                if not length.isdigit():
+                    await self.send_error(writer, HttpError(400), keep_alive=False)
+                    return
+                if int(length):
+                    await reader.readexactly(int(length))  # 只支持 GET/HEAD，请求体直接丢弃
+                keep_alive = self.keep_alive(request)
+                start = time.perf_counter()
+                try:
+                    status = await self.dispatch(request, writer, keep_alive)
+                except HttpError as e:
+                    status = e.status
+                    await self.send_error(writer, e, keep_alive, request)
+                except Exception as e:  # noqa: BLE001  单个请求出错不影响服务器
+                    status = 500
+                    print(f'error: {request.method} {request.target}: {e!r}', file=sys.stderr)
+                    await self.send_error(writer, HttpError(500), keep_alive=False)
+                    keep_alive = False
+                self.requests += 1
+                if self.access_log:
+                    print(f'{status} {request.method} {request.target} {(time.perf_counter() - start) * 1000:.2f} ms')
+                if not keep_alive:
+                    return
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            writer.close()
+            try:
+                await writer.wait_closed()
+            except (ConnectionError, OSError):
+                pass
+
+    @staticmethod
+    def parse_head(head: bytes) -> Request:
+        try:
+            lines = head.decode('latin-1').split('\r\n')
+            method, target, version = lines[0].split(' ')
+        except ValueError:
+            raise HttpError(400)
+        if not version.startswith('HTTP/1.'):
+            raise HttpError(400)
+        headers: Dict[str, str] = {}
+        for line in lines[1:]:
+            if not line:
+                continue
+            name, sep, value = line.partition(':')
+            if not sep:
+                raise HttpError(400)
+            name = name.strip().lower()
+            headers[name] = f'{headers[name]}, {value.strip()}' if name in headers else value.strip()
+        return Request(method, target, version, headers)
+
+    @staticmethod
+    def keep_alive(request: Request) -> bool:
+        connection = request.headers.get('connection', '').lower()
+        if request.version == 'HTTP/1.0':
+            return connection == 'keep-alive'
+        return connection != 'close'
+
+    def http_date(self) -> str:
+        now = int(time.time())
+        if now != self._date_at:
+            self._date = email.utils.formatdate(now, usegmt=True)
+            self._date_at = now
+        return self._date
+
+    def write_head(self, writer: asyncio.StreamWriter, status: int, headers: Dict[str, str], keep_alive: bool):
+        lines = [f'HTTP/1.1 {status} {REASONS.get(status, "")}', f'Date: {self.http_date()}',
+                 'Server: botc-public']
+        lines.extend(f'{k}: {v}' for k, v in headers.items())
+        lines.append(f'Connection: {"keep-alive" if keep_alive else "close"}')
+        writer.write(('\r\n'.join(lines) + '\r\n\r\n').encode('latin-1'))
+
+    async def send_error(self, writer: asyncio.StreamWriter, error: HttpError, keep_alive: bool,
+                         request: Optional[Request] = None):
+        if request is not None and request.path.startswith('/api/'):
+            body = json.dumps({'error': str(error)}, ensure_ascii=False).encode('utf-8')
+            content_type = 'application/json; charset=utf-8'
+        else:
+            body = f'{error.status} {error}\n'.encode('utf-8')
+            content_type = 'text/plain; charset=utf-8'
+        headers = {'Content-Type': content_type, 'Content-Length': str(len(body)), 'Cache-Control': 'no-store'}
+        if error.status == 405:
+            headers['Allow'] = 'GET, HEAD'
+        self.write_head(writer, error.status, headers, keep_alive)
+        if request is None or request.method != 'HEAD':
+            writer.write(body)
+        await writer.drain()
+
+    # ------------------------------------------------------------------
+    # 路由
+
+    async def dispatch(self, request: Request, writer: asyncio.StreamWriter, keep_alive: bool) -> int:
+        if request.method not in ('GET', 'HEAD'):
+            raise HttpError(405)
+        if request.path.startswith('/api/'):
+            return await self.serve_api(request, writer, keep_alive)
+        return await self.serve_static(request, writer, keep_alive)
+
+    async def serve_api(self, request: Request, writer: asyncio.StreamWriter, keep_alive: bool) -> int:
+        self.catalog.refresh()
+        key = (request.target, self.catalog.stamp)
+        cached = self.api_cache.get(key)
+        if cached is not None:
+            self.api_cache.move_to_end(key)
+            return await self.send_body(request, writer, keep_alive, cached[0], cached[1],
+                                        'application/json; charset=utf-8', REVALIDATE)
+        category = request.param('category') or None
+        if category is not None and category not in CATEGORIES:
+            raise HttpError(400, f'未知分类 {category}')
+        if request.path == '/api/manifest':
+            payload = self.catalog.page(category, request.int_param('page', 1, 1, 1 << 30),
+                                        request.int_param('pageSize', DEFAULT_API_PAGE_SIZE, 1, DEFAULT_PAGE_SIZE))
+        elif request.path == '/api/search':
+            payload = self.catalog.search(request.param('q'), category,
+                                          request.int_param('limit', DEFAULT_SEARCH_LIMIT, 1, DEFAULT_PAGE_SIZE))
+        else:
+            raise HttpError(404)
+        body = json.dumps(payload, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+        etag = strong_etag(body)
+        self.api_cache[key] = (body, etag)
+        if len(self.api_cache) > API_CACHE_ENTRIES:
+            self.api_cache.popitem(last=False)
+        return await self.send_body(request, writer, keep_alive, body, etag,
+                                    'application/json; charset=utf-8', REVALIDATE)
+
+    def resolve(self, url_path: str) -> Path:
+        if '\x00' in url_path:
+            raise HttpError(400)
+        path = (self.root / url_path.lstrip('/')).resolve()
+        if path != self.root and self.root not in path.parents:
+            raise HttpError(404)
+        if path.is_dir():
+            path = path / 'index.html'
+        if not path.is_file():
+            fallback = self.root / 'index.html'
+            if not Path(url_path).suffix and fallback.is_file():
+                return fallback
+            raise HttpError(404)
+        return path
+
+    def choose_encoding(self, request: Request, path: Path, st: os.stat_result) -> Tuple[Path, os.stat_result, str]:
+        """按 q 值选择现有的预压缩副本；q 相同时按 ENCODINGS 的顺序（br 优先于 gzip），且压缩副本优先于原文件。
+        原文件（identity）只有显式列出（identity 或 *）时才按其 q 值参与比较，否则作为最后的回退；
+        被 identity;q=0 或 *;q=0 排除且没有可接受的副本时返回 406"""
+        accepted = accepted_encodings(request.headers.get('accept-encoding', ''))
+        identity_q = accepted.get('identity', accepted.get('*'))
+        best: Tuple[Path, os.stat_result, str] = (path, st, '')
+        best_q = identity_q or 0.0
+        for encoding, suffix in ENCODINGS:
+            q = accepted.get(encoding, accepted.get('*', 0.0))
+            if q <= 0 or q < best_q or (q == best_q and best[2]):
+                continue
+            sibling = path.with_name(path.name + suffix)
+            try:
+                sst = sibling.stat()
+            except OSError:
+                continue
+            if sst.st_mtime_ns >= st.st_mtime_ns:
+                best, best_q = (sibling, sst, encoding), q
+        if not best[2] and identity_q is not None and identity_q <= 0:
+            raise HttpError(406)
+        return best
+
+    async def representation(self, path: Path, st: os.stat_result) -> Representation:
+        rep = self.cache.get(path, st)
+        if rep is None:
+            loop = asyncio.get_running_loop()
+            body, etag = await loop.run_in_executor(None, _read_and_hash, path, self.cache.max_file)
+            rep = Representation(path, st.st_mtime_ns, st.st_size, etag, body)
+            self.cache.put(rep)
+        return rep
+
+    async def serve_static(self, request: Request, writer: asyncio.StreamWriter, keep_alive: bool) -> int:
+        path = self.resolve(request.path)
+        st = path.stat()
+        content_type = mimetypes.guess_type(path.name)[0] or 'application/octet-stream'
+        if content_type.startswith('text/') or content_type == 'application/json':
+            content_type += '; charset=utf-8'
+        cache_control = REVALIDATE if path.suffix in ('.json', '.html') else LONG_CACHE
+
+        source, sst, encoding = self.choose_encoding(request, path, st)
+        rep = await self.representation(source, sst)
+        extra = {'Vary': 'Accept-Encoding'}
+        if encoding:
+            extra['Content-Encoding'] = encoding
+        return await self.send_body(request, writer, keep_alive, rep.body, rep.etag, content_type, cache_control,
+                                    extra, rep)
+
+    async def send_body(self, request: Request, writer: asyncio.StreamWriter, keep_alive: bool,
+                        body: Optional[bytes], etag: str, content_type: str, cache_control: str,
+                        extra: Optional[Dict[str, str]] = None, rep: Optional[Representation] = None) -> int:
+        headers = {'ETag': etag, 'Cache-Control': cache_control, **(extra or {})}
+        inm = request.headers.get('if-none-match')
+        if inm is not None and etag_matches(inm, etag):
+            self.write_head(writer, 304, headers, keep_alive)
+            await writer.drain()
+            return 304
+
+        size = len(body) if body is not None else rep.size
+        status, start, end = 200, 0, size
+        range_header = request.headers.get('range')
+        if_range = request.headers.get('if-range')
+        headers['Accept-Ranges'] = 'bytes'
+        if range_header and (if_range is None or if_range.strip() == etag):
+            try:
+                span = parse_range(range_header, size)
+            except ValueError:
+                headers['Content-Range'] = f'bytes */{size}'
+                headers['Content-Length'] = '0'
+                self.write_head(writer, 416, headers, keep_alive)
+                await writer.drain()
+                return 416
+            if span is not None:
+                status, (start, end) = 206, span
+                headers['Content-Range'] = f'bytes {start}-{end - 1}/{size}'
+
+        headers['Content-Type'] = content_type
+        headers['Content-Length'] = str(end - start)
+        self.write_head(writer, status, headers, keep_alive)
+        if request.method == 'HEAD':
+            await writer.drain()
+            return status
+        if body is not None:
+            writer.write(body if (start, end) == (0, size) else memoryview(body)[start:end])
+            await writer.drain()
+        else:
+            await self.stream_file(writer, rep.path, start, end)
+        return status
+
+    @staticmethod
+    async def stream_file(writer: asyncio.StreamWriter, path: Path, start: int, end: int):
+        loop = asyncio.get_running_loop()
+
+        def read_chunk(f, n):
+            return f.read(n)
+
+        with path.open('rb') as f:
+            f.seek(start)
+            remaining = end - start
+            while remaining > 0:
+                chunk = await loop.run_in_executor(None, read_chunk, f, min(STREAM_CHUNK, remaining))
+                if not chunk:
+                    break
+                writer.write(chunk)
+                remaining -= len(chunk)
+                await writer.drain()
+
+
+async def serve(args: argparse.Namespace):
+    server_state = PublicServer(args.root, FileCache(args.cache_mb * 1024 * 1024), access_log=args.log)
+    server = await asyncio.start_server(server_state.handle_connection, args.host, args.port,
+                                        limit=MAX_HEADER_BYTES, reuse_address=True)
+    addresses = ', '.join(f'http://{s.getsockname()[0]}:{s.getsockname()[1]}' for s in server.sockets)
+    print(f'Serving {server_state.root} at {addresses} (cache {args.cache_mb} MiB)', flush=True)
+    async with server:
+        await server.serve_forever()
+
+
+def main():
+    parser = argparse.ArgumentParser(description='以 ETag/304、预压缩与 Range 支持托管 public/，并提供 manifest 分页与搜索接口')
+    parser.add_argument('--root', type=Path, default=DEFAULT_ROOT, help=f'静态文件根目录（默认 {DEFAULT_ROOT}）')
+    parser.add_argument('--host', default=DEFAULT_HOST, help=f'监听地址（默认 {DEFAULT_HOST}）')
+    parser.add_argument('--port', type=int, default=DEFAULT_PORT, help=f'端口（默认 {DEFAULT_PORT}）')
+    parser.add_argument('--cache-mb', type=int, default=DEFAULT_CACHE_BYTES // (1024 * 1024),
+                        help='内存 LRU 的字节预算（MiB）')
+    parser.add_argument('--log', action='store_true', help='打印访问日志')
+    args = parser.parse_args()
+    if not args.root.is_dir():
+        parser.error(f'{args.root} 不是目录')
+    try:
+        asyncio.run(serve(args))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,380 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+剧本分享链接的二进制编码（参考实现，与 src/utils/shareCodec.ts 保持一致）。
+
+ShareDialog 原来把 id 数组 JSON.stringify 后整体 URL 编码，25 个角色的中文剧本加上自定义条目
+动辄几 KB，在聊天软件里容易被截断。新格式（?json=~<token>）：
+
+  token = base64url(无填充) 的字节串：
+    [0]     格式版本 FORMAT_VERSION
+    varint  条目数 n
+    n 个 varint，每个对应一个条目：
+            0            下一个自定义条目（取自末尾的自定义载荷）
+            (i << 1) + 1 冻结表中第 i 个 id 的字符串条目 "id"
+            (i << 1) + 2 冻结表中第 i 个 id 的对象条目 {"id": "id"}
+    自定义载荷（仅在存在自定义条目时）：
+            1 字节标志（0 原文 / 1 deflate-raw）+ 自定义条目的 JSON 数组（UTF-8，紧凑格式）
+
+varint 为无符号 LEB128。冻结表 src/data/shareCodecTable.json 由 roles.json、characters.ts 等数据源
+中出现过的全部 id 生成，只追加不删除，旧链接在新版本中总能解码；初次生成时按剧本库中的出现次数
+排序，常用角色的编号落在单字节 varint 范围内。
+
+测试向量 src/data/shareCodecVectors.json 由本脚本生成，TS 端用同一组向量校验
+（scripts/check-share-codec.mjs，yarn check:share-codec）：
+decode(token) 必须等于 items，decode(encode(items)) 也必须等于 items
+（不同平台的 deflate 输出可能逐字节不同，因此不要求 encode 结果与 token 完全一致）。
+
+用法：
+  python share_codec.py --update-table   追加新出现的 id 到冻结表
+  python share_codec.py --vectors        重新生成测试向量
+  python share_codec.py --check          全部剧本编码/解码往返校验 + 测试向量校验
+  python share_codec.py --bench          与现有 ?json= 格式比较链接长度
+"""
+import argparse
+import base64
+import json
+import statistics
+import sys
+import zlib
+from collections import Counter
+from typing import Any, Dict, List, Optional, Tuple
+from urllib.parse import quote
+
+from chardb import DATA_DIR, load_db
+from generate_manifest import iter_script_files
+
+TABLE_PATH = DATA_DIR / 'shareCodecTable.json'
+VECTORS_PATH = DATA_DIR / 'shareCodecVectors.json'
+
+FORMAT_VERSION = 1
+# ?json= 参数以此开头时按分享编码解析（JSON、http(s) 链接与 / 路径都不会以 ~ 开头）
+TOKEN_PREFIX = '~'
+PAYLOAD_RAW = 0
+PAYLOAD_DEFLATE = 1
+# encodeURIComponent 不转义的字符
+URI_COMPONENT_SAFE = "-_.!~*'()"
+# 常见聊天软件对单条链接长度的大致上限，用于基准报告
+CHAT_LINK_LIMIT = 2000
+
+
+class ShareCodecError(ValueError):
+    pass
+
+
+# ---------------------------------------------------------------------------
+# 冻结表
+# ---------------------------------------------------------------------------
+
+class IdTable:
+    def __init__(self, ids: List[str]):
+        self.ids = ids
+        self.index = {rid: i for i, rid in enumerate(ids)}
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+
+def load_table() -> IdTable:
+    if not TABLE_PATH.exists():
+        return IdTable([])
+    payload = json.loads(TABLE_PATH.read_text(encoding='utf-8'))
+    return IdTable(payload['ids'])
+
+
+def known_ids() -> List[str]:
+    """数据源中出现的全部角色 id（中文 id 与英文 id 都收录）"""
+    db = load_db()
+    ids = set()
+    for role in db.source_roles:
+        for rid in (role.key, role.data.get('id')):
+            if isinstance(rid, str) and rid:
+                ids.add(rid)
+    ids.update(db.cn_to_en)
+    ids.update(db.cn_to_en.values())
+    ids.discard('_meta')
+    return sorted(ids)
+
+
+def corpus_frequency() -> Counter:
+    counts: Counter = Counter()
+    for path, _ in iter_script_files():
+        try:
+            data = json.loads(path.read_bytes().decode('utf-8'))
+        except ValueError:
+            continue
+        for item in data if isinstance(data, list) else ():
+            rid = item if isinstance(item, str) else item.get('id') if isinstance(item, dict) else None
+            if isinstance(rid, str):
+                counts[rid] += 1
+    return counts
+
+
+def update_table() -> Tuple[IdTable, int]:
+    """追加新 id；首次生成时按剧本库出现次数排序。返回 (新表, 新增数量)"""
+    table = load_table()
+    new_ids = [rid for rid in known_ids() if rid not in table.index]
+    if not new_ids:
+        return table, 0
+    if not table.ids:
+        counts = corpus_frequency()
+        new_ids.sort(key=lambda rid: (-counts[rid], rid))
+    ids = table.ids + new_ids
+    body = ''.join(f'    {json.dumps(rid, ensure_ascii=False)},\n' for rid in ids).rstrip(',\n')
+    TABLE_PATH.write_text(f'{{\n  "version": {FORMAT_VERSION},\n  "ids": [\n{body}\n  ]\n}}\n',
+                          encoding='utf-8', newline='\n')
+    return IdTable(ids), len(new_ids)
+
+
+# ---------------------------------------------------------------------------
+# 编码 / 解码
+# ---------------------------------------------------------------------------
+
+def write_varint(out: bytearray, value: int):
+    while value >= 0x80:
+        out.append((value & 0x7F) | 0x80)
+        value >>= 7
+    out.append(value)
+
+
+def read_varint(data: bytes, pos: int) -> Tuple[int, int]:
+    value = shift = 0
+    while True:
+        if pos >= len(data):
+            raise ShareCodecError('varint 被截断')
+        byte = data[pos]
+        pos += 1
+        value |= (byte & 0x7F) << shift
+        if byte < 0x80:
+            return value, pos
+        shift += 7
+
+
+def dumps_compact(value: Any) -> str:
+    """与 JSON.stringify 相同的紧凑格式"""
+    return json.dumps(value, ensure_ascii=False, separators=(',', ':'))
+
+
+def deflate_raw(data: bytes) -> bytes:
+    compressor = zlib.compressobj(9, zlib.DEFLATED, -15)
+    return compressor.compress(data) + compressor.flush()
+
+
+def encode(items: List[Any], table: Optional[IdTable] = None) -> str:
+    table = table or load_table()
+    out = bytearray([FORMAT_VERSION])
+    write_varint(out, len(items))
+    custom: List[Any] = []
+    for item in items:
+        if isinstance(item, str) and item in table.index:
+            write_varint(out, (table.index[item] << 1) + 1)
+        elif (isinstance(item, dict) and len(item) == 1 and isinstance(item.get('id'), str)
+              and item['id'] in table.index):
+            write_varint(out, (table.index[item['id']] << 1) + 2)
+        else:
+            write_varint(out, 0)
+            custom.append(item)
+    if custom:
+        raw = dumps_compact(custom).encode('utf-8')
+        packed = deflate_raw(raw)
+        if len(packed) < len(raw):
+            out.append(PAYLOAD_DEFLATE)
+            out += packed
+        else:
+            out.append(PAYLOAD_RAW)
+            out += raw
+    return TOKEN_PREFIX + base64.urlsafe_b64encode(bytes(out)).rstrip(b'=').decode('ascii')
+
+
+def decode(token: str, table: Optional[IdTable] = None) -> List[Any]:
+    table = table or load_table()
+    if not token.startswith(TOKEN_PREFIX):
+        raise ShareCodecError('不是分享编码')
+    body = token[len(TOKEN_PREFIX):]
+    try:
+        data = base64.urlsafe_b64decode(body + '=' * (-len(body) % 4))
+    except ValueError as e:
+        raise ShareCodecError(f'base64 无效: {e}') from None
+    if not data or data[0] != FORMAT_VERSION:
+        raise ShareCodecError(f'不支持的编码版本 {data[0] if data else None}')
+
+    count, pos = read_varint(data, 1)
+    slots: List[Optional[Any]] = []
+    custom_count = 0
+    for _ in range(count):
+        code, pos = read_varint(data, pos)
+        if code == 0:
+            slots.append(None)
+            custom_count += 1
+            continue
+        i = (code - 1) >> 1
+        if i >= len(table):
+            raise ShareCodecError(f'id 编号 {i} 超出冻结表范围（{len(table)}），链接可能来自更新的版本')
+        rid = table.ids[i]
+        slots.append(rid if code & 1 else {'id': rid})
+
+    custom: List[Any] = []
+    if custom_count:
+        if pos >= len(data):
+            raise ShareCodecError('缺少自定义条目载荷')
+        flag, payload = data[pos], data[pos + 1:]
+        if flag == PAYLOAD_DEFLATE:
+            try:
+                payload = zlib.decompress(payload, -15)
+            except zlib.error as e:
+                raise ShareCodecError(f'自定义条目解压失败: {e}') from None
+        elif flag != PAYLOAD_RAW:
+            raise ShareCodecError(f'未知的载荷标志 {flag}')
+        custom = json.loads(payload.decode('utf-8'))
+        if not isinstance(custom, list) or len(custom) != custom_count:
+            raise ShareCodecError('自定义条目数量不匹配')
+
+    it = iter(custom)
+    return [next(it) if slot is None else slot for slot in slots]
+
+
+# ---------------------------------------------------------------------------
+# 测试向量 / 校验 / 基准
+# ---------------------------------------------------------------------------
+
+def vector_cases() -> List[Tuple[str, List[Any]]]:
+    table = load_table()
+    first, last = table.ids[0], table.ids[-1]
+    # 第一个编号需要两字节 varint 的 id
+    wide = table.ids[63] if len(table) > 63 else last
+    return [
+        ('empty', []),
+        ('meta-only', [{'id': '_meta', 'name': '测试剧本', 'author': 'tester'}]),
+        ('known-strings', ['washerwoman', 'librarian', 'imp', first, last]),
+        ('known-objects', [{'id': 'chef'}, {'id': 'poisoner'}, 'empath']),
+        ('two-byte-varint', [wide, {'id': wide}]),
+        ('custom-raw', [{'id': 'x', 'team': 'townsfolk'}]),
+        ('mixed', [
+            {'id': '_meta', 'name': '一夜鱼龙舞', 'author': '驯鹿&痴愚', 'logo': 'https://example.com/logo.png'},
+            'washerwoman',
+            {'id': 'sibu_button', 'name': '司簿', 'team': 'townsfolk',
+             'ability': '在你的首个夜晚，你要选择一名玩家，你会得知该玩家及其相邻玩家的角色种类数量。'},
+            {'id': 'imp'},
+            {'id': 'imp', 'name': '小恶魔（改）'},
+            42,
+            'not-a-known-role',
+        ]),
+    ]
+
+
+def write_vectors() -> int:
+    table = load_table()
+    vectors = [{'name': name, 'items': items, 'token': encode(items, table)} for name, items in vector_cases()]
+    payload = {'version': FORMAT_VERSION, 'tableSize': len(table), 'vectors': vectors}
+    VECTORS_PATH.write_text(json.dumps(payload, ensure_ascii=False, indent=2) + '\n', encoding='utf-8', newline='\n')
+    return len(vectors)
+
+
+def load_corpus() -> List[Tuple[str, List[Any]]]:
+    scripts = []
+    for path, category in iter_script_files():
+        try:
+            data = json.loads(path.read_bytes().decode('utf-8'))
+        except ValueError:
+            continue
+        if isinstance(data, list):
+            scripts.append((f'{category}/{path.name}', data))
+    return scripts
+
+
+def check() -> List[str]:
+    table = load_table()
+    failures = []
+    for name, data in load_corpus():
+        try:
+            if decode(encode(data, table), table) != data:
+                failures.append(f'{name}: 往返结果不一致')
+        except ShareCodecError as e:
+            failures.append(f'{name}: {e}')
+    if VECTORS_PATH.exists():
+        for v in json.loads(VECTORS_PATH.read_text(encoding='utf-8'))['vectors']:
+            if decode(v['token'], table) != v['items']:
+                failures.append(f"vector {v['name']}: decode 结果不一致")
+            if decode(encode(v['items'], table), table) != v['items']:
+                failures.append(f"vector {v['name']}: 往返结果不一致")
+    return failures
+
+
+def legacy_share_items(data: List[Any], cn_to_en: Dict[str, str]) -> List[Any]:
+    """近似 ShareDialog.generateCompressedJson()：_meta 只留 name/author，角色 id 转为英文 id"""
+    items: List[Any] = []
+    for item in data:
+        rid = item if isinstance(item, str) else item.get('id') if isinstance(item, dict) else None
+        if not isinstance(rid, str):
+            continue
+        if rid == '_meta':
+            items.insert(0, {'id': '_meta', 'name': item.get('name', ''), 'author': item.get('author', '')})
+        else:
+            items.append(cn_to_en.get(rid, rid))
+    return items
+
+
+def bench() -> Dict[str, Any]:
+    table = load_table()
+    cn_to_en = load_db().cn_to_en
+    report: Dict[str, Any] = {}
+    corpus = load_corpus()
+    for label, transform in (('ids', lambda d: legacy_share_items(d, cn_to_en)), ('full', lambda d: d)):
+        legacy, coded = [], []
+        for _, data in corpus:
+            items = transform(data)
+            legacy.append(len(quote(dumps_compact(items), safe=URI_COMPONENT_SAFE)))
+            coded.append(len(encode(items, table)))
+        report[label] = {
+            'scripts': len(corpus),
+            'legacyMedian': statistics.median(legacy),
+            'codecMedian': statistics.median(coded),
+            'legacyMax': max(legacy),
+            'codecMax': max(coded),
+            'legacyTotal': sum(legacy),
+            'codecTotal': sum(coded),
+            'legacyOverLimit': sum(1 for n in legacy if n > CHAT_LINK_LIMIT),
+            'codecOverLimit': sum(1 for n in coded if n > CHAT_LINK_LIMIT),
+        }
+    return report
+
+
+def main():
+    parser = argparse.ArgumentParser(description='剧本分享链接编码：冻结表、测试向量、往返校验与长度基准')
+    parser.add_argument('--update-table', action='store_true', help='把数据源中新出现的 id 追加到冻结表')
+    parser.add_argument('--vectors', action='store_true', help='重新生成 TS 端共用的测试向量')
+    parser.add_argument('--check', action='store_true', help='校验全部剧本与测试向量可以往返')
+    parser.add_argument('--bench', action='store_true', help='与现有 ?json= 格式比较链接长度')
+    parser.add_argument('--json', action='store_true', help='以 JSON 输出基准结果')
+    args = parser.parse_args()
+
+    if args.update_table:
+        table, added = update_table()
+        print(f'Share codec table: {len(table)} ids ({added} new) -> {TABLE_PATH}')
+    if args.vectors:
+        print(f'Wrote {write_vectors()} test vectors -> {VECTORS_PATH}')
+    if args.check:
+        failures = check()
+        for line in failures:
+            print(f'error: {line}', file=sys.stderr)
+        if failures:
+            sys.exit(1)
+        print('Share codec round-trip OK')
+    if args.bench:
+        report = bench()
+        if args.json:
+            json.dump(report, sys.stdout, indent=2)
+            sys.stdout.write('\n')
+        else:
+            print(f"{'payload':8} {'median':>16} {'max':>16} {'total':>20} {f'>{CHAT_LINK_LIMIT}':>10}")
+            for label, r in report.items():
+                print(f"{label:8} {r['legacyMedian']:>7.0f} -> {r['codecMedian']:<6.0f} "
+                      f"{r['legacyMax']:>7} -> {r['codecMax']:<6} "
+                      f"{r['legacyTotal']:>9} -> {r['codecTotal']:<8} "
+                      f"{r['legacyOverLimit']:>4} -> {r['codecOverLimit']:<3}")
+    if not (args.update_table or args.vectors or args.check or args.bench):
+        parser.print_help()
+
+
+if __name__ == '__main__':
+    main()
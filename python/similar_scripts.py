@@ -0,0 +1,303 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+“相似剧本”索引：把每个剧本表示为角色集合（script_summary.role_set()），用 MinHash 签名 +
+LSH 分桶找出候选，再按精确 Jaccard 相似度排序，为每个 manifest 条目输出最相近的 k 个剧本。
+
+- MinHash：NUM_PERM 个形如 (a*h + b) mod P 的哈希函数，h 为角色 id 的 32 位哈希
+- LSH：签名切成 bands 段、每段 rows 个值；任意一段完全相同的剧本互为候选。
+  默认 32×2，Jaccard 0.3 的剧本对成为候选的概率约 95%，0.1 约 27%
+- 只对候选计算精确 Jaccard，总代价与“剧本数 × 平均候选数”成正比，而非剧本数的平方。
+  成员超过 MAX_BUCKET_SCAN 的桶（大量近似的翻版剧本）按每段各自的伪随机顺序选出扫描名单，
+  只有名单内的成员与全桶互为候选，每个剧本的候选数因此不超过 bands × MAX_BUCKET_SCAN
+
+输出 public/scripts/json/similar-index.json（紧凑 JSON）：
+{
+  "version": 1,
+  "k": 5,
+  "ids": [manifest 条目 id, ...],          // 下标即整数 entry id
+  "similar": [[[entry id, jaccard], ...]]  // 与 ids 对齐，按相似度降序
+}
+
+增量更新：签名、角色集合与上一次的结果缓存在 .cache/similar-cache.json。mtime/size 未变的
+剧本不读取；只有内容变化（新增、修改、删除）或进出扫描名单的剧本，以及把它们列为近邻的剧本
+会重新计算近邻，其余剧本只并入与前者的新得分，结果与全量重建一致。
+"""
+import argparse
+import hashlib
+import json
+import os
+import random
+import time
+import zlib
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+
+from generate_manifest import CACHE_DIR, JSON_ROOT, collect_entries, content_hash, iter_script_files, parse_json_bytes
+from instrument import count, stage
+from script_summary import role_set, sources_hash
+
+SIMILAR_INDEX_PATH = JSON_ROOT / 'similar-index.json'
+SIMILAR_INDEX_VERSION = 1
+CACHE_PATH = CACHE_DIR / 'similar-cache.json'
+# 签名算法变化时递增，使旧缓存整体失效
+CACHE_VERSION = 1
+
+NUM_PERM = 64
+DEFAULT_BANDS = 32
+DEFAULT_ROWS = 2
+DEFAULT_K = 5
+# 低于该 Jaccard 相似度的候选不输出
+MIN_SCORE = 0.1
+# 单个 LSH 桶的扫描名单长度，保证最坏情况下仍是次二次复杂度
+MAX_BUCKET_SCAN = 16
+# 固定种子，保证签名在不同运行之间可比
+SEED = 0x5C1237
+MERSENNE_P = (1 << 31) - 1
+
+Band = Tuple[int, ...]
+
+
+def _permutations(n: int) -> List[Tuple[int, int]]:
+    rng = random.Random(SEED)
+    return [(rng.randrange(1, MERSENNE_P), rng.randrange(0, MERSENNE_P)) for _ in range(n)]
+
+
+PERMUTATIONS = _permutations(NUM_PERM)
+
+
+def role_hash(role: str) -> int:
+    return int.from_bytes(hashlib.blake2b(role.encode('utf-8'), digest_size=4).digest(), 'little')
+
+
+def minhash(roles: Iterable[str]) -> List[int]:
+    hashes = [role_hash(r) for r in roles]
+    if not hashes:
+        return []
+    return [min((a * h + b) % MERSENNE_P for h in hashes) for a, b in PERMUTATIONS]
+
+
+def band_keys(sig: List[int], bands: int, rows: int) -> List[Band]:
+    """签名的各段；段号放在首位，使不同段的相同取值落入不同的桶"""
+    if not sig:
+        return []
+    return [(i, *sig[i * rows:(i + 1) * rows]) for i in range(bands)]
+
+
+def scan_order(band: Band, key: str) -> Tuple[int, str]:
+    # 每段各自的伪随机顺序：不同段的扫描名单取到不同的成员
+    return zlib.crc32(f'{band[0]}:{key}'.encode('utf-8')), key
+
+
+def bucket_head(band: Band, members: List[str]) -> Set[str]:
+    """桶的扫描名单：名单内的成员与全桶互为候选，名单外的成员只与名单内的互为候选"""
+    if len(members) <= MAX_BUCKET_SCAN:
+        return set(members)
+    return set(sorted(members, key=lambda m: scan_order(band, m))[:MAX_BUCKET_SCAN])
+
+
+def jaccard(a: Set[str], b: Set[str]) -> float:
+    if not a or not b:
+        return 0.0
+    inter = len(a & b)
+    return inter / (len(a) + len(b) - inter)
+
+
+def load_cache(options: Dict[str, Any]) -> Dict[str, Any]:
+    try:
+        with CACHE_PATH.open('r', encoding='utf-8') as f:
+            cache = json.load(f)
+        if (cache.get('version') == CACHE_VERSION and cache.get('options') == options
+                and isinstance(cache.get('files'), dict)):
+            return cache
+    except Exception:
+        pass
+    return {'version': CACHE_VERSION, 'options': options, 'files': {}}
+
+
+def save_cache(cache: Dict[str, Any]):
+    CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    tmp = CACHE_PATH.with_suffix('.tmp')
+    with tmp.open('w', encoding='utf-8') as f:
+        json.dump(cache, f, ensure_ascii=False, separators=(',', ':'))
+    os.replace(tmp, CACHE_PATH)
+
+
+def build_similar(
+    k: int = DEFAULT_K,
+    bands: int = DEFAULT_BANDS,
+    rows: int = DEFAULT_ROWS,
+    full: bool = False,
+    stats: Optional[Dict[str, int]] = None,
+) -> Dict[str, List[Tuple[str, float]]]:
+    """返回 剧本 key（相对 JSON_ROOT）-> [(相似剧本 key, Jaccard), ...]"""
+    if bands * rows > NUM_PERM:
+        raise ValueError(f'bands × rows 不能超过签名长度 {NUM_PERM}')
+    if stats is None:
+        stats = {}
+    stats.update({'scripts': 0, 'changed': 0, 'affected': 0, 'pairs': 0})
+
+    options = {'numPerm': NUM_PERM, 'seed': SEED, 'bands': bands, 'rows': rows, 'k': k,
+               'minScore': MIN_SCORE, 'maxBucketScan': MAX_BUCKET_SCAN, 'dataHash': sources_hash()}
+    with stage('load_cache'):
+        cache = load_cache(options)
+    old_files: Dict[str, Any] = {} if full else cache['files']
+    files: Dict[str, Any] = {}
+    changed: Set[str] = set()
+
+    # 第一遍：stat 命中的直接复用；内容哈希未变的只更新 stat 信息
+    with stage('signatures'):
+        for jf, _ in iter_script_files():
+            key = jf.relative_to(JSON_ROOT).as_posix()
+            st = jf.stat()
+            record = old_files.get(key)
+            if record and record['mtime_ns'] == st.st_mtime_ns and record['size'] == st.st_size:
+                files[key] = record
+                continue
+            raw = jf.read_bytes()
+            count('files_read')
+            digest = content_hash(raw)
+            if record and record['hash'] == digest:
+                files[key] = {**record, 'mtime_ns': st.st_mtime_ns, 'size': st.st_size}
+                continue
+            roles = sorted(role_set(parse_json_bytes(raw)))
+            files[key] = {'mtime_ns': st.st_mtime_ns, 'size': st.st_size, 'hash': digest,
+                          'roles': roles, 'sig': minhash(roles), 'top': []}
+            changed.add(key)
+    changed |= set(old_files) - set(files)
+    stats['scripts'] = len(files)
+    stats['changed'] = len(changed)
+
+    with stage('buckets'):
+        buckets: Dict[Band, List[str]] = {}
+        for key in files:
+            for band in band_keys(files[key]['sig'], bands, rows):
+                buckets.setdefault(band, []).append(key)
+        heads: Dict[Band, Set[str]] = {band: bucket_head(band, members) for band, members in buckets.items()
+                                       if len(members) > MAX_BUCKET_SCAN}
+
+    def candidates_of(key: str) -> Set[str]:
+        found: Set[str] = set()
+        for band in band_keys(files[key]['sig'], bands, rows):
+            head = heads.get(band)
+            found.update(buckets[band] if head is None or key in head else head)
+        found.discard(key)
+        return found
+
+    # recompute：候选集合可能变化的剧本（内容变化、进出某个桶的扫描名单）；
+    # affected：另外加上近邻列表中含有上述剧本或已删除剧本的剧本。两者都完整重新计算
+    with stage('affected'):
+        if full or not old_files:
+            recompute = affected = set(files)
+        else:
+            recompute = changed & set(files)
+            old_bands: Dict[Band, List[str]] = {}
+            for key in changed:
+                if key in old_files:
+                    for band in band_keys(old_files[key]['sig'], bands, rows):
+                        old_bands.setdefault(band, []).append(key)
+            touched = set(old_bands)
+            for key in recompute:
+                touched.update(band_keys(files[key]['sig'], bands, rows))
+            for band in touched:
+                members = buckets.get(band, [])
+                before = [m for m in members if m not in changed] + old_bands.get(band, [])
+                recompute |= bucket_head(band, before) ^ bucket_head(band, members)
+            recompute &= set(files)
+            stale = recompute | changed
+            affected = recompute | {key for key, record in files.items()
+                                    if any(other in stale for other, _ in record['top'])}
+    stats['affected'] = len(affected)
+
+    role_sets: Dict[str, Set[str]] = {}
+
+    def roles_of(key: str) -> Set[str]:
+        s = role_sets.get(key)
+        if s is None:
+            s = role_sets[key] = set(files[key]['roles'])
+        return s
+
+    def rank(scored: Iterable[Tuple[str, float]]) -> List[List[Any]]:
+        kept = ((other, round(score, 4)) for other, score in scored if score >= MIN_SCORE)
+        return [list(p) for p in sorted(kept, key=lambda p: (-p[1], p[0]))[:k]]
+
+    # 候选关系是对称的：重新计算的剧本 R 与未重新计算的候选 X 之间的得分直接并入 X 的近邻列表，
+    # X 原有近邻都不受影响（否则 X 已在 affected 中），因此结果与全量计算一致
+    with stage('neighbours'):
+        merged: Dict[str, List[Tuple[str, float]]] = {}
+        for key in affected:
+            mine = roles_of(key)
+            scored = [(other, jaccard(mine, roles_of(other))) for other in candidates_of(key)]
+            stats['pairs'] += len(scored)
+            files[key]['top'] = rank(scored)
+            if key in recompute and len(affected) < len(files):
+                for other, score in scored:
+                    if other not in affected:
+                        merged.setdefault(other, []).append((key, score))
+        for key, extra in merged.items():
+            files[key]['top'] = rank([(other, score) for other, score in files[key]['top']] + extra)
+    count('similar_pairs', stats['pairs'])
+
+    cache = {'version': CACHE_VERSION, 'options': options, 'files': files}
+    with stage('save_cache'):
+        save_cache(cache)
+    return {key: [(other, score) for other, score in record['top']] for key, record in files.items()}
+
+
+def write_similar_index(entries: List[Dict[str, Any]], path: Path = SIMILAR_INDEX_PATH, k: int = DEFAULT_K,
+                        bands: int = DEFAULT_BANDS, rows: int = DEFAULT_ROWS, full: bool = False) -> Dict[str, Any]:
+    """按 manifest 条目顺序写出索引，返回统计信息"""
+    start = time.perf_counter()
+    stats: Dict[str, Any] = {}
+    similar = build_similar(k=k, bands=bands, rows=rows, full=full, stats=stats)
+    keys = [f"{e['dir']}/{e['file']}" for e in entries]
+    position = {key: i for i, key in enumerate(keys)}
+    index = {
+        'version': SIMILAR_INDEX_VERSION,
+        'k': k,
+        'ids': [e['id'] for e in entries],
+        'similar': [[[position[other], score] for other, score in similar.get(key, ()) if other in position]
+                    for key in keys],
+    }
+    path.parent.mkdir(parents=True, exist_ok=True)
+    data = json.dumps(index, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+    path.write_bytes(data)
+    stats['bytes'] = len(data)
+    stats['seconds'] = time.perf_counter() - start
+    return stats
+
+
+def print_stats(stats: Dict[str, Any]):
+    n = stats['scripts']
+    all_pairs = n * (n - 1)
+    ratio = f"{stats['pairs'] / all_pairs:.1%} of all pairs" if all_pairs else 'n/a'
+    print(f"Similar scripts: {n} scripts, {stats['changed']} changed, {stats['affected']} recomputed, "
+          f"{stats['pairs']} candidate pairs ({ratio}), {stats['bytes']} bytes in "
+          f"{stats['seconds'] * 1000:.1f} ms -> {SIMILAR_INDEX_PATH}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description='生成相似剧本索引 similar-index.json（角色集合 MinHash + LSH）')
+    parser.add_argument('--full', action='store_true', help='忽略缓存，重新计算全部签名与近邻')
+    parser.add_argument('-k', type=int, default=DEFAULT_K, help=f'每个剧本输出的近邻数（默认 {DEFAULT_K}）')
+    parser.add_argument('--bands', type=int, default=DEFAULT_BANDS, help=f'LSH 段数（默认 {DEFAULT_BANDS}）')
+    parser.add_argument('--rows', type=int, default=DEFAULT_ROWS,
+                        help=f'每段签名长度（默认 {DEFAULT_ROWS}；bands × rows 不超过 {NUM_PERM}）')
+    parser.add_argument('--show', metavar='FILE', help='打印某个剧本（相对 public/scripts/json 的路径）的近邻')
+    args = parser.parse_args()
+    if args.bands * args.rows > NUM_PERM:
+        parser.error(f'bands × rows 不能超过 {NUM_PERM}')
+
+    with stage('collect'):
+        entries = collect_entries()
+    with stage('similar_index'):
+        stats = write_similar_index(entries, k=args.k, bands=args.bands, rows=args.rows, full=args.full)
+    print_stats(stats)
+    if args.show:
+        similar = build_similar(k=args.k, bands=args.bands, rows=args.rows)
+        for other, score in similar.get(args.show, []):
+            print(f'  {score:.3f}  {other}')
+
+
+if __name__ == '__main__':
+    main()
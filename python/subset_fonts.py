@@ -0,0 +1,337 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+按实际用到的字符裁剪字体（依赖 fontTools，可选安装：pip install fonttools brotli）。
+
+1. 从 characters.ts / charactersEn.ts / fabled.ts / loric.ts / jinx.ts / specialRules.ts / i18n.tsx
+   的字符串字面量、roles.json / jinxEn.json 以及所有内置剧本中收集码位集合；
+2. 对 src/index.css 中 @font-face 引用的每个字体，取「语料 ∩ 字体 cmap ∩ unicode-range」
+   生成 WOFF2 子集，写到 public/font/subset/；
+3. 可选 --chunk-size N：把字体中其余字形按 N 个码位一组切成带 unicode-range 的分片，
+   用户自定义剧本里出现语料之外的字时只下载对应分片；
+4. 生成 src/fonts.subset.css（在 index.css 之后导入）。同一 family 的 @font-face 中后定义者优先，
+   因此子集命中时不会再下载原始 TTF；子集之外的字仍回退到 index.css 中的完整字体。
+
+字体文件与码位集合都没有变化时直接跳过（缓存于 .cache/font-subset.json）。
+"""
+import argparse
+import hashlib
+import json
+import logging
+import os
+import re
+import sys
+import time
+from io import BytesIO
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Set, Tuple
+
+try:
+    from fontTools import subset as ft_subset  # type: ignore
+    from fontTools.ttLib import TTFont  # type: ignore
+except ImportError:  # fontTools 为可选依赖
+    ft_subset = None
+    TTFont = None
+
+from generate_manifest import ROOT, iter_script_files
+from ts_literal import tokenize, unescape
+
+PUBLIC_DIR = ROOT / 'public'
+INDEX_CSS = ROOT / 'src' / 'index.css'
+SUBSET_CSS = ROOT / 'src' / 'fonts.subset.css'
+SUBSET_DIR = PUBLIC_DIR / 'font' / 'subset'
+CACHE_PATH = ROOT / '.cache' / 'font-subset.json'
+CACHE_VERSION = 1
+
+DATA_DIR = ROOT / 'src' / 'data'
+TS_SOURCES = (
+    DATA_DIR / 'characters.ts',
+    DATA_DIR / 'charactersEn.ts',
+    DATA_DIR / 'fabled.ts',
+    DATA_DIR / 'loric.ts',
+    DATA_DIR / 'jinx.ts',
+    DATA_DIR / 'specialRules.ts',
+    ROOT / 'src' / 'utils' / 'i18n.tsx',
+)
+JSON_SOURCES = (DATA_DIR / 'roles.json', DATA_DIR / 'jinxEn.json')
+# 始终保留的码位：可打印 ASCII 与常用全角标点
+ALWAYS_KEEP = set(range(0x20, 0x7F)) | set(map(ord, '，。、：；！？（）【】《》「」『』“”‘’…—·'))
+
+_FACE_RE = re.compile(r'@font-face\s*\{(.*?)\}', re.S)
+_DESC_RE = re.compile(r'([\w-]+)\s*:\s*([^;]+);')
+_URL_RE = re.compile(r"url\(\s*['\"]?([^'\")]+)['\"]?\s*\)")
+_RANGE_RE = re.compile(r'U\+([0-9A-Fa-f?]+)(?:-([0-9A-Fa-f]+))?')
+
+
+# ---------------------------------------------------------------------------
+# 码位收集
+# ---------------------------------------------------------------------------
+
+def _walk_json(value: Any, out: Set[int]):
+    if isinstance(value, str):
+        out.update(map(ord, value))
+    elif isinstance(value, dict):
+        for k, v in value.items():
+            _walk_json(v, out)
+    elif isinstance(value, list):
+        for v in value:
+            _walk_json(v, out)
+
+
+def collect_codepoints() -> Tuple[Set[int], List[Path]]:
+    """返回 (码位集合, 参与统计的文件列表)"""
+    codepoints: Set[int] = set(ALWAYS_KEEP)
+    files: List[Path] = []
+    for path in TS_SOURCES:
+        if not path.exists():
+            continue
+        files.append(path)
+        # 只统计字符串字面量，注释与代码本身不会被渲染
+        for tok in tokenize(path.read_bytes()):
+            if tok.kind == 'str':
+                codepoints.update(map(ord, unescape(tok.text[1:-1].decode('utf-8'))))
+
+    json_files = list(JSON_SOURCES) + [p for p, _ in iter_script_files()]
+    for path in json_files:
+        try:
+            data = json.loads(path.read_bytes().decode('utf-8'))
+        except (OSError, ValueError):
+            continue
+        files.append(path)
+        _walk_json(data, codepoints)
+
+    # 控制字符与换行不需要字形
+    return {cp for cp in codepoints if cp >= 0x20}, files
+
+
+# ---------------------------------------------------------------------------
+# @font-face 解析
+# ---------------------------------------------------------------------------
+
+def parse_unicode_range(value: str) -> List[Tuple[int, int]]:
+    ranges = []
+    for start, end in _RANGE_RE.findall(value):
+        if '?' in start:
+            lo, hi = int(start.replace('?', '0'), 16), int(start.replace('?', 'F'), 16)
+        else:
+            lo = int(start, 16)
+            hi = int(end, 16) if end else lo
+        ranges.append((lo, hi))
+    return ranges
+
+
+def parse_font_faces(css_path: Path = INDEX_CSS) -> List[Dict[str, Any]]:
+    faces = []
+    for body in _FACE_RE.findall(css_path.read_text(encoding='utf-8')):
+        desc = {k.lower(): v.strip() for k, v in _DESC_RE.findall(body)}
+        m = _URL_RE.search(desc.get('src', ''))
+        if not m:
+            continue
+        faces.append({
+            'family': desc.get('font-family', '').strip('\'"'),
+            'url': m.group(1),
+            'weight': desc.get('font-weight', 'normal'),
+            'style': desc.get('font-style', 'normal'),
+            'ranges': parse_unicode_range(desc.get('unicode-range', '')),
+        })
+    return faces
+
+
+def in_ranges(cp: int, ranges: List[Tuple[int, int]]) -> bool:
+    return not ranges or any(lo <= cp <= hi for lo, hi in ranges)
+
+
+def to_unicode_range(codepoints: Iterable[int]) -> str:
+    """把码位集合压缩成 CSS unicode-range（连续码位合并为区间）"""
+    parts = []
+    run_start = prev = None
+    for cp in sorted(codepoints):
+        if prev is not None and cp == prev + 1:
+            prev = cp
+            continue
+        if run_start is not None:
+            parts.append(f'U+{run_start:X}' if run_start == prev else f'U+{run_start:X}-{prev:X}')
+        run_start = prev = cp
+    if run_start is not None:
+        parts.append(f'U+{run_start:X}' if run_start == prev else f'U+{run_start:X}-{prev:X}')
+    return ', '.join(parts)
+
+
+# ---------------------------------------------------------------------------
+# 子集化
+# ---------------------------------------------------------------------------
+
+def subset_woff2(font_bytes: bytes, codepoints: Iterable[int]) -> bytes:
+    options = ft_subset.Options()
+    options.flavor = 'woff2'
+    options.layout_features = ['*']
+    options.name_IDs = ['*']
+    options.notdef_outline = True
+    options.drop_tables += ['DSIG']
+    # 不更新 head.modified，保证相同输入得到逐字节相同的输出
+    font = TTFont(BytesIO(font_bytes), recalcTimestamp=False)
+    subsetter = ft_subset.Subsetter(options=options)
+    subsetter.populate(unicodes=list(codepoints))
+    subsetter.subset(font)
+    out = BytesIO()
+    font.flavor = 'woff2'
+    font.save(out)
+    return out.getvalue()
+
+
+def face_stem(face: Dict[str, Any]) -> str:
+    return Path(face['url']).stem
+
+
+def process_face(face: Dict[str, Any], corpus: Set[int], chunk_size: int,
+                 cache: Dict[str, Any], force: bool) -> Dict[str, Any]:
+    """生成单个字体的子集（及分片），返回 CSS 生成所需的信息与体积统计"""
+    src = PUBLIC_DIR / face['url'].lstrip('/')
+    if not src.exists():
+        return {'face': face, 'missing': True}
+
+    font_bytes = src.read_bytes()
+    cmap = set(TTFont(BytesIO(font_bytes), lazy=True).getBestCmap())
+    ranges = face['ranges']
+    core = sorted(cp for cp in corpus & cmap if in_ranges(cp, ranges))
+    rest = sorted(cp for cp in cmap - set(core) if in_ranges(cp, ranges) and cp >= 0x20) if chunk_size else []
+    chunks = [rest[i:i + chunk_size] for i in range(0, len(rest), chunk_size)] if chunk_size else []
+
+    stem = face_stem(face)
+    outputs = [(SUBSET_DIR / f'{stem}.woff2', core)]
+    outputs += [(SUBSET_DIR / f'{stem}.{i + 1}.woff2', chunk) for i, chunk in enumerate(chunks)]
+
+    fingerprint = hashlib.sha1(font_bytes).hexdigest() + ':' + hashlib.sha1(
+        json.dumps([c for _, c in outputs]).encode('ascii')).hexdigest()
+    cached = cache.get(face['url'])
+    up_to_date = (not force and cached and cached.get('fingerprint') == fingerprint
+                  and all(p.exists() for p, _ in outputs))
+
+    if not up_to_date:
+        SUBSET_DIR.mkdir(parents=True, exist_ok=True)
+        for path, cps in outputs:
+            tmp = path.with_suffix('.tmp')
+            tmp.write_bytes(subset_woff2(font_bytes, cps))
+            os.replace(tmp, path)
+        # 清理分片数减少后遗留的旧文件
+        keep = {p.name for p, _ in outputs}
+        for old in SUBSET_DIR.glob(f'{stem}.*.woff2'):
+            if old.name not in keep:
+                old.unlink()
+        cache[face['url']] = {'fingerprint': fingerprint}
+
+    return {
+        'face': face,
+        'missing': False,
+        'regenerated': not up_to_date,
+        'glyphs': len(core),
+        'before': len(font_bytes),
+        'after': outputs[0][0].stat().st_size,
+        'chunks': [(p, to_unicode_range(cps), p.stat().st_size) for p, cps in outputs[1:]],
+        'core': (outputs[0][0], to_unicode_range(core)),
+    }
+
+
+def render_css(results: List[Dict[str, Any]]) -> str:
+    lines = [
+        '/* 此文件由 python/subset_fonts.py 自动生成，请勿手动修改。 */',
+        '/* 必须在 index.css 之后导入：同名 @font-face 中后定义者优先匹配，子集之外的字回退到完整字体。 */',
+    ]
+
+    def rule(face, path, unicode_range):
+        url = '/' + path.relative_to(PUBLIC_DIR).as_posix()
+        lines.extend([
+            '',
+            '@font-face {',
+            f"  font-family: '{face['family']}';",
+            f"  src: url('{url}') format('woff2');",
+            f"  font-weight: {face['weight']};",
+            f"  font-style: {face['style']};",
+            '  font-display: swap;',
+            f'  unicode-range: {unicode_range};',
+            '}',
+        ])
+
+    for r in results:
+        if r['missing'] or not r['glyphs']:
+            continue
+        # 分片先定义、核心子集最后定义，使核心子集优先被匹配
+        for path, unicode_range, _ in r['chunks']:
+            rule(r['face'], path, unicode_range)
+        rule(r['face'], *r['core'])
+    return '\n'.join(lines) + '\n'
+
+
+def load_cache() -> Dict[str, Any]:
+    try:
+        with CACHE_PATH.open('r', encoding='utf-8') as f:
+            cache = json.load(f)
+        if cache.get('version') == CACHE_VERSION:
+            return cache.get('fonts', {})
+    except (OSError, ValueError):
+        pass
+    return {}
+
+
+def save_cache(fonts: Dict[str, Any]):
+    CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+    tmp = CACHE_PATH.with_suffix('.tmp')
+    with tmp.open('w', encoding='utf-8') as f:
+        json.dump({'version': CACHE_VERSION, 'fonts': fonts}, f, ensure_ascii=False, separators=(',', ':'))
+    os.replace(tmp, CACHE_PATH)
+
+
+def format_size(n: int) -> str:
+    return f'{n / 1024:.1f} KiB' if n < 1024 * 1024 else f'{n / 1024 / 1024:.2f} MiB'
+
+
+def main():
+    parser = argparse.ArgumentParser(description='按语料裁剪字体为 WOFF2 子集')
+    parser.add_argument('--chunk-size', type=int, default=0,
+                        help='把其余字形按 N 个码位切成 unicode-range 分片（默认 0：不切分）')
+    parser.add_argument('--force', action='store_true', help='忽略缓存，强制重新生成')
+    args = parser.parse_args()
+
+    if ft_subset is None:
+        print('fontTools 未安装，跳过字体子集化（pip install fonttools brotli）', file=sys.stderr)
+        return
+
+    # fontTools 会对无法子集化的私有表（如 FFTM）逐个打印警告
+    logging.getLogger('fontTools').setLevel(logging.ERROR)
+
+    start = time.perf_counter()
+    corpus, files = collect_codepoints()
+    cjk = sum(1 for cp in corpus if 0x3400 <= cp <= 0x9FFF)
+    print(f'Corpus: {len(corpus)} codepoints ({cjk} CJK) from {len(files)} files')
+
+    cache = load_cache()
+    results = [process_face(face, corpus, args.chunk_size, cache, args.force)
+               for face in parse_font_faces()]
+    save_cache(cache)
+
+    css = render_css(results)
+    current = SUBSET_CSS.read_text(encoding='utf-8') if SUBSET_CSS.exists() else ''
+    if css != current:
+        SUBSET_CSS.write_text(css, encoding='utf-8', newline='\n')
+
+    total_before = total_after = 0
+    for r in results:
+        face = r['face']
+        label = f"{face['family']} ({face['weight']}/{face['style']})"
+        if r['missing']:
+            print(f"  {label:32} missing {face['url']}, skipped")
+            continue
+        chunk_bytes = sum(size for _, _, size in r['chunks'])
+        total_before += r['before']
+        total_after += r['after']
+        status = 'regenerated' if r['regenerated'] else 'up to date'
+        extra = f" + {len(r['chunks'])} chunks {format_size(chunk_bytes)}" if r['chunks'] else ''
+        print(f"  {label:32} {r['glyphs']:5} glyphs  {format_size(r['before']):>10} -> "
+              f"{format_size(r['after']):>10}{extra}  [{status}]")
+    if total_before:
+        print(f'Total: {format_size(total_before)} -> {format_size(total_after)} '
+              f'({total_after / total_before:.1%}) in {time.perf_counter() - start:.1f}s')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,190 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+src/data/*.ts 中 JS 对象字面量子集的单遍流式解析器。
+
+支持：
+- 字符串（双引号 / 单引号 / 不含 ${} 插值的模板字符串）及其转义
+- // 与 /* */ 注释
+- 数字、true/false/null/undefined
+- 数组、嵌套对象、带引号或不带引号的键
+- `isEnglish ? a : b` 这类三元表达式（标识符的取值由 env 提供）
+
+在 UTF-8 字节串上从左到右扫描一次，按需产出 token；iter_blocks() 每解析完一个
+顶层条目就立即产出，并附带它在文件中的字节偏移 [start, end)。
+"""
+import re
+from dataclasses import dataclass
+from typing import Any, Dict, Iterator, List, Optional, Tuple, Union
+
+_TOKEN_RE = re.compile(rb'''
+    (?P<ws>\s+|//[^\n]*|/\*.*?\*/)
+  | (?P<str>"(?:[^"\\]|\\.)*"|'(?:[^'\\]|\\.)*'|`(?:[^`\\]|\\.)*`)
+  | (?P<num>-?\d+(?:\.\d+)?)
+  | (?P<ident>[A-Za-z_$][\w$]*)
+  | (?P<punct>\.\.\.|[{}\[\]:,?()])
+  | (?P<other>.)
+''', re.S | re.X)
+
+_ESCAPES = {'n': '\n', 't': '\t', 'r': '\r', 'b': '\b', 'f': '\f', 'v': '\v', '0': '\0'}
+_ESCAPE_RE = re.compile(r'\\(u\{[0-9a-fA-F]+\}|u[0-9a-fA-F]{4}|x[0-9a-fA-F]{2}|\r\n|.)', re.S)
+
+
+@dataclass(slots=True)
+class Token:
+    kind: str       # str / num / ident / punct / other / eof
+    text: bytes
+    start: int
+    end: int
+
+
+@dataclass(slots=True)
+class Block:
+    """对象中的一个顶层条目：键、解析后的值以及在源文件中的字节区间"""
+    key: str
+    value: Any
+    start: int
+    end: int
+
+
+def unescape(body: str) -> str:
+    def sub(m):
+        esc = m.group(1)
+        if esc[0] in 'ux' and len(esc) > 1:
+            return chr(int(esc[1:].strip('{}'), 16))
+        if esc in ('\n', '\r\n'):
+            return ''  # 行尾续行
+        return _ESCAPES.get(esc, esc)
+    return _ESCAPE_RE.sub(sub, body) if '\\' in body else body
+
+
+def tokenize(data: bytes, pos: int = 0) -> Iterator[Token]:
+    """从 pos 开始逐个产出 token（跳过空白与注释），直到输入结束。
+    子集之外的字符（如字面量之后的 ';'）作为 other 产出，由解析器决定是否报错"""
+    match = _TOKEN_RE.match
+    size = len(data)
+    while pos < size:
+        m = match(data, pos)
+        kind = m.lastgroup
+        if kind != 'ws':
+            yield Token(kind, m.group(), pos, m.end())
+        pos = m.end()
+    yield Token('eof', b'', size, size)
+
+
+class Parser:
+    """在 token 流上做递归下降；token 按需从生成器拉取，不会预先切分整个文件"""
+
+    def __init__(self, data: bytes, pos: int = 0, env: Optional[Dict[str, Any]] = None):
+        self._tokens = tokenize(data, pos)
+        self.tok = next(self._tokens)
+        self.last_end = pos  # 最近一个已消费 token 的结束偏移
+        self.env = env or {}
+
+    def advance(self) -> Token:
+        tok = self.tok
+        if tok.kind != 'eof':
+            self.last_end = tok.end
+            self.tok = next(self._tokens)
+        return tok
+
+    def expect(self, punct: bytes) -> Token:
+        if self.tok.text != punct:
+            raise ValueError(f'期望 {punct.decode()!r}，实际为 {self.tok.text!r} @ byte {self.tok.start}')
+        return self.advance()
+
+    def skip_comma(self):
+        if self.tok.text == b',':
+            self.advance()
+
+    def value(self) -> Any:
+        v = self.primary()
+        if self.tok.text == b'?':
+            self.advance()
+            a = self.value()
+            self.expect(b':')
+            b = self.value()
+            return a if v else b
+        return v
+
+    def primary(self) -> Any:
+        tok = self.advance()
+        kind, text = tok.kind, tok.text
+        if kind == 'str':
+            return unescape(text[1:-1].decode('utf-8'))
+        if kind == 'num':
+            return float(text) if b'.' in text else int(text)
+        if kind == 'ident':
+            name = text.decode('ascii')
+            if name in ('true', 'false'):
+                return name == 'true'
+            if name in ('null', 'undefined'):
+                return None
+            return self.env.get(name)
+        if text == b'{':
+            return {key: value for key, value, _, _ in self.entries()}
+        if text == b'[':
+            items = []
+            while self.tok.text != b']':
+                items.append(self.value())
+                self.skip_comma()
+            self.expect(b']')
+            return items
+        raise ValueError(f'意外的标记 {text!r} @ byte {tok.start}')
+
+    def key(self) -> str:
+        tok = self.advance()
+        if tok.kind == 'str':
+            return unescape(tok.text[1:-1].decode('utf-8'))
+        if tok.kind in ('ident', 'num'):
+            return tok.text.decode('ascii')
+        raise ValueError(f'无效的键 {tok.text!r} @ byte {tok.start}')
+
+    def entries(self) -> Iterator[Tuple[str, Any, int, int]]:
+        """逐个产出对象体（'{' 已消费）中的 (键, 值, 起始偏移, 结束偏移)，重复键全部保留"""
+        while self.tok.text != b'}':
+            if self.tok.kind == 'eof':
+                raise ValueError('对象未闭合')
+            start = self.tok.start
+            key = self.key()
+            self.expect(b':')
+            value = self.value()
+            yield key, value, start, self.last_end
+            self.skip_comma()
+        self.expect(b'}')
+
+
+def _to_bytes(source: Union[str, bytes]) -> bytes:
+    return source.encode('utf-8') if isinstance(source, str) else source
+
+
+def literal_start(data: bytes, anchor: str) -> int:
+    """anchor（正则）匹配处之后第一个 '{' 或 '[' 的字节偏移"""
+    m = re.search(anchor.encode('utf-8'), data)
+    if not m:
+        raise ValueError(f'未找到 {anchor!r}')
+    starts = [p for p in (data.find(b'{', m.end()), data.find(b'[', m.end())) if p >= 0]
+    if not starts:
+        raise ValueError(f'{anchor!r} 之后没有对象或数组字面量')
+    return min(starts)
+
+
+def iter_blocks(source: Union[str, bytes], anchor: str,
+                env: Optional[Dict[str, Any]] = None) -> Iterator[Block]:
+    """流式产出 anchor 之后对象字面量中的每个顶层条目（如 characters.ts 中的每个角色）"""
+    data = _to_bytes(source)
+    parser = Parser(data, literal_start(data, anchor), env)
+    parser.expect(b'{')
+    for key, value, start, end in parser.entries():
+        yield Block(key, value, start, end)
+
+
+def parse_object_pairs(source: Union[str, bytes], anchor: str,
+                       env: Optional[Dict[str, Any]] = None) -> List[Tuple[str, Any]]:
+    return [(b.key, b.value) for b in iter_blocks(source, anchor, env)]
+
+
+def parse_literal(source: Union[str, bytes], anchor: str,
+                  env: Optional[Dict[str, Any]] = None) -> Any:
+    data = _to_bytes(source)
+    return Parser(data, literal_start(data, anchor), env).value()
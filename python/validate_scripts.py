@@ -0,0 +1,288 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+批量校验 public/scripts/json 下的所有剧本，提前发现运行时才会暴露的问题。
+
+检查项（severity 为 error / warning / info）：
+- invalid-json       文件无法解析或顶层不是数组（error）
+- missing-meta       缺少 _meta 条目（error）
+- invalid-item       条目既不是字符串也不是对象（error）
+- unknown-id         id 经 CN/EN 映射后仍不在角色库中，且没有 team，运行时会被丢弃（error）
+- resolved-by-name   id 未知，只能靠 findCharacterIdByName 按名字回退匹配（info：运行时能正确识别，
+                     社区剧本大量使用中文名作 id，逐条列出会淹没真正的问题）
+- shadows-official   自定义条目绑定到官方角色上，却改写了它的能力或阵营（warning；
+                     能力描述只差标记、空白或标点时不算改写）
+- duplicate-role     同一角色出现多次，运行时后者会被跳过（error）
+- unknown-team       team 不是已知阵营（error）
+- team-composition   没有恶魔（error）；缺少镇民/外来者/爪牙（warning，变体剧本可能有意为之）
+
+角色识别与 scriptGenerator.ts 的 getCharacterDictKey() 一致：先精确 id，再经 CN_TO_EN_ID_MAP
+映射，最后按中文/英文 name 回退。角色数据来自 chardb 快照，每个进程只加载一次。
+
+文本输出默认列出 error 与 warning，info 只计数（--verbose 时列出），--quiet 只列出 error；
+末尾汇总各检查项的数量。
+退出码：存在 error 时为 1（--strict 时 warning 也算），否则为 0。
+"""
+import argparse
+import json
+import re
+import sys
+import time
+import unicodedata
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+from chardb import load_db, normalize_id
+from generate_manifest import JSON_ROOT, PARALLEL_THRESHOLD, default_workers, iter_script_files, script_category
+from instrument import count, stage
+
+ROLE_TEAMS = ('townsfolk', 'outsider', 'minion', 'demon', 'traveler', 'fabled', 'loric')
+# 缺失时报 error 的阵营；其余基础阵营缺失只给出 warning（如爪牙大乱斗、暴乱剧本）
+REQUIRED_TEAMS = ('demon',)
+EXPECTED_TEAMS = ('townsfolk', 'outsider', 'minion')
+# 非角色条目，不参与角色检查
+NON_ROLE_TEAMS = ('special_rule', 'a jinxed')
+SEVERITIES = ('error', 'warning', 'info')
+
+_MARKUP_RE = re.compile(r'<[^>]+>')
+_NON_WORD_RE = re.compile(r'[\W_]+')
+
+
+class Resolver:
+    """id / name -> 规范化角色 key 的查找表（对应 CHARACTERS 与 CHARACTERS_EN 两个字典）"""
+
+    def __init__(self):
+        db = load_db()
+        self.db = db
+        self.ids: Dict[str, str] = {}
+        self.names: Dict[str, str] = {}
+        for role in db.source_roles:
+            rid = role.key or role.data.get('id')
+            if not rid:
+                continue
+            key = db.key_of(role.data.get('id') or rid)
+            self.ids.setdefault(rid, key)
+            name = role.data.get('name')
+            if name:
+                self.names.setdefault(name, key)
+
+    def by_id(self, rid: str) -> Optional[str]:
+        if rid in self.ids:
+            return self.ids[rid]
+        # normalizeCharacterId：中英文 id 互相映射
+        mapped = self.db.cn_to_en.get(rid) or self.db.en_to_cn.get(rid)
+        return self.ids.get(mapped) if mapped else None
+
+    def by_name(self, name: Any) -> Optional[str]:
+        return self.names.get(name) if isinstance(name, str) else None
+
+
+@lru_cache(maxsize=1)
+def resolver() -> Resolver:
+    return Resolver()
+
+
+def ability_text(text: Any) -> str:
+    """比较能力描述用：去掉 HTML 标记、空白与标点，只差这些的视为同一描述"""
+    if not isinstance(text, str):
+        return ''
+    text = unicodedata.normalize('NFKC', _MARKUP_RE.sub('', text))
+    return _NON_WORD_RE.sub('', text).lower()
+
+
+def issue(code: str, severity: str, message: str, index: Optional[int] = None,
+          item_id: Optional[str] = None) -> Dict[str, Any]:
+    result: Dict[str, Any] = {'code': code, 'severity': severity, 'message': message}
+    if index is not None:
+        result['index'] = index
+    if item_id is not None:
+        result['id'] = item_id
+    return result
+
+
+def validate_script(data: Any) -> Tuple[List[Dict[str, Any]], Dict[str, int]]:
+    """校验单个剧本，返回 (问题列表, 各阵营角色数)"""
+    res = resolver()
+    issues: List[Dict[str, Any]] = []
+    teams: Dict[str, int] = {}
+
+    if not isinstance(data, list):
+        return [issue('invalid-json', 'error', '剧本顶层必须是数组')], teams
+
+    has_meta = False
+    seen: Dict[str, int] = {}
+
+    for index, item in enumerate(data):
+        if isinstance(item, str):
+            item = {'id': item}
+        if not isinstance(item, dict):
+            issues.append(issue('invalid-item', 'error', f'无法识别的条目类型 {type(item).__name__}', index))
+            continue
+        rid = item.get('id')
+        if rid == '_meta':
+            has_meta = True
+            continue
+        team = item.get('team')
+        if str(team or '').lower() in NON_ROLE_TEAMS:
+            continue
+
+        rid = rid if isinstance(rid, str) else ''
+        name = item.get('name')
+        key = res.by_id(rid) if rid else None
+        official = res.db.characters.get(key) if key else None
+
+        if key is None:
+            key = res.by_name(name)
+            official = res.db.characters.get(key) if key else None
+            if official is not None:
+                if item.get('ability') and ability_text(item['ability']) not in (
+                        ability_text(official.ability_zh), ability_text(official.ability_en)):
+                    issues.append(issue('shadows-official', 'warning',
+                                        f'自定义角色 "{name}" 与官方角色 {official.en_id} 同名，'
+                                        f'运行时会按名字绑定到官方角色', index, rid))
+                else:
+                    issues.append(issue('resolved-by-name', 'info',
+                                        f'id 未知，按名字 "{name}" 回退匹配到 {official.en_id}', index, rid))
+            elif not team:
+                hint = res.db.characters.get(normalize_id(rid))
+                message = f'未知角色 id "{rid}"，且没有 team，运行时会被忽略'
+                if hint is not None:
+                    message += f'（是否应为 "{hint.cn_id}" / "{hint.en_id}"？）'
+                issues.append(issue('unknown-id', 'error', message, index, rid))
+                continue
+        elif team and official is not None and official.team and team != official.team:
+            issues.append(issue('shadows-official', 'warning',
+                                f'官方角色 {official.en_id} 的阵营被改为 {team}（官方为 {official.team}）',
+                                index, rid))
+
+        final_team = team or (official.team if official is not None else '')
+        if final_team not in ROLE_TEAMS:
+            issues.append(issue('unknown-team', 'error', f'未知阵营 "{final_team}"', index, rid))
+            continue
+
+        dedupe_key = key or f'custom:{rid or name}'
+        if dedupe_key in seen:
+            issues.append(issue('duplicate-role', 'error',
+                                f'与第 {seen[dedupe_key]} 项重复（{key or rid or name}）', index, rid))
+            continue
+        seen[dedupe_key] = index
+        teams[final_team] = teams.get(final_team, 0) + 1
+
+    if not has_meta:
+        issues.insert(0, issue('missing-meta', 'error', '缺少 _meta 条目（剧本名称、作者等）'))
+
+    for t in REQUIRED_TEAMS + EXPECTED_TEAMS:
+        if not teams.get(t):
+            severity = 'error' if t in REQUIRED_TEAMS else 'warning'
+            issues.append(issue('team-composition', severity, f'没有 {t} 角色'))
+
+    return issues, teams
+
+
+def _validate_file(job: Tuple[Path, str]) -> Dict[str, Any]:
+    path, category = job
+    try:
+        data = json.loads(path.read_bytes().decode('utf-8'))
+    except (OSError, ValueError) as e:
+        issues, teams = [issue('invalid-json', 'error', f'无法解析: {e}')], {}
+    else:
+        issues, teams = validate_script(data)
+    try:
+        name = path.relative_to(JSON_ROOT).as_posix()
+    except ValueError:
+        name = str(path)
+    return {
+        'file': name,
+        'category': category,
+        'teams': teams,
+        'issues': issues,
+    }
+
+
+def validate_all(files: List[Tuple[Path, str]], workers: Optional[int] = None) -> List[Dict[str, Any]]:
+    workers = workers or default_workers()
+    if workers > 1 and len(files) >= PARALLEL_THRESHOLD:
+        # 先在主进程里确保 chardb 快照是最新的，避免子进程同时重建
+        load_db()
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            chunksize = max(1, len(files) // (workers * 4))
+            return list(pool.map(_validate_file, files, chunksize=chunksize))
+    return [_validate_file(job) for job in files]
+
+
+def count_issues(results: List[Dict[str, Any]]) -> Dict[str, Dict[str, int]]:
+    """按 severity、检查项统计问题数：{'error': {'unknown-id': 3, ...}, 'warning': {...}, 'info': {...}}"""
+    totals: Dict[str, Dict[str, int]] = {severity: {} for severity in SEVERITIES}
+    for r in results:
+        for i in r['issues']:
+            by_code = totals[i['severity']]
+            by_code[i['code']] = by_code.get(i['code'], 0) + 1
+    return totals
+
+
+def summary_line(totals: Dict[str, Dict[str, int]]) -> str:
+    return (f"{sum(totals['error'].values())} errors, {sum(totals['warning'].values())} warnings, "
+            f"{sum(totals['info'].values())} info")
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description='批量校验剧本 JSON（未知 id、重复角色、缺失 _meta、阵营构成等）')
+    parser.add_argument('paths', nargs='*', type=Path, help='只校验这些文件（默认校验 public/scripts/json 下全部剧本）')
+    parser.add_argument('--json', action='store_true', help='以 JSON 输出完整结果')
+    parser.add_argument('--strict', action='store_true', help='存在 warning 时也以非零状态退出')
+    parser.add_argument('--quiet', action='store_true', help='只输出汇总和 error')
+    parser.add_argument('--verbose', action='store_true', help='同时列出 info 级别的问题')
+    parser.add_argument('--workers', type=int, default=None, help='并行进程数（默认 CPU 核数）')
+    return parser.parse_args()
+
+
+def main():
+    args = parse_args()
+    start = time.perf_counter()
+    with stage('walk'):
+        if args.paths:
+            files = [(p.resolve(), script_category(p)) for p in args.paths]
+        else:
+            files = iter_script_files()
+    with stage('validate'):
+        results = validate_all(files, args.workers)
+    count('files_read', len(results))
+    elapsed = time.perf_counter() - start
+
+    totals = count_issues(results)
+    errors, warnings = sum(totals['error'].values()), sum(totals['warning'].values())
+    failed = errors > 0 or (args.strict and warnings > 0)
+
+    if args.json:
+        report = {
+            'files': len(results),
+            'errors': errors,
+            'warnings': warnings,
+            'infos': sum(totals['info'].values()),
+            'seconds': round(elapsed, 3),
+            'results': [r for r in results if r['issues']],
+        }
+        json.dump(report, sys.stdout, ensure_ascii=False, indent=2)
+        sys.stdout.write('\n')
+    else:
+        shown_severities = ('error',) if args.quiet else SEVERITIES if args.verbose else ('error', 'warning')
+        for r in results:
+            shown = [i for i in r['issues'] if i['severity'] in shown_severities]
+            if not shown:
+                continue
+            print(r['file'])
+            for i in shown:
+                where = f"[{i['index']}] " if 'index' in i else ''
+                print(f"  {i['severity']:7} {i['code']:17} {where}{i['message']}")
+        print(f'Validated {len(results)} scripts in {elapsed * 1000:.0f} ms: {summary_line(totals)}')
+        for severity in SEVERITIES:
+            if totals[severity]:
+                print(f'  {severity:7} ' + ', '.join(f'{code} {n}' for code, n in sorted(totals[severity].items())))
+
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,461 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+数据与 manifest 流水线的监听模式：常驻进程，监听 public/scripts/json、src/data 与 scriptGenerator.ts 的改动，
+合并短时间内的连续事件（debounce）后只重跑受影响的阶段，并输出每个阶段的耗时。
+
+文件 -> 阶段：
+- public/scripts/json 下的剧本        validate（仅改动的剧本）、manifest
+- chardb.SOURCES（characters.ts 等）  chardb 快照、lookup、night、jinx、highlight、validate（全部剧本），
+                                      --summary 时还有 manifest（摘要缓存随数据源失效）；
+                                      全部剧本的校验与 chardb 快照写盘在输出 ready 之后才运行
+- jinx.ts / jinxEn.json               jinx；--summary 时还有 manifest
+- pinyinMap.ts                        lookup
+- scriptGenerator.ts（ABILITY_KEYWORDS） highlight
+- 剧本子目录整体移走（或 inotify 事件队列溢出）  manifest
+
+所有阶段在同一进程内执行，数据源变化时清空各模块的进程内缓存（lru_cache），
+不必每次重新启动 Python 与重新导入模块；manifest 阶段沿用 generate_manifest 的增量缓存，
+只重新解析内容有变化的剧本。生成的文件（characterLookup.ts、nightOrder.ts、jinxIndex.ts、
+abilityHighlights.ts、manifest.json 等）不在监听范围内，不会触发自身。
+
+Linux 下通过 ctypes 调用 inotify，其余平台或 inotify 不可用时退回到定时 stat 扫描（--poll）。
+"""
+import argparse
+import ctypes
+import ctypes.util
+import errno
+import os
+import select
+import struct
+import sys
+import time
+import traceback
+from pathlib import Path
+from typing import Callable, Dict, Iterable, List, Optional, Set, Tuple
+
+import ability_highlight
+import chardb
+import generate_manifest
+import gen_lookup_tables
+import jinx_index
+import night_order
+import pinyin_table
+import script_summary
+import validate_scripts
+from chardb import DATA_DIR, load_db
+from generate_manifest import JSON_ROOT, SHARD_DIR
+
+# 合并事件的静默时间：最后一个事件之后这么久没有新事件才开始处理
+DEFAULT_DEBOUNCE_MS = 40
+# 持续有事件时最长等待时间，避免批量复制文件时一直不处理
+MAX_BATCH_SECONDS = 0.5
+DEFAULT_POLL_INTERVAL = 0.1
+
+CHARDB_SOURCES = frozenset(chardb.SOURCES.values())
+JINX_SOURCES = frozenset((jinx_index.JINX_TS, jinx_index.JINX_EN_JSON))
+PINYIN_SOURCES = frozenset((pinyin_table.PINYIN_MAP_TS,))
+HIGHLIGHT_SOURCES = frozenset((ability_highlight.SCRIPT_GENERATOR_TS,))
+DATA_SOURCES = CHARDB_SOURCES | JINX_SOURCES | PINYIN_SOURCES | HIGHLIGHT_SOURCES
+
+STAGES = ('chardb', 'lookup', 'night', 'jinx', 'highlight', 'validate', 'manifest')
+# 只影响报告或缓存、不影响生成文件的阶段：角色数据变化时放到 ready 之后运行
+DEFERRED_STAGES = ('snapshot', 'validate')
+
+
+def is_script_file(path: Path) -> bool:
+    # 与 iter_script_files() 一致：只有分类子目录下的才是剧本，顶层是 manifest 等生成文件
+    return (path.suffix == '.json' and JSON_ROOT in path.parents and path.parent != JSON_ROOT
+            and SHARD_DIR not in path.parents)
+
+
+def is_watched(path: Path) -> bool:
+    return path in DATA_SOURCES or is_script_file(path)
+
+
+# ---------------------------------------------------------------------------
+# 文件监听
+# ---------------------------------------------------------------------------
+
+# 监听的目录：(目录, 是否递归)
+WATCH_ROOTS: Tuple[Tuple[Path, bool], ...] = (
+    (DATA_DIR, False), (ability_highlight.SCRIPT_GENERATOR_TS.parent, False), (JSON_ROOT, True))
+
+
+class InotifyWatcher:
+    """基于 inotify 的监听（仅 Linux）。只关心写入完成、移入移出与删除事件"""
+
+    IN_CLOSE_WRITE = 0x00000008
+    IN_MOVED_FROM = 0x00000040
+    IN_MOVED_TO = 0x00000080
+    IN_CREATE = 0x00000100
+    IN_DELETE = 0x00000200
+    IN_Q_OVERFLOW = 0x00004000
+    IN_IGNORED = 0x00008000
+    IN_ISDIR = 0x40000000
+    IN_NONBLOCK = os.O_NONBLOCK
+    IN_CLOEXEC = 0o2000000
+
+    MASK = IN_CLOSE_WRITE | IN_MOVED_FROM | IN_MOVED_TO | IN_CREATE | IN_DELETE
+    EVENT = struct.Struct('iIII')
+
+    def __init__(self, roots: Iterable[Tuple[Path, bool]], accept: Callable[[Path], bool]):
+        if not sys.platform.startswith('linux'):
+            raise OSError(errno.ENOSYS, 'inotify 仅在 Linux 上可用')
+        libc = ctypes.CDLL(ctypes.util.find_library('c') or 'libc.so.6', use_errno=True)
+        if not hasattr(libc, 'inotify_init1'):
+            raise OSError(errno.ENOSYS, 'libc 不支持 inotify')
+        self._libc = libc
+        self._accept = accept
+        self.fd = libc.inotify_init1(self.IN_NONBLOCK | self.IN_CLOEXEC)
+        if self.fd < 0:
+            raise OSError(ctypes.get_errno(), 'inotify_init1 失败')
+        self._dirs: Dict[int, Tuple[Path, bool]] = {}
+        try:
+            for root, recursive in roots:
+                self._add_tree(root, recursive)
+        except OSError:
+            self.close()
+            raise
+
+    def _add(self, directory: Path, recursive: bool):
+        if recursive and directory == SHARD_DIR:
+            return
+        wd = self._libc.inotify_add_watch(self.fd, os.fsencode(directory), self.MASK)
+        if wd < 0:
+            raise OSError(ctypes.get_errno(), f'无法监听 {directory}')
+        self._dirs[wd] = (directory, recursive)
+
+    def _add_tree(self, root: Path, recursive: bool) -> Set[Path]:
+        """监听 root（递归时含全部子目录），返回其中已有的文件，供新建目录时补报"""
+        found: Set[Path] = set()
+        if not root.is_dir():
+            return found
+        self._add(root, recursive)
+        if recursive:
+            for current, dirnames, filenames in os.walk(root):
+                base = Path(current)
+                dirnames[:] = [d for d in dirnames if base / d != SHARD_DIR]
+                for d in dirnames:
+                    self._add(base / d, True)
+                found.update(p for p in (base / f for f in filenames) if self._accept(p))
+        return found
+
+    def read(self, timeout: Optional[float]) -> Set[Path]:
+        """等待至多 timeout 秒（None 为一直等待），返回改动过的文件"""
+        ready, _, _ = select.select([self.fd], [], [], timeout)
+        if not ready:
+            return set()
+        try:
+            data = os.read(self.fd, 64 * 1024)
+        except BlockingIOError:
+            return set()
+
+        changed: Set[Path] = set()
+        pos = 0
+        while pos < len(data):
+            wd, mask, _, length = self.EVENT.unpack_from(data, pos)
+            pos += self.EVENT.size
+            name = data[pos:pos + length].rstrip(b'\0')
+            pos += length
+            if mask & self.IN_Q_OVERFLOW:
+                # 事件队列溢出：无法得知具体文件，按全部数据源与剧本目录改动处理
+                changed.update(DATA_SOURCES)
+                changed.add(JSON_ROOT)
+                continue
+            if mask & self.IN_IGNORED:
+                self._dirs.pop(wd, None)
+                continue
+            directory, recursive = self._dirs.get(wd, (None, False))
+            if directory is None or not name:
+                continue
+            path = directory / os.fsdecode(name)
+            if mask & self.IN_ISDIR:
+                if recursive and mask & (self.IN_CREATE | self.IN_MOVED_TO):
+                    changed.update(self._add_tree(path, True))
+                elif recursive and mask & self.IN_MOVED_FROM:
+                    # 目录被整体移走时不会逐个报告其中的文件，按剧本目录改动处理
+                    changed.add(JSON_ROOT)
+                continue
+            if self._accept(path):
+                changed.add(path)
+        return changed
+
+    def close(self):
+        if self.fd >= 0:
+            os.close(self.fd)
+            self.fd = -1
+
+
+class PollingWatcher:
+    """定时比较文件的 mtime 与大小；不依赖任何平台接口"""
+
+    def __init__(self, roots: Iterable[Tuple[Path, bool]], accept: Callable[[Path], bool],
+                 interval: float = DEFAULT_POLL_INTERVAL):
+        self.roots = tuple(roots)
+        self.accept = accept
+        self.interval = interval
+        self.state = self.scan()
+
+    def scan(self) -> Dict[Path, Tuple[int, int]]:
+        state: Dict[Path, Tuple[int, int]] = {}
+        for root, recursive in self.roots:
+            if not root.is_dir():
+                continue
+            for p in (root.rglob('*') if recursive else root.iterdir()):
+                if not self.accept(p):
+                    continue
+                try:
+                    st = p.stat()
+                except OSError:
+                    continue
+                state[p] = (st.st_mtime_ns, st.st_size)
+        return state
+
+    def read(self, timeout: Optional[float]) -> Set[Path]:
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            wait = self.interval if deadline is None else min(self.interval, max(0.0, deadline - time.monotonic()))
+            time.sleep(wait)
+            state = self.scan()
+            changed = {p for p in state.keys() | self.state.keys() if state.get(p) != self.state.get(p)}
+            self.state = state
+            if changed or (deadline is not None and time.monotonic() >= deadline):
+                return changed
+
+    def close(self):
+        pass
+
+
+def make_watcher(poll: bool, interval: float):
+    if not poll:
+        try:
+            return InotifyWatcher(WATCH_ROOTS, is_watched)
+        except OSError as e:
+            print(f'inotify 不可用（{e}），改用轮询', file=sys.stderr)
+    return PollingWatcher(WATCH_ROOTS, is_watched, interval)
+
+
+# ---------------------------------------------------------------------------
+# 流水线
+# ---------------------------------------------------------------------------
+
+def write_generated(path: Path, content: str) -> bool:
+    """内容有变化时才写入，返回是否写入"""
+    current = path.read_text(encoding='utf-8') if path.exists() else ''
+    if current == content:
+        return False
+    path.write_text(content, encoding='utf-8', newline='\n')
+    return True
+
+
+class StageError(Exception):
+    """阶段未能产出结果（如相克冲突、查找表冲突）；不打印堆栈"""
+
+
+class Pipeline:
+    def __init__(self, args: argparse.Namespace):
+        self.args = args
+        self.scripts: List[Path] = []
+        self.current: Set[str] = set()
+        self.changed: Set[Path] = set()
+        self.pending_snapshot: Optional[Tuple[chardb.CharacterDB, Dict[str, str]]] = None
+
+    def plan(self, changed: Set[Path]) -> Set[str]:
+        stages: Set[str] = set()
+        self.scripts = sorted(p for p in changed if is_script_file(p))
+        if self.scripts:
+            stages.update(('validate', 'manifest'))
+        if JSON_ROOT in changed:
+            stages.add('manifest')
+        if changed & CHARDB_SOURCES:
+            stages.update(('chardb', 'lookup', 'night', 'jinx', 'highlight', 'validate', 'snapshot'))
+            if self.args.summary:
+                stages.add('manifest')
+        if changed & JINX_SOURCES:
+            stages.add('jinx')
+            if self.args.summary:
+                stages.add('manifest')
+        if changed & PINYIN_SOURCES:
+            stages.add('lookup')
+        if changed & HIGHLIGHT_SOURCES:
+            stages.add('highlight')
+        return stages
+
+    def run_stage(self, name: str) -> bool:
+        t0 = time.perf_counter()
+        ok = True
+        try:
+            detail = getattr(self, f'stage_{name}')()
+        except StageError as e:
+            ok = False
+            detail = f'失败: {e}'
+        except Exception:
+            ok = False
+            detail = '失败:\n' + traceback.format_exc().rstrip()
+        log(f'{name:8} {(time.perf_counter() - t0) * 1000:7.1f} ms  {detail}')
+        return ok
+
+    def run(self, stages: Set[str], started: float) -> bool:
+        # 角色数据变化时要校验全部剧本、重写 chardb 快照，都不影响生成的文件，放到 ready 之后
+        deferred = [name for name in DEFERRED_STAGES if name in stages and 'chardb' in stages]
+        ok = True
+        for name in STAGES:
+            if name not in stages or name in deferred:
+                continue
+            ok = self.run_stage(name) and ok
+            if not ok and name == 'chardb':
+                # 角色数据源解析失败（通常是保存到一半），其余阶段等下一次保存再跑
+                deferred = []
+                break
+        log(f'{"ready" if ok else "errors":8} {(time.perf_counter() - started) * 1000:7.1f} ms  '
+            f'(自首个事件起，含 {self.args.debounce} ms 合并等待)')
+        for name in deferred:
+            ok = self.run_stage(name) and ok
+        return ok
+
+    def stage_chardb(self) -> str:
+        # 依赖角色数据的进程内缓存全部失效
+        for cached in (night_order.night_order_table, jinx_index.jinx_index,
+                       script_summary.role_index, validate_scripts.resolver):
+            cached.cache_clear()
+        if self.changed & CHARDB_SOURCES:
+            # 数据源确实改过，磁盘上的快照必然过期：直接重新解析，快照在 ready 之后再写。
+            # 哈希取自解析之前，解析期间文件再次改动时快照只会被判为过期，不会对错内容
+            digest = chardb.sources_digest()
+            db = load_db(rebuild=True, write=False)
+            self.pending_snapshot = (db, digest)
+            return f'{len(db)} characters'
+        db = load_db()
+        return f'{len(db)} characters -> {chardb.SNAPSHOT_PATH.name}'
+
+    def stage_snapshot(self) -> str:
+        if self.pending_snapshot is None:
+            return 'unchanged'
+        chardb.write_snapshot(*self.pending_snapshot)
+        self.pending_snapshot = None
+        return chardb.SNAPSHOT_PATH.name
+
+    def stage_lookup(self) -> str:
+        tables = gen_lookup_tables.build_tables(load_db())
+        collisions = [f'{t.name} {k!r}' for t in tables for k in sorted(t.collisions)]
+        if collisions:
+            raise StageError(f'查找表冲突 {", ".join(collisions)}')
+        written = write_generated(gen_lookup_tables.OUTPUT_TS, gen_lookup_tables.render_ts(tables))
+        return f'{gen_lookup_tables.OUTPUT_TS.name} {"updated" if written else "unchanged"}'
+
+    def stage_night(self) -> str:
+        table = night_order.night_order_table()
+        written = write_generated(night_order.OUTPUT_TS, night_order.render_ts(table))
+        return f'{night_order.OUTPUT_TS.name} {"updated" if written else "unchanged"} ({len(table.orders)} ids)'
+
+    def stage_jinx(self) -> str:
+        jinx_index.jinx_index.cache_clear()
+        index = jinx_index.jinx_index()
+        conflicts = [m for severity, _, m in index.issues if severity == 'error']
+        if conflicts:
+            raise StageError('相克冲突\n  ' + '\n  '.join(conflicts))
+        written = write_generated(jinx_index.OUTPUT_TS, jinx_index.render_ts(index))
+        return f'{jinx_index.OUTPUT_TS.name} {"updated" if written else "unchanged"} ({len(index.pairs)} pairs)'
+
+    def stage_highlight(self) -> str:
+        table = ability_highlight.build_table(ability_highlight.load_keywords())
+        written = write_generated(ability_highlight.OUTPUT_TS, ability_highlight.render_ts(table))
+        abilities = sum(len(rows) for rows in table.values())
+        return f'{ability_highlight.OUTPUT_TS.name} {"updated" if written else "unchanged"} ({abilities} abilities)'
+
+    def stage_validate(self) -> str:
+        if 'chardb' in self.current:
+            files = generate_manifest.iter_script_files()
+        else:
+            files = [(p, generate_manifest.script_category(p)) for p in self.scripts if p.exists()]
+        results = validate_scripts.validate_all(files, self.args.workers)
+        lines = [f"\n    {r['file']}: {i['code']} {i['message']}"
+                 for r in results for i in r['issues'] if i['severity'] == 'error']
+        totals = validate_scripts.count_issues(results)
+        return f'{len(results)} scripts: {validate_scripts.summary_line(totals)}' + ''.join(lines)
+
+    def stage_manifest(self) -> str:
+        stats: Dict[str, int] = {}
+        entries = generate_manifest.collect_entries(stats=stats, workers=self.args.workers,
+                                                    summary=self.args.summary)
+        generate_manifest.write_manifest(entries)
+        if self.args.sharded:
+            generate_manifest.write_sharded_manifest(entries, page_size=self.args.page_size)
+        if self.args.search_index:
+            from search_index import write_search_index
+            write_search_index(entries)
+        return (f"{len(entries)} entries (reused {stats['reused']}, reparsed {stats['reparsed']}, "
+                f"pruned {stats['pruned']})")
+
+    def handle(self, changed: Set[Path], started: float) -> bool:
+        self.changed = changed
+        self.current = self.plan(changed)
+        if not self.current:
+            return True
+        for p in sorted(changed):
+            log(f'changed  {p.relative_to(generate_manifest.ROOT).as_posix()}')
+        return self.run(self.current, started)
+
+
+def log(message: str):
+    print(f'[{time.strftime("%H:%M:%S")}] {message}', flush=True)
+
+
+def watch(args: argparse.Namespace):
+    watcher = make_watcher(args.poll, args.interval)
+    pipeline = Pipeline(args)
+    kind = 'inotify' if isinstance(watcher, InotifyWatcher) else f'polling every {args.interval * 1000:.0f} ms'
+    roots = ', '.join(root.relative_to(generate_manifest.ROOT).as_posix() for root, _ in WATCH_ROOTS)
+    log(f'watching {roots} ({kind}), Ctrl+C to stop')
+
+    if not args.no_initial:
+        pipeline.current = set(STAGES)
+        pipeline.run(pipeline.current, time.perf_counter())
+
+    debounce = args.debounce / 1000
+    try:
+        while True:
+            changed = watcher.read(None)
+            if not changed:
+                continue
+            started = time.perf_counter()
+            deadline = started + MAX_BATCH_SECONDS
+            while time.perf_counter() < deadline:
+                more = watcher.read(debounce)
+                if not more:
+                    break
+                changed |= more
+            pipeline.handle(changed, started)
+    finally:
+        watcher.close()
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description='监听剧本与角色数据的改动，只重跑受影响的生成步骤')
+    parser.add_argument('--debounce', type=int, default=DEFAULT_DEBOUNCE_MS,
+                        help=f'合并事件的静默时间，毫秒（默认: {DEFAULT_DEBOUNCE_MS}）')
+    parser.add_argument('--poll', action='store_true', help='不使用 inotify，改为定时扫描文件')
+    parser.add_argument('--interval', type=float, default=DEFAULT_POLL_INTERVAL,
+                        help=f'轮询间隔，秒（默认: {DEFAULT_POLL_INTERVAL}）')
+    parser.add_argument('--no-initial', action='store_true', help='启动时不先完整运行一遍流水线')
+    parser.add_argument('--workers', type=int, default=1,
+                        help='manifest 与校验阶段的并行进程数（默认 1：监听模式下每次改动的文件很少）')
+    parser.add_argument('--summary', action='store_true', help='manifest 条目附加内容摘要（同 generate_manifest.py）')
+    parser.add_argument('--sharded', action='store_true', help='同时写出分片 manifest（同 generate_manifest.py）')
+    parser.add_argument('--page-size', type=int, default=generate_manifest.DEFAULT_PAGE_SIZE,
+                        help=f'分片模式下每页条目数（默认: {generate_manifest.DEFAULT_PAGE_SIZE}）')
+    parser.add_argument('--search-index', action='store_true', help='同时更新搜索倒排索引（同 generate_manifest.py）')
+    return parser.parse_args()
+
+
+def main():
+    args = parse_args()
+    try:
+        watch(args)
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,62 @@
+// 用 python/share_codec.py 生成的测试向量校验 src/utils/shareCodec.ts，防止两端实现不一致：
+//   decode(token) 必须等于 items，decode(encode(items)) 也必须等于 items
+// （不同平台的 deflate 输出可能逐字节不同，因此不比较 encode 结果与 token）。
+// 用法：node ./scripts/check-share-codec.mjs（yarn check:share-codec）
+import { readFileSync } from 'node:fs';
+import { isDeepStrictEqual } from 'node:util';
+
+const root = new URL('../', import.meta.url);
+const read = (path) => readFileSync(new URL(path, root), 'utf-8');
+
+// shareCodec.ts 只用可擦除的类型语法（tsconfig: erasableSyntaxOnly），去掉类型即可在 Node 中运行
+const stripTypes = async (source) => {
+  try {
+    const { default: ts } = await import('typescript');
+    return ts.transpileModule(source, {
+      compilerOptions: { module: ts.ModuleKind.ESNext, target: ts.ScriptTarget.ES2022 },
+    }).outputText;
+  } catch (err) {
+    const { stripTypeScriptTypes } = await import('node:module');
+    if (!stripTypeScriptTypes) throw err; // 需要先 yarn install，或 Node >= 22.13
+    return stripTypeScriptTypes(source);
+  }
+};
+
+const loadCodec = async () => {
+  const source = read('src/utils/shareCodec.ts');
+  const tableImport = "import tableData from '../data/shareCodecTable.json';";
+  if (!source.includes(tableImport)) {
+    throw new Error('shareCodec.ts 的冻结表导入语句已变化，请同步更新本脚本');
+  }
+  // data: URL 模块无法解析相对路径，冻结表直接内联
+  const code = (await stripTypes(source))
+    .replace(tableImport, `const tableData = ${read('src/data/shareCodecTable.json')};`);
+  return import(`data:text/javascript;base64,${Buffer.from(code).toString('base64')}`);
+};
+
+const main = async () => {
+  const { encodeShareToken, decodeShareToken } = await loadCodec();
+  const { vectors } = JSON.parse(read('src/data/shareCodecVectors.json'));
+  const failures = [];
+  const failed = new Set();
+  for (const v of vectors) {
+    try {
+      if (!isDeepStrictEqual(await decodeShareToken(v.token), v.items)) {
+        failures.push(`vector ${v.name}: decode 结果不一致`);
+        failed.add(v.name);
+      }
+      if (!isDeepStrictEqual(await decodeShareToken(await encodeShareToken(v.items)), v.items)) {
+        failures.push(`vector ${v.name}: 往返结果不一致`);
+        failed.add(v.name);
+      }
+    } catch (err) {
+      failures.push(`vector ${v.name}: ${err.message}`);
+      failed.add(v.name);
+    }
+  }
+  failures.forEach(f => console.error(f));
+  console.log(`shareCodec.ts: ${vectors.length - failed.size}/${vectors.length} vectors ok`);
+  process.exit(failures.length ? 1 : 0);
+};
+
+main();
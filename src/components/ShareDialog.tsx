@@ -1,4 +1,4 @@
-import React, { useState } from 'react';
+import React, { useEffect, useState } from 'react';
 import {
   Dialog,
   DialogTitle,
@@ -22,6 +22,7 @@ import {
 import { observer } from 'mobx-react-lite';
 import { useTranslation } from '../utils/i18n';
 import { normalizeCharacterId } from '../data/characterIdMapping';
+import { encodeShareToken } from '../utils/shareCodec';
 
 interface ShareDialogProps {
   open: boolean;
@@ -35,7 +36,8 @@ const ShareDialog = observer(({ open, onClose, script, originalJson, normalizedJ
   const { t } = useTranslation();
   const [gistUrl, setGistUrl] = useState('');
   const [fullUrl, setFullUrl] = useState('');
-  const [_compressedUrl, setCompressedUrl] = useState('');
+  const [compressedUrl, setCompressedUrl] = useState('');
+  const [compressError, setCompressError] = useState('');
 
   const steps = [
     t('share.step1'),
@@ -76,35 +78,53 @@ const ShareDialog = observer(({ open, onClose, script, originalJson, normalizedJ
         });
       }
 
-      return JSON.stringify(compressedData);
+      return compressedData;
     } catch (error) {
       console.error('Failed to generate compressed JSON:', error);
-      return '';
+      return null;
     }
   };
 
+  const getPreviewBaseUrl = () => window.location.origin + window.location.pathname + '#/repo/preview';
+
   const handleGistUrlChange = (event: React.ChangeEvent<HTMLInputElement>) => {
     const url = event.target.value;
     setGistUrl(url);
 
     if (url) {
       // 生成完整剧本链接
-      const baseUrl = window.location.origin + window.location.pathname + '#/repo/preview';
-      const fullLink = `${baseUrl}?json=${encodeURIComponent(url)}`;
+      const fullLink = `${getPreviewBaseUrl()}?json=${encodeURIComponent(url)}`;
       setFullUrl(fullLink);
-
-      // 生成压缩链接
-      const compressedJson = generateCompressedJson();
-      if (compressedJson) {
-        const compressedLink = `${baseUrl}?json=${encodeURIComponent(compressedJson)}`;
-        setCompressedUrl(compressedLink);
-      }
     } else {
       setFullUrl('');
-      setCompressedUrl('');
     }
   };
 
+  // 生成压缩链接（二进制编码，见 utils/shareCodec.ts）。编码是异步的：
+  // 剧本变化或对话框关闭后，旧的结果被丢弃，不会覆盖新的链接
+  useEffect(() => {
+    setCompressedUrl('');
+    setCompressError('');
+    if (!open || !gistUrl) return;
+    const compressedJson = generateCompressedJson();
+    if (!compressedJson) {
+      setCompressError(t('share.compressedFailed'));
+      return;
+    }
+    let cancelled = false;
+    encodeShareToken(compressedJson)
+      .then(token => {
+        if (!cancelled) setCompressedUrl(`${getPreviewBaseUrl()}?json=${token}`);
+      })
+      .catch(error => {
+        console.error('Failed to encode share token:', error);
+        if (!cancelled) setCompressError(`${t('share.compressedFailed')}: ${error?.message || error}`);
+      });
+    return () => {
+      cancelled = true;
+    };
+  }, [open, gistUrl, normalizedJson, script]);
+
   const copyToClipboard = async (text: string) => {
     try {
       await navigator.clipboard.writeText(text);
@@ -227,6 +247,37 @@ const ShareDialog = observer(({ open, onClose, script, originalJson, normalizedJ
               </Box>
             </Box>
 
+            {/* 压缩链接 */}
+            <Box sx={{ mb: 2 }}>
+              <Typography variant="subtitle2" sx={{ mb: 1 }}>
+                {t('share.compressedLink')}
+              </Typography>
+              {compressError ? (
+                <Alert severity="error">{compressError}</Alert>
+              ) : (
+                <>
+                  <Box sx={{ display: 'flex', gap: 1 }}>
+                    <TextField
+                      fullWidth
+                      value={compressedUrl}
+                      InputProps={{ readOnly: true }}
+                      size="small"
+                    />
+                    <Tooltip title={t('share.copyLink')}>
+                      <span>
+                        <IconButton onClick={() => copyToClipboard(compressedUrl)} size="small" disabled={!compressedUrl}>
+                          <ContentCopy />
+                        </IconButton>
+                      </span>
+                    </Tooltip>
+                  </Box>
+                  <Typography variant="caption" color="text.secondary">
+                    {t('share.compressedDescription')}
+                  </Typography>
+                </>
+              )}
+            </Box>
+
            
           </Box>
         )}
@@ -0,0 +1,541 @@
+// 此文件由 python/ability_highlight.py 自动生成，请勿手动修改。
+// 角色数据或 scriptGenerator.ts 中的 ABILITY_KEYWORDS 变化后运行：python ./python/ability_highlight.py
+
+export const ABILITY_HIGHLIGHT_TONES = ["evil", "good", "purple"] as const;
+export type HighlightTone = typeof ABILITY_HIGHLIGHT_TONES[number];
+
+// 能力文本 -> [起, 止, 颜色下标, ...]（UTF-16 下标）
+export const ABILITY_HIGHLIGHTS: Record<'zh-CN' | 'en', Record<string, readonly number[]>> = {
+  "zh-CN": {
+    "“我可能有问题，但我就是不承认也不说”": [],
+    "“疯狂”地想要死亡的玩家可能会立即被处决。": [1,3,2,7,9,0,17,20,0],
+    "一名玩家醉酒，即使你已死亡。每局游戏限一次，你可以猜测谁是那个醉酒的玩家，如果猜对了，你会得知谁是恶魔，但如果猜错了，你会得知错误的“谁是恶魔”信息。": [4,6,1,11,13,0,31,33,1,49,51,0,63,65,0,69,71,0],
+    "上帝在本场游戏就是规则的主宰，但是一旦宣布了特殊规则就必须遵守，否则可能会被玩家群殴。": [],
+    "与你邻近的两名镇民玩家会在其首次死亡时被当作仍然存活。[-1外来者]": [7,9,1,16,18,0,24,26,1,30,33,1],
+    "与你邻近的善良玩家之一醉酒，即使你已死亡。": [5,9,1,11,13,1,18,20,0],
+    "任何在夜晚使用自身能力选择你的其他玩家，会改为选中另一名邪恶玩家作为替代。": [28,32,0],
+    "会有额外的外来者在场。[+2外来者]": [5,8,1,14,17,1],
+    "你不知道你是酒鬼。你以为你是一个镇民角色，但其实你不是。": [16,20,1],
+    "你不知道你的能力是什么。每个白天你可以找说书人猜测一次，你会得知你的猜测有多准确。<i>（无关/有关/接近/完美）</i>": [36,40,1],
+    "你与一名对立阵营的玩家互相知道对方是什么角色。如果其中善良玩家被处决，邪恶阵营获胜。如果你们都存活，善良阵营无法获胜。": [27,31,1,31,34,0,35,39,0,39,41,1,47,49,1,50,54,1,56,58,1],
+    "你以为你是一个善良角色，但其实你不是。如果你被恶魔杀死，恶魔要选择一名玩家：他变成玩偶。[玩偶会与恶魔邻座]": [7,11,1,23,25,0,25,27,0,28,30,0,49,51,0],
+    "你以为你是一个善良角色，但其实你不是。恶魔会知道你是提线木偶。[提线木偶会与恶魔邻座]": [7,11,1,19,21,0,38,40,0],
+    "你以为你是一个在场的善良玩家，但其实你不是。该角色的玩家会知道瘾君子在场。如果你们之中其中一人“疯狂”证明瘾君子在场，你们可能都会死亡。": [10,14,1,48,50,2,65,67,0],
+    "你以为你是一个外来者，但你实际上不是。如果有邪恶玩家的能力选择或影响了你，在该效果生效前你会变成一个不在场的镇民角色。": [7,10,1,22,26,0,29,34,0,54,58,1],
+    "你以为你是一个恶魔，但其实你不是。恶魔知道你是疯子以及你在每个夜晚选择了哪些玩家。": [7,9,0,17,19,0,23,25,1],
+    "你以为你是一个爪牙，但其实你不是。": [7,9,0],
+    "你只能使用投票标记才能投票。死亡的玩家可以将他的投票标记给你，如果他这么做，你会得知他的阵营。你不会中毒和醉酒。": [14,16,0,50,52,0,53,55,1],
+    "你可以在夜晚睁眼。当其他邪恶玩家被唤醒时，你也会被唤醒。": [12,16,0],
+    "你可以对“你是奶龙”疯狂，如果你这样做，且有其他玩家对“自己是奶龙”疯狂，他有可能变成奶龙直至下个黎明": [10,12,2,34,36,2],
+    "你可能会被当作邪恶阵营、爪牙角色或恶魔角色，即使你已死亡。": [7,11,0,12,16,0,17,21,0,26,28,0],
+    "你拥有一个爪牙角色的能力。当你使用能力时，说书人可能会要求你更换选择。": [5,9,0],
+    "你拥有上个死于处决的玩家的能力。如果该玩家属于邪恶阵营，你中毒直到下个善良玩家死于处决。": [5,9,0,23,27,0,29,31,0,35,39,1,39,43,0],
+    "你拥有所有外来者能力。[-0~1外来者]": [5,8,1,16,19,1],
+    "你的“如果”会更加容易。 你的能力是如果…，那么…。在你的首个白天拜访并告知说书人“那么”，说书人会告知你能力的“如果”。": [],
+    "你的能力是如果…，那么…。在你的首个白天拜访并告知说书人“如果”，说书人会告知你能力的“那么”。": [],
+    "你的能力是如果…，那么…。在你的首个白天拜访并告知说书人“那么”，说书人会告知你能力的“如果”。": [],
+    "你随时可能死亡。": [5,7,0],
+    "使用灯神的相克规则。所有玩家都会知道其内容。": [],
+    "公开声明—对邻座玩家本局游戏一直保持同一阵营。每局游戏限一次，他们中的一人可能被当作其他的角色/阵营。": [],
+    "只有你和死亡的玩家可以投票，且投票不需要使用投票标记。忽略票数需要过半的要求。": [4,6,0],
+    "只有说书人可以发起提名。每个白天说书人至少要提名一名你对立阵营的玩家。": [],
+    "善良的镇民玩家不会醉酒、中毒或得知错误信息。": [0,2,1,3,5,1,9,11,1,12,14,0,17,19,0],
+    "在你存活时提名你的玩家会在当晚死亡，即使你已死亡。": [2,4,1,15,17,0,22,24,0],
+    "在你的首个夜晚，你会得知一个关键词。首个说出该关键词的善良玩家会在当晚转变为邪恶阵营。": [27,31,1,38,42,0],
+    "在你的首个夜晚，你会得知一个在场的爪牙角色。每局游戏限一次，你可以在白天公开选择一名玩家：如果他是你得知的角色，他死亡。": [17,21,0,57,59,0],
+    "在你的首个夜晚，你会得知一个在场的镇民角色。如果你“疯狂”地证明你是该角色，当他死亡时你获得该角色的能力。": [17,21,1,26,28,2,40,42,0],
+    "在你的首个夜晚，你会得知一名善良玩家。": [14,18,1],
+    "在你的首个夜晚，你会得知一名善良玩家和他的角色。如果恶魔杀死了他，你也会死亡。": [14,18,1,26,28,0,28,30,0,36,38,0],
+    "在你的首个夜晚，你会得知一名玩家的角色类型。每个夜晚*，你会从他的顺时针方向得知下一名非旅行者玩家的角色类型。": [43,47,2],
+    "在你的首个夜晚，你会得知一名邪恶玩家。每当你得知的玩家死亡，你会在当晚得知另一名邪恶玩家。[会有一名镇民转变为邪恶阵营]": [14,18,0,27,29,0,40,44,0,50,52,1,55,59,0],
+    "在你的首个夜晚，你会得知一段秘密短语。每次你在白天公开说出这段短语，当天便可能会有一名玩家在这之后死亡。": [49,51,0],
+    "在你的首个夜晚，你会得知三名玩家：其中有且只有一名玩家是邪恶的。": [19,23,1,28,30,0],
+    "在你的首个夜晚，你会得知两个善良角色和两个邪恶角色。其中有且只有两个角色在场。": [14,18,1,21,25,0,28,32,1],
+    "在你的首个夜晚，你会得知两名善良玩家。他们之中会有一人醉酒，即使你已死亡。": [14,18,1,27,29,1,34,36,0],
+    "在你的首个夜晚，你会得知两名玩家和一个外来者角色：这两名玩家之一是该角色（或者你会得知没有外来者在场）。": [19,24,1,45,48,1],
+    "在你的首个夜晚，你会得知两名玩家和一个爪牙角色：这两名玩家之一是该角色（或者你会得知没有爪牙在场）。": [19,23,0,44,46,0],
+    "在你的首个夜晚，你会得知两名玩家和一个镇民角色：这两名玩家之一是该角色。": [19,23,1],
+    "在你的首个夜晚，你会得知两名非恶魔玩家。": [15,17,0],
+    "在你的首个夜晚，你会得知场上邻座的邪恶玩家有多少对。": [17,21,0],
+    "在你的首个夜晚，你会得知恶魔与爪牙之间最近的距离。（邻座的玩家距离为1）": [12,14,0,15,17,0],
+    "在你的首个夜晚，你会得知有哪些外来者角色在场。如果有外来者在白天死亡，你会在当晚被唤醒并且你要选择一名玩家：他死亡。[-1或+1外来者]": [15,20,1,26,29,1,32,34,0,55,57,0,64,67,1],
+    "在你的首个夜晚，你会得知离你最近的邪恶玩家位于你的哪一侧（左/右/相同）。如果与你邻近的玩家中有邪恶阵营，你会得知错误信息。": [17,21,0,48,52,0,57,59,0],
+    "在你的首个夜晚，你会得知距离最近的邪恶玩家位于你的顺时针还是逆时针方向。如果两侧的邪恶玩家与你距离相等，你得知的信息由说书人决定。": [17,21,0,41,45,0],
+    "在你的首个夜晚，你能查看魔典并选择一名玩家：他中毒。随后，始终会有一名善良玩家知道寡妇在场。": [23,25,0,35,39,1],
+    "在你的首个夜晚，你能查看魔典并选择一名玩家：他在第三个夜晚死亡，即使因为任何原因让他不会死亡。每个夜晚，你要选择一名玩家：上个夜晚被你选择的玩家死亡。": [29,31,0,44,46,0,72,74,0],
+    "在你的首个夜晚，你要选择一个数字。在该数字对应的那一个夜晚，你会得知对应数量的在场角色。": [],
+    "在你的首个夜晚，你要选择一名存活玩家：他死亡但会被当作存活。当他下一次即将死亡时，他重生，随后你重获能力。": [14,16,1,20,22,0,27,29,1,37,39,0],
+    "在你的首个夜晚，你要选择一名玩家：他会知道狐媚娘在场。如果你死于处决，当晚他转变为邪恶阵营。": [30,34,0,41,45,0],
+    "在你的首个夜晚，你要选择存活或死亡。“疯狂”地想要这样做的玩家可能会立即被处决。": [12,14,1,15,17,0,19,21,2,36,39,0],
+    "在你的首个夜晚，你要选择除你以外的一名玩家：你转变为他的阵营，即使你已醉酒或中毒，但你不知道你转变后的阵营。": [35,37,1,38,40,0],
+    "在你的首个夜晚，你要选择除你以外的一名玩家：如果他先死于处决，你会在当晚转变为邪恶；如果你先死于处决，他会在当晚转变为邪恶。": [26,30,0,39,41,0,46,50,0,59,61,0],
+    "在你的首个夜晚，你要选择除你以外的一名玩家：除首个夜晚以外，当他被邪恶玩家的能力选择或影响时，你会在当晚死亡。": [33,37,0,40,45,0,52,54,0],
+    "在你的首个夜晚，如果你是善良的，你会获得一个镇民角色的能力；如果你是邪恶的，你会获得一个爪牙角色的能力。": [12,14,1,22,26,1,34,36,0,44,48,0],
+    "在你的首个白天，你可以公开猜测任意玩家的角色最多五次。在当晚，你会得知猜测正确的角色数量。": [37,39,1],
+    "在你的首个白天，如果你提名并处决了一名玩家，当晚恶魔不会造成死亡。": [14,16,0,24,26,0,30,32,0],
+    "在你首次提名玩家后，你会在当晚得知他的角色。恶魔会被你的能力当作善良角色。": [22,24,0,32,36,1],
+    "在初始设置时，可能会额外增加或减少一个外来者。": [19,22,1],
+    "在游戏的最后一天所有已死亡玩家会重新获得投票标记。": [11,13,0],
+    "在游戏的最后一天，最幸运的玩家身上会发生一些好的事情。": [],
+    "在第三个白天，所有爪牙会变成暴乱，当天被提名的玩家会立即死亡且必须再次提名一名存活的玩家。": [9,11,0,14,16,0,28,30,0,39,41,1],
+    "在等同于初始外来者数量的夜晚，所有镇民玩家中毒直到下个黄昏。[外来者数量任意]": [6,9,1,17,19,1,21,23,0,31,34,1],
+    "在首个夜晚，你会得知三个伪装。在第三个夜晚，你要选择一名玩家：他变成由你选择的邪恶恶魔。[无恶魔在场]": [12,14,0,39,41,0,41,43,0,46,48,0],
+    "如果与你邻近的两名存活的玩家是善良的，他们不会死亡。": [9,11,1,15,17,1,23,25,0],
+    "如果你“疯狂”地证明自己是外来者，你可能被处决。": [4,6,2,13,16,1,20,23,0],
+    "如果你在夜晚死亡，你与一名存活爪牙玩家交换角色。": [6,8,0,13,15,1,15,17,0],
+    "如果你在夜晚死亡，你会被唤醒，然后你要选择一名玩家：你会得知他的角色。": [6,8,0],
+    "如果你在夜晚死亡，恶魔的能力变成“每个夜晚*，可能会有一名玩家死亡。”": [6,8,0,9,11,0,31,33,0],
+    "如果你在白天死亡，当晚你会得知一名善良玩家。如果你在夜晚死亡，当晚你会得知一名邪恶玩家。": [6,8,0,17,21,1,28,30,0,39,43,0],
+    "如果你在被提名后公开声明自己是哥布林且在那个白天被处决，你的阵营获胜。": [24,27,0,32,34,1],
+    "如果你提名了恶魔且他死于这次处决，你会变成那个邪恶的恶魔。当剩余存活玩家小于等于四人时（旅行者除外），你失去能力。": [6,8,0,14,16,0,23,25,0,26,28,0,32,34,1,44,47,2],
+    "如果你是对你的阵营落败负最大责任的人，你转变阵营并获胜，即使你已死亡。": [9,11,0,25,27,1,32,34,0],
+    "如果你死于处决，你的阵营落败。": [3,7,0,12,14,0],
+    "如果你死亡，在当晚恶魔可以选择两名玩家（不能选择其他恶魔）交换角色。": [3,5,0,9,11,0,26,28,0],
+    "如果你死亡，当晚与你邻近的存活玩家之一可能会死亡。": [3,5,0,13,15,1,22,24,0],
+    "如果你死亡，当晚爪牙和恶魔玩家可以选择变成新的爪牙和恶魔角色。": [3,5,0,8,10,0,11,13,0,23,25,0,26,30,0],
+    "如果你的阵营的一名玩家被处决，你可能会代替他被处决。": [11,14,0,22,25,0],
+    "如果你表现得很有趣，当天你不能被流放。": [],
+    "如果你被处决，除三名玩家以外的其他所有玩家均会死亡。倒数十声后，被最多玩家手指指着的玩家死亡。": [3,6,0,23,25,0,44,46,0],
+    "如果只有三名玩家存活且白天没有人被处决，你的阵营获胜。如果你在夜晚死亡，可能会有一名其他玩家代替你死亡。": [8,10,1,16,19,0,24,26,1,33,35,0,49,51,0],
+    "如果场上有爪牙存活，你不会死亡，所有玩家知道你是开心猴。每个白天限3次，你可以在提名开始前公开选择一名玩家与他猜拳，如果你获胜，他死亡。": [5,7,0,7,9,1,13,15,0,61,63,1,65,67,0],
+    "如果多于一名善良玩家被处决，邪恶阵营获胜。所有玩家都知道利维坦在场。在第五个白天结束时，邪恶阵营获胜。": [6,10,1,10,13,0,14,18,0,18,20,1,44,48,0,48,50,1],
+    "如果大于等于五名玩家存活时（旅行者不计算在内）恶魔死亡，你变成那个恶魔。": [10,12,1,14,17,2,23,25,0,25,27,0,33,35,0],
+    "如果大于等于四名玩家存活，每名当前存活的玩家可以公开要求你杀死一名与他阵营相同的玩家（每名玩家限一次）": [10,12,1,17,19,1,29,31,0],
+    "如果已死亡玩家中没有邪恶玩家，你只会死于处决。": [3,5,0,10,14,0,18,22,0],
+    "如果异端分子在场，所有其他善良镇民变为异教徒，并且得知邪恶玩家是谁及他们的角色。[+异端分子或-1外来者]": [13,15,1,15,17,1,27,31,0,49,52,1],
+    "如果恶魔因为死于处决而因此导致游戏结束时，再额外进行一个夜晚和一个白天。在那个白天如果有玩家被处决，他的阵营落败。": [2,4,0,6,10,0,46,49,0,54,56,0],
+    "如果恶魔杀死了你，在当晚你会被唤醒并得知两名玩家，其中一名是杀死你的那个恶魔。": [2,4,0,4,6,0,30,32,0,36,38,0],
+    "如果恶魔杀死了你，所有玩家都会得知此事。从现在开始，你每天可以发起两次提名，每次投票时可以投两票。": [2,4,0,4,6,0],
+    "如果恶魔杀死了国王，你会得知哪名玩家是恶魔。[+国王]": [2,4,0,4,6,0,7,9,1,19,21,0,24,26,1],
+    "如果有大于等于五名玩家存活，你必须在所有提名中投票。": [11,13,1],
+    "如果爪牙死于处决，当晚你会死亡，随后所有邪恶角色醉酒直到明天黄昏。": [2,4,0,4,8,0,13,15,0,20,24,0,24,26,1],
+    "对新玩家的死亡负最大责任的人，可能会遭遇一些不好的事情。": [5,7,0],
+    "对调胜负结果，即使你已死亡。": [11,13,0],
+    "当一名爪牙死于处决时，除了你和旅行者以外的所有其他玩家醉酒直到明天黄昏。": [3,5,0,5,9,0,15,18,2,27,29,1],
+    "当与你同阵营的一名玩家死亡时，可能有一名同阵营玩家复活。": [11,13,0,25,27,1],
+    "当你加入游戏时，所有玩家会得知一名与你阵营相同的玩家。每当他被提名时，你可以杀死提名者。": [38,40,0],
+    "当你在夜晚死亡时，一名存活的善良玩家会变成农夫。": [5,7,0,11,13,1,14,18,1,21,23,1],
+    "当你得知你死亡时，你要公开选择一名存活的玩家。如果他是善良的，在当晚他会死亡。": [5,7,0,17,19,1,27,29,1,36,38,0],
+    "当你得知你死亡时，你要公开选择一名存活的玩家：如果他是邪恶的，你的阵营落败。": [5,7,0,17,19,1,27,29,0,35,37,0],
+    "当你死亡时，会有一名玩家开始醉酒。": [2,4,0,14,16,1],
+    "当你死亡时，说书人会获得一个爪牙能力。": [2,4,0,14,16,0],
+    "当你首次将要死亡时，你不会死亡。": [6,8,0,13,15,0],
+    "当你首次被提名时，如果提名你的玩家是镇民，他立刻被处决。": [18,20,1,24,27,0],
+    "当说书人宣布安静时，仍在说话的玩家可能会遭遇一些不好的事情。": [],
+    "恶魔会以为你是爪牙。爪牙会以为你是恶魔。": [0,2,0,7,9,0,10,12,0,17,19,0],
+    "恶魔可以在夜晚选择放弃攻击（每局游戏至少一次)。邪恶玩家照常获取初始信息": [0,2,0,24,28,0],
+    "恶魔拥有一个不在场的善良角色的能力，即使他醉酒或中毒。你和他都知道他获得了什么能力。": [0,2,0,10,14,1,21,23,1,24,26,0],
+    "恶魔的负面能力对你无效。": [0,2,0,3,7,0],
+    "恶魔知道书生在场。每局游戏限一次，恶魔可以拜访说书人并猜测你是书生。如果恶魔猜测正确，即使你已死亡，当晚该恶魔可以选择一名玩家：他死亡。": [0,2,0,4,6,1,17,19,0,31,33,1,36,38,0,40,42,1,47,49,0,53,55,0,65,67,0],
+    "所有戏子互相认识。不论在场的戏子数量多少或存活与否，胜负结果会被对调。[所有善良玩家都是戏子]": [21,23,1,38,42,1],
+    "所有爪牙都知道落难少女在场。每局游戏限一次，任意爪牙可以公开猜测你是落难少女，如果猜对，你的阵营落败。": [2,4,0,7,11,1,24,26,0,34,38,1,48,50,0],
+    "所有玩家初始都已死亡。被处决的玩家会复活。如果某个阵营的所有玩家都存活，该阵营获胜。": [8,10,0,11,14,0,18,20,1,33,35,1,39,41,1],
+    "所有玩家在投票时闭眼，且票数会秘密统计。每个夜晚，你要选择自己是否醉酒，直到你下次选择。": [33,35,1],
+    "所有玩家都知道你是维齐尔。你在白天时不会死亡。如果一次提名中有善良玩家投票，你可以让被提名者立即被处决。": [9,12,0,20,22,0,31,35,1,48,51,0],
+    "每个夜晚*，你会得知今天是否有非镇民且非旅行者的玩家死亡。": [16,18,1,19,23,2,26,28,0],
+    "每个夜晚*，你会得知今天白天死于处决的玩家的角色。": [14,18,0],
+    "每个夜晚*，你会得知在今天白天时是否有恶魔投过票。": [19,21,0],
+    "每个夜晚*，你会得知在今天白天时是否有爪牙发起过提名。": [19,21,0],
+    "每个夜晚*，你会得知有多少名死亡的玩家是邪恶的。": [14,16,0,20,22,0],
+    "每个夜晚*，你可以选择一名玩家：他死亡。如果你上次选择时没有选择任何玩家，当晚你要选择三名玩家：他们死亡。": [17,19,0,50,52,0],
+    "每个夜晚*，你可以选择三名玩家（所有玩家会得知你选了谁）：他们分别秘密决定自己的生死，然后如果他们都存活则都死亡。": [50,52,1,54,56,0],
+    "每个夜晚*，你可以选择两名存活玩家签订死亡契约。如果他们中的一人因任何原因死亡，另一人也会随之一同死亡。[+1外来者]": [13,15,1,19,21,0,37,39,0,49,51,0,55,58,1],
+    "每个夜晚*，你可以选择至多两名玩家：他们死亡。你选择的玩家数量不能与上个夜晚死亡的玩家数量相同（超过二人时算作二人）。": [20,22,0,38,40,0],
+    "每个夜晚*，你要猜测今晚首个死亡的玩家与你的距离。如果你猜测正确，则除你以外的所有玩家今晚不会死亡，但你可能会死亡。": [14,16,0,30,32,1,47,49,0,55,57,0],
+    "每个夜晚*，你要选择一个角色：他死亡。如果该角色不在场，则由说书人来决定谁会被你杀死。": [16,18,0,40,42,0],
+    "每个夜晚*，你要选择一名存活玩家：如果他是善良的，他死亡，并且当晚恶魔不会造成死亡。会有一名善良玩家始终被当作邪恶阵营。": [12,14,1,21,23,1,26,28,0,33,35,0,39,41,0,46,50,1,55,59,0],
+    "每个夜晚*，你要选择一名存活的玩家：如果他同意，你会得知他的角色，但是你们两个可能同时死亡。": [12,14,1,43,45,0],
+    "每个夜晚*，你要选择一名玩家:他死亡。如果你在被提名后公开声明我冤呐（最后一天除外），在你死于处决后私下选择一名给你投票的玩家，他会变成邪恶的冤，但每局游戏仅能成功转化一次。[-1外来者]": [16,18,0,45,49,0,68,70,0,90,93,1],
+    "每个夜晚*，你要选择一名玩家和一个角色，如果该角色不在场，他变成该角色。如果因此创造了一个恶魔，当晚的死亡由说书人决定。": [45,47,0,51,53,0],
+    "每个夜晚*，你要选择一名玩家并猜测该玩家的角色：如果你猜错了，你会死亡。": [33,35,0],
+    "每个夜晚*，你要选择一名玩家（与上个夜晚不同）：如果你选中了恶魔，他会得知你的角色，但他当晚不会因其自身能力而被唤醒。": [30,32,0],
+    "每个夜晚*，你要选择一名玩家：他死亡。[由你决定谁是什么爪牙，-或+任意数量外来者]": [16,18,0,28,30,0,38,41,1],
+    "每个夜晚*，你要选择一名玩家：他死亡。[邪恶角色全部邻座，你位于正中，+1爪牙，-或+任意数量外来者]": [16,18,0,20,24,0,37,39,0,47,50,1],
+    "每个夜晚*，你要选择一名玩家：他死亡。与你邻近的两名镇民中毒。": [16,18,0,26,28,1,28,30,0],
+    "每个夜晚*，你要选择一名玩家：他死亡。你可能会拥有上一个死于处决的爪牙的能力。": [16,18,0,28,32,0,33,35,0],
+    "每个夜晚*，你要选择一名玩家：他死亡。在你的首个夜晚，你要选择一名存活的玩家：他中毒，只有当他处于死亡状态时你才会立即死亡。": [16,18,0,33,35,1,40,42,0,49,51,0,59,61,0],
+    "每个夜晚*，你要选择一名玩家：他死亡。如果今天白天有外来者死亡，当晚改为你要选择一名玩家：他死亡，但被当作仍然存活，随后会有一名其他玩家死亡。[+1外来者]": [16,18,0,26,29,1,29,31,0,46,48,0,55,57,1,68,70,0,74,77,1],
+    "每个夜晚*，你要选择一名玩家：他死亡。如果你今天白天没有投票，今晚你可以行动两次。": [16,18,0],
+    "每个夜晚*，你要选择一名玩家：他死亡。如果你以这种方式杀死了一名与你邻近的镇民玩家，除旅行者外的所有善良玩家会中毒直到下个黄昏。": [16,18,0,27,29,0,37,39,1,43,46,2,50,54,1,55,57,0],
+    "每个夜晚*，你要选择一名玩家：他死亡。如果你以这种方式自杀，一名爪牙会变成小恶魔。": [16,18,0,27,29,0,32,34,0,37,40,0],
+    "每个夜晚*，你要选择一名玩家：他死亡。当你将要死亡时，改为一名存活且具有能力的爪牙失去能力。你不会得知恶魔信息。": [16,18,0,23,25,0,31,33,1,39,41,0,51,53,0],
+    "每个夜晚*，你要选择一名玩家：他死亡。被你杀死的爪牙保留他的能力，且与他邻近的两名镇民之一中毒。[-1外来者]": [16,18,0,21,23,0,24,26,0,41,43,1,45,47,0,51,54,1],
+    "每个夜晚*，你要选择一名玩家：他死亡。被该能力杀死的外来者变成邪恶的方古且你代替他死亡，但每局游戏仅能成功转化一次。[+1外来者]": [16,18,0,23,25,0,26,29,1,31,33,0,41,43,0,61,64,1],
+    "每个夜晚*，你要选择一名玩家：他死亡。镇民玩家的能力都会产生错误信息。如果白天没人被处决，邪恶阵营获胜。": [16,18,0,19,21,1,30,32,0,41,44,0,45,49,0,49,51,1],
+    "每个夜晚*，你要选择一名玩家：如果他同意，你得知他的精神状态，但他的精神状态可能发生改变。": [],
+    "每个夜晚*，你要选择一名玩家：如果他在下个黄昏前死亡，你代替他死亡。": [24,26,0,31,33,0],
+    "每个夜晚*，你要选择一名玩家：如果他存活，那么他要选择让自己失去能力，或死亡并保留能力直到下个黄昏。": [18,20,1,36,38,0],
+    "每个夜晚*，你要选择一名玩家：如果他是善良角色且当晚被邪恶角色杀死，你和他交换角色。": [19,23,1,27,31,0,31,33,0],
+    "每个夜晚*，你要选择一名玩家：如果你选中了恶魔，你死亡，然后他醉酒直到下个黎明。": [21,23,0,25,27,0,31,33,1],
+    "每个夜晚*，你要选择一名玩家：如果当晚他醉酒或中毒，你死亡。": [20,22,1,23,25,0,27,29,0],
+    "每个夜晚*，你要选择两个善良角色（与上个夜晚不同）：如果他们都存活，他们当晚不会死亡。": [12,16,1,31,33,1,40,42,0],
+    "每个夜晚*，你要选择两名玩家：他们当晚不会死亡，但其中一人会醉酒到下个黄昏。": [21,23,0,30,32,1],
+    "每个夜晚*，你要选择两名玩家：他们死亡。你上个夜晚选择过且当前死亡的玩家之一可能会被你反刍。": [17,19,0,31,33,0,43,45,1],
+    "每个夜晚*，你要选择任意数量的非旅行者玩家或一名旅行者玩家：如果他们的角色类型均不相同，他们死亡。[+1外来者]": [15,19,2,24,27,2,46,48,0,52,55,1],
+    "每个夜晚*，你要选择除你以外的一名玩家：当晚恶魔的负面能力对他无效。": [22,24,0,25,29,0],
+    "每个夜晚*，可能有一名玩家死亡。如果一项提名只有邪恶玩家投票，投票无效。你也会被当作是爪牙。[多数玩家为军团]": [13,15,0,24,28,0,43,45,0,52,54,0],
+    "每个夜晚*，如果今天白天有玩家死于处决，你会得知存活镇民的数量。": [15,19,0,24,26,1,26,28,1],
+    "每个夜晚*，如果今天白天没有人死亡，你会被唤醒并要选择一名玩家：他死亡。当你首次死亡后，你仍存活，但会被当作死亡。": [15,17,0,33,35,0,40,42,0,46,48,1,54,56,0],
+    "每个夜晚*，选择一名玩家：他死亡。 你的能力是如果…，那么…。在你的首个白天拜访并告知说书人“那么”，说书人会告知你能力的“如果”。": [14,16,0],
+    "每个夜晚限一次，一名玩家在使用自身能力选择邪恶玩家时会改为选中你，即使你已死亡。": [21,25,0,37,39,0],
+    "每个夜晚，你会得知一名与上个夜晚得知的玩家角色类型不同的玩家。[+0~1外来者]": [36,39,1],
+    "每个夜晚，你会得知一名说书人认为你最应该与其交流的玩家。": [],
+    "每个夜晚，你会得知与你邻近的两名存活的玩家中邪恶玩家的数量。": [16,18,1,22,26,0],
+    "每个夜晚，你会得知明天当电话铃响后接听电话后会发生什么，接听电话的人也会知道会发生什么，发生的事情可能会打破规则。": [],
+    "每个夜晚，你会得知有多少名玩家的能力因为其他角色的能力而未正常生效。（从上个黎明到你被唤醒时）": [28,33,0],
+    "每个夜晚，你会得知说书人认为哪个阵营当前更有优势（善良/邪恶/均势）。": [25,27,1,28,30,0],
+    "每个夜晚，你会转变为与你邻近的一名存活的玩家的阵营。每个白天，你可以提议所有玩家加入你的教派，如果所有善良玩家同意加入，你的阵营获胜。": [17,19,1,51,55,1,64,66,1],
+    "每个夜晚，你可以选择一个善良角色：你获得该角色的能力，直到你下次选择。你每个奇数或偶数夜晚醉酒。": [12,16,1,45,47,1],
+    "每个夜晚，你能查看魔典。你可能会被当作善良阵营、镇民角色或外来者角色，即使你已死亡。": [19,23,1,24,28,1,29,34,1,39,41,0],
+    "每个夜晚，你要选择一个镇民角色：他们的能力会产生错误信息，直到下个黄昏。": [11,15,1,24,26,0],
+    "每个夜晚，你要选择一个镇民角色：当他下一次通过自身能力获取信息时，改为得知你给出的信息。": [11,15,1],
+    "每个夜晚，你要选择一名存活的玩家（与上个夜晚不同）：如果明天白天他被处决，他不会死亡。": [11,13,1,33,36,0,40,42,0],
+    "每个夜晚，你要选择一名存活的玩家：你或他之一会醉酒直到下个黄昏。你不会死亡。": [11,13,1,23,25,1,35,37,0],
+    "每个夜晚，你要选择一名存活的玩家：如果你选中了恶魔，你和他交换角色和阵营，然后他中毒。": [11,13,1,23,25,0,40,42,0],
+    "每个夜晚，你要选择一名玩家和一个善良角色。他明天白天和夜晚需要“疯狂”地证明自己是这个角色，不然他可能被处决。": [16,20,1,32,34,2,51,54,0],
+    "每个夜晚，你要选择一名玩家：他中毒。上个因你的能力中毒的玩家会死亡并恢复健康。": [15,17,0,25,27,0,31,33,0,34,38,1],
+    "每个夜晚，你要选择一名玩家：他在当晚和明天白天中毒。": [23,25,0],
+    "每个夜晚，你要选择一名玩家：他被你感染。如果被感染的玩家发起提名，他死亡并感染被提名的玩家。在第四个白天结束时，邪恶阵营获胜。": [34,36,0,56,60,0,60,62,1],
+    "每个夜晚，你要选择一名玩家：你会得知他的阵营。[+0~2村夫，复数村夫中有一人醉酒]": [39,41,1],
+    "每个夜晚，你要选择一名玩家：如果他明天白天发起提名，他死亡。如果只有三名存活的玩家，你失去此能力。": [27,29,0,36,38,1],
+    "每个夜晚，你要选择一名玩家：如果你提名他且他被处决，他的阵营落败。当你首次选择或更换目标时，所有玩家都会得知你选择了新的玩家。": [22,25,0,30,32,0],
+    "每个夜晚，你要选择一名玩家：如果你选中了爪牙，他会得知被传教士选中。所有被你选中的爪牙失去能力。": [20,22,0,41,43,0],
+    "每个夜晚，你要选择两名存活玩家：如果他们阵营相同，今晚任何玩家使用自身能力选择他们之一作为目标时，改为选中另一名玩家。": [11,13,1],
+    "每个夜晚，你要选择两名玩家：你会得知他们之中是否有恶魔。会有一名善良玩家始终被你的能力当作恶魔。<i>（干扰项）</i>": [25,27,0,32,36,1,45,47,0],
+    "每个夜晚，你要选择两名玩家：明天第一名玩家需要“疯狂”地证明第二名玩家是邪恶的，否则他们之中可能会有人死亡。": [24,26,2,36,38,0,51,53,0],
+    "每个夜晚，你要选择左或右：你得知该方向上的下一名存活善良玩家的角色，他中毒且其他善良玩家以为他是邪恶的蛊雕，直到下个黄昏。": [24,26,1,26,30,1,35,37,0,40,44,1,48,50,0],
+    "每个夜晚，你要选择至多三名玩家：你会得知今晚是否有邪恶玩家的能力选择或影响了他们之中的玩家。": [25,29,0,32,37,0],
+    "每个夜晚，你要选择至多三名玩家：如果明天白天他们之一死于处决，上次被你选择的其他玩家会在当晚死亡。否则，当晚他们之中会有一名玩家死亡。": [26,30,0,46,48,0,64,66,0],
+    "每个夜晚，你要选择除你以外的一名玩家：你会得知一个与他能力相关的词语。": [],
+    "每个夜晚，你要选择除你以外的一名玩家：明天白天他的投票会被算作负数。": [],
+    "每个夜晚，你要选择除你以外的一名玩家：明天白天，他的投票算作三票。": [],
+    "每个夜晚，你要选择除你以外的一名玩家：明天白天，只有他投票时你才能投票。": [],
+    "每个夜晚，你要选择除你以外的两名存活的玩家：你会得知他们中有几人在当晚因其自身能力而被唤醒。": [16,18,1],
+    "每个夜晚，你要选择除你及旅行者以外的一名玩家：你会得知一个善良角色和一个邪恶角色，该玩家是其中一个角色。": [12,15,2,29,33,1,36,40,0],
+    "每个夜晚，如果死亡的玩家数量大于或等于存活的玩家数量，你会得知一个存活的角色。恶魔知道你是国王。": [7,9,0,19,21,1,33,35,1,39,41,0,45,47,1],
+    "每个夜晚，当有邪恶玩家的能力首次选择或影响与你邻近的存活玩家时，改为此次能力不生效并持续至下个黎明，且你会得知你的能力被触发。": [7,11,0,16,21,0,26,28,1],
+    "每个夜晚，所有爪牙要秘密决定由哪名玩家来照看小怪宝并且“是恶魔”。每个夜晚*，可能会有一名玩家死亡。[+1爪牙]": [7,9,0,22,25,0,29,31,0,47,49,0,53,55,0],
+    "每个夜晚，直至下个黄昏，由说书人二选一：1）一名玩家解除并免受醉酒和中毒影响，且会得知正确信息；2）一名玩家的能力可以生效两次。该玩家会得知是哪个效果。": [31,33,1,34,36,0,43,45,1],
+    "每个夜晚，首个使用其自身能力选择了你的玩家会醉酒直到下个黄昏。你会转变为他的阵营。": [22,24,1],
+    "每个白天的前两分钟，老玩家不能发言。": [],
+    "每个白天限一次，你可以公开选择一名其他玩家，让他选择一个非恶魔角色：你可能会获得这个角色的能力，直到下个黎明。": [29,33,0],
+    "每个白天限一次，你可以杀死与你邻近的两名存活的玩家中的一名，但需要另一边那个存活的玩家同意。": [11,13,0,20,22,1,38,40,1],
+    "每个白天，三名玩家可以一起拜访你。当晚*他们会得知他们之中有几个是邪恶的，但其中一人的信息是错的。": [33,35,0],
+    "每个白天，你可以公开发表一个声明。在当晚，如果该声明是正确的，会有一名玩家死亡。": [27,29,1,37,39,0],
+    "每个白天，你可以公开声明一个角色。在当晚，你会得知该角色是否在场。如果你因此得知了否，你失去此能力。": [],
+    "每个白天，你可以公开进行一次谁是爪牙，谁是恶魔的猜测。如果你猜对，善良阵营获胜。": [16,18,0,21,23,0,33,37,1,37,39,1],
+    "每个白天，你可以公开选择任意名存活玩家：其中的镇民会醉酒直到你再次选择。当晚你会得知正因你醉酒的人数。": [15,17,1,23,25,1,26,28,1,45,47,1],
+    "每个白天，你可以私下询问说书人以得知一条“新闻”，如果你公开宣读了该“新闻”，当天晚上你会得知它是否正确。": [50,52,1],
+    "每个白天，你可以私下询问说书人以得知两条信息：一个是正确的，一个是错误的。": [26,28,1,33,35,0],
+    "每个白天，你可以选择至多三对玩家交换座位。玩家不能离开座位私聊。": [],
+    "每个白天，在提名开始前，你可以公开选择一名玩家：他死亡。如果你被处决，提名你的玩家需要和你猜拳，只有你输了你才会死亡。": [25,27,0,31,34,0,56,58,0],
+    "每个白天，如果你“疯狂”地证明自己是一个善良角色（与之前不同），你可能会在当晚获得那个角色的能力，直到下个黄昏。": [9,11,2,20,24,1],
+    "每个白天，当首次投票被统计后，你可以选择一名刚投过票的玩家：他死亡。": [31,33,0],
+    "每个白天，首次处决后，你可以再次发起提名。": [7,9,0],
+    "每名被提名者选择一名玩家：直到投票前，只有他们可以发言，并且他们要疯狂地认为被提名者是善良的，否则他们可能会死亡。": [33,35,2,43,45,1,54,56,0],
+    "每天晚上选择一名玩家，今晚一名除了他以外的其他玩家将更换角色。": [],
+    "每局游戏你只能发起提名一次。当你发起提名时，如果被你提名的玩家不是恶魔，他死亡。": [33,35,0,37,39,0],
+    "每局游戏限一次，一名善良玩家可能会得知“有问题”的信息。": [10,14,1],
+    "每局游戏限一次，你可以向说书人许愿。如果愿望被实现，可能会伴随着代价和线索。": [32,34,0],
+    "每局游戏限一次，你可以在白天时公开选择一名玩家：如果他是恶魔，他死亡。": [28,30,0,32,34,0],
+    "每局游戏限一次，在夜晚时*，你可以选择一个镇民角色：如果他在场，他中毒并死亡。": [21,25,1,33,35,0,36,38,0],
+    "每局游戏限一次，在夜晚时*，你可以选择一名死亡的玩家：他重新获得能力直到下个黄昏。": [21,23,0],
+    "每局游戏限一次，在夜晚时*，你可以选择一名死亡的玩家：如果他是镇民，你会将他起死回生。": [21,23,0,31,33,1,38,42,1],
+    "每局游戏限一次，在夜晚时*，你可以选择一名玩家：他死亡，即使因为任何原因让他不会死亡。": [25,27,0,40,42,0],
+    "每局游戏限一次，在夜晚时，你可以选择一个善良角色：你获得该角色的能力。如果这个角色在场，他醉酒。": [20,24,1,45,47,1],
+    "每局游戏限一次，在夜晚时，你可以选择一个角色：如果该角色在场，一个该角色从当晚开始醉酒三天三夜。": [41,43,1],
+    "每局游戏限一次，在夜晚时，你可以选择一名存活的玩家：如果你选中了落难少女，她会变成一个不在场的镇民角色。[+落难少女]": [20,22,1,32,36,1,47,51,1,54,58,1],
+    "每局游戏限一次，在夜晚时，你可以选择一名玩家：他会得知你是守夜人。": [29,32,1],
+    "每局游戏限一次，在夜晚时，你可以选择让恶魔变成你选择的恶魔角色，或让所有爪牙变成你选择的爪牙角色。": [19,21,0,27,31,0,36,38,0,44,48,0],
+    "每局游戏限一次，在夜晚时，你可以选择除你以外的两名玩家：你会得知他们是否为同一阵营。": [],
+    "每局游戏限一次，在白天时，你可以提议所有玩家观看你的演出，并从同意参加的玩家中选择你的观众。如果恶魔成为了观众，你会在当晚死亡。": [48,50,0,61,63,0],
+    "每局游戏限一次，在白天时，你可以私下询问说书人一个是非问题，你会得知该问题的答案。": [],
+    "每局游戏限一次，在白天时，你可以让说书人给你一些能帮助你的阵营获胜的建议。": [31,33,1],
+    "每局游戏限一次，在白天时，如果只有四名或更少的玩家存活，你可以私下拜访说书人以查看魔典二十秒。": [25,27,1],
+    "每局游戏限一次，如果其他玩家发起了提名，你可以选择让本次提名直接执行处决或让投票无效。": [34,36,0],
+    "每局游戏限一次，恶魔可以公开猜测你是雪人，如果猜中，当天他被处决时你会代替他被处决。如果白天没人被处决，你的阵营落败。": [8,10,0,29,32,0,38,41,0,48,51,0,56,58,0],
+    "每局游戏限一次，恶魔可以秘密选择一名对立阵营的玩家，所有玩家要表决：这两名玩家中谁的阵营获胜。（平局邪恶阵营获胜)": [8,10,0,44,46,1,50,54,0,54,56,1],
+    "每局游戏限一次，说书人会在关于你的事情上打破规则。随后，你会秘密得知说书人为此做了什么。": [],
+    "每局游戏限一次，说书人可能会犯一个“错误”但会将其纠正，并公开承认自己曾处理有误": [18,20,0],
+    "游戏开始时，你要宣布一个善良角色。如果该角色在场，他只能死于处决，但所有邪恶玩家会在首个夜晚得知他是哪—名玩家。": [12,16,1,28,32,0,36,40,0],
+    "游戏开始时，你要宣布一个善良角色。如果该角色在场，他只能死于处决，但所有邪恶玩家会在首个夜晚得知他是哪一名玩家。": [12,16,1,28,32,0,36,40,0],
+    "游戏过程中邪恶玩家的总数最多能比初始设置多一名。": [5,9,0],
+    "爪牙会在其首个夜晚得知三个伪装。": [0,2,0,13,15,0],
+    "爪牙和恶魔互相不认识。如果你死亡，当晚他们会互相认识。": [0,2,0,3,5,0,14,16,0],
+    "玩家不知道他们的角色或阵营。他们会在死后得知。": [],
+    "由说书人来为一名或更多玩家派发角色。": [],
+    "被处决的善良玩家可能不会死亡。": [0,3,0,4,8,1,12,14,0],
+    "说书人可以打破游戏规则。如果说书人被处决，善良阵营获胜，即使你已死亡。[无邪恶角色在场]": [17,20,0,21,25,1,25,27,1,32,34,0,37,41,0],
+    "足够“吓人”的玩家可能不会死于处决且恶魔的负面能力对他无效。": [13,17,0,18,20,0,21,25,0],
+    "这个剧本包含有自制角色或自制规则。": [],
+    "这个剧本采用村规。": [],
+    "这是一个传奇大聪花。": [],
+    "这是一个传奇角色。": [],
+  },
+  "en": {
+    "\"I may have a problem, but I won't admit it or talk about it.\"": [],
+    "1 player is drunk, even if you die. If you guess (once) who it is, learn the Demon player, but guess wrong & get false info.": [12,17,1,77,82,0,113,118,0],
+    "2 neighboring players are known to be the same alignment. Once per game, 1 of them registers falsely.": [],
+    "A player who is 'mad' that they want to die might be executed immediately.": [17,20,2,53,61,0],
+    "A player who nominates you while you are alive dies tonight, even if you are dead.": [41,46,1],
+    "All Actors know each other. Regardless of how many Actors are in play or alive, the win condition is reversed. [All good players are Actors]": [73,78,1,116,120,1],
+    "All Minions know you are in play. If a Minion publicly guesses you (once), your team loses.": [39,45,0],
+    "All players keep their eyes closed when voting and the vote tally is secret. Each night, choose if you are drunk until dusk.": [107,112,1],
+    "All players know you are the Vizier. You cannot die during the day. If good voted, you may choose to execute immediately.": [29,35,0,71,75,1],
+    "All players start dead. Executed players are resurrected. If all players of a team are alive, that team wins.": [24,32,0,87,92,1],
+    "All players start knowing a player of your alignment. You may choose to kill anyone who nominates them.": [],
+    "Any other player who uses their ability to choose you at night, instead chooses an evil player.": [83,87,0],
+    "At least once per game, the Storyteller will make a mistake, correct it, and publicly admit to it.": [],
+    "Each day, 3 players may choose to visit you. At night,each visitor learns how many visitors are evil, but 1 gets false info.": [96,100,0,113,118,0],
+    "Each day, after the 1st execution, you may nominate again.": [24,33,0],
+    "Each day, after the 1st vote has been tallied, you may choose a player that voted: they die.": [],
+    "Each day, before nominations, you may publicly choose a player: they die. If executed, you only die if you lose roshambo.": [77,85,0],
+    "Each day, choose a player: a different player changes character tonight.": [],
+    "Each day, if you are 'mad' that you are a good character (different from before), you might gain that character's ability tonight, until the next dusk.": [22,25,2,42,46,1],
+    "Each day, if you publicly guess which players are Minion(s) and which are Demon(s), good wins.": [50,56,0,74,79,0,84,88,1],
+    "Each day, you may choose up to 3 sets of 2 players to swap seats. Players may not leave their seats to talk in private.": [],
+    "Each day, you may make a public statement. Tonight, if it was true, a player dies.": [],
+    "Each day, you may privately ask the Storyteller for a piece of 'news'. If you publicly announce this 'news', tonight you learn if it was correct.": [],
+    "Each day, you may publicly choose any number of alive players: the Townsfolk among them are drunk until you choose again. Tonight, you learn how many players are drunk because of you.": [48,53,1,67,76,1,92,97,1,162,167,1],
+    "Each day, you may publicly declare a character. That night, you learn if that character is in play. If you learn 'no' because of this, you lose this ability.": [],
+    "Each day, you may visit the Storyteller to learn 2 things in private: 1 is true & 1 is false.": [87,92,0],
+    "Each night*, a player might die. Executions fail if only evil voted. You register as a Minion too. [Most players are Legion]": [57,61,0,87,93,0],
+    "Each night*, choose 2 players: they can't die tonight, but 1 is drunk until dusk.": [64,69,1],
+    "Each night*, choose 2 players: they die. A dead player you chose last night might be regurgitated.": [],
+    "Each night*, choose 3 players (all players learn who): each silently chooses to live or die, but if all live, all die.": [],
+    "Each night*, choose a character: they die. If they are not in play, the Storyteller chooses who dies.": [],
+    "Each night*, choose a living player: if good, they die, but they are the only player that can die tonight.": [40,44,1],
+    "Each night*, choose a living player: if they agree, you learn their character, but you both might die.": [],
+    "Each night*, choose a player & a character they become (if not-in-play). If a Demon is made, deaths tonight are arbitrary.": [78,83,0],
+    "Each night*, choose a player & guess their character: if you guess wrong, you die.": [],
+    "Each night*, choose a player (different to last night): the Demon, if chosen, learns who you are then doesn't wake tonight.": [60,65,0],
+    "Each night*, choose a player (not yourself): they are safe from the Demon tonight.": [68,73,0],
+    "Each night*, choose a player: if they are a good character and are killed by an evil player tonight, you and they swap characters.": [44,48,1,80,84,0],
+    "Each night*, choose a player: if they are alive, they must choose to either lose their ability, or die and keep their ability until the next dusk.": [42,47,1],
+    "Each night*, choose a player: if they are or become drunk or poisoned tonight, you die.": [52,57,1,61,69,0],
+    "Each night*, choose a player: if they would die before the next dusk, you die instead.": [],
+    "Each night*, choose a player: if you choose the Demon, you die, and they become drunk until the next dawn.": [48,53,0,80,85,1],
+    "Each night*, choose a player: they die. If an Outsider died today, instead, choose a player: they die but are treated as alive, and then one other player dies. [+1 Outsider]": [46,54,1,121,126,1,164,172,1],
+    "Each night*, choose a player: they die. If you did not vote today, you may act twice tonight.": [],
+    "Each night*, choose a player: they die. If you kill a Townsfolk neighbor this way, all good players (except Travelers) are poisoned until next dusk.": [54,63,1,87,91,1,123,131,0],
+    "Each night*, choose a player: they die. If you kill yourself this way, a Minion becomes the Imp.": [73,79,0],
+    "Each night*, choose a player: they die. Minions you kill keep their ability & poison 1 Townsfolk neighbour. [−1 Outsider]": [78,84,0,87,96,1,112,120,1],
+    "Each night*, choose a player: they die. The 1st Outsider this kills becomes an evil Fang Gu & you die instead. [+1 Outsider]": [48,56,1,79,83,0,115,123,1],
+    "Each night*, choose a player: they die. Townsfolk abilities yield false info. Each day, if no-one is executed, evil wins.": [40,49,1,66,71,0,101,109,0,111,115,0],
+    "Each night*, choose a player: they die. When you would die, a living Minion with an ability loses their ability instead. You do not learn Demon info.": [69,75,0,138,143,0],
+    "Each night*, choose a player: they die. You might have the ability of the last Minion who died by execution.": [79,85,0,98,107,0],
+    "Each night*, choose a player: they die. You start by choosing an alive player: they are poisoned - you die if & only if they die.": [65,70,1,88,96,0],
+    "Each night*, choose a player: they die. Your 2 Townsfolk neighbours are poisoned.": [47,56,1,72,80,0],
+    "Each night*, choose a player: they die. Your ability is if…, then…. At your first day, visit the Storyteller and tell them \"then\". The Storyteller will tell you the \"if\" of your ability.": [],
+    "Each night*, choose a player: they die. [Evil characters are in a line. You are in the middle. +1 Minion. -? to +? Outsiders]": [41,45,0,98,104,0],
+    "Each night*, choose a player: they die. [You choose which players are which Minions. -? to +? Outsiders]": [],
+    "Each night*, choose any number of non-Traveler players, or one Traveler: if their character types are all different, they die. [+1 Outsider]": [38,46,2,63,71,2,131,139,1],
+    "Each night*, choose two good characters (different from last night): if they are both alive, they cannot die tonight.": [24,28,1,86,91,1],
+    "Each night*, if a player died by execution today, you learn the number of living Townsfolk.": [33,42,0,81,90,1],
+    "Each night*, if no-one died today, choose a player: they die. The 1st time you die, you live but register as dead.": [],
+    "Each night*, you learn how many dead players are evil.": [49,53,0],
+    "Each night*, you learn if a Demon voted today.": [28,33,0],
+    "Each night*, you learn if a Minion nominated today.": [28,34,0],
+    "Each night*, you learn if any non-Townsfolk, non-Traveler player died today.": [34,43,1,49,57,2],
+    "Each night*, you learn which character died by execution today.": [47,56,0],
+    "Each night*, you may choose a player: they die. If your last choice was no-one, choose 3 players tonight.": [],
+    "Each night*, you may choose two alive players to form a death pact. If one of them dies for any reason, the other dies too. [+1 Outsider]": [32,37,1,128,136,1],
+    "Each night*, you may choose up to two players: they die. The number of players you choose cannot be the same as the number of players who died last night (more than 2 counts as 2).": [],
+    "Each night*, you must choose a player: if they agree, you learn their sanity status, but their sanity status might change.": [],
+    "Each night*, you must choose a player: they die. If you publicly declare \"I'm framed!\" (except the last day), after you are executed, privately choose a player who voted for you. He will become the evil Yuan, but only one successful conversion can be made per game. [-1 Outsider]": [124,132,0,198,202,0,270,278,1],
+    "Each night*, you must guess the distance to the first player who will die tonight. If you are correct, all other players cannot die tonight, but you might.": [],
+    "Each night, Minions choose who babysits Lil' Monsta's token & \"is the Demon\". A player dies each night*. [+1 Minion]": [70,75,0,109,115,0],
+    "Each night, choose 2 alive players (not yourself): you learn how many woke tonight due to their ability.": [21,26,1],
+    "Each night, choose 2 players: tomorrow, the 1st player is mad that the 2nd is evil, or one or both might die.": [58,61,2,78,82,0],
+    "Each night, choose 2 players: you learn if either is a Demon. There is a good player that registers as a Demon to you.": [55,60,0,73,77,1,105,110,0],
+    "Each night, choose a Townsfolk character: the next time they gain information from their ability, they learn what you decide instead.": [21,30,1],
+    "Each night, choose a Townsfolk character: their ability returns false information until the next dusk.": [21,30,1,64,69,0],
+    "Each night, choose a living player (different to last night): if executed tomorrow, they don't die.": [65,73,0],
+    "Each night, choose a player & a good character: they are “mad” they are this character tomorrow, or might be executed.": [32,36,1,58,61,2,109,117,0],
+    "Each night, choose a player (not yourself or Travellers): you learn 1 good and 1 evil character, 1 of which is correct.": [45,55,2,70,74,1,81,85,0],
+    "Each night, choose a player (not yourself): their vote counts as 3 votes tomorrow.": [],
+    "Each night, choose a player (not yourself): their vote counts negatively tomorrow.": [],
+    "Each night, choose a player (not yourself): tomorrow, you may only vote if they are voting too.": [],
+    "Each night, choose a player other than yourself: you learn a word related to their ability.": [],
+    "Each night, choose a player. If you nominate & execute them, their team loses. All players know if you choose a new player.": [],
+    "Each night, choose a player: a Minion, if chosen, learns this. All chosen Minions have no ability.": [31,37,0],
+    "Each night, choose a player: if they nominate tomorrow, they die. If just 3 players live, you lose this ability.": [],
+    "Each night, choose a player: they are poisoned tonight and tomorrow day.": [38,46,0],
+    "Each night, choose a player: they are poisoned. The previously poisoned player dies then becomes healthy.": [38,46,0,63,71,0,97,104,1],
+    "Each night, choose a player: you learn their alignment. [+0 to +2 Village Idiots. 1 of the extras is drunk]": [101,106,1],
+    "Each night, choose an alive player: a chosen Demon swaps characters & alignments with you & is then poisoned.": [22,27,1,45,50,0,100,108,0],
+    "Each night, choose an alive player: either you or they are drunk until dusk. You can't die.": [22,27,1,59,64,1],
+    "Each night, choose left or right: you learn the character of the next living good player in that direction. They are poisoned and register as an evil Gu Diao, until next dusk.": [77,81,1,117,125,0,145,149,0],
+    "Each night, choose two living players: if they have the same alignment, any ability used on one of them tonight targets the other instead.": [],
+    "Each night, choose up to three players: if one of them dies by execution tomorrow, the others you chose last night die tonight. Otherwise, one of them dies tonight.": [63,72,0],
+    "Each night, choose up to three players: you learn if an evil player's ability targeted or affected any of them tonight.": [56,60,0],
+    "Each night, if the dead outnumber the living, you learn 1 alive character. The Demon knows who you are.": [58,63,1,79,84,0],
+    "Each night, learn which player the Storyteller believes you should talk to most.": [],
+    "Each night, the 1st player to choose you with their ability is drunk until dusk. You become their alignment.": [63,68,1],
+    "Each night, the first time an evil player's ability targets or affects a living neighbor of yours, that ability fails until dawn, and you learn your ability was triggered.": [30,34,0],
+    "Each night, until dusk, 1) a player becomes sober, healthy and gets true info, or 2) their ability works twice. They learn which.": [44,49,1,51,58,1],
+    "Each night, you become the alignment of an alive neighbour. If all good players choose to join your cult, your team wins.": [43,48,1,67,71,1],
+    "Each night, you learn 1 player of each character type, until there are no more types to learn. [+1 Outsider]": [99,107,1],
+    "Each night, you learn how many of your 2 alive neighbours are evil.": [41,46,1,62,66,0],
+    "Each night, you learn how many players’ abilities worked abnormally (since dawn) due to another character's ability.": [],
+    "Each night, you learn what will happen tomorrow when the phone rings and is answered. The person who answers also knows. What happens might break the rules.": [],
+    "Each night, you learn which alignment the Storyteller believes is winning: good, evil, or neither.": [75,79,1,81,85,0],
+    "Each night, you may choose a good player: you gain their ability until you choose again. You are drunk on either odd or even nights.": [29,33,1,97,102,1],
+    "Each night, you must choose a player: they are infected by you. If an infected player nominates, they die, and the nominated player becomes infected. At the end of the fourth day, the evil team wins.": [184,188,0],
+    "Each night, you see the Grimoire. You might register as good & as a Townsfolk or Outsider, even if dead.": [56,60,1,68,77,1,81,89,1],
+    "Each nominee chooses a player: until voting, only they may speak & they are mad the nominee is good or they might die.": [76,79,2,95,99,1],
+    "Executed good players might not die.": [0,8,0,9,13,1],
+    "For the first 2 minutes of each day, veteran players may not talk. ": [],
+    "Good Townsfolk players cannot be drunk, poisoned, or learn false information.": [0,4,1,5,14,1,33,38,1,40,48,0,59,64,0],
+    "If 4 ormore players live,each livingplayermaypubliclychoose(oncepergame)that aplayerof theirown alignment dies.": [],
+    "If a Minion dies by execution, you die tonight. Then, all evil players are drunk until dusk tomorrow.": [5,11,0,20,29,0,58,62,0,75,80,1],
+    "If a player of your alignment is executed, you might be executed instead.": [33,41,0,56,64,0],
+    "If both your alive neighbours are good, they can't die.": [13,18,1,34,38,1],
+    "If more than 1 good player is executed, you win. All players know you are in play. After day 5, evil wins.": [15,19,1,30,38,0,96,100,0],
+    "If only 3 players live & no execution occurs, your team wins. If you die at night, another player might die instead.": [28,37,0],
+    "If the Demon dies by execution (ending the game), play for 1 more day. If a player is then executed, their team loses.": [7,12,0,21,30,0,91,99,0],
+    "If the Demon kills the King, you learn which player is the Demon. [+ the King]": [7,12,0,59,64,0],
+    "If the Demon kills you, all players learn this. From now on, you may nominate twice per day and vote twice per nomination.": [7,12,0],
+    "If the Demon kills you, you learn that it is 1 of 2 players.": [7,12,0],
+    "If the Heretic is in play, all other good Townsfolk become Pagans and learn who the evil players are and their roles. [+Heretic or -1 Outsider]": [37,41,1,42,51,1,84,88,0,134,142,1],
+    "If there are 5 or more players alive & the Demon dies, you become the Demon. (Travellers don’t count)": [31,36,1,43,48,0,70,75,0,78,88,2],
+    "If there are 5 or more players alive, you must vote for every nomination.": [31,36,1],
+    "If there are evil players alive, you can not die. All players know you are the Happy Monkey. You can publicly choose a player to play roshambo with you each day. If you win, they die.": [13,17,0,26,31,1],
+    "If there are no evil players among the dead, you can only die by execution.": [16,20,0,65,74,0],
+    "If you are executed, all but 3 players die. 1 minute later, the player with the most players pointing at them dies.": [11,19,0],
+    "If you are “mad” about being an Outsider, you might be executed.": [12,15,2,32,40,1,55,63,0],
+    "If you die at night, an alive good player becomes a Farmer.": [24,29,1,30,34,1],
+    "If you die at night, the Demon's ability becomes 'Each night*, a player might die.'": [25,30,0],
+    "If you die at night, you are woken to choose a player: you learn their character.": [],
+    "If you die at night, you swap characters with a living Minion.": [55,61,0],
+    "If you die by execution, your team loses.": [14,23,0],
+    "If you die during the day, you learn a good player that night. If you die at night, you learn an evil player that night.": [39,43,1,97,101,0],
+    "If you die, one of your living neighbors might die tonight.": [],
+    "If you died today or tonight, the Demon may choose 2 players (not another Demon) to swap characters.": [34,39,0,74,79,0],
+    "If you died today or tonight, the Minion & Demon players may choose new Minion & Demon characters to be.": [34,40,0,43,48,0,72,78,0,81,86,0],
+    "If you nominate the Demon and they die by that execution, you become that evil Demon. You lose this ability when 4 or fewer players (not counting Travelers) are alive.": [20,25,0,47,56,0,74,78,0,79,84,0,161,166,1],
+    "If you publicly claim to be the Goblin when nominated & are executed that day, your team wins.": [60,68,0],
+    "If you were funny today, you cannot die by exile.": [],
+    "If you were the player most responsible for your team losing, you change alignment & win, even if dead.": [],
+    "Minions & Demons do not know each other. If you die, they learn who each other are that night.": [],
+    "Minions start knowing 3 not-in-play characters.": [],
+    "Name a good character. If in play, they can only die by execution, but evil players learn which player it is.": [7,11,1,56,65,0,71,75,0],
+    "Name a good character. If in play, they can only die by execution, but evil players learn which player it is. ": [7,11,1,56,65,0,71,75,0],
+    "Nominees die, but may nominate again immediately (on day 3, they must). After day 3, evil wins. [All Minions are Riot]": [85,89,0],
+    "On night X, all Townsfolk are poisoned until dusk. [X Outsiders]": [16,25,1,30,38,0],
+    "On the final day, all dead players regain their vote token.": [],
+    "On the last day of the game, something good happens to the luckiest players.": [39,43,1],
+    "On your 1st day, if you nominated & executed a player, the Demon doesn't kill tonight.": [36,44,0,59,64,0],
+    "On your 1st day, publicly guess up to 5 players' characters. That night, you learn how many you got correct.": [],
+    "On your 1st night, choose a player (not yourself): you become their alignment (you don't know which) even if drunk or poisoned.": [109,114,1,118,126,0],
+    "On your 1st night, look at the Grimoire and choose a player: they are poisoned. 1 good player knows a Widow is in play.": [70,78,0,82,86,1],
+    "On your 1st night, you gain a Townsfolk ability (if good), or a Minion ability (if evil).": [30,39,1,52,56,1,64,70,0,83,87,0],
+    "On your first night, choose a living player: they die but are treated as alive. The next time they would die, they are resurrected, and you regain this ability.": [73,78,1],
+    "On your first night, choose a number. On the night corresponding to that number, you learn that many characters that are in play.": [],
+    "On your first night, choose a player other than yourself: each night (except the first), if they are targeted or affected by an evil player's ability, you die tonight.": [128,132,0],
+    "On your first night, choose a player other than yourself: if they die by execution first, you become evil that night. If you die by execution first, they become evil that night.": [73,82,0,101,105,0,132,141,0,161,165,0],
+    "On your first night, choose a player: they learn a Hu Meiniang is in play. If you die by execution, they become evil that night.": [89,98,0,112,116,0],
+    "On your first night, you learn one Minion in play. Once per game, you may publicly choose a player: if they are the character you learned, they die.": [35,41,0],
+    "On your first night, you learn the character type of one player. Each night*, you learn the character type of the next non-Traveler player in clockwise order.": [123,131,2],
+    "On your first night, you learn two good characters and two evil characters. Exactly two of these characters are in play.": [35,39,1,59,63,0],
+    "On your first night, you learn two good players. One of them is drunk, even if you are dead.": [35,39,1,64,69,1],
+    "On your first night, you learn which of your sides (left/right/same) the nearest evil player is on. If an evil player is adjacent to you, you learn false information.": [81,85,0,106,110,0,148,153,0],
+    "On your first night, you must choose 'living' or 'dead'. A player who is 'mad' that they want to do this might be executed immediately.": [74,77,2,114,122,0],
+    "On your first night, you see the Grimoire and choose a player: they die on the 3rd night, even if for some reason they could not. Each night, choose a player: the player you chose last night dies.": [],
+    "Once per day, you may choose to kill an alive neighbour, if your other alive neighbour agrees.": [40,45,1,71,76,1],
+    "Once per day, you may publicly choose another player. They choose a non-Demon character: you might gain this character's ability until the next dawn.": [72,77,0],
+    "Once per game, at night*, choose a dead player: if they are a Townsfolk, they are resurrected.": [62,71,1],
+    "Once per game, at night*, choose a player: they die, even if for some reason they could not.": [],
+    "Once per game, at night*, you may choose a Townsfolk character: if they are in play, they are poisoned and die.": [43,52,1,94,102,0],
+    "Once per game, at night, choose 2 players (not yourself): you learn if they are the same alignment.": [],
+    "Once per game, at night, choose a character: they are drunk for 3 nights & 3 days.": [54,59,1],
+    "Once per game, at night, choose a dead player: they regain their ability until dusk.": [],
+    "Once per game, at night, choose a good character: gain that ability. If this character is in play, they are drunk.": [34,38,1,108,113,1],
+    "Once per game, at night, choose a living player: the Damsel, if chosen, becomes a not-in-play Townsfolk. [+the Damsel]": [94,103,1],
+    "Once per game, at night, choose a player: they learn who you are.": [],
+    "Once per game, at night, choose which Minions or which Demon is in play.": [55,60,0],
+    "Once per game, at the start of the day, if there are four or fewer players alive, you may privately visit the Storyteller to view the Book of Apocalypse for twenty seconds.": [75,80,1],
+    "Once per game, choose to make a wish. If granted, it might have a price and leave a clue as to its nature.": [],
+    "Once per game, during the day, privately ask the Storyteller any yes/no question.": [],
+    "Once per game, during the day, publicly choose a player: if they are the Demon, they die.": [73,78,0],
+    "Once per game, during the day, visit the Storyteller for some advice to help you win.": [],
+    "Once per game, during the day, you may propose all players watch your performance, and choose your audience from those who agree. If the Demon is in the audience, you die tonight.": [137,142,0],
+    "Once per game, if another player nominated, you may choose to force the current execution to pass or fail.": [80,89,0],
+    "Once per game, the Demon may publicly guess you are the Snowman. If correct, you are executed instead of them if they are executed today. If no one is executed during the day, your team loses.": [19,24,0,85,93,0,122,130,0,151,159,0],
+    "Once per game, the Demon secretly chooses an opposing player: all players choose which of these 2 players win. ": [19,24,0],
+    "Once per game, the Storyteller will break the rules for you. Then, you learn privately what the Storyteller did.": [],
+    "Once per night, a player using their ability to choose an evil player chooses you instead, even if you are dead.": [58,62,0],
+    "One of your good neighbors is drunk, even if you are dead.": [12,16,1,30,35,1],
+    "Only the Storyteller can nominate. At least 1 opposite player must be nominated each day.": [],
+    "Only you and the dead can vote. They don't need a vote token to do so. A 50% majority is not required.": [],
+    "Players don't know their character or alignment. They learn them after they die.": [],
+    "Players who are \"spooky\" might survive execution be safe from the Demon.": [31,38,1,39,48,0,66,71,0],
+    "Something bad might happen to whoever is most responsible for the death of a new player. ": [],
+    "Something bad might happen to whoever talks when the Storyteller has asked for silence. ": [],
+    "The 1st time you are nominated, if the nominator is a Townsfolk, they are executed immediately.": [54,63,1,74,82,0],
+    "The Demon (even if drunk or poisoned) has a not-in-play good character's ability. You both know which.": [4,9,0,19,24,1,28,36,0,56,60,1],
+    "The Demon knows a Pedant is in play. Once per game, the Demon may visit the Storyteller and guess you are the Pedant. If correct, even if you are dead, the Demon chooses a player tonight: they die.": [4,9,0,56,61,0,156,161,0],
+    "The Demon may choose not to attack must do this at least once per game. Evil players get normal starting info. ": [4,9,0,72,76,0],
+    "The Demon thinks you are a Minion. Minions think you are a Demon.": [4,9,0,27,33,0,59,64,0],
+    "The Storyteller assigns 1 or more players' characters.": [],
+    "The Storyteller assigns 1 or more players'characters. ": [],
+    "The Storyteller can break the game rules & if executed, good wins, even if you are dead. [No evil characters]": [46,54,0,56,60,1,93,97,0],
+    "The first time you die, you don't.": [],
+    "The night after you first nominate a player, you learn their character. The Demon counts as a good character to your ability.": [76,81,0,94,98,1],
+    "There are extra Outsiders in play. [+2 Outsiders]": [],
+    "There can't be more than 1 extra evil player. ": [33,37,0],
+    "There might be 1 extra or 1 fewer Outsider in play. ": [34,42,1],
+    "This is a big onion.": [],
+    "This is a fabled character.": [],
+    "This script has homebrew characters or rules.": [],
+    "This script has homebrew characters or rules. ": [],
+    "Ths god controls all the rules in this game.": [],
+    "Use the Djinn's special rule. All players know what it is.": [],
+    "When a Minion dies by execution, all other players (except Travellers) are drunk until dusk tomorrow.": [7,13,0,22,31,0,59,69,2,75,80,1],
+    "When a player on your team dies, a player on your team might be resurrected.": [],
+    "When you die, 1 player is drunk from now on.": [26,31,1],
+    "When you die, the Storyteller gains a Minion ability.": [38,44,0],
+    "When you learn that you died, publicly choose 1 alive player. Tonight, if it was a good player, they die.": [48,53,1,83,87,1],
+    "When you learn that you died, publicly choose 1 alive player: if they are evil, your team loses.": [48,53,1,74,78,0],
+    "Whoever wins, loses & whoever loses, wins, even if you are dead.": [],
+    "You & an opposing player know each other. If the good player is executed, evil wins. Good can't win if you both live.": [49,53,1,64,72,0,74,78,0,85,89,1],
+    "You are safe from the Demon.": [22,27,0],
+    "You can go crazy about \"I'm Nailong\". If you do this, and another player goes crazy about \"I'm Nailong\", he may become Nailong until the next dawn.": [],
+    "You do not know what your ability is. Each day, privately guess what it is: you learn how accurate you are.": [],
+    "You do not know you are the Drunk. You think you are a Townsfolk character, but you are not.": [28,33,1,55,64,1],
+    "You get 3 bluffs. On the 3rd night, choose a player: they become an evil Demon of your choice. [No Demon]": [68,72,0,73,78,0,99,104,0],
+    "You have a not-in-play Minion ability.": [23,29,0],
+    "You have all Outsider abilities. [-0 or -1 Outsider]": [13,21,1,43,51,1],
+    "You have the ability of the recently killed executee. If they are evil, you are poisoned until a good player dies by execution.": [66,70,0,80,88,0,97,101,1,117,126,0],
+    "You may choose to open your eyes at night. You wake when other evil players do.": [63,67,0],
+    "You may only nominate once per game. When you do, if the nominee is not the Demon, they die.": [76,81,0],
+    "You might die at any time.": [],
+    "You might register as evil & as a Minion or Demon, even if dead.": [22,26,0,34,40,0,44,49,0],
+    "You must use a vote token to vote. Dead players may choose to give you theirs. If so, you learn their alignment. You are sober & healthy.": [121,126,1,129,136,1],
+    "You start knowing 1 evil player. If the player you know dies, you learn another evil player tonight. [1 Townsfolk is evil]": [20,24,0,80,84,0,104,113,1,117,121,0],
+    "You start knowing 1 good player.": [20,24,1],
+    "You start knowing 1 in-play Townsfolk. If you were mad that you were this character, you gain their ability when they die.": [28,37,1,51,54,2],
+    "You start knowing 2 players that are not the Demon.": [45,50,0],
+    "You start knowing 3 players, 1 and only 1 of which is evil.": [54,58,0],
+    "You start knowing a good player & their character. If the Demon kills them, you die too.": [20,24,1,58,63,0],
+    "You start knowing a secret phrase. For each time you said it publicly today, a player might die.": [],
+    "You start knowing a secret word. The 1st good player to say this word becomes evil that night.": [41,45,1,78,82,0],
+    "You start knowing how many pairs of evil players there are.": [36,40,0],
+    "You start knowing how many steps from the Demon to its nearest Minion.": [42,47,0,63,69,0],
+    "You start knowing if your closest evil player is clockwise or anti-clockwise. If equidistant, this info is arbitrary.": [34,38,0],
+    "You start knowing that 1 of 2 players is a particular Minion.": [54,60,0],
+    "You start knowing that 1 of 2 players is a particular Outsider. (Or that zero are in play.)": [54,62,1],
+    "You start knowing that 1 of 2 players is a particular Townsfolk.": [54,63,1],
+    "You start knowing which Outsiders are in play. If 1 died today, choose a player tonight: they die. [−1 or +1 Outsider]": [109,117,1],
+    "You think you are a Demon, but you are not. The Demon knows who you are & who you choose at night.": [20,25,0,48,53,0],
+    "You think you are a Minion, but you are not.": [20,26,0],
+    "You think you are a good character but you are not. The Demon knows who you are. [You neighbour the Demon]": [20,24,1,56,61,0,100,105,0],
+    "You think you are a good character, but you are not. If you are killed by the Demon, the Demon must choose a player: they become the Doll. [The Doll sits next to the Demon]": [20,24,1,78,83,0,89,94,0,166,171,0],
+    "You think you are a good player in play, but you are not. The player who has this role knows the Drugster is in play. If one of you 'madly' proves the Drugster is in play, you both might die.": [20,24,1],
+    "You think you are an Outsider, but you are not. If an evil player's ability targets or affects you, you become a Townsfolk character that is not in play before it resolves.": [21,29,1,54,58,0,113,122,1],
+    "Your \"if\" is easier. Your ability is if…, then…. At your first day, visit the Storyteller and tell them \"then\". The Storyteller will tell you the \"if\" of your ability.": [],
+    "Your ability is if…, then…. At your first day, visit the Storyteller and tell them \"if\". The Storyteller will tell you the \"then\" of your ability.": [],
+    "Your ability is if…, then…. At your first day, visit the Storyteller and tell them \"then\". The Storyteller will tell you the \"if\" of your ability.": [],
+    "Your two Townsfolk neighbors are treated as alive the first time they die. [-1 Outsider]": [9,18,1,44,49,1,79,87,1],
+  },
+};
@@ -0,0 +1,1576 @@
+// 此文件由 python/gen_lookup_tables.py 自动生成，请勿手动修改。
+// 数据源变化后运行：python ./python/gen_lookup_tables.py
+
+export const ZH_NAME_TO_ID: Record<string, string> = {
+  "主教": "bishop",
+  "主谋": "mastermind",
+  "九头蛇": "jiutoushe",
+  "乞丐": "beggar",
+  "书生": "shusheng",
+  "书童": "shutong",
+  "事务官": "steward",
+  "亡骨魔": "vigormortis",
+  "亡魂": "wraith",
+  "传奇角色": "fabled_charactor",
+  "传教士": "preacher",
+  "佛陀": "buddhist",
+  "使节": "shijie",
+  "侍女": "chambermaid",
+  "侍臣": "courtier",
+  "侏儒": "gnome",
+  "俑匠": "yongjiang",
+  "修女": "nun",
+  "修行者": "shugenja",
+  "修补匠": "tinker",
+  "偃师": "yanshi",
+  "僧侣": "monk",
+  "僵怖": "zombuul",
+  "入殓师": "rulianshi",
+  "公主": "princess",
+  "公爵夫人": "duchess",
+  "共情者": "empath",
+  "典狱长": "dianyuzhang",
+  "养蛊人": "yangguren",
+  "军团": "legion",
+  "农夫": "farmer",
+  "冤": "yuan",
+  "刀客": "daoke",
+  "利维坦": "leviathan",
+  "刺客": "assassin",
+  "半仙": "banxian",
+  "半兽人": "lycanthrope",
+  "卖花女孩": "flowergirl",
+  "南瓜": "pumpkin",
+  "博学者": "savant",
+  "占卜师": "fortune_teller",
+  "卡扎力": "kazali",
+  "厨师": "chef",
+  "变脸师": "bianlianshi",
+  "叫花子": "jiaohuazi",
+  "召唤师": "summoner",
+  "史官": "shiguan",
+  "吟游诗人": "minstrel",
+  "呆瓜": "klutz",
+  "告密者": "snitch",
+  "和尚": "heshang",
+  "和平主义者": "pacifist",
+  "咖啡师": "barista",
+  "哈迪寂亚": "al-hadikhia",
+  "哥布林": "goblin",
+  "哨兵": "sentinel",
+  "哲学家": "philosopher",
+  "唱诗男孩": "choirboy",
+  "嘴硬的上帝": "zuiyingdeshangdi",
+  "园丁": "gardener",
+  "国王": "king",
+  "图书管理员": "librarian",
+  "圣徒": "saint",
+  "圣洁之魂": "spirit_of_ivory",
+  "地狱藏书员": "hells_librarian",
+  "城镇公告员": "town_crier",
+  "堤丰之首": "lord_of_typhon",
+  "士兵": "soldier",
+  "大假发": "bigwig_loric",
+  "大聪花": "onion",
+  "天使": "angel",
+  "天启召唤者": "apocalypse",
+  "天才": "genius",
+  "失去梦想家": "lost_dreamer",
+  "失忆者": "amnesiac",
+  "失望": "disappointed",
+  "失败的上帝": "deusexfiasco",
+  "契魔": "qimo",
+  "奥赫": "ojo",
+  "女巫": "witch",
+  "女祭司": "high_priestess",
+  "女舍监": "matron",
+  "女裁缝": "seamstress",
+  "奶龙": "nailong",
+  "奸佞": "jianning",
+  "姑获鸟": "guhuoniao",
+  "孟婆": "mengpo",
+  "学徒": "apprentice",
+  "守夜人": "nightwatchman",
+  "守鸦人": "ravenkeeper",
+  "官员": "bureaucrat",
+  "宠妃": "chongfei",
+  "寡妇": "widow",
+  "将军": "general",
+  "小怪宝": "lil_monsta",
+  "小恶魔": "imp",
+  "小提琴手": "fiddler",
+  "小精灵": "pixie",
+  "屠夫": "butcher",
+  "巡察": "xuncha",
+  "巡山人": "huntsman",
+  "工程师": "engineer",
+  "巫师": "wizard",
+  "巫毒师": "voudon",
+  "帽匠": "hatter",
+  "店小二": "dianxiaoer",
+  "开心猴": "kaixinhou",
+  "异教徒": "pagan",
+  "异教领袖": "cult_leader",
+  "异端分子": "heretic",
+  "弄臣": "fool",
+  "引路人": "yinluren",
+  "强权上帝": "deus_ex_fiasco2",
+  "心上人": "sweetheart",
+  "怪咖": "deviant",
+  "恐惧之灵": "fearmonger",
+  "悟道者": "wudaozhe",
+  "戏子": "xizi",
+  "戏法师": "alsaahir",
+  "我是村规王": "bootlegger2",
+  "打更人": "dagengren",
+  "扼杀梦想家": "kill_dreamer",
+  "投毒者": "poisoner",
+  "报丧女妖": "banshee",
+  "掮客": "qianke",
+  "提刑官": "tixingguan",
+  "提线木偶": "marionette",
+  "摆渡人": "ferryman",
+  "政客": "politician",
+  "教授": "professor",
+  "教父": "godfather",
+  "数学家": "mathematician",
+  "方古": "fang_gu",
+  "方士": "fangshi",
+  "旅店老板": "innkeeper",
+  "无神论者": "atheist",
+  "普卡": "pukka",
+  "暴乱": "riot",
+  "暴君": "baojun",
+  "暴风捕手": "stormcatcher",
+  "替罪羊": "scapegoat",
+  "月之子": "moonchild",
+  "末日预言者": "doomsayer",
+  "杂技演员": "acrobat",
+  "杂耍艺人": "juggler",
+  "村夫": "village_idiot",
+  "枪手": "gunslinger",
+  "染坊坊主": "ranfangfangzhu",
+  "梼杌": "taowu",
+  "歌伶": "geling",
+  "殉教少女": "martyr",
+  "气球驾驶员": "balloonist",
+  "氪金梦想家": "gold_dreamer",
+  "水手": "sailor",
+  "沙巴洛斯": "shabaloth",
+  "法官": "judge",
+  "洗脑师": "cerenovus",
+  "洗衣妇": "washerwoman",
+  "活体病毒": "virilus",
+  "流莺": "harlot",
+  "涡流": "vortox",
+  "混沌": "hundun",
+  "渔夫": "fisherman",
+  "游歌者": "wandering_singer",
+  "灯神": "djinn",
+  "灵言师": "mezepheles",
+  "炸弹人": "boomdandy",
+  "炼金术士": "alchemist",
+  "煞星": "shaxing",
+  "熊孩子": "xionghaizi",
+  "牙噶巴卜": "yaggababble",
+  "狂热者": "zealot",
+  "狐媚娘": "humeiniang",
+  "狸猫": "limao",
+  "猎手": "slayer",
+  "玩偶": "wanou",
+  "玩具匠": "toymaker",
+  "珀": "po",
+  "理发师": "barber",
+  "男爵": "baron",
+  "画皮": "huapi",
+  "畸形秀演员": "mutant",
+  "疯子": "lunatic",
+  "痢蛭": "lleech",
+  "瘟疫医生": "plague_doctor",
+  "瘾君子": "drugster",
+  "白日梦想家": "day_dreamer",
+  "知府": "zhifu",
+  "祖母": "grandmother",
+  "神谕者": "oracle",
+  "禁卫军": "jinweijun",
+  "禁卫军Ⅱ": "jinweijun2",
+  "私货商人": "bootlegger",
+  "秉笔": "bingbi",
+  "科学怪人": "boffin",
+  "穷奇": "qiongqi",
+  "窃贼": "thief",
+  "笑匠": "cacklejack",
+  "筑梦师": "dreamer",
+  "管家": "butler",
+  "精神病患者": "psychopath",
+  "红唇女郎": "scarlet_woman",
+  "经销商": "trade_dealer",
+  "维齐尔": "vizier",
+  "罂粟种植者": "poppy_grower",
+  "美术馆长": "meishuguanzhang",
+  "舞蛇人": "snake_charmer",
+  "艺术家": "artist",
+  "茶艺师": "tea_lady",
+  "莽夫": "goon",
+  "落难少女": "damsel",
+  "蛊雕": "gudiao",
+  "街头风琴手": "organ_grinder",
+  "解谜大师": "puzzlemaster",
+  "诺-达鲺": "no_dashii",
+  "调查员": "investigator",
+  "贞洁者": "virgin",
+  "贤者": "sage",
+  "贵族": "noble",
+  "赌徒": "gambler",
+  "赏金猎人": "bounty_hunter",
+  "赶尸人": "ganshiren",
+  "送报童": "newspaper_boy",
+  "送葬者": "undertaker",
+  "逆臣": "nichen",
+  "造谣者": "gossip",
+  "道士": "daoshi",
+  "郎中": "langzhong",
+  "酒保": "jiubao",
+  "酒鬼": "drunk",
+  "酿酒师": "niangjiushi",
+  "钟表匠": "clockmaker",
+  "钦天监": "qintianjian",
+  "锦衣卫": "jinyiwei",
+  "镇长": "mayor",
+  "镜像双子": "evil_twin",
+  "间谍": "spy",
+  "阎罗": "yanluo",
+  "阴阳师": "yinyangshi",
+  "陌客": "recluse",
+  "限": "xaan",
+  "隐士": "hermit",
+  "集骨者": "bone_collector",
+  "雪人": "snowman",
+  "革命者": "revolutionary",
+  "风水师": "fengshuishi",
+  "食人族": "cannibal",
+  "食人魔": "ogre",
+  "饕餮": "taotie",
+  "驱魔人": "exorcist",
+  "驿使": "yishi",
+  "骑士": "knight",
+  "骗人精": "fibbin",
+  "魂归者": "risen",
+  "魔像": "golem",
+  "魔术师": "magician",
+  "魔鬼代言人": "devils_advocate",
+  "鸩": "zhen",
+  "鹰身女妖": "harpy",
+  "麒麟": "qilin",
+  "麻脸巫婆": "pit-hag",
+  "黄昏": "tor_loric",
+  "黑帮": "gangster",
+};
+
+export const EN_NAME_TO_ID: Record<string, string> = {
+  "Acrobat": "acrobat",
+  "Actor": "xizi",
+  "Al-Hadikhia": "alhadikhia",
+  "Alchemist": "alchemist",
+  "Alsaahir": "alsaahir",
+  "Amnesiac": "amnesiac",
+  "Angel": "angel",
+  "Apocalypse Caller": "apocalypse",
+  "Apprentice": "apprentice",
+  "Artisan": "yongjiang",
+  "Artist": "artist",
+  "Assassin": "assassin",
+  "Atheist": "atheist",
+  "Balloonist": "balloonist",
+  "Banshee": "banshee",
+  "Banxian": "banxian",
+  "Barber": "barber",
+  "Barista": "barista",
+  "Baron": "baron",
+  "Bartender": "jiubao",
+  "Beggar": "beggar",
+  "Big Onion": "onion",
+  "Big Wig": "bigwig_loric",
+  "Bishop": "bishop",
+  "Boffin": "boffin",
+  "Bone Collector": "bonecollector",
+  "Bookboy": "shutong",
+  "Boomdandy": "boomdandy",
+  "Bootlegger": "bootlegger",
+  "Bounty Hunter": "bountyhunter",
+  "Brewer": "niangjiushi",
+  "Brocadier": "jinyiwei",
+  "Broker": "qianke",
+  "Brush Holder": "bingbi",
+  "Buddhist": "buddhist",
+  "Bug Keeper": "yangguren",
+  "Bureaucrat": "bureaucrat",
+  "Butcher": "butcher",
+  "Butler": "butler",
+  "Cacklejack": "cacklejack",
+  "Cannibal": "cannibal",
+  "Cerenovus": "cerenovus",
+  "Chambermaid": "chambermaid",
+  "Chef": "chef",
+  "Choirboy": "choirboy",
+  "Clockmaker": "clockmaker",
+  "Contract Demon": "qimo",
+  "Corpse Walker": "ganshiren",
+  "Courtier": "courtier",
+  "Cult Leader": "cultleader",
+  "Damsel": "damsel",
+  "Daoshi": "daoshi",
+  "Day Dreamer": "day_dreamer",
+  "Deus Ex Fiasco": "deusexfiasco",
+  "Deus Ex Fiasco 2": "deus_ex_fiasco2",
+  "Deviant": "deviant",
+  "Devil's Advocate": "devilsadvocate",
+  "Disappointed": "disappointed",
+  "Diva": "geling",
+  "Djinn": "djinn",
+  "Doll": "wanou",
+  "Doomsayer": "doomsayer",
+  "Dreamer": "dreamer",
+  "Drugster": "drugster",
+  "Drunk": "drunk",
+  "Duchess": "duchess",
+  "Dyer": "ranfangfangzhu",
+  "Empath": "empath",
+  "Engineer": "engineer",
+  "Enlightened One": "wudaozhe",
+  "Envoy": "shijie",
+  "Evil Twin": "eviltwin",
+  "Exorcist": "exorcist",
+  "Fabled Charactor": "fabled_charactor",
+  "Face Changer": "bianlianshi",
+  "Fang Gu": "fanggu",
+  "Fangshi": "fangshi",
+  "Farmer": "farmer",
+  "Favored Consort": "chongfei",
+  "Fearmonger": "fearmonger",
+  "Fengshui Master": "fengshuishi",
+  "Ferryman": "ferryman",
+  "Fiddler": "fiddler",
+  "Firewatcher": "dagengren",
+  "Fisherman": "fisherman",
+  "Flowergirl": "flowergirl",
+  "Fool": "fool",
+  "Fortune Teller": "fortuneteller",
+  "Gambler": "gambler",
+  "Gangster": "gangster",
+  "Gardener": "gardener",
+  "General": "general",
+  "Genius": "genius",
+  "Gnome": "gnome",
+  "Goblin": "goblin",
+  "Godfather": "godfather",
+  "Gold Dreamer": "gold_dreamer",
+  "Golem": "golem",
+  "Goon": "goon",
+  "Gossip": "gossip",
+  "Grandmother": "grandmother",
+  "Gu Diao": "gudiao",
+  "Guhuo": "guhuoniao",
+  "Guide": "yinluren",
+  "Gunslinger": "gunslinger",
+  "Happy Monkey": "kaixinhou",
+  "Harlot": "harlot",
+  "Harpy": "harpy",
+  "Hatter": "hatter",
+  "Hell's Librarian": "hells_librarian",
+  "Herb Doctor": "langzhong",
+  "Heretic": "heretic",
+  "Hermit": "hermit",
+  "Heshang": "heshang",
+  "High Priestess": "highpriestess",
+  "Historian": "shiguan",
+  "Hu Meiniang": "humeiniang",
+  "Huapi": "huapi",
+  "Hundun": "hundun",
+  "Huntsman": "huntsman",
+  "Hydra": "jiutoushe",
+  "Imp": "imp",
+  "Imperialist": "jinweijun",
+  "Imperialist Ⅱ": "jinweijun2",
+  "Innkeeper": "innkeeper",
+  "Investigator": "investigator",
+  "Judge": "judge",
+  "Juggler": "juggler",
+  "Kazali": "kazali",
+  "Kill Dreamer": "kill_dreamer",
+  "King": "king",
+  "Klutz": "klutz",
+  "Knight": "knight",
+  "Legion": "legion",
+  "Leviathan": "leviathan",
+  "Li Mao": "limao",
+  "Librarian": "librarian",
+  "Lil' Monsta": "lilmonsta",
+  "Lleech": "lleech",
+  "Lord of Typhon": "lordoftyphon",
+  "Lost Dreamer": "lost_dreamer",
+  "Lunatic": "lunatic",
+  "Lycanthrope": "lycanthrope",
+  "Magician": "magician",
+  "Magistrate": "tixingguan",
+  "Marionette": "marionette",
+  "Martyr Girl": "martyr",
+  "Mastermind": "mastermind",
+  "Mathematician": "mathematician",
+  "Matron": "matron",
+  "Mayor": "mayor",
+  "Meng Po": "mengpo",
+  "Messenger": "yishi",
+  "Mezepheles": "mezepheles",
+  "Minstrel": "minstrel",
+  "Monk": "monk",
+  "Moonchild": "moonchild",
+  "Mortician": "rulianshi",
+  "Mr. Misfortune": "shaxing",
+  "Museum Curator": "meishuguanzhang",
+  "Mutant": "mutant",
+  "Nailong": "nailong",
+  "Newspaper Boy": "newspaper_boy",
+  "Nightwatchman": "nightwatchman",
+  "No Dashii": "nodashii",
+  "Noble": "noble",
+  "Nun": "nun",
+  "Ogre": "ogre",
+  "Ojo": "ojo",
+  "Oracle": "oracle",
+  "Organ Grinder": "organgrinder",
+  "Pacifist": "pacifist",
+  "Pagan": "pagan",
+  "Patrolman": "xuncha",
+  "Pauper": "jiaohuazi",
+  "Pedant": "shusheng",
+  "Philosopher": "philosopher",
+  "Pit-Hag": "pithag",
+  "Pixie": "pixie",
+  "Plague Doctor": "plaguedoctor",
+  "Po": "po",
+  "Poisoner": "poisoner",
+  "Politician": "politician",
+  "Poppy Grower": "poppygrower",
+  "Preacher": "preacher",
+  "Prefect": "zhifu",
+  "Princess": "princess",
+  "Professor": "professor",
+  "Psychopath": "psychopath",
+  "Pukka": "pukka",
+  "Pumpkin": "pumpkin",
+  "Puppeteer": "yanshi",
+  "Puzzlemaster": "puzzlemaster",
+  "Qilin": "qilin",
+  "Qiongqi": "qiongqi",
+  "Rascal": "xionghaizi",
+  "Ravenkeeper": "ravenkeeper",
+  "Recluse": "recluse",
+  "Revolutionary": "revolutionary",
+  "Riot": "riot",
+  "Risen": "risen",
+  "Sage": "sage",
+  "Sailor": "sailor",
+  "Saint": "saint",
+  "Savant": "savant",
+  "Scapegoat": "scapegoat",
+  "Scarlet Woman": "scarletwoman",
+  "Seamstress": "seamstress",
+  "Sentinel": "sentinel",
+  "Shabaloth": "shabaloth",
+  "Shugenja": "shugenja",
+  "Slayer": "slayer",
+  "Snake Charmer": "snakecharmer",
+  "Snitch": "snitch",
+  "Snowman": "snowman",
+  "Soldier": "soldier",
+  "Spirit of Ivory": "spirit_of_ivory",
+  "Spy": "spy",
+  "Stargazer": "qintianjian",
+  "Steward": "steward",
+  "Storm Catcher": "stormcatcher",
+  "Summoner": "summoner",
+  "Sweetheart": "sweetheart",
+  "Swordman": "daoke",
+  "Sycophant": "jianning",
+  "Taotie": "taotie",
+  "Taowu": "taowu",
+  "Tea Lady": "tealady",
+  "The Stubborn God": "zuiyingdeshangdi",
+  "Thief": "thief",
+  "Tinker": "tinker",
+  "Tor": "tor_loric",
+  "Town Crier": "towncrier",
+  "Toymaker": "toymaker",
+  "Trade Dealer": "trade_dealer",
+  "Turncoat": "nichen",
+  "Tyrant": "baojun",
+  "Undertaker": "undertaker",
+  "Vigormortis": "vigormortis",
+  "Village Idiot": "villageidiot",
+  "Village King": "bootlegger2",
+  "Virgin": "virgin",
+  "Virilus": "virilus",
+  "Vizier": "vizier",
+  "Vortox": "vortox",
+  "Voudon": "voudon",
+  "Waiter": "dianxiaoer",
+  "Wandering Singer": "wandering_singer",
+  "Warden": "dianyuzhang",
+  "Washerwoman": "washerwoman",
+  "Widow": "widow",
+  "Witch": "witch",
+  "Wizard": "wizard",
+  "Wraith": "wraith",
+  "Xaan": "xaan",
+  "Yaggababble": "yaggababble",
+  "Yanluo": "yanluo",
+  "Yin-Yang Diviner": "yinyangshi",
+  "Yuan": "yuan",
+  "Zealot": "zealot",
+  "Zhen": "zhen",
+  "Zombuul": "zombuul",
+  "fibbin": "fibbin",
+};
+
+export const NORMALIZED_ID_TO_ID: Record<string, string> = {
+  "acrobat": "acrobat",
+  "alchemist": "alchemist",
+  "alhadikhia": "alhadikhia",
+  "alsaahir": "alsaahir",
+  "amnesiac": "amnesiac",
+  "angel": "angel",
+  "apocalypse": "apocalypse",
+  "apprentice": "apprentice",
+  "artist": "artist",
+  "assassin": "assassin",
+  "atheist": "atheist",
+  "balloonist": "balloonist",
+  "banshee": "banshee",
+  "banxian": "banxian",
+  "baojun": "baojun",
+  "barber": "barber",
+  "barista": "barista",
+  "baron": "baron",
+  "beggar": "beggar",
+  "bianlianshi": "bianlianshi",
+  "bigwigloric": "bigwig_loric",
+  "bingbi": "bingbi",
+  "bishop": "bishop",
+  "boffin": "boffin",
+  "bonecollector": "bonecollector",
+  "boomdandy": "boomdandy",
+  "bootlegger": "bootlegger",
+  "bootlegger2": "bootlegger2",
+  "bootleggerloric": "bootlegger_loric",
+  "bountyhunter": "bountyhunter",
+  "buddhist": "buddhist",
+  "bureaucrat": "bureaucrat",
+  "butcher": "butcher",
+  "butler": "butler",
+  "cacklejack": "cacklejack",
+  "cannibal": "cannibal",
+  "cerenovus": "cerenovus",
+  "chambermaid": "chambermaid",
+  "chef": "chef",
+  "choirboy": "choirboy",
+  "chongfei": "chongfei",
+  "clockmaker": "clockmaker",
+  "courtier": "courtier",
+  "cultleader": "cultleader",
+  "dagengren": "dagengren",
+  "damsel": "damsel",
+  "daoke": "daoke",
+  "daoshi": "daoshi",
+  "daydreamer": "day_dreamer",
+  "deusexfiasco": "deusexfiasco",
+  "deusexfiasco2": "deus_ex_fiasco2",
+  "deviant": "deviant",
+  "devilsadvocate": "devilsadvocate",
+  "dianxiaoer": "dianxiaoer",
+  "dianyuzhang": "dianyuzhang",
+  "disappointed": "disappointed",
+  "djinn": "djinn",
+  "doomsayer": "doomsayer",
+  "dreamer": "dreamer",
+  "drugster": "drugster",
+  "drunk": "drunk",
+  "duchess": "duchess",
+  "empath": "empath",
+  "engineer": "engineer",
+  "eviltwin": "eviltwin",
+  "exorcist": "exorcist",
+  "fabledcharactor": "fabled_charactor",
+  "fanggu": "fanggu",
+  "fangshi": "fangshi",
+  "farmer": "farmer",
+  "fearmonger": "fearmonger",
+  "fengshuishi": "fengshuishi",
+  "ferryman": "ferryman",
+  "fibbin": "fibbin",
+  "fiddler": "fiddler",
+  "fisherman": "fisherman",
+  "flowergirl": "flowergirl",
+  "fool": "fool",
+  "fortuneteller": "fortuneteller",
+  "gambler": "gambler",
+  "gangster": "gangster",
+  "ganshiren": "ganshiren",
+  "gardener": "gardener",
+  "gardenerloric": "gardener_loric",
+  "geling": "geling",
+  "general": "general",
+  "genius": "genius",
+  "gnome": "gnome",
+  "goblin": "goblin",
+  "godfather": "godfather",
+  "golddreamer": "gold_dreamer",
+  "golem": "golem",
+  "goon": "goon",
+  "gossip": "gossip",
+  "grandmother": "grandmother",
+  "gudiao": "gudiao",
+  "guhuoniao": "guhuoniao",
+  "gunslinger": "gunslinger",
+  "harlot": "harlot",
+  "harpy": "harpy",
+  "hatter": "hatter",
+  "hellslibrarian": "hells_librarian",
+  "heretic": "heretic",
+  "hermit": "hermit",
+  "heshang": "heshang",
+  "highpriestess": "highpriestess",
+  "huapi": "huapi",
+  "humeiniang": "humeiniang",
+  "hundun": "hundun",
+  "huntsman": "huntsman",
+  "imp": "imp",
+  "innkeeper": "innkeeper",
+  "investigator": "investigator",
+  "jianning": "jianning",
+  "jiaohuazi": "jiaohuazi",
+  "jinweijun": "jinweijun",
+  "jinweijun2": "jinweijun2",
+  "jinyiwei": "jinyiwei",
+  "jiubao": "jiubao",
+  "jiutoushe": "jiutoushe",
+  "judge": "judge",
+  "juggler": "juggler",
+  "kaixinhou": "kaixinhou",
+  "kazali": "kazali",
+  "killdreamer": "kill_dreamer",
+  "king": "king",
+  "klutz": "klutz",
+  "knight": "knight",
+  "langzhong": "langzhong",
+  "legion": "legion",
+  "leviathan": "leviathan",
+  "librarian": "librarian",
+  "lilmonsta": "lilmonsta",
+  "limao": "limao",
+  "lleech": "lleech",
+  "lordoftyphon": "lordoftyphon",
+  "lostdreamer": "lost_dreamer",
+  "lunatic": "lunatic",
+  "lycanthrope": "lycanthrope",
+  "magician": "magician",
+  "marionette": "marionette",
+  "martyr": "martyr",
+  "mastermind": "mastermind",
+  "mathematician": "mathematician",
+  "matron": "matron",
+  "mayor": "mayor",
+  "meishuguanzhang": "meishuguanzhang",
+  "mengpo": "mengpo",
+  "mezepheles": "mezepheles",
+  "minstrel": "minstrel",
+  "monk": "monk",
+  "moonchild": "moonchild",
+  "mutant": "mutant",
+  "nailong": "nailong",
+  "newspaperboy": "newspaper_boy",
+  "niangjiushi": "niangjiushi",
+  "nichen": "nichen",
+  "nightwatchman": "nightwatchman",
+  "noble": "noble",
+  "nodashii": "nodashii",
+  "nun": "nun",
+  "ogre": "ogre",
+  "ojo": "ojo",
+  "onion": "onion",
+  "oracle": "oracle",
+  "organgrinder": "organgrinder",
+  "pacifist": "pacifist",
+  "pagan": "pagan",
+  "philosopher": "philosopher",
+  "pithag": "pithag",
+  "pixie": "pixie",
+  "plaguedoctor": "plaguedoctor",
+  "po": "po",
+  "poisoner": "poisoner",
+  "politician": "politician",
+  "poppygrower": "poppygrower",
+  "preacher": "preacher",
+  "princess": "princess",
+  "professor": "professor",
+  "psychopath": "psychopath",
+  "pukka": "pukka",
+  "pumpkin": "pumpkin",
+  "puzzlemaster": "puzzlemaster",
+  "qianke": "qianke",
+  "qilin": "qilin",
+  "qimo": "qimo",
+  "qintianjian": "qintianjian",
+  "qiongqi": "qiongqi",
+  "ranfangfangzhu": "ranfangfangzhu",
+  "ravenkeeper": "ravenkeeper",
+  "recluse": "recluse",
+  "revolutionary": "revolutionary",
+  "riot": "riot",
+  "risen": "risen",
+  "rulianshi": "rulianshi",
+  "sage": "sage",
+  "sailor": "sailor",
+  "saint": "saint",
+  "savant": "savant",
+  "scapegoat": "scapegoat",
+  "scarletwoman": "scarletwoman",
+  "seamstress": "seamstress",
+  "sentinel": "sentinel",
+  "shabaloth": "shabaloth",
+  "shaxing": "shaxing",
+  "shiguan": "shiguan",
+  "shijie": "shijie",
+  "shugenja": "shugenja",
+  "shusheng": "shusheng",
+  "shutong": "shutong",
+  "slayer": "slayer",
+  "snakecharmer": "snakecharmer",
+  "snitch": "snitch",
+  "snowman": "snowman",
+  "soldier": "soldier",
+  "spiritofivory": "spirit_of_ivory",
+  "spy": "spy",
+  "steward": "steward",
+  "stormcatcher": "stormcatcher",
+  "stormcatcherloric": "stormcatcher_loric",
+  "summoner": "summoner",
+  "sweetheart": "sweetheart",
+  "taotie": "taotie",
+  "taowu": "taowu",
+  "tealady": "tealady",
+  "thief": "thief",
+  "tinker": "tinker",
+  "tixingguan": "tixingguan",
+  "torloric": "tor_loric",
+  "towncrier": "towncrier",
+  "toymaker": "toymaker",
+  "tradedealer": "trade_dealer",
+  "undertaker": "undertaker",
+  "vigormortis": "vigormortis",
+  "villageidiot": "villageidiot",
+  "virgin": "virgin",
+  "virilus": "virilus",
+  "vizier": "vizier",
+  "vortox": "vortox",
+  "voudon": "voudon",
+  "wanderingsinger": "wandering_singer",
+  "wanou": "wanou",
+  "washerwoman": "washerwoman",
+  "widow": "widow",
+  "witch": "witch",
+  "wizard": "wizard",
+  "wraith": "wraith",
+  "wudaozhe": "wudaozhe",
+  "xaan": "xaan",
+  "xionghaizi": "xionghaizi",
+  "xizi": "xizi",
+  "xuncha": "xuncha",
+  "yaggababble": "yaggababble",
+  "yangguren": "yangguren",
+  "yanluo": "yanluo",
+  "yanshi": "yanshi",
+  "yinluren": "yinluren",
+  "yinyangshi": "yinyangshi",
+  "yishi": "yishi",
+  "yongjiang": "yongjiang",
+  "yuan": "yuan",
+  "zealot": "zealot",
+  "zhen": "zhen",
+  "zhifu": "zhifu",
+  "zombuul": "zombuul",
+  "zuiyingdeshangdi": "zuiyingdeshangdi",
+};
+
+export const CN_ID_TO_EN_ID: Record<string, string> = {
+  "acrobat": "acrobat",
+  "al-hadikhia": "alhadikhia",
+  "alchemist": "alchemist",
+  "alsaahir": "alsaahir",
+  "amnesiac": "amnesiac",
+  "angel": "angel",
+  "apocalypse": "apocalypse",
+  "apprentice": "apprentice",
+  "artist": "artist",
+  "assassin": "assassin",
+  "atheist": "atheist",
+  "balloonist": "balloonist",
+  "banshee": "banshee",
+  "banxian": "banxian",
+  "baojun": "baojun",
+  "barber": "barber",
+  "barista": "barista",
+  "baron": "baron",
+  "beggar": "beggar",
+  "bianlianshi": "bianlianshi",
+  "bigwig_loric": "bigwig_loric",
+  "bingbi": "bingbi",
+  "bishop": "bishop",
+  "boffin": "boffin",
+  "bone_collector": "bonecollector",
+  "boomdandy": "boomdandy",
+  "bootlegger": "bootlegger",
+  "bootlegger2": "bootlegger2",
+  "bootlegger_loric": "bootlegger_loric",
+  "bounty_hunter": "bountyhunter",
+  "buddhist": "buddhist",
+  "bureaucrat": "bureaucrat",
+  "butcher": "butcher",
+  "butler": "butler",
+  "cacklejack": "cacklejack",
+  "cannibal": "cannibal",
+  "cerenovus": "cerenovus",
+  "chambermaid": "chambermaid",
+  "chef": "chef",
+  "choirboy": "choirboy",
+  "chongfei": "chongfei",
+  "clockmaker": "clockmaker",
+  "courtier": "courtier",
+  "cult_leader": "cultleader",
+  "dagengren": "dagengren",
+  "damsel": "damsel",
+  "daoke": "daoke",
+  "daoshi": "daoshi",
+  "day_dreamer": "day_dreamer",
+  "deus_ex_fiasco2": "deus_ex_fiasco2",
+  "deusexfiasco": "deusexfiasco",
+  "deviant": "deviant",
+  "devils_advocate": "devilsadvocate",
+  "dianxiaoer": "dianxiaoer",
+  "dianyuzhang": "dianyuzhang",
+  "disappointed": "disappointed",
+  "djinn": "djinn",
+  "doomsayer": "doomsayer",
+  "dreamer": "dreamer",
+  "drugster": "drugster",
+  "drunk": "drunk",
+  "duchess": "duchess",
+  "empath": "empath",
+  "engineer": "engineer",
+  "evil_twin": "eviltwin",
+  "exorcist": "exorcist",
+  "fabled_charactor": "fabled_charactor",
+  "fang_gu": "fanggu",
+  "fangshi": "fangshi",
+  "farmer": "farmer",
+  "fearmonger": "fearmonger",
+  "fengshuishi": "fengshuishi",
+  "ferryman": "ferryman",
+  "fibbin": "fibbin",
+  "fiddler": "fiddler",
+  "fisherman": "fisherman",
+  "flowergirl": "flowergirl",
+  "fool": "fool",
+  "fortune_teller": "fortuneteller",
+  "gambler": "gambler",
+  "gangster": "gangster",
+  "ganshiren": "ganshiren",
+  "gardener": "gardener",
+  "gardener_loric": "gardener_loric",
+  "geling": "geling",
+  "general": "general",
+  "genius": "genius",
+  "gnome": "gnome",
+  "goblin": "goblin",
+  "godfather": "godfather",
+  "gold_dreamer": "gold_dreamer",
+  "golem": "golem",
+  "goon": "goon",
+  "gossip": "gossip",
+  "grandmother": "grandmother",
+  "gudiao": "gudiao",
+  "guhuoniao": "guhuoniao",
+  "gunslinger": "gunslinger",
+  "harlot": "harlot",
+  "harpy": "harpy",
+  "hatter": "hatter",
+  "hells_librarian": "hells_librarian",
+  "heretic": "heretic",
+  "hermit": "hermit",
+  "heshang": "heshang",
+  "high_priestess": "highpriestess",
+  "huapi": "huapi",
+  "humeiniang": "humeiniang",
+  "hundun": "hundun",
+  "huntsman": "huntsman",
+  "imp": "imp",
+  "innkeeper": "innkeeper",
+  "investigator": "investigator",
+  "jianning": "jianning",
+  "jiaohuazi": "jiaohuazi",
+  "jinweijun": "jinweijun",
+  "jinweijun2": "jinweijun2",
+  "jinyiwei": "jinyiwei",
+  "jiubao": "jiubao",
+  "jiutoushe": "jiutoushe",
+  "judge": "judge",
+  "juggler": "juggler",
+  "kaixinhou": "kaixinhou",
+  "kazali": "kazali",
+  "kill_dreamer": "kill_dreamer",
+  "king": "king",
+  "klutz": "klutz",
+  "knight": "knight",
+  "langzhong": "langzhong",
+  "legion": "legion",
+  "leviathan": "leviathan",
+  "librarian": "librarian",
+  "lil_monsta": "lilmonsta",
+  "limao": "limao",
+  "lleech": "lleech",
+  "lord_of_typhon": "lordoftyphon",
+  "lost_dreamer": "lost_dreamer",
+  "lunatic": "lunatic",
+  "lycanthrope": "lycanthrope",
+  "magician": "magician",
+  "marionette": "marionette",
+  "martyr": "martyr",
+  "mastermind": "mastermind",
+  "mathematician": "mathematician",
+  "matron": "matron",
+  "mayor": "mayor",
+  "meishuguanzhang": "meishuguanzhang",
+  "mengpo": "mengpo",
+  "mezepheles": "mezepheles",
+  "minstrel": "minstrel",
+  "monk": "monk",
+  "moonchild": "moonchild",
+  "mutant": "mutant",
+  "nailong": "nailong",
+  "newspaper_boy": "newspaper_boy",
+  "niangjiushi": "niangjiushi",
+  "nichen": "nichen",
+  "nightwatchman": "nightwatchman",
+  "no_dashii": "nodashii",
+  "noble": "noble",
+  "nun": "nun",
+  "ogre": "ogre",
+  "ojo": "ojo",
+  "onion": "onion",
+  "oracle": "oracle",
+  "organ_grinder": "organgrinder",
+  "pacifist": "pacifist",
+  "pagan": "pagan",
+  "philosopher": "philosopher",
+  "pit-hag": "pithag",
+  "pixie": "pixie",
+  "plague_doctor": "plaguedoctor",
+  "po": "po",
+  "poisoner": "poisoner",
+  "politician": "politician",
+  "poppy_grower": "poppygrower",
+  "preacher": "preacher",
+  "princess": "princess",
+  "professor": "professor",
+  "psychopath": "psychopath",
+  "pukka": "pukka",
+  "pumpkin": "pumpkin",
+  "puzzlemaster": "puzzlemaster",
+  "qianke": "qianke",
+  "qilin": "qilin",
+  "qimo": "qimo",
+  "qintianjian": "qintianjian",
+  "qiongqi": "qiongqi",
+  "ranfangfangzhu": "ranfangfangzhu",
+  "ravenkeeper": "ravenkeeper",
+  "recluse": "recluse",
+  "revolutionary": "revolutionary",
+  "riot": "riot",
+  "risen": "risen",
+  "rulianshi": "rulianshi",
+  "sage": "sage",
+  "sailor": "sailor",
+  "saint": "saint",
+  "savant": "savant",
+  "scapegoat": "scapegoat",
+  "scarlet_woman": "scarletwoman",
+  "seamstress": "seamstress",
+  "sentinel": "sentinel",
+  "shabaloth": "shabaloth",
+  "shaxing": "shaxing",
+  "shiguan": "shiguan",
+  "shijie": "shijie",
+  "shugenja": "shugenja",
+  "shusheng": "shusheng",
+  "shutong": "shutong",
+  "slayer": "slayer",
+  "snake_charmer": "snakecharmer",
+  "snitch": "snitch",
+  "snowman": "snowman",
+  "soldier": "soldier",
+  "spirit_of_ivory": "spirit_of_ivory",
+  "spy": "spy",
+  "steward": "steward",
+  "stormcatcher": "stormcatcher",
+  "stormcatcher_loric": "stormcatcher_loric",
+  "summoner": "summoner",
+  "sweetheart": "sweetheart",
+  "taotie": "taotie",
+  "taowu": "taowu",
+  "tea_lady": "tealady",
+  "thief": "thief",
+  "tinker": "tinker",
+  "tixingguan": "tixingguan",
+  "tor_loric": "tor_loric",
+  "town_crier": "towncrier",
+  "toymaker": "toymaker",
+  "trade_dealer": "trade_dealer",
+  "undertaker": "undertaker",
+  "vigormortis": "vigormortis",
+  "village_idiot": "villageidiot",
+  "virgin": "virgin",
+  "virilus": "virilus",
+  "vizier": "vizier",
+  "vortox": "vortox",
+  "voudon": "voudon",
+  "wandering_singer": "wandering_singer",
+  "wanou": "wanou",
+  "washerwoman": "washerwoman",
+  "widow": "widow",
+  "witch": "witch",
+  "wizard": "wizard",
+  "wraith": "wraith",
+  "wudaozhe": "wudaozhe",
+  "xaan": "xaan",
+  "xionghaizi": "xionghaizi",
+  "xizi": "xizi",
+  "xuncha": "xuncha",
+  "yaggababble": "yaggababble",
+  "yangguren": "yangguren",
+  "yanluo": "yanluo",
+  "yanshi": "yanshi",
+  "yinluren": "yinluren",
+  "yinyangshi": "yinyangshi",
+  "yishi": "yishi",
+  "yongjiang": "yongjiang",
+  "yuan": "yuan",
+  "zealot": "zealot",
+  "zhen": "zhen",
+  "zhifu": "zhifu",
+  "zombuul": "zombuul",
+  "zuiyingdeshangdi": "zuiyingdeshangdi",
+};
+
+export const EN_ID_TO_CN_ID: Record<string, string> = {
+  "acrobat": "acrobat",
+  "alchemist": "alchemist",
+  "alhadikhia": "al-hadikhia",
+  "alsaahir": "alsaahir",
+  "amnesiac": "amnesiac",
+  "angel": "angel",
+  "apocalypse": "apocalypse",
+  "apprentice": "apprentice",
+  "artist": "artist",
+  "assassin": "assassin",
+  "atheist": "atheist",
+  "balloonist": "balloonist",
+  "banshee": "banshee",
+  "banxian": "banxian",
+  "baojun": "baojun",
+  "barber": "barber",
+  "barista": "barista",
+  "baron": "baron",
+  "beggar": "beggar",
+  "bianlianshi": "bianlianshi",
+  "bigwig_loric": "bigwig_loric",
+  "bingbi": "bingbi",
+  "bishop": "bishop",
+  "boffin": "boffin",
+  "bonecollector": "bone_collector",
+  "boomdandy": "boomdandy",
+  "bootlegger": "bootlegger",
+  "bootlegger2": "bootlegger2",
+  "bootlegger_loric": "bootlegger_loric",
+  "bountyhunter": "bounty_hunter",
+  "buddhist": "buddhist",
+  "bureaucrat": "bureaucrat",
+  "butcher": "butcher",
+  "butler": "butler",
+  "cacklejack": "cacklejack",
+  "cannibal": "cannibal",
+  "cerenovus": "cerenovus",
+  "chambermaid": "chambermaid",
+  "chef": "chef",
+  "choirboy": "choirboy",
+  "chongfei": "chongfei",
+  "clockmaker": "clockmaker",
+  "courtier": "courtier",
+  "cultleader": "cult_leader",
+  "dagengren": "dagengren",
+  "damsel": "damsel",
+  "daoke": "daoke",
+  "daoshi": "daoshi",
+  "day_dreamer": "day_dreamer",
+  "deus_ex_fiasco2": "deus_ex_fiasco2",
+  "deusexfiasco": "deusexfiasco",
+  "deviant": "deviant",
+  "devilsadvocate": "devils_advocate",
+  "dianxiaoer": "dianxiaoer",
+  "dianyuzhang": "dianyuzhang",
+  "disappointed": "disappointed",
+  "djinn": "djinn",
+  "doomsayer": "doomsayer",
+  "dreamer": "dreamer",
+  "drugster": "drugster",
+  "drunk": "drunk",
+  "duchess": "duchess",
+  "empath": "empath",
+  "engineer": "engineer",
+  "eviltwin": "evil_twin",
+  "exorcist": "exorcist",
+  "fabled_charactor": "fabled_charactor",
+  "fanggu": "fang_gu",
+  "fangshi": "fangshi",
+  "farmer": "farmer",
+  "fearmonger": "fearmonger",
+  "fengshuishi": "fengshuishi",
+  "ferryman": "ferryman",
+  "fibbin": "fibbin",
+  "fiddler": "fiddler",
+  "fisherman": "fisherman",
+  "flowergirl": "flowergirl",
+  "fool": "fool",
+  "fortuneteller": "fortune_teller",
+  "gambler": "gambler",
+  "gangster": "gangster",
+  "ganshiren": "ganshiren",
+  "gardener": "gardener",
+  "gardener_loric": "gardener_loric",
+  "geling": "geling",
+  "general": "general",
+  "genius": "genius",
+  "gnome": "gnome",
+  "goblin": "goblin",
+  "godfather": "godfather",
+  "gold_dreamer": "gold_dreamer",
+  "golem": "golem",
+  "goon": "goon",
+  "gossip": "gossip",
+  "grandmother": "grandmother",
+  "gudiao": "gudiao",
+  "guhuoniao": "guhuoniao",
+  "gunslinger": "gunslinger",
+  "harlot": "harlot",
+  "harpy": "harpy",
+  "hatter": "hatter",
+  "hells_librarian": "hells_librarian",
+  "heretic": "heretic",
+  "hermit": "hermit",
+  "heshang": "heshang",
+  "highpriestess": "high_priestess",
+  "huapi": "huapi",
+  "humeiniang": "humeiniang",
+  "hundun": "hundun",
+  "huntsman": "huntsman",
+  "imp": "imp",
+  "innkeeper": "innkeeper",
+  "investigator": "investigator",
+  "jianning": "jianning",
+  "jiaohuazi": "jiaohuazi",
+  "jinweijun": "jinweijun",
+  "jinweijun2": "jinweijun2",
+  "jinyiwei": "jinyiwei",
+  "jiubao": "jiubao",
+  "jiutoushe": "jiutoushe",
+  "judge": "judge",
+  "juggler": "juggler",
+  "kaixinhou": "kaixinhou",
+  "kazali": "kazali",
+  "kill_dreamer": "kill_dreamer",
+  "king": "king",
+  "klutz": "klutz",
+  "knight": "knight",
+  "langzhong": "langzhong",
+  "legion": "legion",
+  "leviathan": "leviathan",
+  "librarian": "librarian",
+  "lilmonsta": "lil_monsta",
+  "limao": "limao",
+  "lleech": "lleech",
+  "lordoftyphon": "lord_of_typhon",
+  "lost_dreamer": "lost_dreamer",
+  "lunatic": "lunatic",
+  "lycanthrope": "lycanthrope",
+  "magician": "magician",
+  "marionette": "marionette",
+  "martyr": "martyr",
+  "mastermind": "mastermind",
+  "mathematician": "mathematician",
+  "matron": "matron",
+  "mayor": "mayor",
+  "meishuguanzhang": "meishuguanzhang",
+  "mengpo": "mengpo",
+  "mezepheles": "mezepheles",
+  "minstrel": "minstrel",
+  "monk": "monk",
+  "moonchild": "moonchild",
+  "mutant": "mutant",
+  "nailong": "nailong",
+  "newspaper_boy": "newspaper_boy",
+  "niangjiushi": "niangjiushi",
+  "nichen": "nichen",
+  "nightwatchman": "nightwatchman",
+  "noble": "noble",
+  "nodashii": "no_dashii",
+  "nun": "nun",
+  "ogre": "ogre",
+  "ojo": "ojo",
+  "onion": "onion",
+  "oracle": "oracle",
+  "organgrinder": "organ_grinder",
+  "pacifist": "pacifist",
+  "pagan": "pagan",
+  "philosopher": "philosopher",
+  "pithag": "pit-hag",
+  "pixie": "pixie",
+  "plaguedoctor": "plague_doctor",
+  "po": "po",
+  "poisoner": "poisoner",
+  "politician": "politician",
+  "poppygrower": "poppy_grower",
+  "preacher": "preacher",
+  "princess": "princess",
+  "professor": "professor",
+  "psychopath": "psychopath",
+  "pukka": "pukka",
+  "pumpkin": "pumpkin",
+  "puzzlemaster": "puzzlemaster",
+  "qianke": "qianke",
+  "qilin": "qilin",
+  "qimo": "qimo",
+  "qintianjian": "qintianjian",
+  "qiongqi": "qiongqi",
+  "ranfangfangzhu": "ranfangfangzhu",
+  "ravenkeeper": "ravenkeeper",
+  "recluse": "recluse",
+  "revolutionary": "revolutionary",
+  "riot": "riot",
+  "risen": "risen",
+  "rulianshi": "rulianshi",
+  "sage": "sage",
+  "sailor": "sailor",
+  "saint": "saint",
+  "savant": "savant",
+  "scapegoat": "scapegoat",
+  "scarletwoman": "scarlet_woman",
+  "seamstress": "seamstress",
+  "sentinel": "sentinel",
+  "shabaloth": "shabaloth",
+  "shaxing": "shaxing",
+  "shiguan": "shiguan",
+  "shijie": "shijie",
+  "shugenja": "shugenja",
+  "shusheng": "shusheng",
+  "shutong": "shutong",
+  "slayer": "slayer",
+  "snakecharmer": "snake_charmer",
+  "snitch": "snitch",
+  "snowman": "snowman",
+  "soldier": "soldier",
+  "spirit_of_ivory": "spirit_of_ivory",
+  "spy": "spy",
+  "steward": "steward",
+  "stormcatcher": "stormcatcher",
+  "stormcatcher_loric": "stormcatcher_loric",
+  "summoner": "summoner",
+  "sweetheart": "sweetheart",
+  "taotie": "taotie",
+  "taowu": "taowu",
+  "tealady": "tea_lady",
+  "thief": "thief",
+  "tinker": "tinker",
+  "tixingguan": "tixingguan",
+  "tor_loric": "tor_loric",
+  "towncrier": "town_crier",
+  "toymaker": "toymaker",
+  "trade_dealer": "trade_dealer",
+  "undertaker": "undertaker",
+  "vigormortis": "vigormortis",
+  "villageidiot": "village_idiot",
+  "virgin": "virgin",
+  "virilus": "virilus",
+  "vizier": "vizier",
+  "vortox": "vortox",
+  "voudon": "voudon",
+  "wandering_singer": "wandering_singer",
+  "wanou": "wanou",
+  "washerwoman": "washerwoman",
+  "widow": "widow",
+  "witch": "witch",
+  "wizard": "wizard",
+  "wraith": "wraith",
+  "wudaozhe": "wudaozhe",
+  "xaan": "xaan",
+  "xionghaizi": "xionghaizi",
+  "xizi": "xizi",
+  "xuncha": "xuncha",
+  "yaggababble": "yaggababble",
+  "yangguren": "yangguren",
+  "yanluo": "yanluo",
+  "yanshi": "yanshi",
+  "yinluren": "yinluren",
+  "yinyangshi": "yinyangshi",
+  "yishi": "yishi",
+  "yongjiang": "yongjiang",
+  "yuan": "yuan",
+  "zealot": "zealot",
+  "zhen": "zhen",
+  "zhifu": "zhifu",
+  "zombuul": "zombuul",
+  "zuiyingdeshangdi": "zuiyingdeshangdi",
+};
+
+export const PINYIN_TO_ID: Record<string, string> = {
+  "aohe": "ojo",
+  "baiduren": "ferryman",
+  "banshouren": "lycanthrope",
+  "banxian": "banxian",
+  "baofengbushou": "stormcatcher",
+  "baojun": "baojun",
+  "baoluan": "riot",
+  "baosangnvyao": "banshee",
+  "bianlianshi": "bianlianshi",
+  "bingbi": "bingbi",
+  "boxuezhe": "savant",
+  "changshananhai": "choirboy",
+  "chayishi": "tea_lady",
+  "chengzhengonggaoyuan": "town_crier",
+  "chongfei": "chongfei",
+  "chuanjiaoshi": "preacher",
+  "chuanqijiaose": "fabled_charactor",
+  "chushi": "chef",
+  "cike": "assassin",
+  "cunfu": "village_idiot",
+  "daconghua": "onion",
+  "dagengren": "dagengren",
+  "daigua": "klutz",
+  "daoke": "daoke",
+  "daoshi": "daoshi",
+  "dengshen": "djinn",
+  "diachayuan": "investigator",
+  "dianxiaoer": "dianxiaoer",
+  "dianyuzhang": "dianyuzhang",
+  "difengzhishou": "lord_of_typhon",
+  "dutu": "gambler",
+  "faguan": "judge",
+  "fanggu": "fang_gu",
+  "fangshi": "fangshi",
+  "fengshuishi": "fengshuishi",
+  "fengzi": "lunatic",
+  "fotuo": "buddhist",
+  "ganshiren": "ganshiren",
+  "gaomizhe": "snitch",
+  "gebulin": "goblin",
+  "geling": "geling",
+  "gemingzhe": "revolutionary",
+  "gongchengshi": "engineer",
+  "gongkefuren": "duchess",
+  "gongqingzhe": "empath",
+  "gongzhu": "princess",
+  "guafu": "widow",
+  "guaika": "deviant",
+  "guanjia": "butler",
+  "guanyuan": "bureaucrat",
+  "gudiao": "gudiao",
+  "guhuoniao": "guhuoniao",
+  "guizu": "noble",
+  "guowang": "king",
+  "hadijiya": "al-hadikhia",
+  "heibang": "gangster",
+  "hepingzhuyizhe": "pacifist",
+  "heshang": "heshang",
+  "hongchunnvlang": "scarlet_woman",
+  "huapi": "huapi",
+  "humeiniang": "humeiniang",
+  "hundun": "hundun",
+  "jiandie": "spy",
+  "jiangbu": "zombuul",
+  "jiangjun": "general",
+  "jianning": "jianning",
+  "jiaofu": "godfather",
+  "jiaohuazi": "jiaohuazi",
+  "jiaoshou": "professor",
+  "jiemidashi": "puzzlemaster",
+  "jietoufengqinshou": "organ_grinder",
+  "jiguzhe": "bone_collector",
+  "jingshenbinghuanzhe": "psychopath",
+  "jingxiangshuangzi": "evil_twin",
+  "jinweijun": "jinweijun",
+  "jinyiwei": "jinyiwei",
+  "jiubao": "jiubao",
+  "jiugui": "drunk",
+  "jixingxiuyanyuan": "mutant",
+  "juntuan": "legion",
+  "kafeishi": "barista",
+  "kazhali": "kazali",
+  "kexueguairen": "boffin",
+  "kongjuzhiling": "fearmonger",
+  "kuangrezhe": "zealot",
+  "langzhong": "langzhong",
+  "lianjinshushi": "alchemist",
+  "lieshou": "slayer",
+  "lifashi": "barber",
+  "limao": "limao",
+  "lingyanshi": "mezepheles",
+  "liuying": "harlot",
+  "liweitan": "leviathan",
+  "lizhi": "lleech",
+  "luonanshaonv": "damsel",
+  "lvdianlaoban": "innkeeper",
+  "maihuanvhai": "flowergirl",
+  "malianwupo": "pit-hag",
+  "mangfu": "goon",
+  "maojiang": "hatter",
+  "mengpo": "mengpo",
+  "moguidaiyanren": "devils_advocate",
+  "moke": "recluse",
+  "moshushi": "magician",
+  "moxiang": "golem",
+  "nanjue": "baron",
+  "niangjiushi": "niangjiushi",
+  "nichen": "nichen",
+  "nongchen": "fool",
+  "nongfu": "farmer",
+  "nuodashi": "no_dashii",
+  "nvcaifeng": "seamstress",
+  "nvjisi": "high_priestess",
+  "nvshejian": "matron",
+  "nvwu": "witch",
+  "pianrenjing": "fibbin",
+  "po": "po",
+  "puka": "pukka",
+  "qiangquanshangdi": "deus_ex_fiasco2",
+  "qiangshou": "gunslinger",
+  "qianke": "qianke",
+  "qiezei": "thief",
+  "qigai": "beggar",
+  "qilin": "qilin",
+  "qintianjian": "qintianjian",
+  "qiongqi": "qiongqi",
+  "qiqiujiashiyuan": "balloonist",
+  "qishi": "knight",
+  "qumoren": "exorcist",
+  "ranfangfangzhu": "ranfangfangzhu",
+  "rulianshi": "rulianshi",
+  "senglv": "monk",
+  "shabaluosi": "shabaloth",
+  "shangjinlieren": "bounty_hunter",
+  "shaobing": "sentinel",
+  "shaxing": "shaxing",
+  "shengjizhihun": "spirit_of_ivory",
+  "shengtu": "saint",
+  "shenyuzhe": "oracle",
+  "shibaideshangdi": "deusexfiasco",
+  "shibing": "soldier",
+  "shichen": "courtier",
+  "shiguan": "shiguan",
+  "shijie": "shijie",
+  "shinv": "chambermaid",
+  "shirenmo": "ogre",
+  "shirenzu": "cannibal",
+  "shiwuguan": "steward",
+  "shiyizhe": "amnesiac",
+  "shouyaren": "ravenkeeper",
+  "shouyeren": "nightwatchman",
+  "shuishou": "sailor",
+  "shusheng": "shusheng",
+  "shutong": "shutong",
+  "shuxuejia": "mathematician",
+  "songzangzhe": "undertaker",
+  "taotie": "taotie",
+  "taowu": "taowu",
+  "tianshi": "angel",
+  "tixianmuou": "marionette",
+  "tixingguan": "tixingguan",
+  "tizuiyang": "scapegoat",
+  "touduzhe": "poisoner",
+  "tufu": "butcher",
+  "tushugualiyuan": "librarian",
+  "wanggumo": "vigormortis",
+  "wanghun": "wraith",
+  "wanjujiang": "toymaker",
+  "weiqier": "vizier",
+  "wenyiyisheng": "plague_doctor",
+  "woliu": "vortox",
+  "woshicunguiwang": "bootlegger2",
+  "wudaozhe": "wudaozhe",
+  "wudushi": "voudon",
+  "wushenlunzhe": "atheist",
+  "wusheren": "snake_charmer",
+  "wushi": "wizard",
+  "xian": "xaan",
+  "xianzhe": "sage",
+  "xiaoemo": "imp",
+  "xiaoguaibao": "lil_monsta",
+  "xiaojiang": "cacklejack",
+  "xiaojingling": "pixie",
+  "xiaotiqinshou": "fiddler",
+  "xifashi": "alsaahir",
+  "xinaoshi": "cerenovus",
+  "xinshangren": "sweetheart",
+  "xionghaizi": "xionghaizi",
+  "xiubujiang": "tinker",
+  "xiuxingzhe": "shugenja",
+  "xiyifu": "washerwoman",
+  "xizi": "xizi",
+  "xuetu": "apprentice",
+  "xuncha": "xuncha",
+  "xunshanren": "huntsman",
+  "yagababu": "yaggababble",
+  "yangguren": "yangguren",
+  "yanluo": "yanluo",
+  "yanshi": "yanshi",
+  "yiduanfenzi": "heretic",
+  "yijiaolingxiu": "cult_leader",
+  "yingshennvyao": "harpy",
+  "yingsuzhongzhizhe": "poppy_grower",
+  "yinluren": "yinluren",
+  "yinshi": "hermit",
+  "yinyangshi": "yinyangshi",
+  "yinyoushiren": "minstrel",
+  "yishi": "yishi",
+  "yishujia": "artist",
+  "yongjiang": "yongjiang",
+  "yuanding": "gardener",
+  "yuezhizi": "moonchild",
+  "yufu": "fisherman",
+  "zajiyanyuan": "acrobat",
+  "zaoyaozhe": "gossip",
+  "zashuayiren": "juggler",
+  "zhadanren": "boomdandy",
+  "zhanbuishi": "fortune_teller",
+  "zhaohuanshi": "summoner",
+  "zhen": "zhen",
+  "zhengke": "politician",
+  "zhenjiezhe": "virgin",
+  "zhenzhang": "mayor",
+  "zhexuejia": "philosopher",
+  "zhifu": "zhifu",
+  "zhongbiaojiang": "clockmaker",
+  "zhujiao": "bishop",
+  "zhumengshi": "dreamer",
+  "zhumou": "mastermind",
+  "zhuru": "gnome",
+  "zuiyingdeshangdi": "zuiyingdeshangdi",
+  "zumu": "grandmother",
+};
@@ -255,6 +255,9 @@ const jinx = {
 
 // 英文相克关系数据 - 从 jinxEn.json 导入
 import jinxEnData from './jinxEn.json';
+import { JINX_PAIRS } from './jinxIndex';
+import { ZH_NAME_TO_ID, NORMALIZED_ID_TO_ID } from './characterLookup';
+import { normalizeCharacterId } from './characterIdMapping';
 
 // 构建英文相克数据结构
 const jinxEn: Record<string, Record<string, string>> = {};
@@ -289,3 +292,40 @@ export function getJinx(charA: string, charB: string, language: 'zh-CN' | 'en' =
   }
   return '';
 }
+
+// 预编译的相克索引（python/jinx_index.py）：规范 id -> [相邻规范 id, JINX_PAIRS 下标][]
+const JINX_ADJACENCY = new Map<string, [string, number][]>();
+JINX_PAIRS.forEach(([a, b], index) => {
+  if (!JINX_ADJACENCY.has(a)) JINX_ADJACENCY.set(a, []);
+  if (!JINX_ADJACENCY.has(b)) JINX_ADJACENCY.set(b, []);
+  JINX_ADJACENCY.get(a)!.push([b, index]);
+  JINX_ADJACENCY.get(b)!.push([a, index]);
+});
+
+// 角色在相克索引中的 id：中文模式按角色名（与 JINX_DATA 的键一致），英文模式按官方 id
+export function getJinxKey(id: string, name: string, language: 'zh-CN' | 'en' = 'zh-CN'): string {
+  if (language === 'en') {
+    const enId = normalizeCharacterId(id, 'en');
+    if (JINX_ADJACENCY.has(enId)) return enId;
+    return NORMALIZED_ID_TO_ID[enId.replace(/[_-]/g, '').toLowerCase()] ?? enId;
+  }
+  const cnId = ZH_NAME_TO_ID[name];
+  // 角色库中没有的名字（如改版角色）在索引中以 "zh:<名字>" 保留
+  return cnId ? normalizeCharacterId(cnId, 'en') : `zh:${name}`;
+}
+
+// 返回 keys 之间触发的官方相克 [keyA, keyB, 原因]；只遍历各角色的邻接边，不做两两比较
+export function findJinxes(keys: Iterable<string>, language: 'zh-CN' | 'en' = 'zh-CN'): [string, string, string][] {
+  const present = new Set(keys);
+  const column = language === 'en' ? 3 : 2;
+  const result: [string, string, string][] = [];
+  present.forEach(a => {
+    JINX_ADJACENCY.get(a)?.forEach(([b, index]) => {
+      const reason = JINX_PAIRS[index][column];
+      if (a < b && reason && present.has(b)) {
+        result.push([a, b, reason]);
+      }
+    });
+  });
+  return result;
+}
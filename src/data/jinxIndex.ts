@@ -0,0 +1,189 @@
+// 此文件由 python/jinx_index.py 自动生成，请勿手动修改。
+// jinx.ts / jinxEn.json 变化后运行：python ./python/jinx_index.py
+
+// [规范 id A, 规范 id B, 中文原因, 英文原因]，A < B
+export const JINX_PAIRS: readonly (readonly [string, string, string, string])[] = [
+  ["alchemist", "boffin", "如果炼金术士拥有科学怪人的能力，炼金术士不会得知恶魔因此获得了哪个角色的能力。", "If the Alchemist has the Boffin ability, the Alchemist does not learn what ability the Demon has."],
+  ["alchemist", "marionette", "", "An Alchemist-Marionette has no Marionette ability & the Marionette is in play."],
+  ["alchemist", "mastermind", "", "An Alchemist-Mastermind has no Mastermind ability & the Mastermind is not-in-play."],
+  ["alchemist", "organgrinder", "", "If the Alchemist has the Organ Grinder ability, the Organ Grinder is in play & if both the Alchemist and Organ Grinder are sober, both are drunk."],
+  ["alchemist", "spy", "如果炼金术士获得了间谍的能力，他无法查看魔典，并且间谍不能被当作善良阵营、镇民角色或外来者角色。", "If the Alchemist has the Spy ability, they do not, and a Spy is in play. Each day, after the execution phase, the living Alchemist may publicly guess a living player as the Spy. If correct, the Demon must choose the Spy tonight."],
+  ["alchemist", "summoner", "如果炼金术士获得了召唤师的能力，游戏会以初始有恶魔在场进行。炼金术士召唤师选择的玩家会变成恶魔但不会改变阵营。", "The Alchemist-Summoner does not get bluffs, and chooses which Demon but not which player. If they die before this happens, evil wins. [No Demon]"],
+  ["alchemist", "widow", "如果炼金术士获得了寡妇的能力，他无法查看魔典。", "If the Alchemist has the Widow ability, they do not, and a Widow is in play. Each day, after the execution phase, the living Alchemist may publicly guess a living player as the Widow. If correct, the Demon must choose the Widow tonight."],
+  ["alchemist", "wraith", "", "If the Alchemist has the Wraith ability, they do not, and a Wraith is in play. Each day, after the execution phase, the living Alchemist may publicly guess a living player as the Wraith: if correct, the Demon must choose the Wraith tonight."],
+  ["alhadikhia", "mastermind", "如果哈迪寂亚死于处决，且主谋存活，当晚哈迪寂亚要选择三名善良玩家：如果他们都选择存活，邪恶阵营获胜。否则，善良阵营获胜。", "If the Al-Hadikhia dies by execution, and the Mastermind is alive, the Al-Hadikhia chooses 3 good players tonight: if all 3 choose to live, evil wins. Otherwise, good wins."],
+  ["alhadikhia", "princess", "如果公主在首个白天提名并处决了一名玩家，没有人会因为哈迪寂亚的能力而死亡。(公主与哈迪寂亚角色互动结果本应如此，此条仅做说明)", "If the Princess nominated & executed a player on their 1st day, no one dies to the Al-Hadikhia ability tonight."],
+  ["alhadikhia", "rulianshi", "如果出现两名存活的哈迪寂亚，则入殓师变成的哈迪寂亚会变回入殓师，但阵营保持邪恶。", "If there are two living Al-Hadikhias, the Rulianshi who became Al-Hadikhia turns back into the Rulianshi, but remains evil."],
+  ["alhadikhia", "scarletwoman", "如果出现两名存活的哈迪寂亚，则红唇女郎变成的哈迪寂亚会变回红唇女郎。", "If there are two living Al-Hadikhias, the Scarlet Woman Al-Hadikhia becomes the Scarlet Woman again."],
+  ["alsaahir", "vizier", "如果维齐尔在场，戏法师在进行猜测时还需要猜测恶魔的具体角色。", "If the Vizier is in play, the Alsaahir must also guess which Demon(s) are in play."],
+  ["atheist", "zh:戏子（改）", "无神论者在剧本中时，处决说书人导致的胜负结果不会被反转，无神论者不会因为戏子（改）的能力醉酒。", ""],
+  ["balloonist", "marionette", "如果提线木偶抽到了气球驾驶员，也可能会+1外来者", "If the Marionette thinks that they are the Balloonist, +1 Outsider might have been added."],
+  ["banshee", "leviathan", "每个夜晚*，利维坦要选择一名存活的善良玩家（与之前的每个夜晚不同）：如果报丧女妖被选择，他死亡并能力生效。", "Each night*, the Leviathan chooses an alive good player (different to previous nights): a chosen Banshee dies & gains their ability."],
+  ["banshee", "riot", "每个夜晚*，暴乱要选择一名存活的善良玩家（与之前的每个夜晚不同）：如果报丧女妖被选择，他死亡并能力生效。", "Each night*, Riot chooses an alive good player (different to previous nights): a chosen Banshee dies & gains their ability."],
+  ["banshee", "vortox", "如果恶魔杀死报丧女妖时涡流在场，玩家仍然会得知正确信息。", "If the Vortox is in play and the Demon kills the Banshee, the players still learn that the Banshee has died."],
+  ["banxian", "kazali", "卡扎力可以把半仙转变成邪恶的爪牙。", ""],
+  ["barber", "cultleader", "通过理发师交换的邪恶异教领袖无法因为自身能力转变为善良阵营。", ""],
+  ["barber", "damsel", "如果恶魔选择交换落难少女的角色，参与角色交换的另一名玩家改为由说书人来决定。", ""],
+  ["barber", "goon", "通过理发师交换的邪恶莽夫无法因为自身能力转变为善良阵营。", ""],
+  ["barber", "politician", "通过理发师交换的邪恶政客无法因为自身能力转变为善良阵营。", ""],
+  ["barber", "taowu", "如果梼杌变成了其他角色，因为梼杌而失去能力的爪牙会立即死亡。", "If the Taowu changes to another character, Minions who lost their ability due to the Taowu die immediately."],
+  ["baron", "heretic", "如果异端分子在剧本中，男爵的效果可能会只增加一个而非两个外来者。", "The Baron might only add 1 Outsider, not 2."],
+  ["baron", "plaguedoctor", "如果说书人获得了男爵的能力，至多两名玩家会变成不在场的外来者。", "If the Storyteller gains the Baron ability, up to two players become not-in-play Outsiders."],
+  ["boffin", "cultleader", "如果恶魔拥有异教领袖的能力，他无法因为该能力转变为善良阵营。", "If the Demon has the Cult Leader ability, they can’t turn good due to this ability."],
+  ["boffin", "drunk", "如果恶魔拥有酒鬼的能力，改为由科学怪人选择一名玩家：如果他是镇民，他醉酒。", "If the Demon would have the Drunk ability, the Boffin chooses a Townsfolk player to have this ability instead."],
+  ["boffin", "goon", "如果恶魔拥有莽夫的能力，他无法因为该能力转变为善良阵营。", "If the Demon has the Goon ability, they can’t turn good due to this ability."],
+  ["boffin", "heretic", "恶魔无法拥有异端分子的能力。", "The Demon cannot have the Heretic ability."],
+  ["boffin", "ogre", "恶魔无法拥有食人魔的能力。", "The Demon cannot have the Ogre ability."],
+  ["boffin", "politician", "恶魔无法拥有政客的能力。", "The Demon cannot have the Politician ability."],
+  ["boffin", "villageidiot", "如果村夫在场数量不足3人，科学怪人可以让恶魔拥有村夫的能力。", "If there is a spare token, the Boffin can give the Demon the Village Idiot ability."],
+  ["boffin", "zh:戏子（改）", "科学怪人无法使恶魔获得戏子（改）的能力。", ""],
+  ["boomdandy", "plaguedoctor", "如果瘟疫医生死于处决且说书人会因此获得炸弹人的能力，那么炸弹人的能力会立即被触发。", "If the Plague Doctor is executed and the Storyteller would gain the Boomdandy ability, the Boomdandy ability triggers immediately."],
+  ["bountyhunter", "kazali", "在卡扎力行动完毕后，如果赏金猎人仍然在场，才会创造邪恶镇民。", "An evil Townsfolk is only created if the Bounty Hunter is still in play after the Kazali acts."],
+  ["bountyhunter", "philosopher", "如果哲学家获得了赏金猎人的能力，可能会有一名镇民玩家转变为邪恶。", "If the Philosopher gains the Bounty Hunter ability, a Townsfolk might turn evil."],
+  ["butler", "cannibal", "如果食人族获得了管家的能力，他会得知这一信息。", "If the Cannibal gains the Butler ability, the Cannibal learns this."],
+  ["butler", "organgrinder", "如果街头风琴手使得玩家需要闭眼投票，管家可以自由举手投票，但只在他的主人投票时他的票才会被统计。", "If the Organ Grinder is causing eyes closed voting, the Butler may raise their hand to vote but their vote is only counted if their master voted too."],
+  ["cannibal", "juggler", "如果杂耍艺人在自己的首个白天猜测后在当天死于处决，当晚食人族会替杂耍艺人得知对应的信息。", "If the Juggler guesses on their first day and dies by execution, tonight the living Cannibal learns how many guesses the Juggler got correct."],
+  ["cannibal", "poppygrower", "如果食人族获得了罂粟种植者的能力，当他获得下一个能力时，爪牙和恶魔也会互相认识。", "If the Cannibal eats the Poppy Grower, then dies or loses the Poppy Grower ability, the Demon and Minions learn each other that night."],
+  ["cannibal", "princess", "如果食人族提名并处决了公主且公主因此死亡，当晚恶魔不会造成死亡。", "If the Cannibal nominated, executed, & killed the Princess today, the Demon doesn’t kill tonight."],
+  ["cannibal", "zealot", "如果食人族获得了狂热者的能力，他会得知这一信息。", "If the Cannibal gains the Zealot ability, the Cannibal learns this."],
+  ["cerenovus", "goblin", "洗脑师可以选择将玩家洗脑成哥布林。", "The Cerenovus may choose to make a player mad that they are the Goblin."],
+  ["chambermaid", "mathematician", "侍女会得知数学家是否醒来，即使她是在数学家之前醒来。", "The Chambermaid learns if the Mathematician wakes tonight or not, even though the Chambermaid wakes first."],
+  ["chambermaid", "yinluren", "侍女会得知引路人是否醒来，即使她是在引路人之前醒来。", "The Chambermaid learns if the Yinluren wakes tonight or not, even though the Chambermaid wakes first."],
+  ["choirboy", "kazali", "如果唱诗男孩在场，卡扎力在选择国王后无法将他变成爪牙。", "The Kazali can not choose the King to become a Minion if a Choirboy is in play."],
+  ["clockmaker", "summoner", "如果召唤师在场，在创造恶魔之后钟表匠才会得知信息。", "If the Summoner is in play, the Clockmaker does not receive their information until a Demon is created."],
+  ["courtier", "summoner", "如果召唤师因为侍臣的能力在第三个夜晚醉酒，由召唤师来选择创造哪种恶魔，由说书人来决定哪名玩家发生转变。", "If the Summoner is drunk on the 3rd night, the Summoner chooses which Demon, but the Storyteller chooses which player."],
+  ["courtier", "vizier", "如果维齐尔失去能力，他会得知这一信息。如果侍臣在剧本列表中，且维齐尔在具有能力时被处决，他的阵营获胜。", "If the Vizier loses their ability, they learn this. If the Vizier is executed while they have their ability, their team wins."],
+  ["cultleader", "pithag", "被麻脸巫婆创造的邪恶异教领袖无法因为自身能力转变为善良阵营。", "If the Pit-Hag turns an evil player into the Cult Leader, they can't turn good due to their own ability."],
+  ["damsel", "marionette", "提线木偶不会得知落难少女在场。", "The Marionette does not learn that a Damsel is in play."],
+  ["damsel", "pithag", "如果麻脸巫婆创造了落难少女，改为由说书人来决定哪一名玩家变成落难少女。", "If a Pit-Hag creates a Damsel, the Storyteller chooses which player it is."],
+  ["damsel", "spy", "如果间谍正在场或曾经在场，落难少女中毒。", "If the Spy is (or has been) in play, the Damsel is poisoned."],
+  ["damsel", "widow", "如果寡妇正在场或曾经在场，落难少女中毒。", "If the Widow is (or has been) in play, the Damsel is poisoned."],
+  ["damsel", "zh:戏子（改）", "落难少女不会因为戏子（改）的能力醉酒。", ""],
+  ["engineer", "legion", "军团和工程师不能在初始时同时在场。如果工程师创造了军团，那么包括所有邪恶玩家在内的绝大多数玩家都会变成邪恶的军团。", "Legion and the Engineer can not both be in play at the start of the game. If the Engineer creates Legion, most players (including all evil players) become evil Legion."],
+  ["engineer", "summoner", "如果工程师的能力使得召唤师在使用自己的能力前离场，召唤师会在此前立即使用自己的能力。", "If the Engineer removes a Summoner from play before that Summoner uses their ability, the Summoner uses their ability immediately."],
+  ["engineer", "taowu", "如果梼杌变成了其他角色，因为梼杌而失去能力的爪牙会立即死亡。", "If the Taowu changes to another character, Minions who lost their ability due to the Taowu die immediately."],
+  ["eviltwin", "plaguedoctor", "说书人无法在瘟疫医生死亡时获得镜像双子的能力。", "The Storyteller cannot gain the Evil Twin ability if the Plague Doctor dies."],
+  ["eviltwin", "taowu", "镜像双子在梼杌的能力判断中被当作“不具有能力”。", "The Evil Twin is considered \"without ability\" for the Taowu's ability."],
+  ["eviltwin", "zh:戏子（改）", "互为克星的角色在同一时间里只能有其中一个角色在场。", ""],
+  ["exorcist", "leviathan", "如果驱魔人存活并且成功选中过利维坦，即使有多于一名善良玩家被处决，邪恶阵营也不会获胜。", "Evil does not win when more than 1 good player has been executed, if the Exorcist is alive and has ever successfully chosen the Leviathan."],
+  ["exorcist", "riot", "如果驱魔人在第三个夜晚选中了暴乱，爪牙不会变成暴乱。", "If the Exorcist chooses Riot on the 3rd night, Minions do not become Riot."],
+  ["exorcist", "yaggababble", "如果驱魔人选中了牙噶巴卜，那么牙噶巴卜的能力在当晚无法造成死亡。", "If the Exorcist chooses the Yaggababble, the Yaggababble ability does not kill tonight."],
+  ["fanggu", "scarletwoman", "如果方古成功转化了外来者并因此死去，红唇女郎不会变成方古。", "If the Fang Gu chooses an Outsider and dies, the Scarlet Woman does not become the Fang Gu."],
+  ["farmer", "leviathan", "每个夜晚*，利维坦要选择一名存活的善良玩家（与之前的每个夜晚不同）：如果农夫被选择，他的能力生效但不会死亡。", "Each night*, the Leviathan chooses an alive good player (different to previous nights): a chosen Farmer uses their ability but does not die."],
+  ["farmer", "riot", "每个夜晚*，暴乱要选择一名存活的善良玩家（与之前的每个夜晚不同）：如果农夫被选择，他的能力生效但不会死亡。", "Each night*, Riot chooses an alive good player (different to previous nights): a chosen Farmer uses their ability but does not die."],
+  ["fearmonger", "plaguedoctor", "如果瘟疫医生死亡且说书人会因此获得恐惧之灵的能力，改为一名存活的爪牙玩家获得此能力，且他会得知此事。", "If the Plague Doctor dies, a living Minion gains the Fearmonger ability in addition to their own ability, and learns this."],
+  ["fearmonger", "vizier", "在恐惧之灵因为自己的能力被唤醒时，维齐尔会一同被唤醒。他会得知恐惧之灵选择了哪名玩家，并且无法使用自己的能力让那名玩家立即被处决。", "The Vizier wakes with the Fearmonger, learns who they choose and cannot choose to immediately execute that player."],
+  ["fearmonger", "zh:戏子（改）", "戏子（改）无法反转由恐惧之灵的能力产生的胜负结果。", ""],
+  ["ganshiren", "plaguedoctor", "如果瘟疫医生死亡且说书人会因此获得赶尸人的能力，改为一名存活的爪牙玩家获得此能力，且他会得知此事。", ""],
+  ["goblin", "plaguedoctor", "如果瘟疫医生死亡且说书人会因此获得哥布林的能力，改为一名存活的爪牙玩家获得此能力，且他会得知此事。", "If the Plague Doctor dies, a living Minion gains the Goblin ability in addition to their own ability, and learns this."],
+  ["goblin", "zh:戏子（改）", "戏子（改）无法反转由哥布林的能力产生的胜负结果。", ""],
+  ["godfather", "heretic", "异端分子会被教父当作一个不在场的外来者，异端分子会知道是哪个外来者。", "Only 1 jinxed character can be in play."],
+  ["goon", "kazali", "卡扎力可以把莽夫转变成邪恶的爪牙。", "The Kazali can choose that the Goon player is one of their evil Minions."],
+  ["goon", "pithag", "被麻脸巫婆创造的邪恶莽夫无法因为自身能力转变为善良阵营。", "If the Pit-Hag turns an evil player into the Goon, they can't turn good due to their own ability."],
+  ["grandmother", "leviathan", "如果利维坦在场，孙子死于处决，邪恶阵营获胜。", "If Leviathan is in play and the Grandchild dies by execution, evil wins."],
+  ["grandmother", "riot", "如果暴乱在场，孙子在白天死亡，祖母会一同死亡。", "If Riot is in play and the Grandchild dies during the day, the Grandmother dies too."],
+  ["hatter", "legion", "如果帽匠死亡时军团在场，则无事发生。如果帽匠死亡时一名邪恶玩家选择变成军团，当前所有邪恶玩家都会一同变成军团。", "If the Hatter dies and Legion is in play, nothing happens. If the Hatter dies and an evil player chooses Legion, all current evil players become Legion."],
+  ["hatter", "leviathan", "如果帽匠在第五个白天或之后死亡，恶魔不能选择变成利维坦。", "If the Hatter dies on or after day 5, the Demon cannot choose Leviathan."],
+  ["hatter", "lilmonsta", "如果恶魔选择了小怪宝，则还需要选择一个爪牙角色，他变成这个爪牙且当晚照看小怪宝。", "If a Demon chooses Lil' Monsta, they also choose a Minion to become and babysit Lil' Monsta tonight."],
+  ["hatter", "summoner", "召唤师无法创造已经在场的恶魔。如果召唤师创造了一个不在场的恶魔，当晚的死亡由说书人决定。", "The Summoner cannot create an in-play Demon. If the Summoner creates a not-in-play Demon, deaths tonight are arbitrary."],
+  ["hatter", "taowu", "如果梼杌变成了其他角色，因为梼杌而失去能力的爪牙会立即死亡。", "If the Taowu changes to another character, Minions who lost their ability due to the Taowu die immediately."],
+  ["heretic", "lleech", "如果痢蛭选择异端分子作为宿主，痢蛭死亡时异端分子仍会中毒。", "If the Lleech has poisoned the Heretic then the Lleech dies, the Heretic remains poisoned."],
+  ["heretic", "pithag", "麻脸巫婆无法创造异端分子。", "A Pit-Hag can not create a Heretic."],
+  ["heretic", "spy", "异端分子会被间谍当作一个不在场的外来者，异端分子会知道是哪个外来者。", "Only 1 jinxed character can be in play."],
+  ["heretic", "widow", "异端分子会被寡妇当作一个不在场的外来者，异端分子会知道是哪个外来者。", "Only 1 jinxed character can be in play."],
+  ["heretic", "zh:狐魅娘", "互为克星的角色在同一时间里只能有其中一个角色在场。", ""],
+  ["heshang", "kazali", "卡扎力可以把与和尚邻近的玩家转变成邪恶的爪牙。", ""],
+  ["heshang", "leviathan", "如果利维坦发起的提名中被处决的玩家是与和尚邻近的存活玩家，那么那名玩家不会死亡，并且当晚和尚得知他的能力被触发。", ""],
+  ["huntsman", "kazali", "如果卡扎力将落难少女变成了爪牙，并且巡山人在场，一名善良的玩家会变成落难少女。", "If the Kazali chooses the Damsel to become a Minion, and a Huntsman is in play, a good player becomes the Damsel."],
+  ["huntsman", "marionette", "如果提线木偶抽到了巡山人，也会增加落难少女。", "If the Marionette thinks that they are the Huntsman, the Damsel was added."],
+  ["innkeeper", "leviathan", "如果利维坦在场，旅店老板保护的玩家免疫所有邪恶阵营的负面效果。", "If the Leviathan is in play, the Innkeeper-protected-players are safe from all evil abilities."],
+  ["innkeeper", "riot", "如果暴乱在场，旅店老板保护的玩家免疫所有邪恶阵营的负面效果。", "If Riot is in play, the Innkeeper-protected player is safe from all evil abilities."],
+  ["investigator", "vizier", "如果调查员的能力使其得知了维齐尔，则说书人不会告知所有人维齐尔在场。", "If the Investigator learns that the Vizier is in play, the existence of the Vizier is not announced by the Storyteller."],
+  ["kazali", "marionette", "如果卡扎力选择创造提线木偶，他只能选择将自己的邻座玩家变成提线木偶。", "If the Kazali chooses to create a Marionette, they must choose one of their neighbors."],
+  ["kazali", "soldier", "卡扎力可以把士兵转变成邪恶的爪牙。", "The Kazali can choose that the Soldier player is one of their evil Minions."],
+  ["kazali", "summoner", "召唤师无法创造已经在场的恶魔。如果召唤师创造了一个不在场的恶魔，当晚的死亡由说书人决定。", "The Summoner cannot create an in-play Demon. If the Summoner creates a not-in-play Demon, deaths tonight are arbitrary."],
+  ["king", "leviathan", "如果利维坦在场，当至少一名玩家死亡时，国王每晚就会得知一个存活的角色。", "If the Leviathan is in play, and at least 1 player is dead, the King learns an alive character each night."],
+  ["king", "riot", "如果暴乱在场，当至少一名玩家死亡时，国王每晚就会得知一个存活的角色。", "If Riot is in play, and at least 1 player is dead, the King learns an alive character each night."],
+  ["king", "zh:戏子（改）", "国王不会因为戏子（改）的能力醉酒。", ""],
+  ["legion", "minstrel", "如果军团死于处决，所有军团保留能力，但吟游诗人可能会在当晚得知今天白天死于处决的玩家是军团。", "If Legion died by execution today, Legion keeps their ability, but the Minstrel might learn they are Legion."],
+  ["legion", "preacher", "如果传教士选中了军团，军团仍然保留能力，但传教士可能会得知自己选中了军团。", "If the Preacher chooses Legion, Legion keeps their ability, but the Preacher might learn they are Legion."],
+  ["legion", "summoner", "如果召唤师创造了军团，包括所有邪恶玩家在内的绝大多数玩家都会变成邪恶的军团。", "If the Summoner creates Legion, most players (including all evil players) become evil Legion."],
+  ["legion", "zealot", "军团的能力可能会将狂热者当作邪恶阵营。", "The Zealot might register as evil to Legion's ability."],
+  ["legion", "zh:戏子（改）", "在戏子（改）存在于剧本中时，军团可以在游戏中任意时候向说书人示意自己“想要死亡”。说书人会在夜晚一同唤醒所有军团，并询问他们是否要一同死亡。", ""],
+  ["leviathan", "limao", "每个夜晚*，利维坦要选择一名存活的善良玩家（与之前的每个夜晚不同）：如果“太子”被选择，他会与狸猫交换角色但不会死亡。", ""],
+  ["leviathan", "mayor", "如果利维坦在场，镇长存活且第五天没有处决发生，则善良阵营获胜。", "If the Leviathan is in play & no execution occurs on day 5, good wins."],
+  ["leviathan", "monk", "如果利维坦在场，僧侣保护的玩家免疫所有邪恶阵营的负面效果。", "If the Leviathan is in play, the Monk-protected-player is safe from all evil abilities."],
+  ["leviathan", "pithag", "在第五个白天之后，麻脸巫婆无法创造利维坦。", "After day 5, the Pit-Hag cannot choose Leviathan."],
+  ["leviathan", "ravenkeeper", "每个夜晚*，利维坦要选择一名存活的善良玩家（与之前的每个夜晚不同）：如果守鸦人被选择，他的能力生效但不会死亡。", "Each night*, the Leviathan chooses an alive player (different to previous nights): a chosen Ravenkeeper uses their ability but does not die."],
+  ["leviathan", "sage", "每个夜晚*，利维坦要选择一名存活的善良玩家（与之前的每个夜晚不同）：如果贤者被选择，他的能力生效但不会死亡。", "Each night*, the Leviathan chooses an alive good player (different to previous nights): a chosen Sage uses their ability but does not die."],
+  ["leviathan", "soldier", "如果利维坦在场，士兵免疫所有邪恶阵营的负面效果。", "If the Leviathan is in play, the Soldier is safe from all evil abilities."],
+  ["leviathan", "xuncha", "如果利维坦在场，巡察保护的玩家免疫所有邪恶阵营的负面效果。", ""],
+  ["leviathan", "zh:戏子（改）", "在戏子（改）存在于剧本中时，利维坦可以在游戏中任意时候向说书人示意自己“想要死亡”。说书人会在当晚杀死这名玩家。", ""],
+  ["lilmonsta", "magician", "每个夜晚，由魔术师来选择一个爪牙角色：如果他和小怪宝均存活，由他来照看小怪宝。", "Each night, the Magician chooses a Minion: if that Minion & Lil' Monsta are alive, that Minion babysits Lil’ Monsta."],
+  ["lilmonsta", "marionette", "提线木偶会与一名爪牙玩家邻座，而不是恶魔。提线木偶不会被唤醒来决定是否照看小怪宝，也不会在照看小怪宝时得知自己是提线木偶。", "The Marionette neighbors a Minion, not the Demon. The Marionette is not woken to choose who takes the Lil' Monsta token, and does not learn they are the Marionette if they have the Lil' Monsta token."],
+  ["lilmonsta", "poppygrower", "如果罂粟种植者在场，爪牙们不会同时醒来选择照看小怪宝。他们会依次单独被唤醒，直到其中一人选择照看小怪宝。", "If the Poppy Grower is in play, Minions don't wake together. They are woken one by one, until one of them chooses to take the Lil' Monsta token."],
+  ["lilmonsta", "rulianshi", "如果在五名及以上的玩家存活时，入殓师提名并处决了照看小怪宝的玩家，入殓师会变为邪恶的该角色，当晚原入殓师玩家必须要照看小怪宝。", "If there are 5 or more players alive when the Rulianshi nominates and executes the player babysitting Lil' Monsta, the Rulianshi becomes the evil version of that character, and the original Rulianshi player must babysit Lil' Monsta tonight."],
+  ["lilmonsta", "scarletwoman", "如果在五名及以上的玩家存活时照看小怪宝的玩家死亡，当晚红唇女郎必须要照看小怪宝。", "If there are 5 or more players alive and the player holding the Lil' Monsta token dies, the Scarlet Woman is given the Lil' Monsta token tonight."],
+  ["lilmonsta", "vizier", "照看小怪宝的维齐尔能够死于处决。", "The Vizier can die by execution if they are babysitting Lil' Monsta."],
+  ["lilmonsta", "zh:戏子（改）", "在戏子（改）存在于剧本中时，照看小怪宝的玩家可以在游戏中任意时候向说书人示意自己“想要死亡”。说书人会在当晚将小怪宝从游戏中移除。", ""],
+  ["lleech", "mastermind", "如果主谋存活且痢蛭的宿主死于处决，痢蛭存活但失去能力。", "If the Mastermind is alive and the Lleech's host dies by execution, the Lleech lives but loses their ability."],
+  ["lleech", "rulianshi", "如果在大于等于五名玩家存活时，入殓师提名并处决了宿主且他死于这次处决，原本的痢蛭会在当晚死亡，入殓师变为邪恶的痢蛭且当晚无法攻击。", "If there are 5 or more players alive when the Rulianshi nominates and executes the host and they die from this execution, the original Lleech dies tonight, and the Rulianshi becomes the evil Lleech but cannot attack tonight."],
+  ["lleech", "slayer", "如果猎手选择了痢蛭的宿主，则宿主会死亡。", "If the Slayer slays the Lleech's host, the host dies."],
+  ["lordoftyphon", "summoner", "如果召唤师创造了堤丰之首，则堤丰之首必须与一名爪牙相邻，且堤丰之首另一侧的玩家变成一个不在场的邪恶爪牙。", "If the Summoner creates a Lord of Typhon, the Lord of Typhon must neighbor a Minion. The other neighbor becomes a not-in-play evil Minion."],
+  ["lunatic", "mathematician", "", "The Mathematician learns if the Lunatic attacks a different player(s) than the real Demon attacked."],
+  ["lunatic", "zh:戏子（改）", "疯子不会因为戏子（改）能力参与互认，也不会因为戏子（改）的能力醉酒。", ""],
+  ["magician", "spy", "当间谍查看魔典时，魔术师和恶魔的角色标记会被说书人移除。", "When the Spy sees the Grimoire, the Demon and Magician's character tokens are removed."],
+  ["magician", "vizier", "如果维齐尔和魔术师都在场，恶魔不会得知谁是爪牙。", "If the Vizier and Magician are both in play, the Demon does not learn the Minions."],
+  ["magician", "widow", "当寡妇查看魔典时，魔术师和恶魔的标记会被说书人移除。", "When the Widow sees the Grimoire, the Demon and Magician's character tokens are removed."],
+  ["magician", "wraith", "", "Each day, after the execution phase, the living Magician may publicly guess a living player as the Wraith: if correct, the Demon must choose the Wraith tonight."],
+  ["marionette", "plaguedoctor", "如果在瘟疫医生死亡时说书人获得了提线木偶的能力，且与恶魔邻座的存活玩家中有镇民或外来者，其中一名玩家会变成邪恶的提线木偶。如果此时场上的邪恶玩家数量比初始设置时的数量超出一名或更多，改为无事发生。", "If the Demon has a neighbor who is alive and a Townsfolk or Outsider when the Plague Doctor dies, that player becomes an evil Marionette. If there is already an extra evil player, this does not happen."],
+  ["marionette", "poppygrower", "当罂粟种植者死亡后，恶魔会知道谁是提线木偶，但提线木偶什么都不会知道。", "When the Poppy Grower dies, the Demon learns the Marionette but the Marionette learns nothing."],
+  ["marionette", "snitch", "提线木偶不会得知三个不在场的角色，如果提线木偶与告密者均在场，改为由恶魔额外得知三个不在场角色。", "The Marionette does not learn 3 not in-play characters. The Demon learns an extra 3 instead."],
+  ["marionette", "summoner", "在初始设置时，提线木偶会与召唤师邻座。召唤师会得知谁是提线木偶。", "The Marionette neighbors the Summoner. The Summoner knows who the Marionette is."],
+  ["marionette", "taowu", "梼杌不会得知谁是提线木偶。在梼杌使得提线木偶失去能力后，梼杌会得知对应的那一名提线木偶是谁，但提线木偶会仍然以为自己是一个善良角色。", "The Taowu does not learn who the Marionette is. After the Taowu causes the Marionette to lose their ability, the Taowu learns which Marionette it was, but the Marionette still believes they are a good character."],
+  ["marionette", "wraith", "", "The Wraith does not wake with the Marionette."],
+  ["mastermind", "taowu", "主谋在梼杌的能力判断中被当作“不具有能力”。", "The Mastermind is considered \"without ability\" for the Taowu's ability."],
+  ["mathematician", "yinluren", "引路人会得知数学家是否被影响，即使他是在数学家之前醒来。", "The Yinluren learns if the Mathematician is affected or not, even though they wake before the Mathematician."],
+  ["mayor", "riot", "镇长可以停止提名。如果他这样做了，并且场上只有一名暴乱存活，善良阵营获胜；否则，邪恶阵营获胜。", "The Mayor may choose to stop nominations. If they do so when only 1 Riot is alive, good wins. Otherwise, evil wins."],
+  ["monk", "riot", "如果暴乱在场，僧侣保护的玩家免疫所有邪恶阵营的负面效果。", "If Riot is in play, the Monk-protected player is safe from all evil abilities."],
+  ["ogre", "pithag", "", "If the Pit-Hag turns an evil player into the Ogre, they can't turn good due to their own ability."],
+  ["ogre", "recluse", "如果陌客被食人魔当作邪恶阵营，食人魔会得知自己转变为邪恶。", "If the Recluse registers as evil to the Ogre, the Ogre learns that they are evil."],
+  ["ogre", "spy", "间谍必定被食人魔当作邪恶阵营。", "The Spy registers as evil to the Ogre."],
+  ["ogre", "zh:熬药巫婆", "被麻脸巫婆创造的邪恶食人魔无法因为自身能力转变为善良阵营。", ""],
+  ["organgrinder", "taowu", "当梼杌被处决时，如果街头风琴手具有能力，说书人会宣布“无人被处决”。", "When the Taowu is executed, if the Organ Grinder has their ability, the Storyteller announces \"no one was executed.\""],
+  ["pithag", "politician", "被麻脸巫婆创造的邪恶政客无法因为自身能力转变为善良阵营。", "If the Pit-Hag turns an evil player into the Politician, they can't turn good due to their own ability."],
+  ["pithag", "summoner", "召唤师无法创造已经在场的恶魔。如果召唤师创造了一名不在场的恶魔，当晚的死亡由说书人决定。", "The Summoner cannot create an in-play Demon. If the Summoner creates a not-in-play Demon, deaths tonight are arbitrary."],
+  ["pithag", "taowu", "如果梼杌变成了其他角色，因为梼杌而失去能力的爪牙会立即死亡。", "If the Taowu changes to another character, Minions who lost their ability due to the Taowu die immediately."],
+  ["pithag", "villageidiot", "如果村夫在场数量不足3人，麻脸巫婆可以创造新的村夫。如果她这么做，村夫的醉酒效果可能会更换目标。", "If there is a spare token, the Pit-Hag can create an extra Village Idiot. If so, the drunk Village Idiot might change."],
+  ["pithag", "zh:戏子（改）", "麻脸巫婆无法创造戏子（改），麻脸巫婆创造的邪恶玩家无法获得戏子（改）的能力。", ""],
+  ["plaguedoctor", "scarletwoman", "如果瘟疫医生死亡且说书人会因此获得红唇女郎的能力，改为一名存活的爪牙玩家获得此能力，且他会得知此事。", "If the Plague Doctor dies, a living Minion gains the Scarlet Woman ability in addition to their own ability, and learns this."],
+  ["plaguedoctor", "spy", "如果瘟疫医生死亡且说书人会因此获得间谍的能力，改为一名存活的爪牙玩家获得此能力，且他会得知此事。", "If the Plague Doctor dies, a living Minion gains the Spy ability in addition to their own ability, and learns this."],
+  ["plaguedoctor", "wraith", "", "If the Plague Doctor dies, a living Minion gains the Wraith ability in addition to their own ability, and learns this."],
+  ["plaguedoctor", "yangguren", "如果瘟疫医生死亡且说书人会因此获得养蛊人的能力，改为一名存活的爪牙玩家获得此能力，且他会得知此事。", ""],
+  ["plaguedoctor", "zh:狐魅娘", "如果瘟疫医生死亡且说书人会因此获得狐魅娘的能力，改为一名存活的爪牙玩家获得此能力，且他会得知此事。", ""],
+  ["politician", "vizier", "维齐尔的能力可能会将政客当作邪恶阵营。", "The Politician might register as evil to the Vizier."],
+  ["poppygrower", "spy", "如果罂粟种植者在场，直到其死亡前间谍无法查看魔典。", "If the Poppy Grower is in play, the Spy does not see the Grimoire until the Poppy Grower dies."],
+  ["poppygrower", "summoner", "如果召唤师创造恶魔时罂粟种植者存活，由召唤师来选择创造哪种恶魔，由说书人来决定哪名玩家发生转变。", "If the Poppy Grower is alive when the Summoner acts, the Summoner chooses which Demon, but the Storyteller chooses which player."],
+  ["poppygrower", "widow", "如果罂粟种植者在场，直到其死亡前寡妇无法查看魔典。寡妇会在罂粟种植者死后的首个夜晚触发自身的能力。", "If the Poppy Grower is in play, the Widow does not see the Grimoire until the Poppy Grower dies."],
+  ["preacher", "summoner", "如果召唤师在第三个夜晚或之前被传教士选中，由召唤师来选择创造哪种恶魔，由说书人来决定哪名玩家发生转变。", "If the Preacher chose the Summoner on or before the 3rd night, the Summoner chooses which Demon, but the Storyteller chooses which player."],
+  ["preacher", "vizier", "如果维齐尔失去能力，他会得知这一信息。如果传教士在剧本列表中，且维齐尔在具有能力时被处决，他的阵营获胜。", "If the Vizier loses their ability, they learn this. If the Vizier is executed while they have their ability, their team wins."],
+  ["pukka", "summoner", "召唤师可以选择在第二个夜晚将一名玩家变成普卡。", "The Summoner may choose a player to become the Pukka on the 2nd night."],
+  ["pukka", "zh:戏子（改）", "在戏子（改）存在于剧本中时，普卡可以在游戏中任意时候向说书人示意自己“想要死亡”。说书人会在当晚杀死这名玩家。", ""],
+  ["ravenkeeper", "riot", "每个夜晚*，暴乱要选择一名存活的善良玩家（与之前的每个夜晚不同）：如果守鸦人被选择，他的能力生效但不会死亡。", "Each night*, Riot chooses an alive good player (different to previous nights): a chosen Ravenkeeper uses their ability but does not die."],
+  ["riot", "sage", "每个夜晚*，暴乱要选择一名存活的善良玩家（与之前的每个夜晚不同）：如果贤者被选择，他的能力生效但不会死亡。", "Each night*, Riot chooses an alive good player (different to previous nights): a chosen Sage uses their ability but does not die."],
+  ["riot", "soldier", "如果暴乱在场，士兵免疫所有邪恶阵营的负面效果。", "If Riot is in play, the Soldier is safe from all evil abilities."],
+  ["riot", "xuncha", "如果暴乱在场，巡察保护的玩家免疫所有邪恶阵营的负面效果。", ""],
+  ["riot", "zealot", "狂热者在被提名后必须立马发起提名，即使自己已死亡。", ""],
+  ["riot", "zh:戏子（改）", "互为克星的角色在同一时间里只能有其中一个角色在场。", ""],
+  ["rulianshi", "scarletwoman", "入殓师提名并处决了恶魔并成功变成邪恶恶魔时，红唇女郎不会变成恶魔。", "When the Rulianshi nominates and executes the Demon and successfully becomes the evil Demon, the Scarlet Woman does not become the Demon."],
+  ["scarletwoman", "taowu", "红唇女郎在梼杌的能力判断中被当作“不具有能力”。", "The Scarlet Woman is considered \"without ability\" for the Taowu's ability."],
+  ["shusheng", "zh:戏子（改）", "书生不会因为戏子（改）的能力醉酒。", ""],
+  ["snakecharmer", "taowu", "如果梼杌变成了其他角色，因为梼杌而失去能力的爪牙会立即死亡。", "If the Taowu changes to another character, Minions who lost their ability due to the Taowu die immediately."],
+  ["snitch", "zh:戏子（改）", "告密者不会因为戏子（改）的能力醉酒。", ""],
+  ["spy", "zh:戏子（改）", "互为克星的角色在同一时间里只能有其中一个角色在场。", ""],
+  ["summoner", "zh:戏子（改）", "互为克星的角色在同一时间里只能有其中一个角色在场。", ""],
+  ["summoner", "zombuul", "如果召唤师将一名已死亡的玩家变成了僵怖，该玩家会变成“已经死过一次”的僵怖。", "If the Summoner turns a dead player into the Zombuul, the Storyteller treats that player as a Zombuul that has died once."],
+  ["villageidiot", "wudaozhe", "如果村夫在场数量不足3人，悟道者可以变成新的村夫。如果因此使得村夫的在场数量超过1人，会有一名村夫醉酒。", "If there are fewer than 3 Village Idiots in play, the Wudaozhe can become a new Village Idiot. If this causes more than 1 Village Idiot to be in play, one Village Idiot is drunk."],
+  ["vizier", "zealot", "维齐尔的能力可能会将狂热者当作邪恶阵营。", "The Zealot might register as evil to the Vizier."],
+  ["widow", "zh:戏子（改）", "互为克星的角色在同一时间里只能有其中一个角色在场。", ""],
+];
@@ -0,0 +1,348 @@
+// 此文件由 python/night_order.py 自动生成，请勿手动修改。
+// 数据源变化后运行：python ./python/night_order.py
+
+export interface NightStep {
+  id: string;
+  cnId: string;
+  team: string;
+  order: number;
+  reminder: { 'zh-CN': string; en: string };
+}
+
+export const NIGHT_ORDER: Record<string, readonly [number, number]> = {
+  "acrobat": [0, 2150],
+  "al-hadikhia": [0, 42],
+  "alhadikhia": [0, 42],
+  "apprentice": [1, 1],
+  "assassin": [0, 52],
+  "balloonist": [3050, 90],
+  "banshee": [0, 75],
+  "barber": [0, 67],
+  "barista": [1, 1],
+  "bone_collector": [0, 1],
+  "bonecollector": [0, 1],
+  "bounty_hunter": [3055, 94],
+  "bountyhunter": [3055, 94],
+  "bureaucrat": [1, 1],
+  "butler": [3041, 82],
+  "cerenovus": [3025, 20],
+  "chambermaid": [3064, 100],
+  "chef": [3038, 0],
+  "choirboy": [0, 73],
+  "clockmaker": [3044, 0],
+  "courtier": [3020, 11],
+  "cult_leader": [3057, 96],
+  "cultleader": [3057, 96],
+  "dagengren": [0, 15],
+  "devils_advocate": [3022, 18],
+  "devilsadvocate": [3022, 18],
+  "dianxiaoer": [3053, 0],
+  "disappointed": [5, 5],
+  "dreamer": [3045, 84],
+  "drugster": [0, 63],
+  "empath": [3039, 80],
+  "engineer": [3014, 6],
+  "evil_twin": [3023, 0],
+  "eviltwin": [3023, 0],
+  "exorcist": [0, 29],
+  "fang_gu": [0, 36],
+  "fanggu": [0, 36],
+  "farmer": [0, 74],
+  "fearmonger": [3026, 21],
+  "flowergirl": [0, 85],
+  "fortune_teller": [3040, 81],
+  "fortuneteller": [3040, 81],
+  "gambler": [0, 12],
+  "geling": [0, 61],
+  "general": [3063, 99],
+  "genius": [3, 2],
+  "godfather": [3021, 53],
+  "gossip": [0, 62],
+  "grandmother": [3043, 66],
+  "harlot": [0, 1],
+  "harpy": [3027, 22],
+  "hatter": [0, 3],
+  "high_priestess": [3060, 98],
+  "highpriestess": [3060, 98],
+  "humeiniang": [3029, 24],
+  "hundun": [0, 47],
+  "huntsman": [3034, 77],
+  "imp": [0, 31],
+  "innkeeper": [0, 10],
+  "investigator": [3037, 0],
+  "jiaohuazi": [1, 1],
+  "jinyiwei": [0, 16],
+  "juggler": [0, 89],
+  "kaixinhou": [128001, 0],
+  "kazali": [0, 46],
+  "king": [3009, 93],
+  "knight": [3048, 0],
+  "langzhong": [3052, 91],
+  "legion": [0, 39],
+  "leviathan": [3070, 120],
+  "librarian": [3036, 0],
+  "lil_monsta": [3016, 44],
+  "lilmonsta": [3016, 44],
+  "lleech": [3017, 43],
+  "lunatic": [0, 28],
+  "lycanthrope": [0, 30],
+  "marionette": [3010, 0],
+  "mathematician": [3065, 101],
+  "meishuguanzhang": [1, 1],
+  "mezepheles": [3028, 23],
+  "monk": [0, 14],
+  "moonchild": [0, 64],
+  "nichen": [3042, 25],
+  "nightwatchman": [3056, 95],
+  "no_dashii": [0, 37],
+  "noble": [3049, 0],
+  "nodashii": [0, 37],
+  "ogre": [3059, 0],
+  "ojo": [0, 41],
+  "oracle": [0, 87],
+  "pagan": [200, 0],
+  "philosopher": [3, 2],
+  "pit-hag": [0, 8],
+  "pithag": [0, 8],
+  "pixie": [3033, 0],
+  "plague_doctor": [0, 72],
+  "plaguedoctor": [0, 72],
+  "po": [0, 35],
+  "poisoner": [3018, 9],
+  "poppy_grower": [0, 4],
+  "poppygrower": [0, 4],
+  "preacher": [3015, 7],
+  "princess": [0, 35],
+  "professor": [0, 76],
+  "pukka": [3030, 33],
+  "qimo": [0, 41],
+  "qintianjian": [3062, 0],
+  "qiongqi": [0, 48],
+  "ravenkeeper": [0, 70],
+  "sage": [0, 71],
+  "sailor": [3013, 5],
+  "scarlet_woman": [0, 26],
+  "scarletwoman": [0, 26],
+  "seamstress": [3046, 88],
+  "shabaloth": [0, 34],
+  "shaxing": [0, 65],
+  "shugenja": [3061, 0],
+  "shusheng": [3011, 51],
+  "snake_charmer": [3021, 13],
+  "snakecharmer": [3021, 13],
+  "snitch": [2005, 0],
+  "spy": [3058, 97],
+  "steward": [3047, 0],
+  "summoner": [0, 27],
+  "sweetheart": [0, 68],
+  "taotie": [0, 49],
+  "taowu": [0, 50],
+  "thief": [1, 1],
+  "tinker": [0, 63],
+  "town_crier": [0, 86],
+  "towncrier": [0, 86],
+  "trade_dealer": [1, 1],
+  "undertaker": [0, 83],
+  "vigormortis": [0, 40],
+  "village_idiot": [3054, 92],
+  "villageidiot": [3054, 92],
+  "vizier": [3075, 0],
+  "vortox": [0, 38],
+  "washerwoman": [3035, 0],
+  "widow": [3019, 0],
+  "witch": [3024, 19],
+  "xionghaizi": [3032, 17],
+  "xizi": [3012, 0],
+  "yaggababble": [3031, 45],
+  "yangguren": [0, 54],
+  "yinyangshi": [3051, 0],
+  "yuan": [0, 100],
+  "zombuul": [0, 32],
+};
+
+export const FIRST_NIGHT_STEPS: readonly NightStep[] = [
+  {"id": "apprentice", "cnId": "apprentice", "team": "traveler", "order": 1, "reminder": {"zh-CN": "在学徒加入游戏的首个夜晚，唤醒学徒。向学徒展示“你是”信息标记，然后展示一个镇民或爪牙的角色标记。在魔典上，将学徒的角色标记替换为刚刚展示的角色标记，并放置“是学徒”提示标记。这名玩家还是学徒，只是他拥有了该角色的能力。", "en": "Show the Apprentice the 'You are' card, then a Townsfolk or Minion token. In the Grimoire, replace the Apprentice token with that character token, and put the Apprentice's 'Is the Apprentice' reminder by that character token."}},
+  {"id": "barista", "cnId": "barista", "team": "traveler", "order": 1, "reminder": {"zh-CN": "每个夜晚，移除先前的标记并在任一角色标记旁放置咖啡师的“清醒且健康”标记或“行动两次”提示。唤醒那个角色的玩家并向他展示“该角色的能力对你生效”信息标记，咖啡师标记和一根手指（代表他现在清醒且健康）或两根手指（代表他要行动两次）。让这名玩家入睡。", "en": "Choose a player, wake them and tell them which Barista power is affecting them. Treat them accordingly (sober/healthy/true info or activate their ability twice)."}},
+  {"id": "bureaucrat", "cnId": "bureaucrat", "team": "traveler", "order": 1, "reminder": {"zh-CN": "唤醒官员。让官员指向任意一名玩家。用官员的“3票”提示标记那名被选中的玩家。让官员入睡。", "en": "The Bureaucrat points to a player. Put the Bureaucrat's '3 votes' reminder by the chosen player's character token."}},
+  {"id": "jiaohuazi", "cnId": "jiaohuazi", "team": "traveler", "order": 1, "reminder": {"zh-CN": "如果你决定不让叫花子获得这个角色的能力，无事发生。如果你决定让叫花子获得这个角色的能力，那么让他行动。如果该角色已在场，你可以自由决定是先唤醒原角色对应的玩家还是先唤醒叫花子玩家来进行行动。", "en": "If you decide the Beggar does not gain the ability, nothing happens. If you decide the Beggar gains the ability, wake them. If the character is in play, you may decide whether to wake the original player or the Beggar player first to act."}},
+  {"id": "meishuguanzhang", "cnId": "meishuguanzhang", "team": "traveler", "order": 1, "reminder": {"zh-CN": "", "en": ""}},
+  {"id": "thief", "cnId": "thief", "team": "traveler", "order": 1, "reminder": {"zh-CN": "唤醒窃贼。让窃贼指向任意一名玩家。用窃贼的“负票”提示标记那名被选中的玩家。让窃贼入睡。", "en": "The Thief points to a player. Put the Thief's 'Negative vote' reminder by the chosen player's character token."}},
+  {"id": "trade_dealer", "cnId": "trade_dealer", "team": "traveler", "order": 1, "reminder": {"zh-CN": "", "en": ""}},
+  {"id": "genius", "cnId": "genius", "team": "townsfolk", "order": 3, "reminder": {"zh-CN": "", "en": ""}},
+  {"id": "philosopher", "cnId": "philosopher", "team": "townsfolk", "order": 3, "reminder": {"zh-CN": "唤醒哲学家，他可以摇头不使用能力，或选择获得角色列表上的一个善良角色的能力。", "en": "The Philosopher either shows a 'no' head signal, or points to a good character on their sheet. If they chose a character: Swap the out-of-play character token with the Philosopher token and add the 'Is the Philosopher' reminder. If the character is in play, place the drunk marker by that player."}},
+  {"id": "disappointed", "cnId": "disappointed", "team": "outsider", "order": 5, "reminder": {"zh-CN": "", "en": ""}},
+  {"id": "pagan", "cnId": "pagan", "team": "townsfolk", "order": 200, "reminder": {"zh-CN": "如果异教徒和异端分子都在场，唤醒所有善良的镇民，并告知他们都成为了异教徒。", "en": "If both the Pagan and Heretic are in play, wake all good Townsfolk and inform them they have all become Pagans."}},
+  {"id": "snitch", "cnId": "snitch", "team": "outsider", "order": 2005, "reminder": {"zh-CN": "如果告密者在场，对爪牙展示三个不在场的善良角色标记。", "en": "After Minion info wake each Minion and show them three not-in-play character tokens. These may be the same or different to each other and the ones shown to the Demon."}},
+  {"id": "king", "cnId": "king", "team": "townsfolk", "order": 3009, "reminder": {"zh-CN": "如果国王在场，对恶魔展示国王角色标记并指向国王玩家。", "en": "Wake the Demon, show them the 'This character selected you' card, show the King token and point to the King player."}},
+  {"id": "marionette", "cnId": "marionette", "team": "minion", "order": 3010, "reminder": {"zh-CN": "如果提线木偶在场，对恶魔展示提线木偶角色标记并指向提线木偶玩家。", "en": "Select one of the good players next to the Demon and place the Is the Marionette reminder token. Wake the Demon and show them the Marionette."}},
+  {"id": "shusheng", "cnId": "shusheng", "team": "outsider", "order": 3011, "reminder": {"zh-CN": "如果书生在场，对恶魔展示书生角色标记。", "en": "If the Pedant is in play, show the Demon the Pedant character token."}},
+  {"id": "xizi", "cnId": "xizi", "team": "townsfolk", "order": 3012, "reminder": {"zh-CN": "唤醒所有戏子并让他们互认。", "en": "Wake all Actors and have them acknowledge each other."}},
+  {"id": "sailor", "cnId": "sailor", "team": "townsfolk", "order": 3013, "reminder": {"zh-CN": "唤醒水手，让他选择一名玩家。决定他俩其中谁因为水手能力醉酒。", "en": "The Sailor points to a living player. Either the Sailor, or the chosen player, is drunk."}},
+  {"id": "engineer", "cnId": "engineer", "team": "townsfolk", "order": 3014, "reminder": {"zh-CN": "唤醒工程师，他可以摇头不使用能力，或选择角色列表上的恶魔或爪牙角色，来执行同角色类型的这些玩家的角色变化。", "en": "The Engineer shows a 'no' head signal, or points to a Demon or points to the relevant number of Minions. If the Engineer chose characters, replace the Demon or Minions with the choices, then wake the relevant players and show them the You are card and the relevant character tokens."}},
+  {"id": "preacher", "cnId": "preacher", "team": "townsfolk", "order": 3015, "reminder": {"zh-CN": "唤醒传教士，让他选择一名玩家。如果他选中了爪牙，该爪牙失去能力。在传教士入睡后通知该爪牙被传教士选中。", "en": "The Preacher chooses a player. If a Minion is chosen, wake the Minion and show the 'This character selected you' card and then the Preacher token."}},
+  {"id": "lilmonsta", "cnId": "lil_monsta", "team": "demon", "order": 3016, "reminder": {"zh-CN": "唤醒所有爪牙选择由谁照看小怪宝。", "en": "Wake all Minions together, allow them to vote by pointing at who they want to babysit Lil' Monsta."}},
+  {"id": "lleech", "cnId": "lleech", "team": "demon", "order": 3017, "reminder": {"zh-CN": "唤醒痢蛭，让他选择一名玩家以寄生。", "en": "The Lleech points to a player. Place the Poisoned reminder token."}},
+  {"id": "poisoner", "cnId": "poisoner", "team": "minion", "order": 3018, "reminder": {"zh-CN": "唤醒投毒者，让他选择一名玩家，那名玩家中毒。", "en": "The Poisoner points to a player. That player is poisoned."}},
+  {"id": "widow", "cnId": "widow", "team": "minion", "order": 3019, "reminder": {"zh-CN": "唤醒寡妇，让她查看魔典。在她查看完毕后让她选择一名玩家，那名玩家中毒。随后如果寡妇未醉酒中毒，唤醒一名善良玩家，对他展示寡妇角色标记。", "en": "Show the Grimoire to the Widow for as long as they need. The Widow points to a player. That player is poisoned. Wake a good player. Show the 'These characters are in play' card, then the Widow character token."}},
+  {"id": "courtier", "cnId": "courtier", "team": "townsfolk", "order": 3020, "reminder": {"zh-CN": "唤醒侍臣，他可以摇头不使用能力，或选择角色列表上的一个任意角色，该角色对应的玩家之一醉酒。", "en": "The Courtier either shows a 'no' head signal, or points to a character on the sheet. If the Courtier used their ability: If that character is in play, that player is drunk."}},
+  {"id": "godfather", "cnId": "godfather", "team": "minion", "order": 3021, "reminder": {"zh-CN": "唤醒教父，对他展示外来者角色标记，告诉他有哪些外来者在场。", "en": "Show each of the Outsider tokens in play."}},
+  {"id": "snakecharmer", "cnId": "snake_charmer", "team": "townsfolk", "order": 3021, "reminder": {"zh-CN": "唤醒舞蛇人，让他选择一名存活玩家。如果选中恶魔则执行角色和阵营的交换，并在舞蛇人入睡后通知旧恶魔角色变化。", "en": "The Snake Charmer points to a player. If that player is the Demon: swap the Demon and Snake Charmer character and alignments. Wake each player to inform them of their new role and alignment. The new Snake Charmer is poisoned."}},
+  {"id": "devilsadvocate", "cnId": "devils_advocate", "team": "minion", "order": 3022, "reminder": {"zh-CN": "唤醒魔鬼代言人，让他选择一名玩家，那名玩家处决不死。", "en": "The Devil’s Advocate points to a living player. That player survives execution tomorrow."}},
+  {"id": "eviltwin", "cnId": "evil_twin", "team": "minion", "order": 3023, "reminder": {"zh-CN": "分别独自唤醒镜像双子和对立双子，告知他们由于镜像双子能力而得知的信息。", "en": "Wake the Evil Twin and their twin. Confirm that they have acknowledged each other. Point to the Evil Twin. Show their Evil Twin token to the twin player. Point to the twin. Show their character token to the Evil Twin player."}},
+  {"id": "witch", "cnId": "witch", "team": "minion", "order": 3024, "reminder": {"zh-CN": "唤醒女巫，让她选择一名玩家，那名玩家被诅咒。", "en": "The Witch points to a player. If that player nominates tomorrow they die immediately."}},
+  {"id": "cerenovus", "cnId": "cerenovus", "team": "minion", "order": 3025, "reminder": {"zh-CN": "唤醒洗脑师，让他选择一名玩家和角色列表上的一个善良角色，那名玩家明天需要“疯狂”证明自己是那个角色。在洗脑师入睡后通知那名玩家被洗脑。", "en": "The Cerenovus points to a player, then to a character on their sheet. Wake that player. Show the 'This character selected you' card, then the Cerenovus token. Show the selected character token. If the player is not mad about being that character tomorrow, they can be executed."}},
+  {"id": "fearmonger", "cnId": "fearmonger", "team": "minion", "order": 3026, "reminder": {"zh-CN": "唤醒恐惧之灵，让他选择一名玩家，随后通知所有玩家恐惧之灵选择了一名玩家。", "en": "The Fearmonger points to a player. Place the Fear token next to that player and announce that a new player has been selected with the Fearmonger ability."}},
+  {"id": "harpy", "cnId": "harpy", "team": "minion", "order": 3027, "reminder": {"zh-CN": "唤醒鹰身女妖，让她选择两名玩家，第一名玩家明天需要“疯狂”证明第二名玩家邪恶。在鹰身女妖入睡后通知第一名玩家被鹰身女妖选中。", "en": "Wake the Harpy. They select one player, then another. Wake the first player. Show them the 'This character selected you' info token, then the Harpy token, and finally the second player."}},
+  {"id": "mezepheles", "cnId": "mezepheles", "team": "minion", "order": 3028, "reminder": {"zh-CN": "唤醒灵言师，对他展示他的关键词。", "en": "Show the Mezepheles their secret word."}},
+  {"id": "humeiniang", "cnId": "humeiniang", "team": "minion", "order": 3029, "reminder": {"zh-CN": "唤醒狐媚娘，让她选择一名玩家。在狐媚娘入睡后通知那名玩家狐媚娘在场。", "en": "Wake the Hu Meiniang. They choose a player. After the Hu Meiniang sleeps, inform that player a Hu Meiniang is in play."}},
+  {"id": "pukka", "cnId": "pukka", "team": "demon", "order": 3030, "reminder": {"zh-CN": "唤醒普卡，让他选择一名玩家，那名玩家中毒。", "en": "The Pukka points to a player. That player is poisoned."}},
+  {"id": "yaggababble", "cnId": "yaggababble", "team": "demon", "order": 3031, "reminder": {"zh-CN": "唤醒牙噶巴卜，对他展示他的秘密短语。", "en": "Show the Yaggababble their phrase"}},
+  {"id": "xionghaizi", "cnId": "xionghaizi", "team": "townsfolk", "order": 3032, "reminder": {"zh-CN": "唤醒熊孩子，让他选择角色列表上的一个镇民角色，该角色会产生错误信息。", "en": "Wake the Rascal. They choose a Townsfolk character from the character list. That character's ability returns false information."}},
+  {"id": "pixie", "cnId": "pixie", "team": "townsfolk", "order": 3033, "reminder": {"zh-CN": "唤醒小精灵，对他展示一个在场镇民角色标记。", "en": "Show the Pixie 1 in-play Townsfolk character token."}},
+  {"id": "huntsman", "cnId": "huntsman", "team": "townsfolk", "order": 3034, "reminder": {"zh-CN": "唤醒巡山人，他可以摇头不使用能力，或选择一名玩家。如果巡山人选中了落难少女，则在巡山人入睡后通知落难少女角色变化。", "en": "The Huntsman shakes their head 'no' or points to a player. If they point to the Damsel, wake that player, show the 'You are' card and a not-in-play character token."}},
+  {"id": "washerwoman", "cnId": "washerwoman", "team": "townsfolk", "order": 3035, "reminder": {"zh-CN": "唤醒洗衣妇，对她指向两名玩家，并展示一个镇民角色标记。这两名玩家其中之一是这个镇民。", "en": "Show the character token of a Townsfolk in play. Point to two players, one of which is that character."}},
+  {"id": "librarian", "cnId": "librarian", "team": "townsfolk", "order": 3036, "reminder": {"zh-CN": "唤醒图书管理员，对他指向两名玩家，并展示一个外来者角色标记。这两名玩家其中之一是这个外来者。", "en": "Show the character token of an Outsider in play. Point to two players, one of which is that character."}},
+  {"id": "investigator", "cnId": "investigator", "team": "townsfolk", "order": 3037, "reminder": {"zh-CN": "唤醒调查员，对他指向两名玩家，并展示一个爪牙角色标记。这两名玩家其中之一是这个爪牙。", "en": "Show the character token of a Minion in play. Point to two players, one of which is that character."}},
+  {"id": "chef", "cnId": "chef", "team": "townsfolk", "order": 3038, "reminder": {"zh-CN": "唤醒厨师，对他用手势比划数字来告知他邻座邪恶玩家有几对。", "en": "Show the finger signal (0, 1, 2, …) for the number of pairs of neighbouring evil players."}},
+  {"id": "empath", "cnId": "empath", "team": "townsfolk", "order": 3039, "reminder": {"zh-CN": "唤醒共情者，对他用手势比划数字来告知他与他邻近的存活玩家中有几人是邪恶玩家。", "en": "Show the finger signal (0, 1, 2) for the number of evil alive neighbours of the Empath."}},
+  {"id": "fortuneteller", "cnId": "fortune_teller", "team": "townsfolk", "order": 3040, "reminder": {"zh-CN": "唤醒占卜师，让他选择两名玩家。以点头或摇头告知他是否选中了恶魔。", "en": "The Fortune Teller points to two players. Give the head signal (nod yes, shake no) for whether one of those players is the Demon. "}},
+  {"id": "butler", "cnId": "butler", "team": "outsider", "order": 3041, "reminder": {"zh-CN": "唤醒管家，让他选择一名除自己以外的玩家，那名玩家成为他的主人。", "en": "The Butler points to a player. Mark that player as 'Master'."}},
+  {"id": "nichen", "cnId": "nichen", "team": "outsider", "order": 3042, "reminder": {"zh-CN": "唤醒逆臣，让他选择一名除自己以外的玩家，那名玩家现在与他不共戴天。", "en": "Wake the Turncoat. They choose a player other than themself. That player is now their Nemesis."}},
+  {"id": "grandmother", "cnId": "grandmother", "team": "townsfolk", "order": 3043, "reminder": {"zh-CN": "唤醒祖母，对她指向一名善良玩家，并展示该玩家的角色标记。", "en": "Show the marked character token. Point to the marked player."}},
+  {"id": "clockmaker", "cnId": "clockmaker", "team": "townsfolk", "order": 3044, "reminder": {"zh-CN": "唤醒钟表匠，对他用手势比划数字来告知他恶魔与爪牙之间的最近距离。", "en": "Show the hand signal for the number (1, 2, 3, etc.) of places from Demon to closest Minion."}},
+  {"id": "dreamer", "cnId": "dreamer", "team": "townsfolk", "order": 3045, "reminder": {"zh-CN": "唤醒筑梦师，让他选择一名除自己以外的非旅行者玩家。对他展示一善一恶两个角色标记。", "en": "The Dreamer points to a player. Show 1 good and 1 evil character token; one of these is correct."}},
+  {"id": "seamstress", "cnId": "seamstress", "team": "townsfolk", "order": 3046, "reminder": {"zh-CN": "唤醒女裁缝，她可以摇头不使用能力，或选择除自己以外的两名玩家。以点头或摇头告知她选择的玩家是否为同一阵营。", "en": "The Seamstress either shows a 'no' head signal, or points to two other players. If the Seamstress chose players , nod 'yes' or shake 'no' for whether they are of same alignment."}},
+  {"id": "steward", "cnId": "steward", "team": "townsfolk", "order": 3047, "reminder": {"zh-CN": "唤醒事务官，对他指向一名善良玩家。", "en": "During the first night, wake the Steward. Point to the player marked KNOW. Put the Steward to sleep."}},
+  {"id": "knight", "cnId": "knight", "team": "townsfolk", "order": 3048, "reminder": {"zh-CN": "唤醒骑士，对他指向两名非恶魔玩家。", "en": "Point to the two known players."}},
+  {"id": "noble", "cnId": "noble", "team": "townsfolk", "order": 3049, "reminder": {"zh-CN": "唤醒贵族，对他指向三名玩家。这三名玩家中有且仅有一名是邪恶玩家。", "en": "Point to 3 players including one evil player, in no particular order."}},
+  {"id": "balloonist", "cnId": "balloonist", "team": "townsfolk", "order": 3050, "reminder": {"zh-CN": "唤醒气球驾驶员，对他指向一名玩家。", "en": "Choose a character type. Point to a player whose character is of that type. Place the Balloonist's Seen reminder next to that character."}},
+  {"id": "yinyangshi", "cnId": "yinyangshi", "team": "townsfolk", "order": 3051, "reminder": {"zh-CN": "唤醒阴阳师，对他展示两个善良角色和两个邪恶角色。", "en": "Wake the Yin-Yang Diviner. Show them two good characters and two evil characters."}},
+  {"id": "langzhong", "cnId": "langzhong", "team": "townsfolk", "order": 3052, "reminder": {"zh-CN": "唤醒郎中，让他指向除他以外的一名玩家。对郎中展示一个与该玩家能力相关的词语。", "en": "Wake the Herb Doctor. They point to a player other than themself. Show the Herb Doctor a word related to that player's ability."}},
+  {"id": "dianxiaoer", "cnId": "dianxiaoer", "team": "townsfolk", "order": 3053, "reminder": {"zh-CN": "唤醒店小二，对他指向两名善良玩家。", "en": "Wake the Waiter. Point to two good players."}},
+  {"id": "villageidiot", "cnId": "village_idiot", "team": "townsfolk", "order": 3054, "reminder": {"zh-CN": "唤醒村夫，让他指向一名玩家，用手势告诉他那名玩家的阵营。", "en": "Wake any Village Idiot. They point to a player. Reveal their allignment. Repeat with a different Village Idiot until all were woken."}},
+  {"id": "bountyhunter", "cnId": "bounty_hunter", "team": "townsfolk", "order": 3055, "reminder": {"zh-CN": "（在进入首个夜晚时立即通知赏金猎人转变的那个镇民他的阵营发生了变化）唤醒赏金猎人，对他指向一名邪恶玩家。", "en": "Point to 1 evil player. Wake the townsfolk who is evil and show them the 'You are' card and the thumbs down evil sign."}},
+  {"id": "nightwatchman", "cnId": "nightwatchman", "team": "townsfolk", "order": 3056, "reminder": {"zh-CN": "唤醒守夜人，他可以摇头不使用能力，或选择一名玩家。如果守夜人选择了玩家，则在守夜人入睡后通知那名玩家谁是守夜人。", "en": "The Nightwatchman may point to a player. Wake that player, show the 'This character selected you' card and the Nightwatchman token, then point to the Nightwatchman player."}},
+  {"id": "cultleader", "cnId": "cult_leader", "team": "townsfolk", "order": 3057, "reminder": {"zh-CN": "如果异教领袖的阵营发生了变化，将他唤醒并通知他最新阵营。", "en": "If the cult leader changed alignment, show them the thumbs up good signal of the thumbs down evil signal accordingly."}},
+  {"id": "spy", "cnId": "spy", "team": "minion", "order": 3058, "reminder": {"zh-CN": "唤醒间谍，让他查看魔典。", "en": "Show the Grimoire to the Spy for as long as they need."}},
+  {"id": "ogre", "cnId": "ogre", "team": "outsider", "order": 3059, "reminder": {"zh-CN": "唤醒食人魔，让他选择一名玩家。如果他选择了邪恶玩家，将他的角色标记在魔典中倒置以表示他转变为邪恶阵营。", "en": "Wake the Ogre. They point to a player. If they point at an evil player, mark the Ogre as evil."}},
+  {"id": "highpriestess", "cnId": "high_priestess", "team": "townsfolk", "order": 3060, "reminder": {"zh-CN": "唤醒女祭司，对她指向一名玩家。", "en": "Point to the player you believe the High Priestess should talk to most."}},
+  {"id": "shugenja", "cnId": "shugenja", "team": "townsfolk", "order": 3061, "reminder": {"zh-CN": "唤醒修行者，对他指向对应方向来告知他最近的邪恶玩家的方向。", "en": "Point to the direction the closest evil is."}},
+  {"id": "qintianjian", "cnId": "qintianjian", "team": "townsfolk", "order": 3062, "reminder": {"zh-CN": "唤醒钦天监，对他指向对应方向来告知他最近的邪恶玩家的方向。", "en": "Wake the Qintianjian. Point in the direction of the nearest evil player."}},
+  {"id": "general", "cnId": "general", "team": "townsfolk", "order": 3063, "reminder": {"zh-CN": "唤醒将军，对他用手势比划当前的优势阵营。", "en": "Show the General thumbs up for good winning, thumbs down for evil winning or thumb to the side for neither."}},
+  {"id": "chambermaid", "cnId": "chambermaid", "team": "townsfolk", "order": 3064, "reminder": {"zh-CN": "唤醒侍女，让她选择两名除自己以外的存活玩家。用手势比划数字来告知她这些玩家中因自己能力而唤醒的玩家数量。", "en": "The Chambermaid points to two players. Show the number signal (0, 1, 2, …) for how many of those players wake tonight for their ability."}},
+  {"id": "mathematician", "cnId": "mathematician", "team": "townsfolk", "order": 3065, "reminder": {"zh-CN": "唤醒数学家，用手势比划数字来告诉他今天有多少玩家的能力未正常生效。", "en": "Show the hand signal for the number (0, 1, 2, etc.) of players whose ability malfunctioned due to other abilities."}},
+  {"id": "leviathan", "cnId": "leviathan", "team": "demon", "order": 3070, "reminder": {"zh-CN": "如果利维坦在场，告知所有人利维坦在场，现在是第一个白天。", "en": "Place the Leviathan 'Day 1' marker. Announce 'The Leviathan is in play; this is Day 1.'"}},
+  {"id": "vizier", "cnId": "vizier", "team": "minion", "order": 3075, "reminder": {"zh-CN": "如果维齐尔在场，告知所有人谁是维齐尔。", "en": ""}},
+  {"id": "kaixinhou", "cnId": "kaixinhou", "team": "demon", "order": 128001, "reminder": {"zh-CN": "告诉所有人他是开心猴。", "en": "Tell all players he is the Happy Monkey."}},
+];
+
+export const OTHER_NIGHT_STEPS: readonly NightStep[] = [
+  {"id": "apprentice", "cnId": "apprentice", "team": "traveler", "order": 1, "reminder": {"zh-CN": "在学徒加入游戏的首个夜晚，唤醒学徒。向学徒展示“你是”信息标记，然后展示一个镇民或爪牙的角色标记。在魔典上，将学徒的角色标记替换为刚刚展示的角色标记，并放置“是学徒”提示标记。这名玩家还是学徒，只是他拥有了该角色的能力。", "en": ""}},
+  {"id": "barista", "cnId": "barista", "team": "traveler", "order": 1, "reminder": {"zh-CN": "每个夜晚，移除先前的标记并在任一角色标记旁放置咖啡师的“清醒且健康”标记或“行动两次”提示。唤醒那个角色的玩家并向他展示“该角色的能力对你生效”信息标记，咖啡师标记和一根手指（代表他现在清醒且健康）或两根手指（代表他要行动两次）。让这名玩家入睡。", "en": "Choose a player, wake them and tell them which Barista power is affecting them. Treat them accordingly (sober/healthy/true info or activate their ability twice)."}},
+  {"id": "bonecollector", "cnId": "bone_collector", "team": "traveler", "order": 1, "reminder": {"zh-CN": "每个夜晚，唤醒集骨者。集骨者要么摇头表示不使用能力，或者是指向任何一名已死亡的玩家。让集骨者重新入睡。", "en": "The Bone Collector either shakes their head no or points at any dead player. If they pointed at any dead player, put the Bone Collector's 'Has Ability' reminder by the chosen player's character token. (They may need to be woken tonight to use it.)"}},
+  {"id": "bureaucrat", "cnId": "bureaucrat", "team": "traveler", "order": 1, "reminder": {"zh-CN": "唤醒官员。让官员指向任意一名玩家。用官员的“3票”提示标记那名被选中的玩家。让官员入睡。", "en": "The Bureaucrat points to a player. Put the Bureaucrat's '3 votes' reminder by the chosen player's character token."}},
+  {"id": "harlot", "cnId": "harlot", "team": "traveler", "order": 1, "reminder": {"zh-CN": "唤醒流莺。让流莺指向任意一名玩家。让流莺重新入睡。唤醒被选中的玩家，对该玩家展示“该角色的能力对你生效”提示标记和流莺角色标记。该玩家需要通过点头表示是，摇头表示否。然后让该玩家重新入睡。", "en": "The Harlot points at any player. Then, put the Harlot to sleep. Wake the chosen player, show them the 'This character selected you' token, then the Harlot token. That player either nods their head yes or shakes their head no. If they nodded their head yes, wake the Harlot and show them the chosen player's character token. Then, you may decide that both players die."}},
+  {"id": "jiaohuazi", "cnId": "jiaohuazi", "team": "traveler", "order": 1, "reminder": {"zh-CN": "如果你决定不让叫花子获得这个角色的能力，无事发生。如果你决定让叫花子获得这个角色的能力，那么让他行动。如果该角色已在场，你可以自由决定是先唤醒原角色对应的玩家还是先唤醒叫花子玩家来进行行动。", "en": "If you decide the Beggar does not gain the ability, nothing happens. If you decide the Beggar gains the ability, wake them. If the character is in play, you may decide whether to wake the original player or the Beggar player first to act."}},
+  {"id": "meishuguanzhang", "cnId": "meishuguanzhang", "team": "traveler", "order": 1, "reminder": {"zh-CN": "", "en": ""}},
+  {"id": "thief", "cnId": "thief", "team": "traveler", "order": 1, "reminder": {"zh-CN": "唤醒窃贼。让窃贼指向任意一名玩家。用窃贼的“负票”提示标记那名被选中的玩家。让窃贼入睡。", "en": "The Thief points to a player. Put the Thief's 'Negative vote' reminder by the chosen player's character token."}},
+  {"id": "trade_dealer", "cnId": "trade_dealer", "team": "traveler", "order": 1, "reminder": {"zh-CN": "", "en": ""}},
+  {"id": "genius", "cnId": "genius", "team": "townsfolk", "order": 2, "reminder": {"zh-CN": "", "en": ""}},
+  {"id": "philosopher", "cnId": "philosopher", "team": "townsfolk", "order": 2, "reminder": {"zh-CN": "如果哲学家未曾使用能力，唤醒哲学家，他可以摇头不使用能力，或选择获得角色列表上的一个善良角色的能力。", "en": "If the Philosopher has not used their ability: the Philosopher either shows a 'no' head signal, or points to a good character on their sheet. If they chose a character: Swap the out-of-play character token with the Philosopher token and add the 'Is the Philosopher' reminder. If the character is in play, place the drunk marker by that player."}},
+  {"id": "hatter", "cnId": "hatter", "team": "outsider", "order": 3, "reminder": {"zh-CN": "如果帽匠死于白天，（建议分别）唤醒恶魔和爪牙并让他们选择是否改变角色。如果帽匠死于夜晚，则在当前玩家行动结束后立即开始茶会。", "en": "If the Hatter died today: Wake Demon and Minions. Show the 'This character selected you' card, then Hatter token. Each either shows a 'no' head signal, or points to another character of the same type of their current character. If they chose a character: Change their character to the selected one. If a player chooses the same character as another, shake your head and gesture them to choose again."}},
+  {"id": "poppygrower", "cnId": "poppy_grower", "team": "townsfolk", "order": 4, "reminder": {"zh-CN": "如果罂粟种植者死于白天，插入执行爪牙信息和恶魔信息（不包含恶魔伪装）流程。如果罂粟种植者死于夜晚，则在当前玩家行动结束后立即执行相关流程。", "en": "If the Poppy Grower has died, show the Minions/Demon who each other are."}},
+  {"id": "disappointed", "cnId": "disappointed", "team": "outsider", "order": 5, "reminder": {"zh-CN": "", "en": ""}},
+  {"id": "sailor", "cnId": "sailor", "team": "townsfolk", "order": 5, "reminder": {"zh-CN": "唤醒水手，让他选择一名玩家。决定他俩其中谁因为水手能力醉酒。", "en": "The previously drunk player is no longer drunk. The Sailor points to a living player. Either the Sailor, or the chosen player, is drunk."}},
+  {"id": "engineer", "cnId": "engineer", "team": "townsfolk", "order": 6, "reminder": {"zh-CN": "如果工程师未曾使用能力，唤醒工程师，他可以摇头不使用能力，或选择角色列表上的恶魔或爪牙角色，来执行同角色类型的这些玩家的角色变化。", "en": "The Engineer shows a 'no' head signal, or points to a Demon or points to the relevant number of Minions. If the Engineer chose characters, replace the Demon or Minions with the choices, then wake the relevant players and show them the 'You are' card and the relevant character tokens."}},
+  {"id": "preacher", "cnId": "preacher", "team": "townsfolk", "order": 7, "reminder": {"zh-CN": "唤醒传教士，让他选择一名玩家。如果他选中了爪牙，该爪牙失去能力。在传教士入睡后通知该爪牙被传教士选中。", "en": "The Preacher chooses a player. If a Minion is chosen, wake the Minion and show the 'This character selected you' card and then the Preacher token."}},
+  {"id": "pithag", "cnId": "pit-hag", "team": "minion", "order": 8, "reminder": {"zh-CN": "唤醒麻脸巫婆，让她选择一名玩家和角色列表上的一个角色。如果该角色不在场，则在麻脸巫婆入睡后通知该玩家角色变化。根据实际情况，可以将相关通知合并，例如玩家变成了恶魔，则在恶魔行动时一并唤醒，通知角色变化并让他执行相应行动。", "en": "The Pit-Hag points to a player and a character on the sheet. If this character is not in play, wake that player and show them the 'You are' card and the relevant character token. If the character is in play, nothing happens."}},
+  {"id": "poisoner", "cnId": "poisoner", "team": "minion", "order": 9, "reminder": {"zh-CN": "唤醒投毒者，让他选择一名玩家，那名玩家中毒。", "en": "The previously poisoned player is no longer poisoned. The Poisoner points to a player. That player is poisoned."}},
+  {"id": "innkeeper", "cnId": "innkeeper", "team": "townsfolk", "order": 10, "reminder": {"zh-CN": "唤醒旅店老板，让他选择两名玩家。这两名玩家今晚不死，同时需要决定他俩其中谁因为旅店老板能力醉酒。", "en": "The previously protected and drunk players lose those markers. The Innkeeper points to two players. Those players are protected. One is drunk."}},
+  {"id": "courtier", "cnId": "courtier", "team": "townsfolk", "order": 11, "reminder": {"zh-CN": "如果侍臣未曾使用能力，唤醒侍臣，他可以摇头不使用能力，或选择角色列表上的一个任意角色，该角色对应的玩家之一醉酒。", "en": "Reduce the remaining number of days the marked player is poisoned. If the Courtier has not yet used their ability: The Courtier either shows a 'no' head signal, or points to a character on the sheet. If the Courtier used their ability: If that character is in play, that player is drunk."}},
+  {"id": "gambler", "cnId": "gambler", "team": "townsfolk", "order": 12, "reminder": {"zh-CN": "唤醒赌徒，让他进行猜测。如果猜测错误，他死亡。", "en": "The Gambler points to a player, and a character on their sheet. If incorrect, the Gambler dies."}},
+  {"id": "snakecharmer", "cnId": "snake_charmer", "team": "townsfolk", "order": 13, "reminder": {"zh-CN": "唤醒舞蛇人，让他选择一名存活玩家。如果选中恶魔则执行角色和阵营的交换，并在舞蛇人入睡后通知旧恶魔角色变化。", "en": "The Snake Charmer points to a player. If that player is the Demon: swap the Demon and Snake Charmer character and alignments. Wake each player to inform them of their new role and alignment. The new Snake Charmer is poisoned."}},
+  {"id": "monk", "cnId": "monk", "team": "townsfolk", "order": 14, "reminder": {"zh-CN": "唤醒僧侣，让他选择除自己以外的一名玩家，那名玩家今晚免受恶魔负面效果影响。", "en": "The previously protected player is no longer protected. The Monk points to a player not themself. Mark that player 'Protected'."}},
+  {"id": "dagengren", "cnId": "dagengren", "team": "townsfolk", "order": 15, "reminder": {"zh-CN": "唤醒打更人，让他进行猜测，并放置提示标记到对应玩家旁。", "en": "Wake the Firewatcher. They make a guess. Place reminder tokens by the corresponding players."}},
+  {"id": "jinyiwei", "cnId": "jinyiwei", "team": "townsfolk", "order": 16, "reminder": {"zh-CN": "唤醒锦衣卫，让他选择一名玩家。他现在开始保护那名玩家。", "en": "Wake the brocadier. They choose a player. They are now protecting that player."}},
+  {"id": "xionghaizi", "cnId": "xionghaizi", "team": "townsfolk", "order": 17, "reminder": {"zh-CN": "唤醒熊孩子，让他选择角色列表上的一个镇民角色，该角色会产生错误信息。", "en": "Wake the Rascal. They choose a Townsfolk character from the character list. That character's ability returns false information."}},
+  {"id": "devilsadvocate", "cnId": "devils_advocate", "team": "minion", "order": 18, "reminder": {"zh-CN": "唤醒魔鬼代言人，让他选择一名与上一晚不同的玩家，那名玩家处决不死。", "en": "The Devil’s Advocate points to a living player, different from the previous night. That player survives execution tomorrow."}},
+  {"id": "witch", "cnId": "witch", "team": "minion", "order": 19, "reminder": {"zh-CN": "唤醒女巫，让她选择一名玩家，那名玩家被诅咒。", "en": "If there are 4 or more players alive: The Witch points to a player. If that player nominates tomorrow they die immediately."}},
+  {"id": "cerenovus", "cnId": "cerenovus", "team": "minion", "order": 20, "reminder": {"zh-CN": "唤醒洗脑师，让他选择一名玩家和角色列表上的一个善良角色，那名玩家明天需要“疯狂”证明自己是那个角色。在洗脑师入睡后通知那名玩家被洗脑。", "en": "The Cerenovus points to a player, then to a character on their sheet. Wake that player. Show the 'This character selected you' card, then the Cerenovus token. Show the selected character token. If the player is not mad about being that character tomorrow, they can be executed."}},
+  {"id": "fearmonger", "cnId": "fearmonger", "team": "minion", "order": 21, "reminder": {"zh-CN": "唤醒恐惧之灵，让他选择一名玩家，随后如果恐惧之灵的目标发生了变更，通知所有玩家恐惧之灵选择了一名玩家。", "en": "The Fearmonger points to a player. If different from the previous night, place the Fear token next to that player and announce that a new player has been selected with the Fearmonger ability."}},
+  {"id": "harpy", "cnId": "harpy", "team": "minion", "order": 22, "reminder": {"zh-CN": "唤醒鹰身女妖，让她选择两名玩家，第一名玩家明天需要“疯狂”证明第二名玩家邪恶。在鹰身女妖入睡后通知第一名玩家被鹰身女妖选中。", "en": "Wake the Harpy. They select one player, then another. Wake the first player. Show them the 'This character selected you' info token, then the Harpy token, and finally the second player."}},
+  {"id": "mezepheles", "cnId": "mezepheles", "team": "minion", "order": 23, "reminder": {"zh-CN": "如果首次有善良玩家说出了灵言师的关键词，唤醒该玩家并通知他阵营变化。", "en": "Wake the 1st good player that said the Mezepheles' secret word and show them the 'You are' card and the thumbs down evil signal."}},
+  {"id": "humeiniang", "cnId": "humeiniang", "team": "minion", "order": 24, "reminder": {"zh-CN": "如果狐媚娘死于处决，唤醒她选择的玩家并通知他阵营变化。", "en": "If the Hu Meiniang dies by execution, wake their chosen player and inform them of their alignment change."}},
+  {"id": "nichen", "cnId": "nichen", "team": "outsider", "order": 25, "reminder": {"zh-CN": "如果逆臣或他的目标玩家，这两人之一死于处决，唤醒另一名玩家并通知他阵营变化。", "en": "If the Turncoat or their target dies by execution, wake the other player and inform them of their alignment change."}},
+  {"id": "scarletwoman", "cnId": "scarlet_woman", "team": "minion", "order": 26, "reminder": {"zh-CN": "如果红唇女郎的能力曾被触发，唤醒她并告知她变成了哪个恶魔角色。", "en": "If the Scarlet Woman became the Demon today: Show the 'You are' card, then the demon token."}},
+  {"id": "summoner", "cnId": "summoner", "team": "minion", "order": 27, "reminder": {"zh-CN": "如果这是游戏中的第三个夜晚，唤醒召唤师，让他选择一名玩家和一个恶魔角色，那名玩家变成由他选择的邪恶恶魔。", "en": "Increase the Night Counter. If it is the third night, wake the Summoner. They point to a player, and a Demon on the character sheet. Put the summoner to sleep and wake the chosen player. Show them the 'You Are' info token, then the Demon token. Show them the 'You Are' info token, then a thumbs down. Replace their character token with the new Demon token."}},
+  {"id": "lunatic", "cnId": "lunatic", "team": "outsider", "order": 28, "reminder": {"zh-CN": "如果疯子以为的恶魔会在当晚行动，唤醒疯子，并让他以恶魔的方式行动。", "en": "Allow the Lunatic to do the actions of the Demon. Place their 'attack' markers. If the Lunatic selected players: Wake the Demon. Show the 'attack' marker, then point to each marked player. Remove any Lunatic 'attack' markers."}},
+  {"id": "exorcist", "cnId": "exorcist", "team": "townsfolk", "order": 29, "reminder": {"zh-CN": "唤醒驱魔人，让他选择一名与上一晚不同的玩家。如果他选中了恶魔，则在驱魔人入睡后通知该恶魔谁是驱魔人。", "en": "The Exorcist points to a player, different from the previous night. If that player is the Demon: Wake the Demon. Show the Exorcist token. Point to the Exorcist. The Demon does not act tonight."}},
+  {"id": "lycanthrope", "cnId": "lycanthrope", "team": "townsfolk", "order": 30, "reminder": {"zh-CN": "唤醒半兽人，让他选择一名玩家。如果该玩家是善良玩家，该玩家死亡，且当晚不会有其他玩家死亡。", "en": "The Lycanthrope points to a living player: if good, they die and no one else can die tonight."}},
+  {"id": "imp", "cnId": "imp", "team": "demon", "order": 31, "reminder": {"zh-CN": "唤醒小恶魔，让他攻击一名玩家。如果他成功自杀，则在他入睡后通知一名爪牙角色变化。", "en": "The Imp points to a player. That player dies. If the Imp chose themselves: Replace the character of 1 alive minion with a spare Imp token. Show the 'You are' card, then the Imp token."}},
+  {"id": "zombuul", "cnId": "zombuul", "team": "demon", "order": 32, "reminder": {"zh-CN": "如果白天无人死亡，唤醒僵怖，让他攻击一名玩家。", "en": "If no-one died during the day: The Zombuul points to a player. That player dies."}},
+  {"id": "pukka", "cnId": "pukka", "team": "demon", "order": 33, "reminder": {"zh-CN": "唤醒普卡，让他选择一名玩家，该玩家中毒。上一个被普卡中毒的玩家死亡。", "en": "The Pukka points to a player. That player is poisoned. The previously poisoned player dies. "}},
+  {"id": "shabaloth", "cnId": "shabaloth", "team": "demon", "order": 34, "reminder": {"zh-CN": "决定上一夜被沙巴洛斯选择的玩家是否被反刍。然后唤醒沙巴洛斯，让他攻击两名玩家。", "en": "One player that the Shabaloth chose the previous night might be resurrected. The Shabaloth points to two players. Those players die."}},
+  {"id": "po", "cnId": "po", "team": "demon", "order": 35, "reminder": {"zh-CN": "唤醒珀，他可以攻击一名玩家或不进行攻击，如果他上一次选择了不进行攻击，则此次必须攻击三名玩家。", "en": "If the Po chose no-one the previous night: The Po points to three players. Otherwise: The Po either shows the 'no' head signal , or points to a player. Chosen players die"}},
+  {"id": "princess", "cnId": "princess", "team": "townsfolk", "order": 35, "reminder": {"zh-CN": "", "en": "If it was the Princess' first day today, and they nominated and executed a player, the Demon doesn't kill."}},
+  {"id": "fanggu", "cnId": "fang_gu", "team": "demon", "order": 36, "reminder": {"zh-CN": "唤醒方古，让他攻击一名玩家。如果该玩家是外来者并成功转化，则方古死亡，在他入睡后通知那名外来者角色变化。", "en": "The Fang Gu points to a player. That player dies. Or, if that player was an Outsider and there are no other Fang Gu in play: The Fang Gu dies instead of the chosen player. The chosen player is now an evil Fang Gu. Wake the new Fang Gu. Show the 'You are' card, then the Fang Gu token. Show the 'You are' card, then the thumb-down 'evil' hand sign."}},
+  {"id": "nodashii", "cnId": "no_dashii", "team": "demon", "order": 37, "reminder": {"zh-CN": "唤醒诺-达鲺，让他攻击一名玩家。", "en": "The No Dashii points to a player. That player dies."}},
+  {"id": "vortox", "cnId": "vortox", "team": "demon", "order": 38, "reminder": {"zh-CN": "唤醒涡流，让他攻击一名玩家。", "en": "The Vortox points to a player. That player dies."}},
+  {"id": "legion", "cnId": "legion", "team": "demon", "order": 39, "reminder": {"zh-CN": "决定今晚谁会因为军团能力死亡。", "en": "Choose a player, that player dies."}},
+  {"id": "vigormortis", "cnId": "vigormortis", "team": "demon", "order": 40, "reminder": {"zh-CN": "唤醒亡骨魔，让他攻击一名玩家。", "en": "The Vigormortis points to a player. That player dies. If a Minion, they keep their ability and one of their Townsfolk neighbours is poisoned."}},
+  {"id": "ojo", "cnId": "ojo", "team": "demon", "order": 41, "reminder": {"zh-CN": "唤醒奥赫，让他选择角色列表上的一个角色。该角色对应的玩家死亡，如果该角色不在场，替奥赫决定今晚谁会因为奥赫能力死亡。", "en": "The Ojo points to a character icon on their character sheet. If that character is in play, their player dies. If not, the storyteller chooses a player to die."}},
+  {"id": "qimo", "cnId": "qimo", "team": "demon", "order": 41, "reminder": {"zh-CN": "唤醒契魔，让他选择两名玩家。用“链接”标记他们。白天开始时，公开宣布这两名玩家被链接。", "en": "Wake the Contract Demon. They choose two players. Mark them with 'Linked'. At the start of the day, publicly announce these two players are linked."}},
+  {"id": "alhadikhia", "cnId": "al-hadikhia", "team": "demon", "order": 42, "reminder": {"zh-CN": "唤醒哈迪寂亚，让他选择三名玩家。执行哈迪寂亚的能力流程（参考哈迪寂亚的百科页面）。", "en": "The Al-Hadikhia chooses 3 players. Announce the first player, wake them to nod yes to live or shake head no to die, kill or resurrect accordingly, then put to sleep and announce the next player. If all 3 are alive after this, all 3 die."}},
+  {"id": "lleech", "cnId": "lleech", "team": "demon", "order": 43, "reminder": {"zh-CN": "唤醒痢蛭，让他攻击一名玩家。", "en": "The Lleech points to a player. That player dies."}},
+  {"id": "lilmonsta", "cnId": "lil_monsta", "team": "demon", "order": 44, "reminder": {"zh-CN": "唤醒所有爪牙选择由谁照看小怪宝。随后，决定今晚谁会因为小怪宝能力死亡。", "en": "Wake all Minions together, allow them to vote by pointing at who they want to babysit Lil' Monsta. Choose a player, that player dies."}},
+  {"id": "yaggababble", "cnId": "yaggababble", "team": "demon", "order": 45, "reminder": {"zh-CN": "根据已放置的提示标记数量，选择最多等同于该数量的玩家死亡。该夜晚行动只是一个提示，死亡的造成时机可以是白天，也可以是夜晚的任何时候。", "en": "Kill a number of players equalling or less the ammount of babble tokens."}},
+  {"id": "kazali", "cnId": "kazali", "team": "demon", "order": 46, "reminder": {"zh-CN": "唤醒卡扎力，让他攻击一名玩家。", "en": "The Kazali points to a player. That player dies."}},
+  {"id": "hundun", "cnId": "hundun", "team": "demon", "order": 47, "reminder": {"zh-CN": "唤醒混沌，让他攻击一名玩家。如果他杀死了自己邻近的镇民，所有善良玩家中毒。", "en": "Wake Hundun. They attack a player. If they kill an adjacent Townsfolk, all good players are poisoned."}},
+  {"id": "qiongqi", "cnId": "qiongqi", "team": "demon", "order": 48, "reminder": {"zh-CN": "唤醒穷奇，让他攻击一名玩家。如果今天白天有外来者死亡，他攻击并杀死的玩家成为活尸，随后决定今晚谁会因为穷奇能力死亡。", "en": "Wake Qiongqi. They attack a player. If an Outsider died today, the player they attack becomes a 'Living Dead', then decide who else dies tonight due to Qiongqi's ability."}},
+  {"id": "taotie", "cnId": "taotie", "team": "demon", "order": 49, "reminder": {"zh-CN": "唤醒饕餮，让他选择任意数量的非旅行者玩家或一名旅行者玩家。如果这些玩家角色类型不同，他们死亡。", "en": "Wake Taotie. They choose any number of non-Traveler players or one Traveler. If these players all have different character types, they die."}},
+  {"id": "taowu", "cnId": "taowu", "team": "demon", "order": 50, "reminder": {"zh-CN": "唤醒梼杌，让他攻击一名玩家。", "en": "Wake Taowu. They attack a player."}},
+  {"id": "shusheng", "cnId": "shusheng", "team": "outsider", "order": 51, "reminder": {"zh-CN": "如果恶魔猜中了书生，让恶魔选择一名玩家，该玩家死亡。", "en": "If the Demon guesses the Pedant correctly, let the Demon choose a player: that player dies."}},
+  {"id": "assassin", "cnId": "assassin", "team": "minion", "order": 52, "reminder": {"zh-CN": "如果刺客未曾使用能力，唤醒刺客，他可以摇头不使用能力，或选择攻击一名玩家。", "en": "If the Assassin has not yet used their ability: The Assassin either shows the 'no' head signal, or points to a player. That player dies."}},
+  {"id": "godfather", "cnId": "godfather", "team": "minion", "order": 53, "reminder": {"zh-CN": "如果今天白天有外来者死亡，唤醒教父，让他攻击一名玩家。", "en": "If an Outsider died today: The Godfather points to a player. That player dies."}},
+  {"id": "yangguren", "cnId": "yangguren", "team": "minion", "order": 54, "reminder": {"zh-CN": "今天白天提名了存活的养蛊人的玩家死亡。", "en": "The player who nominated the living Bug Keeper today dies."}},
+  {"id": "geling", "cnId": "geling", "team": "townsfolk", "order": 61, "reminder": {"zh-CN": "如果歌伶今天白天使用了自己的能力且恶魔成为了观众，歌伶死亡。", "en": "If the Diva used their ability today and the Demon was in the audience, the Songstress dies."}},
+  {"id": "gossip", "cnId": "gossip", "team": "townsfolk", "order": 62, "reminder": {"zh-CN": "如果造谣者今天白天的声明正确，一名玩家死亡。", "en": "If the Gossip’s public statement was true: Choose a player not protected from dying tonight. That player dies."}},
+  {"id": "drugster", "cnId": "drugster", "team": "traveler", "order": 63, "reminder": {"zh-CN": "", "en": ""}},
+  {"id": "tinker", "cnId": "tinker", "team": "outsider", "order": 63, "reminder": {"zh-CN": "在夜晚的任意时机，你都可以决定杀死修补匠。这里只是一个提示以免遗忘修补匠。", "en": "The Tinker might die."}},
+  {"id": "moonchild", "cnId": "moonchild", "team": "outsider", "order": 64, "reminder": {"zh-CN": "如果月之子在今天白天的时候使用自己的能力选择了一名善良玩家，那名玩家死亡。", "en": "If the Moonchild used their ability to target a player today: If that player is good, they die."}},
+  {"id": "shaxing", "cnId": "shaxing", "team": "outsider", "order": 65, "reminder": {"zh-CN": "如果煞星死亡，决定是否让一名与他邻近的存活玩家死亡。", "en": "If the Mr. Misfortune dies, decide if one of their living neighbors dies."}},
+  {"id": "grandmother", "cnId": "grandmother", "team": "townsfolk", "order": 66, "reminder": {"zh-CN": "如果恶魔杀死了孙子，祖母死亡。", "en": "If the Grandmother’s grandchild was killed by the Demon tonight: The Grandmother dies."}},
+  {"id": "barber", "cnId": "barber", "team": "outsider", "order": 67, "reminder": {"zh-CN": "如果理发师死于白天，唤醒恶魔让他决定是否使用理发师的能力。如果理发师死于夜晚，（如果让除攻击理发师以外的恶魔进行选择则需要等当前恶魔入睡后）让一名恶魔决定是否使用理发师的能力。", "en": "If the Barber died today: Wake the Demon. Show the 'This character selected you' card, then Barber token. The Demon either shows a 'no' head signal, or points to 2 players. If they chose players: Swap the character tokens. Wake each player. Show 'You are', then their new character token."}},
+  {"id": "sweetheart", "cnId": "sweetheart", "team": "outsider", "order": 68, "reminder": {"zh-CN": "如果心上人死亡，一名玩家醉酒。", "en": "Choose a player that is drunk."}},
+  {"id": "ravenkeeper", "cnId": "ravenkeeper", "team": "townsfolk", "order": 70, "reminder": {"zh-CN": "如果守鸦人死于夜晚，唤醒守鸦人，让他选择一名玩家。对他展示这名玩家的角色标记。", "en": "If the Ravenkeeper died tonight: The Ravenkeeper points to a player. Show that player’s character token."}},
+  {"id": "sage", "cnId": "sage", "team": "townsfolk", "order": 71, "reminder": {"zh-CN": "如果贤者被恶魔杀死，唤醒贤者，对他指向两名玩家。其中之一是杀死贤者的恶魔。", "en": "If the Sage was killed by a Demon: Point to two players, one of which is that Demon."}},
+  {"id": "plaguedoctor", "cnId": "plague_doctor", "team": "outsider", "order": 72, "reminder": {"zh-CN": "如果瘟疫医生死亡，说书人获得一项爪牙能力。", "en": ""}},
+  {"id": "choirboy", "cnId": "choirboy", "team": "townsfolk", "order": 73, "reminder": {"zh-CN": "如果恶魔杀死了国王，唤醒唱诗男孩，对他指向恶魔。", "en": "If the King was killed by the Demon, wake the Choirboy and point to the Demon player."}},
+  {"id": "farmer", "cnId": "farmer", "team": "townsfolk", "order": 74, "reminder": {"zh-CN": "如果农夫死于夜晚，唤醒一名存活的善良玩家告知他角色变化。", "en": "If a Farmer died tonight, choose another good player and make them the Farmer. Wake this player, show them the 'You are' card and the Farmer character token."}},
+  {"id": "banshee", "cnId": "banshee", "team": "townsfolk", "order": 75, "reminder": {"zh-CN": "", "en": ""}},
+  {"id": "professor", "cnId": "professor", "team": "townsfolk", "order": 76, "reminder": {"zh-CN": "如果教授未曾使用能力且在城镇广场上有玩家死亡，唤醒教授，他可以摇头不使用能力，或选择一名已死亡的玩家。如果该玩家是镇民，该玩家被起死回生。", "en": "If the Professor has not used their ability: The Professor either shakes their head no, or points to a player. If that player is a Townsfolk, they are now alive."}},
+  {"id": "huntsman", "cnId": "huntsman", "team": "townsfolk", "order": 77, "reminder": {"zh-CN": "如果巡山人未曾使用能力，唤醒巡山人，他可以摇头不使用能力，或选择一名玩家。如果巡山人选中了落难少女，则在巡山人入睡后通知落难少女角色变化。", "en": "The Huntsman shakes their head 'no' or points to a player. If they point to the Damsel, wake that player, show the 'You are' card and a not-in-play character token."}},
+  {"id": "empath", "cnId": "empath", "team": "townsfolk", "order": 80, "reminder": {"zh-CN": "唤醒共情者，对他用手势比划数字来告知他与他邻近的存活玩家中有几人是邪恶玩家。", "en": "Show the finger signal (0, 1, 2) for the number of evil neighbours."}},
+  {"id": "fortuneteller", "cnId": "fortune_teller", "team": "townsfolk", "order": 81, "reminder": {"zh-CN": "唤醒占卜师，让他选择两名玩家。以点头或摇头告知他是否选中了恶魔。", "en": "The Fortune Teller points to two players. Show the head signal (nod 'yes', shake 'no') for whether one of those players is the Demon."}},
+  {"id": "butler", "cnId": "butler", "team": "outsider", "order": 82, "reminder": {"zh-CN": "唤醒管家，让他选择一名除自己以外的玩家，那名玩家成为他的主人。", "en": "The Butler points to a player. Mark that player as 'Master'."}},
+  {"id": "undertaker", "cnId": "undertaker", "team": "townsfolk", "order": 83, "reminder": {"zh-CN": "如果今天白天有玩家死于处决，唤醒送葬者，对他展示那名玩家的角色标记。", "en": "If a player was executed today: Show that player’s character token."}},
+  {"id": "dreamer", "cnId": "dreamer", "team": "townsfolk", "order": 84, "reminder": {"zh-CN": "唤醒筑梦师，让他选择一名除自己以外的非旅行者玩家。对他展示一善一恶两个角色标记。", "en": "The Dreamer points to a player. Show 1 good and 1 evil character token; one of these is correct."}},
+  {"id": "flowergirl", "cnId": "flowergirl", "team": "townsfolk", "order": 85, "reminder": {"zh-CN": "唤醒卖花女孩，以点头或摇头告知她今天白天是否有恶魔参与投票。", "en": "Nod 'yes' or shake head 'no' for whether the Demon voted today. Place the 'Demon not voted' marker (remove 'Demon voted', if any)."}},
+  {"id": "towncrier", "cnId": "town_crier", "team": "townsfolk", "order": 86, "reminder": {"zh-CN": "唤醒城镇公告员，以点头或摇头告知他今天白天是否有爪牙发起提名。", "en": "Nod 'yes' or shake head 'no' for whether a Minion nominated today. Place the 'Minion not nominated' marker (remove 'Minion nominated', if any)."}},
+  {"id": "oracle", "cnId": "oracle", "team": "townsfolk", "order": 87, "reminder": {"zh-CN": "唤醒神谕者，对他用手势比划数字来告知他当前死亡玩家中邪恶玩家的数量。", "en": "Show the hand signal for the number (0, 1, 2, etc.) of dead evil players."}},
+  {"id": "seamstress", "cnId": "seamstress", "team": "townsfolk", "order": 88, "reminder": {"zh-CN": "如果女裁缝未曾使用能力，唤醒女裁缝，她可以摇头不使用能力，或选择除自己以外的两名玩家。以点头或摇头告知她选择的玩家是否为同一阵营。", "en": "If the Seamstress has not yet used their ability: the Seamstress either shows a 'no' head signal, or points to two other players. If the Seamstress chose players , nod 'yes' or shake 'no' for whether they are of same alignment."}},
+  {"id": "juggler", "cnId": "juggler", "team": "townsfolk", "order": 89, "reminder": {"zh-CN": "如果杂耍艺人在今天白天使用了能力，唤醒杂耍艺人，对他用手势比划数字来告知他白天猜测正确的次数。", "en": "If today was the Juggler’s first day: Show the hand signal for the number (0, 1, 2, etc.) of 'Correct' markers. Remove markers."}},
+  {"id": "balloonist", "cnId": "balloonist", "team": "townsfolk", "order": 90, "reminder": {"zh-CN": "唤醒气球驾驶员，对他指向一名玩家，这名玩家与之前气球驾驶员上一个夜晚得知过的玩家属于不同的角色类型。", "en": "Choose a character type that does not yet have a Seen reminder next to a character of that type. Point to a player whose character is of that type, if there are any. Place the Balloonist's Seen reminder next to that character."}},
+  {"id": "langzhong", "cnId": "langzhong", "team": "townsfolk", "order": 91, "reminder": {"zh-CN": "唤醒郎中，让他指向除他以外的一名玩家。对郎中展示一个与该玩家能力相关的词语。", "en": "Wake the Herb Doctor. They point to a player other than themself. Show the Herb Doctor a word related to that player's ability."}},
+  {"id": "villageidiot", "cnId": "village_idiot", "team": "townsfolk", "order": 92, "reminder": {"zh-CN": "唤醒村夫，让他指向一名玩家，用手势告诉他那名玩家的阵营。", "en": "Wake any Village Idiot. They point to a player. Reveal their allignment. Repeat with a different Village Idiot until all were woken."}},
+  {"id": "king", "cnId": "king", "team": "townsfolk", "order": 93, "reminder": {"zh-CN": "如果满足国王的唤醒条件，唤醒国王，对他展示一个存活的角色标记。", "en": "If there are more dead than living, show the King a character token of a living player."}},
+  {"id": "bountyhunter", "cnId": "bounty_hunter", "team": "townsfolk", "order": 94, "reminder": {"zh-CN": "如果赏金猎人之前得知的玩家死亡，唤醒赏金猎人，对他指向一名新的邪恶玩家。", "en": "If the known evil player has died, point to another evil player. "}},
+  {"id": "nightwatchman", "cnId": "nightwatchman", "team": "townsfolk", "order": 95, "reminder": {"zh-CN": "如果守夜人未曾使用能力，唤醒守夜人，他可以摇头不使用能力，或选择一名玩家。如果守夜人选择了玩家，则在守夜人入睡后通知那名玩家谁是守夜人。", "en": "The Nightwatchman may point to a player. Wake that player, show the 'This character selected you' card and the Nightwatchman token, then point to the Nightwatchman player."}},
+  {"id": "cultleader", "cnId": "cult_leader", "team": "townsfolk", "order": 96, "reminder": {"zh-CN": "如果异教领袖的阵营发生了变化，将他唤醒并通知他最新阵营。", "en": "If the cult leader changed alignment, show them the thumbs up good signal of the thumbs down evil signal accordingly."}},
+  {"id": "spy", "cnId": "spy", "team": "minion", "order": 97, "reminder": {"zh-CN": "唤醒间谍，让他查看魔典。", "en": "Show the Grimoire to the Spy for as long as they need."}},
+  {"id": "highpriestess", "cnId": "high_priestess", "team": "townsfolk", "order": 98, "reminder": {"zh-CN": "唤醒女祭司，对她指向一名玩家。", "en": "Point to the player you believe the High Priestess should talk to most."}},
+  {"id": "general", "cnId": "general", "team": "townsfolk", "order": 99, "reminder": {"zh-CN": "唤醒将军，对他用手势比划当前的优势阵营。", "en": "Show the General thumbs up for good winning, thumbs down for evil winning or thumb to the side for neither."}},
+  {"id": "chambermaid", "cnId": "chambermaid", "team": "townsfolk", "order": 100, "reminder": {"zh-CN": "唤醒侍女，让她选择两名除自己以外的存活玩家。用手势比划数字来告知她这些玩家中因自己能力而唤醒的玩家数量。", "en": "The Chambermaid points to two players. Show the number signal (0, 1, 2, …) for how many of those players wake tonight for their ability."}},
+  {"id": "yuan", "cnId": "yuan", "team": "demon", "order": 100, "reminder": {"zh-CN": "", "en": ""}},
+  {"id": "mathematician", "cnId": "mathematician", "team": "townsfolk", "order": 101, "reminder": {"zh-CN": "唤醒数学家，用手势比划数字来告诉他今天有多少玩家的能力未正常生效。", "en": "Show the hand signal for the number (0, 1, 2, etc.) of players whose ability malfunctioned due to other abilities."}},
+  {"id": "leviathan", "cnId": "leviathan", "team": "demon", "order": 120, "reminder": {"zh-CN": "如果利维坦在场，告知所有人利维坦在场，现在是第几个白天。（如果玩家一致同意，则无需在已经知晓利维坦在场的前提下在其他夜晚执行此项操作。）", "en": "Change the Leviathan Day reminder for the next day."}},
+  {"id": "acrobat", "cnId": "acrobat", "team": "townsfolk", "order": 2150, "reminder": {"zh-CN": "让杂技演员选择一名玩家。标记该名玩家“被选择”。让杂技演员重新入睡。 如果被选择的玩家在当晚任何时刻醉酒或中毒，标记杂技演员”死亡“。", "en": "Every night, the Acrobat chooses a player. If the chosen player is drunk or poisoned, you die."}},
+];
@@ -8,6 +8,17 @@ export interface ScriptData {
   logo?: string;
   json?: string; // 剧本的完整JSON字符串（可选，用于已加载的数据）
   jsonUrl: string; // JSON文件的URL路径
+  summary?: ScriptSummary; // manifest 中预计算的内容摘要（可选）
+}
+
+// manifest 条目的内容摘要（generate_manifest.py --summary，字段含义见 python/script_summary.py）
+export interface ScriptSummary {
+  teams: Record<string, number>; // 各阵营角色数量
+  roles: string[]; // 已识别的官方角色 id（升序）
+  custom: number; // 自定义角色数量
+  jinxes: Array<[string, string]>; // 剧本内触发的相克对
+  firstNight: string[]; // 首夜行动顺序
+  otherNight: string[]; // 其他夜晚行动顺序
 }
 
 // 剧本映射表：剧本名 -> JSON文件URL
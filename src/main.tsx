@@ -2,6 +2,8 @@ import { StrictMode } from 'react'
 import { createRoot } from 'react-dom/client'
 import { HashRouter, Routes, Route } from 'react-router-dom'
 import './index.css'
+// 字体子集（python/subset_fonts.py 生成），须在 index.css 之后导入
+import './fonts.subset.css'
 import './print.css'
 import App from './App.tsx'
 import ScriptRepository from './pages/ScriptRepository.tsx'
@@ -21,6 +21,7 @@ import PrintIcon from '@mui/icons-material/Print';
 import { observer } from 'mobx-react-lite';
 import { getScriptJsonUrl, loadScriptJson } from '../data/scriptRepository';
 import { generateScript } from '../utils/scriptGenerator';
+import { decodeShareToken, isShareToken } from '../utils/shareCodec';
 import ScriptRenderer from '../components/ScriptRenderer';
 import { THEME_COLORS, THEME_FONTS } from '../theme/colors';
 import { useTranslation } from '../utils/i18n';
@@ -84,6 +85,9 @@ const ScriptPreview = observer(() => {
               throw new Error(`HTTP ${response.status}: ${response.statusText}`);
             }
             jsonString = await response.text();
+          } else if (isShareToken(jsonParam)) {
+            // 分享链接的二进制编码
+            jsonString = JSON.stringify(await decodeShareToken(jsonParam));
           } else {
             // 直接解码JSON字符串
             jsonString = decodeURIComponent(jsonParam);
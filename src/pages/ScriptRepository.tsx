@@ -1,4 +1,4 @@
-import { useEffect, useMemo, useState } from 'react';
+import { useEffect, useMemo, useRef, useState } from 'react';
 import { useNavigate, useSearchParams } from 'react-router-dom';
 import {
   Container,
@@ -16,13 +16,40 @@ import {
 import SearchIcon from '@mui/icons-material/Search';
 import ArrowBackIcon from '@mui/icons-material/ArrowBack';
 import { observer } from 'mobx-react-lite';
-import { searchScripts, type ScriptData } from '../data/scriptRepository';
+import { searchScripts, type ScriptData, type ScriptSummary } from '../data/scriptRepository';
 import { THEME_COLORS } from '../theme/colors';
 import { useTranslation } from '../utils/i18n';
 import LanguageSwitcher from '../components/LanguageSwitcher';
 
 type RepoScript = ScriptData & { nameEn?: string };
 
+// manifest-index.json（generate_manifest.py --sharded）：各分类条目数与分页文件 URL
+interface ManifestIndex {
+  pageSize: number;
+  categories: Record<string, { count: number; pages: string[] }>;
+}
+
+// 卡片上显示角色数量的阵营（摘要中其余阵营不显示）
+const SUMMARY_TEAMS = ['townsfolk', 'outsider', 'minion', 'demon', 'traveler', 'fabled', 'loric'] as const;
+
+const toRepoScript = (s: any): RepoScript => ({
+  id: s.id,
+  name: s.name,
+  nameEn: s.nameEn,
+  author: s.author || '未知',
+  description: s.description || '',
+  category: (s.category || 'custom'),
+  logo: s.logo || undefined,
+  jsonUrl: s.jsonUrl,
+  summary: s.summary as ScriptSummary | undefined,
+});
+
+const fetchJson = async (url: string) => {
+  const res = await fetch(url, { cache: 'no-cache' });
+  if (!res.ok) throw new Error(`${url}: ${res.status}`);
+  return res.json();
+};
+
 const ScriptRepository = observer(() => {
   const navigate = useNavigate();
   const { t, language } = useTranslation();
@@ -33,8 +60,13 @@ const ScriptRepository = observer(() => {
   const categoryFromUrl = (searchParams.get('category') || 'official') as 'official' | 'official_mix' | 'custom';
   const [category, setCategory] = useState<'official' | 'official_mix' | 'custom'>(categoryFromUrl);
   
-  const [allScripts, setAllScripts] = useState<RepoScript[]>(searchScripts('').map(s => ({ ...s })));
-  const [scripts, setScripts] = useState<RepoScript[]>([]);
+  // 浏览时只加载分片索引与当前页所在的分片；完整 manifest.json 只在搜索（或没有分片产物）时加载
+  // manifestIndex: undefined 表示加载中，null 表示没有分片产物
+  const [manifestIndex, setManifestIndex] = useState<ManifestIndex | null | undefined>(undefined);
+  const [shardPages, setShardPages] = useState<Record<string, RepoScript[]>>({});
+  const [allScripts, setAllScripts] = useState<RepoScript[] | null>(null);
+  const requestedShards = useRef(new Set<string>());
+  const fullRequested = useRef(false);
   const [page, setPage] = useState(1);
   const itemsPerPage = 12; // 3列 * 4行
 
@@ -49,6 +81,12 @@ const ScriptRepository = observer(() => {
 
   const getDisplayName = (s: RepoScript) => (language === 'en' && s.nameEn ? s.nameEn : s.name);
 
+  // 由预计算摘要得到“镇民 13 · 外来者 4 · ...”，无需下载剧本 JSON
+  const getTeamCounts = (summary: ScriptSummary) =>
+    SUMMARY_TEAMS.filter(team => summary.teams[team])
+      .map(team => `${t(`team.${team}`)} ${summary.teams[team]}`)
+      .join(' · ');
+
   // 同步URL参数的变化到state
   useEffect(() => {
     const urlCategory = (searchParams.get('category') || 'official') as 'official' | 'official_mix' | 'custom';
@@ -58,47 +96,71 @@ const ScriptRepository = observer(() => {
   }, [searchParams]);
 
   useEffect(() => {
+    setPage(1);
+  }, [category, searchQuery]);
+
+  const searching = searchQuery.trim() !== '';
+  const browseShards = !searching && !!manifestIndex;
+
+  useEffect(() => {
+    fetchJson('/scripts/json/manifest-index.json')
+      .then(index => setManifestIndex(index))
+      .catch(() => setManifestIndex(null));
+  }, []);
+
+  // 当前页跨越的分片（分片按 URL 缓存，迟到的响应只会补齐缓存，不会覆盖其它页）
+  useEffect(() => {
+    if (!browseShards || !manifestIndex) return;
+    const pages = manifestIndex.categories[category]?.pages ?? [];
+    const start = (page - 1) * itemsPerPage;
+    const first = Math.floor(start / manifestIndex.pageSize);
+    const last = Math.floor((start + itemsPerPage - 1) / manifestIndex.pageSize);
+    for (const url of pages.slice(first, last + 1)) {
+      if (requestedShards.current.has(url)) continue;
+      requestedShards.current.add(url);
+      fetchJson(url)
+        .then(data => setShardPages(prev => ({ ...prev, [url]: (data.scripts || []).map(toRepoScript) })))
+        .catch(() => setManifestIndex(null)); // 分片缺失或过期：回退到完整 manifest
+    }
+  }, [browseShards, manifestIndex, category, page]);
+
+  // 完整 manifest：仅在搜索或没有分片时加载一次
+  useEffect(() => {
+    if (!(searching || manifestIndex === null) || fullRequested.current) return;
+    fullRequested.current = true;
+    fetchJson('/scripts/json/manifest.json')
+      .then(data => setAllScripts((data.scripts || []).map(toRepoScript)))
+      // 回退到内置的数据（仅官方三剧本）
+      .catch(() => setAllScripts(searchScripts('').map(s => ({ ...s }))));
+  }, [searching, manifestIndex]);
+
+  const filteredScripts = useMemo(() => {
+    if (browseShards || !allScripts) return [];
     const q = searchQuery.toLowerCase();
-    const filtered = (searchQuery ? allScripts.filter(s =>
+    return (searching ? allScripts.filter(s =>
       getDisplayName(s).toLowerCase().includes(q) ||
       s.author.toLowerCase().includes(q) ||
       (s.description || '').toLowerCase().includes(q)
     ) : allScripts).filter(s => s.category === category);
-    setPage(1);
-    setScripts(filtered);
-  }, [category, searchQuery, allScripts, language]);
+  }, [browseShards, allScripts, searching, searchQuery, category, language]);
 
-  // 加载 manifest.json（若存在）
-  useEffect(() => {
-    const loadManifest = async () => {
-      try {
-        const res = await fetch('/scripts/json/manifest.json', { cache: 'no-store' });
-        if (!res.ok) throw new Error('manifest not found');
-        const data = await res.json();
-        const list = (data.scripts || []).map((s: any): RepoScript => ({
-          id: s.id,
-          name: s.name,
-          nameEn: s.nameEn,
-          author: s.author || '未知',
-          description: s.description || '',
-          category: (s.category || 'custom'),
-          logo: s.logo || undefined,
-          jsonUrl: s.jsonUrl,
-        }));
-        setAllScripts(list);
-      } catch {
-        // 回退到内置的数据（仅官方三剧本）
-        setAllScripts(searchScripts('').map(s => ({ ...s })));
-      }
-    };
-    loadManifest();
-  }, []);
-
-  const totalPages = useMemo(() => Math.max(1, Math.ceil(scripts.length / itemsPerPage)), [scripts.length]);
+  const loading = !browseShards && !allScripts;
+  const total = browseShards && manifestIndex
+    ? (manifestIndex.categories[category]?.count ?? 0)
+    : filteredScripts.length;
+  const totalPages = Math.max(1, Math.ceil(total / itemsPerPage));
   const pagedScripts = useMemo(() => {
     const start = (page - 1) * itemsPerPage;
-    return scripts.slice(start, start + itemsPerPage);
-  }, [page, scripts]);
+    if (!browseShards || !manifestIndex) return filteredScripts.slice(start, start + itemsPerPage);
+    const pages = manifestIndex.categories[category]?.pages ?? [];
+    const result: RepoScript[] = [];
+    for (let i = start; i < Math.min(start + itemsPerPage, total); i++) {
+      const item = shardPages[pages[Math.floor(i / manifestIndex.pageSize)]]?.[i % manifestIndex.pageSize];
+      if (!item) break; // 分片仍在加载
+      result.push(item);
+    }
+    return result;
+  }, [browseShards, manifestIndex, shardPages, filteredScripts, category, page, total]);
 
   const handleScriptClick = (script: RepoScript) => {
     // 直接通过 json 参数跳到预览，避免依赖静态映射，同时带上当前分类参数
@@ -300,6 +362,17 @@ const ScriptRepository = observer(() => {
                   >
                     {t('repo.author')}：{script.author}
                   </Typography>
+                  {script.summary && (
+                    <Typography
+                      sx={{
+                        color: THEME_COLORS.paper.secondary,
+                        mb: 1,
+                        fontSize: '0.85rem',
+                      }}
+                    >
+                      {getTeamCounts(script.summary)}
+                    </Typography>
+                  )}
                   <Typography
                     sx={{
                       color: THEME_COLORS.paper.secondary,
@@ -316,7 +389,7 @@ const ScriptRepository = observer(() => {
         </Box>
 
         {/* 无结果提示 */}
-        {scripts.length === 0 && (
+        {!loading && total === 0 && (
           <Box
             sx={{
               textAlign: 'center',
@@ -335,7 +408,7 @@ const ScriptRepository = observer(() => {
         )}
 
         {/* 分页 */}
-        {scripts.length > 0 && (
+        {total > 0 && (
           <Box sx={{ display: 'flex', justifyContent: 'center', mt: 3 }}>
             <Pagination
               count={totalPages}
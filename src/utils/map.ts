@@ -193,6 +193,7 @@ export const translations = {
     'share.fullScriptLink': '完整剧本链接',
     'share.compressedLink': '压缩链接',
     'share.compressedDescription': '使用简化格式，只包含角色 ID，链接更短',
+    'share.compressedFailed': '压缩链接生成失败',
     'share.copyLink': '复制链接',
 
     // 标题编辑
@@ -626,6 +627,7 @@ export const translations = {
     'share.fullScriptLink': 'Full Script Link',
     'share.compressedLink': 'Compressed Link',
     'share.compressedDescription': 'Uses simplified format with only character IDs, shorter URL',
+    'share.compressedFailed': 'Failed to generate the compressed link',
     'share.copyLink': 'Copy Link',
 
     // Character Edit
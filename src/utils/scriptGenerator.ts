@@ -1,9 +1,13 @@
 import type { Character, Script } from '../types';
 import { CHARACTERS } from '../data/characters';
 import { CHARACTERS_EN } from '../data/charactersEn';
-import { hasJinx, getJinx } from '../data/jinx';
+import { getJinxKey, findJinxes } from '../data/jinx';
 import { THEME_COLORS } from '../theme/colors';
 import { normalizeCharacterId } from '../data/characterIdMapping';
+import { ZH_NAME_TO_ID, EN_NAME_TO_ID } from '../data/characterLookup';
+import { NIGHT_ORDER } from '../data/nightOrder';
+import { ABILITY_HIGHLIGHTS, ABILITY_HIGHLIGHT_TONES } from '../data/abilityHighlights';
+import type { HighlightTone } from '../data/abilityHighlights';
 import { configStore } from '../stores/ConfigStore';
 
 /**
@@ -21,10 +25,21 @@ function findCharacterIdByName(
   skipCrossLanguageSearch: boolean = false
 ): string | null {
   // 1. 优先查找当前语言字典的Name（核心场景）
-  for (const [id, character] of Object.entries(charactersDict)) {
-    if (character.name === name) {
+  // 内置字典使用预生成的 name -> id 查找表（python/gen_lookup_tables.py），O(1)
+  const nameTable = charactersDict === CHARACTERS ? ZH_NAME_TO_ID
+    : charactersDict === CHARACTERS_EN ? EN_NAME_TO_ID
+    : null;
+  if (nameTable) {
+    const id = Object.hasOwn(nameTable, name) ? nameTable[name] : undefined;
+    if (id !== undefined && id in charactersDict) {
       return id;
     }
+  } else {
+    for (const [id, character] of Object.entries(charactersDict)) {
+      if (character.name === name) {
+        return id;
+      }
+    }
   }
 
   // 2. 跨语言反向查找（实现对称核心）- 仅在首次调用时执行，防止无限递归
@@ -78,19 +93,8 @@ function getNightOrderFromChinese(
     );
 
     if (found) {
-      // 找到了官方角色，使用官方数据（始终从中文库获取夜间顺序）
-      const cnId = normalizeCharacterId(dictKey, 'zh-CN');
-      
-      let officialFirstNight = 0;
-      let officialOtherNight = 0;
-
-      if (CHARACTERS[cnId]) {
-        officialFirstNight = CHARACTERS[cnId].firstNight || 0;
-        officialOtherNight = CHARACTERS[cnId].otherNight || 0;
-      } else if (CHARACTERS[dictKey]) {
-        officialFirstNight = CHARACTERS[dictKey].firstNight || 0;
-        officialOtherNight = CHARACTERS[dictKey].otherNight || 0;
-      }
+      // 找到了官方角色，使用官方数据（预生成的表已按中文库取值，见 python/night_order.py）
+      const [officialFirstNight, officialOtherNight] = NIGHT_ORDER[dictKey] ?? [0, 0];
 
       // 官方ID解析模式：如果找到了官方角色，使用官方数据；否则回退到JSON数据
       return {
@@ -107,19 +111,8 @@ function getNightOrderFromChinese(
   }
 
   // 普通模式：JSON优先，JSON缺失时从中文官方库补充
-  // 1. 先尝试从中文官方库获取默认值（作为回退）
-  const cnId = normalizeCharacterId(characterId, 'zh-CN');
-  let officialFirstNight = 0;
-  let officialOtherNight = 0;
-
-  // 始终从中文库（CHARACTERS）获取官方数据
-  if (CHARACTERS[cnId]) {
-    officialFirstNight = CHARACTERS[cnId].firstNight || 0;
-    officialOtherNight = CHARACTERS[cnId].otherNight || 0;
-  } else if (CHARACTERS[characterId]) {
-    officialFirstNight = CHARACTERS[characterId].firstNight || 0;
-    officialOtherNight = CHARACTERS[characterId].otherNight || 0;
-  }
+  // 1. 先从中文官方库的夜晚顺序表获取默认值（作为回退）
+  const [officialFirstNight, officialOtherNight] = NIGHT_ORDER[characterId] ?? [0, 0];
 
   // 2. JSON中有定义的字段优先使用JSON的值，否则使用官方库的值
   return {
@@ -666,46 +659,57 @@ export function generateScript(jsonString: string, language: 'zh-CN' | 'en' = 'z
     }
   }
 
-  // 自动检查角色间的相克关系
-  for (const charA of script.all) {
-    for (const charB of script.all) {
-      if (charA.id !== charB.id) {
-        // 获取用于查询相克关系的key
-        // 优先使用保存的官方ID，如果没有则回退到原始逻辑
-        let keyA: string;
-        let keyB: string;
-
-        if (language === 'en') {
-          // 英文模式：优先使用官方ID，否则使用原始ID
-          keyA = (charA as any)._officialId || charA.id;
-          keyB = (charB as any)._officialId || charB.id;
-        } else {
-          // 中文模式：使用角色名称
-          keyA = charA.name;
-          keyB = charB.name;
-        }
-
-        if (hasJinx(keyA, keyB, language)) {
-          // 存储相克关系：统一使用角色的name字段作为key
-          const nameA = charA.name;
-          const nameB = charB.name;
-
-          if (!script.jinx[nameA]) {
-            script.jinx[nameA] = {};
-          }
-          if (!script.jinx[nameA][nameB]) {
-            // 官方相克规则，默认显示
-            script.jinx[nameA][nameB] = {
-              reason: getJinx(keyA, keyB, language),
-              display: true,
-              isOfficial: true,
-            };
-          }
+  // 自动检查角色间的相克关系：按预编译相克索引的邻接边查找（python/jinx_index.py），不再两两比较
+  // 英文模式优先使用保存的官方ID，中文模式使用角色名称
+  const jinxPositions = new Map<string, number[]>();
+  script.all.forEach((char, index) => {
+    const key = getJinxKey((char as any)._officialId || char.id, char.name, language);
+    if (!jinxPositions.has(key)) {
+      jinxPositions.set(key, []);
+    }
+    jinxPositions.get(key)!.push(index);
+  });
+
+  // 角色下标 -> (相克角色下标 -> 原因)，双向记录
+  const jinxMatches = new Map<number, Map<number, string>>();
+  const addJinxMatch = (from: number, to: number, reason: string) => {
+    if (!jinxMatches.has(from)) {
+      jinxMatches.set(from, new Map());
+    }
+    jinxMatches.get(from)!.set(to, reason);
+  };
+  for (const [keyA, keyB, reason] of findJinxes(jinxPositions.keys(), language)) {
+    for (const i of jinxPositions.get(keyA)!) {
+      for (const j of jinxPositions.get(keyB)!) {
+        if (script.all[i].id !== script.all[j].id) {
+          addJinxMatch(i, j, reason);
+          addJinxMatch(j, i, reason);
         }
       }
     }
   }
 
+  // 按角色在剧本中的顺序写入，与逐对检查时的顺序一致
+  [...jinxMatches.keys()].sort((a, b) => a - b).forEach(i => {
+    const nameA = script.all[i].name;
+    const partners = jinxMatches.get(i)!;
+    [...partners.keys()].sort((a, b) => a - b).forEach(j => {
+      // 存储相克关系：统一使用角色的name字段作为key
+      const nameB = script.all[j].name;
+      if (!script.jinx[nameA]) {
+        script.jinx[nameA] = {};
+      }
+      if (!script.jinx[nameA][nameB]) {
+        // 官方相克规则，默认显示
+        script.jinx[nameA][nameB] = {
+          reason: partners.get(j)!,
+          display: true,
+          isOfficial: true,
+        };
+      }
+    });
+  });
+
   // 按行动顺序排序
   script.firstnight.sort((a, b) => a.index - b.index);
   script.othernight.sort((a, b) => a.index - b.index);
@@ -713,6 +717,80 @@ export function generateScript(jsonString: string, language: 'zh-CN' | 'en' = 'z
   return script;
 }
 
+// 能力描述中需要高亮的关键词，按颜色分组。
+// python/ability_highlight.py 从这里读取关键词表，为内置角色的能力描述预先计算高亮区间（abilityHighlights.ts），
+// 修改后需重新运行该脚本。同一位置有多个关键词可匹配时取最长的一个（如“恶魔角色”优先于“恶魔”）
+export const ABILITY_KEYWORDS: Record<'zh-CN' | 'en', Record<HighlightTone, string[]>> = {
+  'zh-CN': {
+    evil: [
+      '未正常生效', '选择或影响', '死于处决', '恶魔角色', '爪牙角色',
+      '邪恶玩家', '邪恶阵营', '邪恶角色', '"是恶魔"', '负面能力',
+      '小恶魔', '小怪宝', '维齐尔', '被处决', '杀死',
+      '死亡', '邪恶', '落败', '中毒', '爪牙', '恶魔', '处决',
+      '错误', '自杀', '暴乱', '军团', '代价', '伪装',
+      '作弊',
+    ],
+    good: [
+      '外来者角色', '善良玩家', '善良阵营', '善良角色', '镇民角色',
+      '恢复健康', '起死回生', '落难少女', '有且只有', '有多准确',
+      '守夜人', '外来者', '农夫', '书生', '疯子', '国王',
+      '醉酒', '复活', '反刍', '镇民', '善良', '正确', '存活', '获胜', '大法官', '暗影筹码', '梭哈',
+    ],
+    purple: ['非旅行者', '旅行者', '疯狂'],
+  },
+  // 英文按完整单词匹配，不区分大小写
+  en: {
+    evil: [
+      'not work correctly', 'not functioning', 'affect or choose',
+      'evil', 'negative ability',
+      'executed', 'execution', 'Demon', 'Minion', 'Evil',
+      'poisoned', 'poison',
+      'Vizier', 'false',
+    ],
+    good: [
+      'drunk', 'good', 'Tea Lady',
+      'Outsider', 'Good', 'Townsfolk',
+      'healthy', 'sober', 'alive', 'lives', 'survive',
+      'resurrect', 'regurgitate',
+    ],
+    purple: [
+      'Travellers', 'Traveler',
+      'mad', 'madness',
+    ],
+  },
+};
+
+const highlightSpan = (text: string, tone: HighlightTone) =>
+  `<span style="color: ${THEME_COLORS[tone]}; font-weight: 700;">${text}</span>`;
+
+// 每种语言一条由全部关键词组成的正则（长的在前，交替分支按顺序尝试即为最长匹配），首次使用时构建
+const highlightPatterns = new Map<'zh-CN' | 'en', { regex: RegExp; tones: Map<string, HighlightTone> }>();
+
+const getHighlightPattern = (language: 'zh-CN' | 'en') => {
+  let pattern = highlightPatterns.get(language);
+  if (!pattern) {
+    const english = language === 'en';
+    const tones = new Map<string, HighlightTone>();
+    ABILITY_HIGHLIGHT_TONES.forEach(tone => {
+      ABILITY_KEYWORDS[language][tone].forEach(keyword => {
+        const key = english ? keyword.toLowerCase() : keyword;
+        if (!tones.has(key)) {
+          tones.set(key, tone);
+        }
+      });
+    });
+    // 转义正则表达式特殊字符
+    const alternatives = [...tones.keys()]
+      .sort((a, b) => b.length - a.length)
+      .map(keyword => keyword.replace(/[.*+?^${}()|[\]\\]/g, '\\$&'))
+      .join('|');
+    const regex = english ? new RegExp(`\\b(?:${alternatives})\\b`, 'gi') : new RegExp(alternatives, 'g');
+    pattern = { regex, tones };
+    highlightPatterns.set(language, pattern);
+  }
+  return pattern;
+};
+
 // 高亮能力文本中的关键词
 export function highlightAbilityText(text: string, language: 'zh-CN' | 'en' = 'zh-CN'): string {
   // 防御性检查：如果 text 为 undefined 或 null，返回空字符串
@@ -720,114 +798,21 @@ export function highlightAbilityText(text: string, language: 'zh-CN' | 'en' = 'z
     return '';
   }
 
-  // 中文关键词
-  const redKeywordsCN = [
-    '未正常生效', '选择或影响', '死于处决', '恶魔角色', '爪牙角色',
-    '邪恶玩家', '邪恶阵营', '邪恶角色', '"是恶魔"', '负面能力',
-    '小恶魔', '小怪宝', '维齐尔', '被处决', '杀死',
-    '死亡', '邪恶', '落败', '中毒', '爪牙', '恶魔', '处决',
-    '错误', '自杀', '暴乱', '军团', '代价', '伪装',
-    '作弊',
-  ];
-
-  const blueKeywordsCN = [
-    '外来者角色', '善良玩家', '善良阵营', '善良角色', '镇民角色',
-    '恢复健康', '起死回生', '落难少女', '有且只有', '有多准确',
-    '守夜人', '外来者', '农夫', '书生', '疯子', '国王',
-    '醉酒', '复活', '反刍', '镇民', '善良', '正确', '存活', '获胜', '大法官', '暗影筹码', '梭哈',
-  ];
-
-  const purpleKeywordsCN = ['非旅行者', '旅行者', '疯狂'];
-
-  // 英文关键词
-  const redKeywordsEN = [
-    'not work correctly', 'not functioning', 'affect or choose',
-    'evil', 'negative ability',
-    'executed', 'execution', 'Demon', 'Minion', 'Evil',
-    'poisoned', 'poison',
-    'Vizier', 'false'
-  ];
-
-  const blueKeywordsEN = [
-    'drunk', 'good', 'Tea Lady',
-    'Outsider', 'Good', 'Townsfolk',
-    'healthy', 'sober', 'alive', 'lives', 'survive',
-    'resurrect', 'regurgitate',
-  ];
-
-  const purpleKeywordsEN = [
-    'Travellers', 'Traveler',
-    'mad', 'madness',
-  ];
-
-  // 根据语言选择对应的关键词列表
-  let redKeywords = language === 'zh-CN' ? redKeywordsCN : redKeywordsEN;
-  let blueKeywords = language === 'zh-CN' ? blueKeywordsCN : blueKeywordsEN;
-  let purpleKeywords = language === 'zh-CN' ? purpleKeywordsCN : purpleKeywordsEN;
-
-  // 转义正则表达式特殊字符的辅助函数
-  const escapeRegex = (str: string) => {
-    return str.replace(/[.*+?^${}()|[\]\\]/g, '\\$&');
-  };
-
-  // 英文需要按长度排序（长的在前），避免短词先被替换导致长短语无法匹配
-  if (language === 'en') {
-    redKeywords = [...redKeywords].sort((a, b) => b.length - a.length);
-    blueKeywords = [...blueKeywords].sort((a, b) => b.length - a.length);
-    purpleKeywords = [...purpleKeywords].sort((a, b) => b.length - a.length);
-  }
-
-  let result = text;
-
-  // 英文需要使用单词边界匹配，中文直接替换
-  if (language === 'en') {
-    // 英文：使用正则表达式确保只匹配完整单词
-    redKeywords.forEach((keyword) => {
-      const escapedKeyword = escapeRegex(keyword);
-      const regex = new RegExp(`\\b${escapedKeyword}\\b`, 'gi');
-      result = result.replace(regex, (match) =>
-        `<span style="color: ${THEME_COLORS.evil}; font-weight: 700;">${match}</span>`
-      );
-    });
-
-    blueKeywords.forEach((keyword) => {
-      const escapedKeyword = escapeRegex(keyword);
-      const regex = new RegExp(`\\b${escapedKeyword}\\b`, 'gi');
-      result = result.replace(regex, (match) =>
-        `<span style="color: ${THEME_COLORS.good}; font-weight: 700;">${match}</span>`
-      );
-    });
-
-    purpleKeywords.forEach((keyword) => {
-      const escapedKeyword = escapeRegex(keyword);
-      const regex = new RegExp(`\\b${escapedKeyword}\\b`, 'gi');
-      result = result.replace(regex, (match) =>
-        `<span style="color: ${THEME_COLORS.purple}; font-weight: 700;">${match}</span>`
-      );
-    });
-  } else {
-    // 中文：直接替换
-    redKeywords.forEach((keyword) => {
-      result = result.replaceAll(
-        keyword,
-        `<span style="color: ${THEME_COLORS.evil}; font-weight: 700;">${keyword}</span>`
-      );
-    });
-
-    blueKeywords.forEach((keyword) => {
-      result = result.replaceAll(
-        keyword,
-        `<span style="color: ${THEME_COLORS.good}; font-weight: 700;">${keyword}</span>`
-      );
-    });
-
-    purpleKeywords.forEach((keyword) => {
-      result = result.replaceAll(
-        keyword,
-        `<span style="color: ${THEME_COLORS.purple}; font-weight: 700;">${keyword}</span>`
-      );
-    });
+  // 内置角色的能力描述：直接使用预先计算的高亮区间 [起, 止, 颜色下标, ...]
+  const ranges = ABILITY_HIGHLIGHTS[language][text];
+  if (ranges) {
+    let result = '';
+    let last = 0;
+    for (let i = 0; i < ranges.length; i += 3) {
+      result += text.slice(last, ranges[i]) + highlightSpan(text.slice(ranges[i], ranges[i + 1]), ABILITY_HIGHLIGHT_TONES[ranges[i + 2]]);
+      last = ranges[i + 1];
+    }
+    return result + text.slice(last);
   }
 
-  return result;
+  // 用户编辑过的自定义角色：单次正则扫描
+  const { regex, tones } = getHighlightPattern(language);
+  return text.replace(regex, match =>
+    highlightSpan(match, tones.get(language === 'en' ? match.toLowerCase() : match)!)
+  );
 }
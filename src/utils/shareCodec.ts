@@ -0,0 +1,135 @@
+// 剧本分享链接的二进制编码，格式说明与参考实现见 python/share_codec.py。
+// ?json= 参数以 SHARE_TOKEN_PREFIX 开头时按此格式解析。
+import tableData from '../data/shareCodecTable.json';
+
+export const SHARE_TOKEN_PREFIX = '~';
+const FORMAT_VERSION = 1;
+const PAYLOAD_RAW = 0;
+const PAYLOAD_DEFLATE = 1;
+
+const TABLE: readonly string[] = tableData.ids;
+const TABLE_INDEX = new Map<string, number>(TABLE.map((id, i) => [id, i]));
+
+export const isShareToken = (value: string): boolean => value.startsWith(SHARE_TOKEN_PREFIX);
+
+const writeVarint = (out: number[], value: number) => {
+  while (value >= 0x80) {
+    out.push((value & 0x7f) | 0x80);
+    value = Math.floor(value / 128);
+  }
+  out.push(value);
+};
+
+const readVarint = (data: Uint8Array, pos: number): [number, number] => {
+  let value = 0;
+  let scale = 1;
+  for (;;) {
+    if (pos >= data.length) {
+      throw new Error('share token truncated');
+    }
+    const byte = data[pos++];
+    value += (byte & 0x7f) * scale;
+    if (byte < 0x80) {
+      return [value, pos];
+    }
+    scale *= 128;
+  }
+};
+
+const pipeThrough = async (data: Uint8Array, stream: CompressionStream | DecompressionStream) => {
+  const buffer = await new Response(new Blob([data as BlobPart]).stream().pipeThrough(stream)).arrayBuffer();
+  return new Uint8Array(buffer);
+};
+
+const toBase64Url = (bytes: Uint8Array) => {
+  let binary = '';
+  bytes.forEach(b => { binary += String.fromCharCode(b); });
+  return btoa(binary).replace(/\+/g, '-').replace(/\//g, '_').replace(/=+$/, '');
+};
+
+const fromBase64Url = (text: string) => {
+  const base64 = text.replace(/-/g, '+').replace(/_/g, '/');
+  const binary = atob(base64 + '='.repeat((4 - (base64.length % 4)) % 4));
+  return Uint8Array.from(binary, c => c.charCodeAt(0));
+};
+
+// 编码剧本条目数组：已知 id 写成冻结表编号，其余条目合并为一段（必要时 deflate 压缩的）JSON
+export const encodeShareToken = async (items: any[]): Promise<string> => {
+  const out: number[] = [FORMAT_VERSION];
+  writeVarint(out, items.length);
+  const custom: any[] = [];
+  items.forEach(item => {
+    if (typeof item === 'string' && TABLE_INDEX.has(item)) {
+      writeVarint(out, TABLE_INDEX.get(item)! * 2 + 1);
+    } else if (
+      item && typeof item === 'object' && !Array.isArray(item) &&
+      Object.keys(item).length === 1 && typeof item.id === 'string' && TABLE_INDEX.has(item.id)
+    ) {
+      writeVarint(out, TABLE_INDEX.get(item.id)! * 2 + 2);
+    } else {
+      writeVarint(out, 0);
+      custom.push(item);
+    }
+  });
+
+  let bytes = Uint8Array.from(out);
+  if (custom.length > 0) {
+    const raw = new TextEncoder().encode(JSON.stringify(custom));
+    const packed = await pipeThrough(raw, new CompressionStream('deflate-raw'));
+    const useDeflate = packed.length < raw.length;
+    const payload = useDeflate ? packed : raw;
+    const merged = new Uint8Array(bytes.length + 1 + payload.length);
+    merged.set(bytes);
+    merged[bytes.length] = useDeflate ? PAYLOAD_DEFLATE : PAYLOAD_RAW;
+    merged.set(payload, bytes.length + 1);
+    bytes = merged;
+  }
+  return SHARE_TOKEN_PREFIX + toBase64Url(bytes);
+};
+
+export const decodeShareToken = async (token: string): Promise<any[]> => {
+  if (!isShareToken(token)) {
+    throw new Error('not a share token');
+  }
+  const data = fromBase64Url(token.slice(SHARE_TOKEN_PREFIX.length));
+  if (data[0] !== FORMAT_VERSION) {
+    throw new Error(`unsupported share token version ${data[0]}`);
+  }
+
+  let [count, pos] = readVarint(data, 1);
+  const slots: (any | undefined)[] = [];
+  let customCount = 0;
+  while (count-- > 0) {
+    let code: number;
+    [code, pos] = readVarint(data, pos);
+    if (code === 0) {
+      slots.push(undefined);
+      customCount++;
+      continue;
+    }
+    const index = Math.floor((code - 1) / 2);
+    if (index >= TABLE.length) {
+      // 链接来自更新的冻结表
+      throw new Error(`share token id index ${index} out of range`);
+    }
+    slots.push(code % 2 === 1 ? TABLE[index] : { id: TABLE[index] });
+  }
+
+  let custom: any[] = [];
+  if (customCount > 0) {
+    const flag = data[pos];
+    let payload = data.subarray(pos + 1);
+    if (flag === PAYLOAD_DEFLATE) {
+      payload = await pipeThrough(payload, new DecompressionStream('deflate-raw'));
+    } else if (flag !== PAYLOAD_RAW) {
+      throw new Error(`unknown share token payload flag ${flag}`);
+    }
+    custom = JSON.parse(new TextDecoder().decode(payload));
+    if (!Array.isArray(custom) || custom.length !== customCount) {
+      throw new Error('share token custom entries mismatch');
+    }
+  }
+
+  let next = 0;
+  return slots.map(slot => (slot === undefined ? custom[next++] : slot));
+};